@@ -12,6 +12,9 @@ Usage:
     # Local testing
     python entrypoint.py
 
+    # Offline (AWS 불필요): FakeModel + Mock CloudWatch/KB 도구
+    AGENTCORE_OFFLINE=true python entrypoint.py
+
     # Deployed via AgentCore Starter Toolkit
     agentcore configure --entrypoint entrypoint.py
     agentcore launch
@@ -44,6 +47,13 @@ if otel_endpoint:
     except Exception as e:
         logger.error(f"[AgentCore] OTEL setup failed: {e}", exc_info=True)
 
+# 오프라인 모드: BedrockModel 대신 스크립트된 FakeModel, Mock CloudWatch/KB 도구 사용
+# (로컬 부하 테스트/회귀 검증용, Settings 로드 전에 도구 모드를 고정)
+OFFLINE = os.environ.get("AGENTCORE_OFFLINE", "").lower() in ("1", "true", "yes")
+if OFFLINE:
+    os.environ["CLOUDWATCH_MODE"] = "mock"
+    os.environ["KB_MODE"] = "mock"
+
 # ==========================================================================
 # 나머지 imports (OTEL 초기화 이후)
 # ==========================================================================
@@ -56,10 +66,11 @@ src_path = project_root / "src"
 if src_path.exists():
     sys.path.insert(0, str(src_path))
 
-from bedrock_agentcore.runtime import BedrockAgentCoreApp
+from bedrock_agentcore.runtime import BedrockAgentCoreApp, PingStatus
 
 from ops_agent.agent import OpsAgent
 from ops_agent.config import get_settings
+from ops_agent.graph.admission import AdmissionController, AdmissionRejected
 
 
 # ==========================================================================
@@ -162,7 +173,16 @@ class StreamingEventExtractor:
 settings = get_settings()
 
 logger.info("Initializing OpsAgent for AgentCore Runtime...")
-logger.info(f"  Model: {settings.bedrock_model_id}")
+if OFFLINE:
+    from ops_agent.graph import nodes
+    from ops_agent.testing import FakeModel, ops_responder
+
+    # 토큰 간 지연으로 LLM 스트리밍을 모사 (TTFT/총 지연이 0이 되지 않도록)
+    token_delay = float(os.environ.get("AGENTCORE_OFFLINE_TOKEN_DELAY", "0.005"))
+    nodes.use_model(FakeModel(ops_responder, token_delay=token_delay))
+    logger.info(f"  Model: FakeModel (offline, token_delay={token_delay}s, mock tools)")
+else:
+    logger.info(f"  Model: {settings.bedrock_model_id}")
 logger.info(f"  Region: {settings.aws_region}")
 
 # AgentCore용 기본 세션 ID (Langfuse 트레이스 그룹화용)
@@ -178,12 +198,29 @@ agent = OpsAgent(
 )
 logger.info(f"  Session ID: {default_session_id}")
 
+# 동시 실행 제한: 초과 요청은 대기열에서 대기, 대기열 초과/시간 초과 시 거부
+admission = AdmissionController.from_settings()
+logger.info(
+    f"  Admission: max_in_flight={admission.max_in_flight}, "
+    f"max_queue={admission.max_queue}, queue_timeout={admission.queue_timeout}s, "
+    f"max_per_session={admission.max_per_session or 'unlimited'}"
+)
+
 # ==========================================================================
 # 런타임 앱 및 엔트리포인트
 # ==========================================================================
 app = BedrockAgentCoreApp()
 
 
+@app.ping
+def ping() -> PingStatus:
+    """실행 중이거나 대기 중인 요청이 있으면 HEALTHY_BUSY."""
+    stats = admission.stats()
+    if stats["in_flight"] or stats["queue_depth"]:
+        return PingStatus.HEALTHY_BUSY
+    return PingStatus.HEALTHY
+
+
 @app.entrypoint
 async def invoke(payload: dict):
     """AgentCore Runtime 스트리밍 entrypoint.
@@ -196,6 +233,7 @@ async def invoke(payload: dict):
 
     Yields:
         {"type": "delta", "content": "..."} - 스트리밍 토큰
+        {"error": "overloaded", ...} - 동시 실행 제한으로 거부된 경우
     """
     # 사용자 프롬프트 (필수)
     prompt = payload.get("prompt", "")
@@ -214,27 +252,45 @@ async def invoke(payload: dict):
         logger.info(f"Session: {session_id}")
 
     try:
-        # 스트리밍 여부 추적 (중복 방지용)
-        has_streamed = False
-
-        async for event in agent.stream_async(prompt):
-            if raw_events:
-                # 디버그 모드: 원시 이벤트 그대로 전달
-                yield event
-            else:
-                # 일반 모드: 텍스트만 추출
-                text, is_delta = StreamingEventExtractor.extract(event)
-                if text:
-                    if is_delta:
-                        # 토큰 델타 - 실시간 스트리밍
-                        has_streamed = True
-                        yield {"type": "delta", "content": text}
-                    elif not has_streamed:
-                        # finalize 결과 - 스트리밍이 없었을 때만 전송 (중복 방지)
-                        yield {"type": "text", "content": text}
+        # 동시 실행 슬롯 확보 (슬롯이 없으면 대기열에서 대기)
+        async with admission.admit(session_id) as wait_seconds:
+            if wait_seconds > 0.1:
+                logger.info(
+                    f"Admitted after {wait_seconds:.2f}s "
+                    f"(queue_depth={admission.queue_depth})"
+                )
+
+            # 스트리밍 여부 추적 (중복 방지용)
+            has_streamed = False
+
+            async for event in agent.stream_async(prompt):
+                if raw_events:
+                    # 디버그 모드: 원시 이벤트 그대로 전달
+                    yield event
+                else:
+                    # 일반 모드: 텍스트만 추출
+                    text, is_delta = StreamingEventExtractor.extract(event)
+                    if text:
+                        if is_delta:
+                            # 토큰 델타 - 실시간 스트리밍
+                            has_streamed = True
+                            yield {"type": "delta", "content": text}
+                        elif not has_streamed:
+                            # finalize 결과 - 스트리밍이 없었을 때만 전송 (중복 방지)
+                            yield {"type": "text", "content": text}
 
         logger.info("Streaming complete")
 
+    except AdmissionRejected as e:
+        logger.warning(f"Admission rejected ({e.reason}): {e.stats}")
+        yield {
+            "error": "overloaded",
+            "reason": e.reason,
+            "message": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+            "queue_depth": e.stats["queue_depth"],
+            "in_flight": e.stats["in_flight"],
+        }
+
     except Exception as e:
         logger.error(f"Streaming error: {e}")
         yield {"error": str(e), "message": "요청 처리 중 오류가 발생했습니다."}
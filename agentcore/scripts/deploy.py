@@ -98,6 +98,44 @@ def copy_source_to_runtime(runtime_dir: Path, project_root: Path) -> Path:
     return dest_ops_agent
 
 
+def copy_kb_data_to_runtime(runtime_dir: Path) -> Path:
+    """Mock KB YAML과 미리 생성한 스냅샷을 runtime 디렉토리로 복사.
+
+    컨테이너는 non-root 사용자로 실행되어 스냅샷을 직접 저장할 수 없으므로,
+    배포 전에 스냅샷을 만들어 이미지에 넣어야 콜드 스타트에서 YAML 파싱을 생략합니다.
+
+    Args:
+        runtime_dir: agentcore/runtime/ 경로
+
+    Returns:
+        복사된 data 디렉토리 경로
+    """
+    from ops_agent.tools.knowledge_base import data_loader
+
+    data_loader.build_snapshot()
+    snapshot_path = data_loader.get_snapshot_path()
+    if not snapshot_path.exists():
+        logger.error(f"KB 스냅샷을 생성할 수 없음: {snapshot_path}")
+        sys.exit(1)
+
+    dest_data = runtime_dir / data_loader.DATA_SUBDIR.parts[0]
+    dest_yaml_dir = runtime_dir / data_loader.DATA_SUBDIR
+
+    # 기존 복사본이 있으면 삭제
+    if dest_data.exists():
+        logger.info(f"기존 복사본 삭제: {dest_data}")
+        shutil.rmtree(dest_data)
+
+    # 스냅샷은 YAML mtime/크기로 검증하므로 copy2로 mtime 유지
+    logger.info(f"복사 중: {data_loader.DATA_DIR} (+ 스냅샷) -> {dest_yaml_dir}")
+    dest_yaml_dir.mkdir(parents=True)
+    for source in sorted(data_loader.DATA_DIR.glob("*.yaml")):
+        shutil.copy2(source, dest_yaml_dir / source.name)
+    shutil.copy2(snapshot_path, dest_yaml_dir.with_name(snapshot_path.name))
+
+    return dest_data
+
+
 def cleanup_runtime_copy(dest_ops_agent: Path) -> None:
     """배포 후 runtime 디렉토리에서 복사된 소스 삭제."""
     if dest_ops_agent.exists():
@@ -201,6 +239,7 @@ def deploy_agent(
     logger.info("")
     logger.info("Docker 빌드를 위한 소스 코드 준비 중...")
     dest_ops_agent = copy_source_to_runtime(runtime_dir, project_root)
+    dest_kb_data = copy_kb_data_to_runtime(runtime_dir)
 
     # 배포를 위해 runtime 디렉토리로 이동
     original_dir = os.getcwd()
@@ -223,6 +262,12 @@ def deploy_agent(
             env_vars["BEDROCK_KNOWLEDGE_BASE_ID"] = settings.bedrock_knowledge_base_id
         logger.info(f"KB 환경 변수: KB_MODE={settings.kb_mode}, KB_ID={settings.bedrock_knowledge_base_id}")
 
+        # 동시 실행 제한 환경 변수 추가
+        env_vars["ADMISSION_MAX_IN_FLIGHT"] = str(settings.admission_max_in_flight)
+        env_vars["ADMISSION_MAX_QUEUE"] = str(settings.admission_max_queue)
+        env_vars["ADMISSION_QUEUE_TIMEOUT"] = str(settings.admission_queue_timeout)
+        env_vars["ADMISSION_MAX_PER_SESSION"] = str(settings.admission_max_per_session)
+
         # 배포 설정 (authorizer 없음 = IAM SigV4 인증 사용)
         logger.info("에이전트 배포 설정 중...")
         # Langfuse 사용 시 AWS ADOT 비활성화 필요
@@ -267,8 +312,9 @@ def deploy_agent(
         # 성공 시에만 복사본 정리 (실패 시 디버깅을 위해 유지)
         if deployment_success and not keep_source_copy:
             cleanup_runtime_copy(dest_ops_agent)
+            cleanup_runtime_copy(dest_kb_data)
         elif not deployment_success:
-            logger.info(f"디버깅을 위해 소스 복사본 유지: {dest_ops_agent}")
+            logger.info(f"디버깅을 위해 소스 복사본 유지: {dest_ops_agent}, {dest_kb_data}")
 
 
 def main():
@@ -6,11 +6,14 @@
     uv run python scripts/invoke.py --test simple
     uv run python scripts/invoke.py --test simple --verbose
     uv run python scripts/invoke.py --interactive
+    uv run python scripts/invoke.py bench --concurrency 8 --requests 100 --json report.json
+    uv run python scripts/invoke.py bench --local-url http://127.0.0.1:8080 --rps 5 --csv report.csv
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import logging
 import os
@@ -22,7 +25,7 @@ from pathlib import Path
 import boto3
 from botocore.exceptions import ClientError
 
-from util import AgentCoreClient, Metrics
+from util import AgentCoreClient, AsyncAgentCoreClient, Metrics, run_load
 
 # =============================================================================
 # Configuration
@@ -188,6 +191,87 @@ def run_interactive(client: AgentCoreClient, raw: bool = False) -> None:
             print(f"\nError: {e}\n")
 
 
+def load_corpus(path: str | None) -> list[str]:
+    """벤치마크 프롬프트 코퍼스 로드.
+
+    지원 형식:
+        - .json: 문자열 또는 {"prompt": ...} 객체 배열
+        - .jsonl: 줄마다 {"prompt": ...} 객체
+        - 그 외: 줄마다 프롬프트 하나 (빈 줄, # 주석 무시)
+
+    Args:
+        path: 코퍼스 파일 경로 (없으면 TEST_PROMPTS 사용)
+
+    Returns:
+        프롬프트 목록
+    """
+    if path is None:
+        return list(TEST_PROMPTS.values())
+
+    text = Path(path).read_text(encoding="utf-8")
+    if path.endswith(".json"):
+        items = json.loads(text)
+    elif path.endswith(".jsonl"):
+        items = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        return [line.strip() for line in text.splitlines() if line.strip() and not line.startswith("#")]
+
+    return [item["prompt"] if isinstance(item, dict) else str(item) for item in items]
+
+
+def run_bench(client: AsyncAgentCoreClient, args: argparse.Namespace) -> dict:
+    """부하 테스트 실행 및 리포트 저장.
+
+    Args:
+        client: 비동기 AgentCore 클라이언트
+        args: bench 서브커맨드 인자
+
+    Returns:
+        요약 리포트
+    """
+    prompts = load_corpus(args.corpus)
+    concurrency = None if args.rps else args.concurrency
+
+    logger.info(
+        f"Bench: {args.requests} requests, "
+        f"{f'{args.rps} rps' if args.rps else f'concurrency {concurrency}'}, "
+        f"{len(prompts)} prompts"
+    )
+
+    async def _run():
+        async with client:
+            return await run_load(client, prompts, args.requests, concurrency=concurrency, rps=args.rps)
+
+    report = asyncio.run(_run())
+    summary = report.summary()
+
+    print()
+    print("=" * 70)
+    print("BENCHMARK")
+    print("=" * 70)
+    print(f"Target:     {summary['target']} ({summary['mode']})")
+    print(f"Requests:   {summary['requests']} ({summary['errors']} errors, {summary['error_rate']:.1%})")
+    print(f"Throughput: {summary['throughput_rps']:.2f} req/s over {summary['elapsed']:.2f}s")
+    for name in ("ttft", "total"):
+        stats = summary[name]
+        print(
+            f"{name.upper():<11} p50 {stats['p50']:.3f}s | p90 {stats['p90']:.3f}s | "
+            f"p99 {stats['p99']:.3f}s | max {stats['max']:.3f}s"
+        )
+    for reason, count in summary["errors_by_reason"].items():
+        print(f"Error:      {count}x {reason}")
+    print("=" * 70)
+
+    if args.json:
+        report.write_json(args.json)
+        logger.info(f"JSON report: {args.json}")
+    if args.csv:
+        report.write_csv(args.csv)
+        logger.info(f"CSV report: {args.csv}")
+
+    return summary
+
+
 # =============================================================================
 # CLI
 # =============================================================================
@@ -204,6 +288,8 @@ Examples:
     %(prog)s --test simple
     %(prog)s --test simple --verbose
     %(prog)s --interactive
+    %(prog)s bench --concurrency 8 --requests 100 --json report.json
+    %(prog)s bench --local-url http://127.0.0.1:8080 --rps 5
 """,
     )
 
@@ -215,8 +301,36 @@ Examples:
     parser.add_argument("--raw", action="store_true", help="Show raw SSE events")
     parser.add_argument("-v", "--verbose", action="store_true", help="Show token-by-token with timing")
 
+    subparsers = parser.add_subparsers(dest="command")
+    bench = subparsers.add_parser("bench", help="Replay a prompt corpus and report latency percentiles")
+    bench.add_argument("--corpus", help="Prompt corpus (.txt, .json, .jsonl; default: test prompts)")
+    bench.add_argument("--requests", type=int, default=20, help="Total requests (default: 20)")
+    load = bench.add_mutually_exclusive_group()
+    load.add_argument("--concurrency", type=int, default=4, help="Concurrent streams (default: 4)")
+    load.add_argument("--rps", type=float, help="Target requests per second (open loop)")
+    bench.add_argument("--max-connections", type=int, help="Connection pool size (default: concurrency or 32)")
+    bench.add_argument("--local-url", help="Local BedrockAgentCoreApp URL (e.g. http://127.0.0.1:8080)")
+    bench.add_argument("--json", help="Write JSON report")
+    bench.add_argument("--csv", help="Write per-request CSV report")
+
     args = parser.parse_args()
 
+    if args.command == "bench":
+        pool_size = args.max_connections or (32 if args.rps else args.concurrency)
+        if args.local_url:
+            async_client = AsyncAgentCoreClient.local(args.local_url, pool_size)
+        else:
+            try:
+                arn = resolve_arn(args.region, Path(__file__).parent, args.agent_arn)
+            except ValueError as e:
+                logger.error(str(e))
+                sys.exit(1)
+            async_client = AsyncAgentCoreClient(arn, args.region, pool_size)
+
+        logger.info(f"Agent: {async_client.arn}")
+        summary = run_bench(async_client, args)
+        sys.exit(1 if summary["succeeded"] == 0 else 0)
+
     # Resolve ARN
     try:
         arn = resolve_arn(args.region, Path(__file__).parent, args.agent_arn)
@@ -4,15 +4,29 @@
 - Metrics: 스트리밍 성능 메트릭
 - SSEParser: Server-Sent Events 파서
 - AgentCoreClient: AgentCore Runtime 클라이언트
+- LocalRuntimeClient: 로컬 BedrockAgentCoreApp (/invocations) 클라이언트
+- AsyncAgentCoreClient: 연결 풀을 공유하는 asyncio 클라이언트 (동시 호출/부하 테스트)
+- BenchReport / run_load: 부하 생성 및 지연 시간 집계
 """
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import csv
+import itertools
 import json
+import math
 import time
+import urllib.error
+import urllib.request
 import uuid
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Generator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Generator
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import boto3
 from botocore.config import Config
@@ -80,11 +94,17 @@ class Metrics:
 
 
 class SSEParser:
-    """Buffer-based SSE 파서.
+    """Offset 기반 증분 SSE 파서.
 
     Server-Sent Events 형식의 스트림을 파싱합니다.
     청크가 불완전하게 도착해도 버퍼링하여 올바르게 처리합니다.
 
+    구현:
+        - bytearray 버퍼에 누적하고 새로 들어온 구간에서만 구분자 검색
+        - 완성된 이벤트 구간을 한 번에 UTF-8 디코딩 (청크 경계에서 잘린 멀티바이트 문자도 안전)
+        - "content"가 없는 이벤트는 JSON 파싱 생략
+        - 중복 제거는 SSE id 기준, 최근 dedup_window개만 보관 (id 없는 이벤트는 그대로 전달)
+
     Example:
         parser = SSEParser()
         for chunk in stream:
@@ -94,75 +114,139 @@ class SSEParser:
             print(text, end="")
     """
 
-    DELIMITER = "\n\n"
+    DELIMITER = b"\n\n"
+    DEDUP_WINDOW = 1024
 
-    def __init__(self) -> None:
-        self._buffer = ""
-        self._seen: set[str] = set()  # 중복 제거용
+    _decoder = json.JSONDecoder()
 
-    def feed(self, chunk: str) -> Generator[str, None, None]:
-        """청크 파싱 후 텍스트 yield.
+    def __init__(self, dedup_window: int = DEDUP_WINDOW) -> None:
+        """파서 초기화.
 
         Args:
-            chunk: SSE 청크 문자열
+            dedup_window: 중복 확인용으로 보관할 최근 이벤트 id 수
+        """
+        self._buffer = bytearray()
+        self._scan_from = 0  # 다음 구분자 검색 시작 위치 (이미 검색한 구간 재검색 방지)
+        self._dedup_window = dedup_window
+        self._seen_ids: OrderedDict[str, None] = OrderedDict()
+        self.error: dict | None = None  # 스트림 중 전달된 마지막 오류 이벤트
 
-        Yields:
-            추출된 텍스트 콘텐츠
+    def feed(self, chunk: bytes | str) -> list[str]:
+        """청크 파싱 후 완성된 이벤트의 텍스트 반환.
+
+        Args:
+            chunk: SSE 청크 (bytes 권장, str도 허용)
+
+        Returns:
+            추출된 텍스트 콘텐츠 목록
         """
-        self._buffer += chunk
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
 
-        while self.DELIMITER in self._buffer:
-            event_str, self._buffer = self._buffer.split(self.DELIMITER, 1)
-            text = self._extract_text(event_str)
-            if text and text not in self._seen:
-                self._seen.add(text)
-                yield text
+        buffer = self._buffer
+        buffer += chunk
 
-    def flush(self) -> Generator[str, None, None]:
-        """남은 버퍼 처리.
+        end = buffer.rfind(self.DELIMITER, self._scan_from)
+        if end < 0:
+            # 구분자가 청크 경계에 걸칠 수 있으므로 마지막 1바이트부터 다시 검색
+            self._scan_from = max(0, len(buffer) - len(self.DELIMITER) + 1)
+            return []
 
-        Yields:
-            추출된 텍스트 콘텐츠
+        # 완성된 이벤트 구간만 디코딩하고 버퍼에서 제거 (남은 미완성 이벤트만 유지)
+        block = buffer[:end].decode("utf-8", errors="replace")
+        del buffer[:end + len(self.DELIMITER)]
+        self._scan_from = max(0, len(buffer) - len(self.DELIMITER) + 1)
+
+        texts: list[str] = []
+        for event in block.split("\n\n"):
+            text = self._extract_text(event)
+            if text:
+                texts.append(text)
+        return texts
+
+    def flush(self) -> list[str]:
+        """남은 버퍼 처리 및 상태 초기화.
+
+        Returns:
+            추출된 텍스트 콘텐츠 목록
         """
+        texts: list[str] = []
         if self._buffer.strip():
-            text = self._extract_text(self._buffer)
-            if text and text not in self._seen:
-                yield text
-        self._buffer = ""
-        self._seen.clear()
-
-    def _extract_text(self, event_str: str) -> str | None:
+            text = self._extract_text(self._buffer.decode("utf-8", errors="replace"))
+            if text:
+                texts.append(text)
+        self._buffer.clear()
+        self._scan_from = 0
+        self._seen_ids.clear()
+        return texts
+
+    def _extract_text(self, event: str) -> str | None:
         """SSE 이벤트에서 텍스트 추출.
 
         지원 형식:
             - data: {"type": "delta", "content": "..."}
             - data: {"type": "text", "content": "..."}
+            - id: <event id> (선택, 중복 제거용)
 
         Args:
-            event_str: SSE 이벤트 문자열
+            event: SSE 이벤트 문자열 (구분자 제외)
 
         Returns:
             추출된 텍스트 또는 None
         """
-        # data: 프리픽스 추출
-        data = ""
-        for line in event_str.split("\n"):
-            line = line.strip()
-            if line.startswith("data:"):
-                data += line[6:] if line.startswith("data: ") else line[5:]
-
-        if not data:
+        event_id: str | None = None
+
+        if event.startswith("data: ") and "\n" not in event:
+            # 가장 흔한 형식 (data 한 줄)은 줄 분리 생략
+            data = event[6:]
+        else:
+            data_lines: list[str] = []
+            for line in event.split("\n"):
+                line = line.strip()
+                if line.startswith("data:"):
+                    data_lines.append(line[6:] if line.startswith("data: ") else line[5:])
+                elif line.startswith("id:"):
+                    event_id = line[3:].strip()
+            if not data_lines:
+                return None
+            data = "\n".join(data_lines)
+
+        # 텍스트/오류 이벤트가 아니면 JSON 파싱 생략
+        if '"content"' not in data:
+            if '"error"' in data:
+                self._record_error(data)
+            return None
+
+        if event_id is not None and self._is_duplicate(event_id):
             return None
 
         try:
-            obj = json.loads(data)
-            if obj.get("type") in ("delta", "text"):
-                return obj.get("content")
+            obj, _ = self._decoder.raw_decode(data.strip())
         except json.JSONDecodeError:
-            pass
+            return None
 
+        if isinstance(obj, dict) and obj.get("type") in ("delta", "text"):
+            return obj.get("content")
         return None
 
+    def _record_error(self, data: str) -> None:
+        """{"error": ...} 이벤트 기록 (entrypoint의 과부하/처리 오류)."""
+        try:
+            obj, _ = self._decoder.raw_decode(data.strip())
+        except json.JSONDecodeError:
+            return
+        if isinstance(obj, dict) and "error" in obj:
+            self.error = obj
+
+    def _is_duplicate(self, event_id: str) -> bool:
+        """최근 id 목록으로 중복 여부 확인 (목록은 dedup_window개로 제한)."""
+        if event_id in self._seen_ids:
+            return True
+        self._seen_ids[event_id] = None
+        if len(self._seen_ids) > self._dedup_window:
+            self._seen_ids.popitem(last=False)
+        return False
+
 
 # =============================================================================
 # AgentCore Client
@@ -180,15 +264,25 @@ class AgentCoreClient:
             print(token, end="")
     """
 
-    def __init__(self, arn: str, region: str) -> None:
+    def __init__(
+        self,
+        arn: str,
+        region: str,
+        max_pool_connections: int = 10,
+        endpoint_url: str | None = None,
+    ) -> None:
         """클라이언트 초기화.
 
         Args:
             arn: AgentCore Runtime ARN
             region: AWS 리전
+            max_pool_connections: HTTP 연결 풀 크기
+            endpoint_url: 엔드포인트 재정의 (로컬 테스트용)
         """
         self.arn = arn
         self.region = region
+        self.max_pool_connections = max_pool_connections
+        self.endpoint_url = endpoint_url
         self._client: BedrockAgentRuntimeClient | None = None
 
     @property
@@ -198,7 +292,13 @@ class AgentCoreClient:
             self._client = boto3.client(
                 "bedrock-agentcore",
                 region_name=self.region,
-                config=Config(read_timeout=900, connect_timeout=60, retries={"max_attempts": 3}),
+                endpoint_url=self.endpoint_url,
+                config=Config(
+                    read_timeout=900,
+                    connect_timeout=60,
+                    retries={"max_attempts": 3},
+                    max_pool_connections=self.max_pool_connections,
+                ),
             )
         return self._client
 
@@ -221,10 +321,47 @@ class AgentCoreClient:
         Raises:
             RuntimeError: API 호출 실패 시
         """
-        session_id = session_id or str(uuid.uuid4())
+        response = self.invoke(prompt, session_id or str(uuid.uuid4()))
+
+        if "response" not in response:
+            return
+
+        parser = SSEParser()
+        # raw 모드: 청크 경계에서 잘린 UTF-8 문자를 다음 청크와 이어서 디코딩
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
 
+        for event in response["response"]:
+            chunk = self._chunk_bytes(event)
+
+            if raw:
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+            else:
+                yield from parser.feed(chunk)
+
+        if raw:
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+        else:
+            yield from parser.flush()
+
+    def invoke(self, prompt: str, session_id: str) -> dict:
+        """invoke_agent_runtime 호출 (응답 스트림은 읽지 않음).
+
+        Args:
+            prompt: 사용자 프롬프트
+            session_id: 세션 ID
+
+        Returns:
+            boto3 응답 (response: 스트리밍 본문)
+
+        Raises:
+            RuntimeError: API 호출 실패 시
+        """
         try:
-            response = self.client.invoke_agent_runtime(
+            return self.client.invoke_agent_runtime(
                 agentRuntimeArn=self.arn,
                 runtimeSessionId=session_id,
                 payload=json.dumps({"prompt": prompt}),
@@ -238,21 +375,20 @@ class AgentCoreClient:
                 raise RuntimeError("접근 거부") from e
             raise RuntimeError(f"호출 실패: {msg}") from e
 
-        if "response" not in response:
-            return
-
-        parser = SSEParser()
+    def _chunk_bytes(self, event: dict | bytes) -> bytes:
+        """이벤트에서 원시 바이트 추출 (디코딩은 파서/증분 디코더에서 수행).
 
-        for event in response["response"]:
-            chunk = self._decode(event)
-
-            if raw:
-                yield chunk
-            else:
-                yield from parser.feed(chunk)
+        Args:
+            event: 원시 이벤트
 
-        if not raw:
-            yield from parser.flush()
+        Returns:
+            청크 바이트
+        """
+        if isinstance(event, dict) and "chunk" in event and "bytes" in event["chunk"]:
+            return event["chunk"]["bytes"]
+        if isinstance(event, (bytes, bytearray)):
+            return bytes(event)
+        return self._decode(event).encode("utf-8")
 
     def _decode(self, event: dict | bytes) -> str:
         """이벤트 디코딩.
@@ -272,3 +408,417 @@ class AgentCoreClient:
         if isinstance(event, bytes):
             return event.decode("utf-8", errors="replace")
         return str(event)
+
+
+class LocalRuntimeClient:
+    """로컬 BedrockAgentCoreApp 클라이언트.
+
+    `python agentcore/runtime/entrypoint.py`로 실행한 앱의 /invocations를 호출합니다.
+    AgentCoreClient.invoke와 같은 형식의 응답을 반환하므로 AsyncAgentCoreClient의
+    전송 계층으로 사용할 수 있습니다 (AWS 자격 증명 불필요).
+
+    Example:
+        client = AsyncAgentCoreClient.local("http://127.0.0.1:8080")
+    """
+
+    CHUNK_SIZE = 8192
+
+    def __init__(self, url: str, timeout: float = 900) -> None:
+        """클라이언트 초기화.
+
+        Args:
+            url: 앱 주소 (예: http://127.0.0.1:8080)
+            timeout: 응답 대기 시간 (초)
+        """
+        self.arn = url.rstrip("/")
+        self.timeout = timeout
+
+    def invoke(self, prompt: str, session_id: str) -> dict:
+        """/invocations 호출 (응답 스트림은 읽지 않음).
+
+        Args:
+            prompt: 사용자 프롬프트
+            session_id: 세션 ID
+
+        Returns:
+            {"response": 청크 바이트 이터레이터}
+
+        Raises:
+            RuntimeError: 호출 실패 시
+        """
+        request = urllib.request.Request(
+            f"{self.arn}/invocations",
+            data=json.dumps({"prompt": prompt, "session_id": session_id}).encode("utf-8"),
+            headers={
+                "Content-Type": "application/json",
+                "X-Amzn-Bedrock-AgentCore-Runtime-Session-Id": session_id,
+            },
+            method="POST",
+        )
+        try:
+            response = urllib.request.urlopen(request, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            raise RuntimeError(f"호출 실패: HTTP {e.code}") from e
+        except urllib.error.URLError as e:
+            raise RuntimeError(f"호출 실패: {e.reason}") from e
+
+        return {"response": self._iter_chunks(response)}
+
+    def _iter_chunks(self, response) -> Iterator[bytes]:
+        """응답 본문을 도착하는 대로 청크 단위로 반환."""
+        with response:
+            while chunk := response.read1(self.CHUNK_SIZE):
+                yield chunk
+
+    def _chunk_bytes(self, event: bytes) -> bytes:
+        """청크는 이미 바이트."""
+        return event
+
+
+# =============================================================================
+# Async AgentCore Client
+# =============================================================================
+
+
+@dataclass
+class StreamResult:
+    """비동기 호출 결과.
+
+    Attributes:
+        prompt: 사용자 프롬프트
+        session_id: 세션 ID
+        text: 수신한 전체 텍스트
+        metrics: 스트림별 메트릭
+        error: 실패 시 오류 메시지
+    """
+
+    prompt: str
+    session_id: str
+    text: str = ""
+    metrics: Metrics = field(default_factory=Metrics)
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """성공 여부."""
+        return self.error is None
+
+
+class AsyncAgentCoreClient:
+    """연결 풀을 공유하는 asyncio AgentCore 클라이언트.
+
+    boto3 클라이언트 하나(연결 풀 max_pool_connections개)를 공유하고,
+    블로킹 호출과 스트림 읽기는 같은 크기의 스레드 풀에서 실행합니다.
+    동시 스트림 수는 연결 풀 크기로 제한되어 연결이 풀 밖에서 생성되지 않습니다.
+
+    Example:
+        async with AsyncAgentCoreClient(arn, region, max_pool_connections=20) as client:
+            results = await client.run_many(prompts)
+            for result in results:
+                print(result.metrics)
+    """
+
+    def __init__(
+        self,
+        arn: str,
+        region: str,
+        max_pool_connections: int = 10,
+        endpoint_url: str | None = None,
+        transport: AgentCoreClient | LocalRuntimeClient | None = None,
+    ) -> None:
+        """클라이언트 초기화.
+
+        Args:
+            arn: AgentCore Runtime ARN
+            region: AWS 리전
+            max_pool_connections: HTTP 연결 풀 크기 (= 최대 동시 스트림 수)
+            endpoint_url: 엔드포인트 재정의 (로컬 테스트용)
+            transport: 블로킹 호출에 사용할 클라이언트 (기본: AgentCoreClient)
+        """
+        self.max_pool_connections = max_pool_connections
+        self._sync = transport or AgentCoreClient(arn, region, max_pool_connections, endpoint_url)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_pool_connections,
+            thread_name_prefix="agentcore",
+        )
+        self._slots = asyncio.Semaphore(max_pool_connections)
+
+    @classmethod
+    def local(cls, url: str, max_pool_connections: int = 10) -> AsyncAgentCoreClient:
+        """로컬 BedrockAgentCoreApp을 호출하는 클라이언트 생성.
+
+        Args:
+            url: 앱 주소 (예: http://127.0.0.1:8080)
+            max_pool_connections: 최대 동시 스트림 수
+
+        Returns:
+            AsyncAgentCoreClient
+        """
+        return cls(url, "local", max_pool_connections, transport=LocalRuntimeClient(url))
+
+    @property
+    def arn(self) -> str:
+        """AgentCore Runtime ARN (로컬이면 앱 주소)."""
+        return self._sync.arn
+
+    async def stream(
+        self,
+        prompt: str,
+        session_id: str | None = None,
+        raw: bool = False,
+        metrics: Metrics | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """비동기 스트리밍 호출.
+
+        Args:
+            prompt: 사용자 프롬프트
+            session_id: 세션 ID (없으면 자동 생성)
+            raw: True면 원시 청크 반환
+            metrics: 토큰 수신을 기록할 메트릭 (선택)
+
+        Yields:
+            텍스트 토큰 또는 원시 청크
+
+        Raises:
+            RuntimeError: API 호출 실패 또는 스트림에 오류 이벤트가 전달된 경우
+        """
+        session_id = session_id or str(uuid.uuid4())
+        loop = asyncio.get_running_loop()
+
+        async with self._slots:
+            response = await loop.run_in_executor(self._executor, self._sync.invoke, prompt, session_id)
+            body = response.get("response")
+            if body is None:
+                return
+
+            parser = SSEParser()
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            chunks = iter(body)
+
+            try:
+                while True:
+                    event = await loop.run_in_executor(self._executor, next, chunks, None)
+                    if event is None:
+                        break
+
+                    chunk = self._sync._chunk_bytes(event)
+                    tokens = [decoder.decode(chunk)] if raw else parser.feed(chunk)
+                    for token in tokens:
+                        if token:
+                            if metrics is not None:
+                                metrics.record_token()
+                            yield token
+
+                for token in [decoder.decode(b"", final=True)] if raw else parser.flush():
+                    if token:
+                        if metrics is not None:
+                            metrics.record_token()
+                        yield token
+
+                if parser.error is not None:
+                    raise RuntimeError(str(parser.error.get("error")))
+            finally:
+                if hasattr(body, "close"):
+                    body.close()
+
+    async def run(self, prompt: str, session_id: str | None = None) -> StreamResult:
+        """프롬프트 하나를 끝까지 실행하고 결과 반환 (실패도 결과로 반환).
+
+        Args:
+            prompt: 사용자 프롬프트
+            session_id: 세션 ID (없으면 자동 생성)
+
+        Returns:
+            StreamResult
+        """
+        result = StreamResult(prompt=prompt, session_id=session_id or str(uuid.uuid4()))
+        tokens: list[str] = []
+
+        try:
+            async for token in self.stream(prompt, result.session_id, metrics=result.metrics):
+                tokens.append(token)
+        except Exception as e:
+            result.error = str(e)
+
+        result.metrics.finish()
+        result.text = "".join(tokens)
+        return result
+
+    async def run_many(self, prompts: Iterable[str]) -> list[StreamResult]:
+        """여러 프롬프트를 동시에 실행 (동시 스트림 수는 연결 풀 크기로 제한).
+
+        Args:
+            prompts: 사용자 프롬프트 목록
+
+        Returns:
+            입력 순서와 같은 StreamResult 목록
+        """
+        return list(await asyncio.gather(*(self.run(prompt) for prompt in prompts)))
+
+    def close(self) -> None:
+        """스레드 풀 종료."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self) -> AsyncAgentCoreClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+
+# =============================================================================
+# Load Benchmark
+# =============================================================================
+
+
+def percentile(values: list[float], q: float) -> float:
+    """선형 보간 백분위수.
+
+    Args:
+        values: 측정값 목록
+        q: 백분위 (0~100)
+
+    Returns:
+        백분위수 (값이 없으면 0.0)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+@dataclass
+class BenchReport:
+    """부하 테스트 결과.
+
+    Attributes:
+        results: 요청별 결과 (실행 순서)
+        elapsed: 전체 소요 시간 (초)
+        mode: "concurrency" 또는 "rps"
+        target: 목표 동시 실행 수 또는 RPS
+    """
+
+    results: list[StreamResult]
+    elapsed: float
+    mode: str
+    target: float
+
+    def summary(self) -> dict:
+        """p50/p90/p99 TTFT·총 지연 시간과 오류율 집계 (지연 시간은 성공한 요청만)."""
+        succeeded = [r for r in self.results if r.ok]
+        errors: dict[str, int] = {}
+        for r in self.results:
+            if not r.ok:
+                errors[r.error] = errors.get(r.error, 0) + 1
+
+        def latency(values: list[float]) -> dict:
+            return {
+                "p50": round(percentile(values, 50), 4),
+                "p90": round(percentile(values, 90), 4),
+                "p99": round(percentile(values, 99), 4),
+                "mean": round(sum(values) / len(values), 4) if values else 0.0,
+                "max": round(max(values), 4) if values else 0.0,
+            }
+
+        total = len(self.results)
+        return {
+            "mode": self.mode,
+            "target": self.target,
+            "requests": total,
+            "succeeded": len(succeeded),
+            "errors": total - len(succeeded),
+            "error_rate": round((total - len(succeeded)) / total, 4) if total else 0.0,
+            "elapsed": round(self.elapsed, 4),
+            "throughput_rps": round(total / self.elapsed, 4) if self.elapsed > 0 else 0.0,
+            "ttft": latency([r.metrics.ttft for r in succeeded]),
+            "total": latency([r.metrics.total for r in succeeded]),
+            "tokens": sum(r.metrics.tokens for r in succeeded),
+            "errors_by_reason": errors,
+        }
+
+    def write_json(self, path: str | Path) -> None:
+        """요약과 요청별 결과를 JSON으로 저장."""
+        report = {"summary": self.summary(), "requests": self._rows()}
+        Path(path).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def write_csv(self, path: str | Path) -> None:
+        """요청별 결과를 CSV로 저장."""
+        rows = self._rows()
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=["index", "session_id", "prompt", "ok", "ttft", "total", "tokens", "error"])
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def _rows(self) -> list[dict]:
+        return [
+            {
+                "index": i,
+                "session_id": r.session_id,
+                "prompt": r.prompt,
+                "ok": r.ok,
+                "ttft": round(r.metrics.ttft, 4) if r.ok else None,
+                "total": round(r.metrics.total, 4),
+                "tokens": r.metrics.tokens,
+                "error": r.error,
+            }
+            for i, r in enumerate(self.results)
+        ]
+
+
+async def run_load(
+    client: AsyncAgentCoreClient,
+    prompts: list[str],
+    requests: int,
+    concurrency: int | None = None,
+    rps: float | None = None,
+) -> BenchReport:
+    """프롬프트 코퍼스를 반복 재생하여 부하 생성.
+
+    - concurrency: 동시 실행 수를 유지 (closed loop)
+    - rps: 응답과 무관하게 일정 간격으로 요청 시작 (open loop, 대기 시간도 지연에 포함)
+
+    Args:
+        client: 비동기 클라이언트
+        prompts: 프롬프트 코퍼스 (requests보다 적으면 순환)
+        requests: 총 요청 수
+        concurrency: 목표 동시 실행 수
+        rps: 목표 초당 요청 수
+
+    Returns:
+        BenchReport
+
+    Raises:
+        ValueError: concurrency와 rps가 둘 다 없거나 둘 다 지정된 경우
+    """
+    if (concurrency is None) == (rps is None):
+        raise ValueError("concurrency와 rps 중 하나만 지정하세요")
+    if not prompts:
+        raise ValueError("프롬프트 코퍼스가 비어 있습니다")
+
+    corpus = list(itertools.islice(itertools.cycle(prompts), requests))
+    results: list[StreamResult | None] = [None] * len(corpus)
+    started = time.perf_counter()
+
+    if rps is not None:
+        async def scheduled(index: int) -> None:
+            await asyncio.sleep(max(0.0, started + index / rps - time.perf_counter()))
+            results[index] = await client.run(corpus[index])
+
+        await asyncio.gather(*(scheduled(i) for i in range(len(corpus))))
+    else:
+        indexes = iter(range(len(corpus)))
+
+        async def worker() -> None:
+            for index in indexes:
+                results[index] = await client.run(corpus[index])
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return BenchReport(
+        results=results,
+        elapsed=time.perf_counter() - started,
+        mode="rps" if rps is not None else "concurrency",
+        target=rps if rps is not None else concurrency,
+    )
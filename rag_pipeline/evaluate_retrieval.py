@@ -13,15 +13,33 @@
     uv run python rag_pipeline/evaluate_retrieval.py --dataset refrigerator --rag --query "에러코드 22E가 뭐야?"
     uv run python rag_pipeline/evaluate_retrieval.py --dataset refrigerator --rag --category diagnostics
     uv run python rag_pipeline/evaluate_retrieval.py --dataset refrigerator --rag --limit 2
+
+    # 동시 실행 수 / 응답 캐시 / JSON 결과
+    uv run python rag_pipeline/evaluate_retrieval.py --dataset refrigerator --workers 16 --json eval.json
+    uv run python rag_pipeline/evaluate_retrieval.py --dataset refrigerator --no-cache
+
+동시 실행과 캐시:
+    테스트 케이스는 --workers 개의 스레드에서 동시에 실행되고, 스로틀링 오류는 지수 백오프로
+    재시도합니다. 응답은 (kb_id, 최근 ingestion job, query, filter) 키로
+    data/RAG/<dataset>_yaml.retrieval_cache.json에 캐싱되므로 같은 테스트셋 재실행은 API를
+    호출하지 않습니다. KB를 다시 동기화하면 ingestion job이 바뀌어 캐시가 자동으로 무효화됩니다.
 """
 
 import argparse
+import functools
 import json
 import os
+import random
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 import yaml
+from botocore.config import Config
+from botocore.exceptions import ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotoConnectionError
 
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.join(CURRENT_DIR, "..")
@@ -30,6 +48,26 @@ DATASETS_CONFIG = os.path.join(CURRENT_DIR, "datasets.yaml")
 # Add project root to path for settings import
 sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
 
+# Concurrency / retry
+DEFAULT_WORKERS = 8
+NUM_RESULTS = 5
+MAX_RETRIES = 5
+BACKOFF_BASE = 0.5          # 재시도 대기 (초): BACKOFF_BASE * 2^attempt (+ jitter)
+BACKOFF_MAX = 20.0
+THROTTLE_ERRORS = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ServiceUnavailableException",
+}
+# 일시적 서버 오류 (5xx 계열)
+TRANSIENT_ERRORS = {
+    "InternalServerException",
+    "BadGatewayException",
+    "DependencyFailedException",
+}
+# 연결 실패/끊김, 연결/읽기 타임아웃 (EndpointConnectionError, ReadTimeoutError 등)
+NETWORK_ERRORS = (BotoConnectionError, HTTPClientError)
+
 
 def load_dataset_config(dataset_name):
     """datasets.yaml에서 데이터셋 설정 로드."""
@@ -432,6 +470,332 @@ def evaluate_result(results, expected_ids):
     return top1, top3, top5
 
 
+# ─── Concurrent evaluation engine ───────────────────────────────────────────
+
+
+def is_retryable_error(error):
+    """재시도 대상 여부: 스로틀링, 일시적 서버 오류 (5xx), 네트워크 오류."""
+    if isinstance(error, NETWORK_ERRORS):
+        return True
+    code = error.response.get("Error", {}).get("Code") if isinstance(error, ClientError) else None
+    return code in THROTTLE_ERRORS or code in TRANSIENT_ERRORS
+
+
+def call_with_retry(fn, *args, max_retries=MAX_RETRIES, backoff=None, timing=None, **kwargs):
+    """일시적 오류를 지수 백오프 (jitter)로 재시도하며 fn 호출.
+
+    Args:
+        timing: dict를 넘기면 재시도 횟수 ("retries")와 마지막 시도의 소요 시간
+            ("latency", 초, 백오프 대기 제외)을 기록
+    """
+    backoff = BACKOFF_BASE if backoff is None else backoff
+    for attempt in range(max_retries + 1):
+        started = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except (ClientError, *NETWORK_ERRORS) as e:
+            if timing is not None:
+                timing["retries"] = attempt
+            if not is_retryable_error(e) or attempt == max_retries:
+                raise
+            delay = min(BACKOFF_MAX, backoff * 2 ** attempt)
+            time.sleep(delay * random.uniform(0.5, 1.0))
+            continue
+        if timing is not None:
+            timing.update(retries=attempt, latency=time.perf_counter() - started)
+        return result
+
+
+class ResponseCache:
+    """KB 응답 캐시 (스레드 안전, path가 있으면 JSON 파일로 저장).
+
+    키는 cache_key()로 만든 문자열이며 값은 JSON 직렬화 가능한 응답입니다.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._data = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self._data = json.load(f)
+
+    @staticmethod
+    def key(*parts):
+        """캐시 키 (부분 값들의 JSON 배열)."""
+        return json.dumps(parts, ensure_ascii=False)
+
+    def get_or_call(self, key, fn):
+        """캐시에 있으면 반환, 없으면 fn() 결과를 저장 후 반환.
+
+        Returns:
+            (값, 캐시 적중 여부)
+        """
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                return self._data[key], True
+        value = fn()
+        with self._lock:
+            self._data[key] = value
+            self.misses += 1
+        return value, False
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def evict_other_versions(self, kb_id, kb_version):
+        """키의 (kb_id, KB 버전)이 현재와 다른 항목 삭제 (이전 ingestion job 응답).
+
+        키는 [모드, kb_id, KB 버전, ...] 형식입니다 (cached_search의 key_parts).
+
+        Returns:
+            삭제한 항목 수
+        """
+        current = [kb_id, kb_version]
+        with self._lock:
+            stale = [key for key in self._data if json.loads(key)[1:3] != current]
+            for key in stale:
+                del self._data[key]
+        return len(stale)
+
+    def save(self):
+        """파일에 저장 (임시 파일 + os.replace)."""
+        if not self.path:
+            return
+        with self._lock:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+
+
+def get_cache_path(ds_config):
+    """데이터셋 응답 캐시 파일 경로 (data/RAG/<dataset>_yaml.retrieval_cache.json)."""
+    yaml_dir = os.path.normpath(os.path.join(PROJECT_ROOT, ds_config["yaml_dir"]))
+    return f"{yaml_dir}.retrieval_cache.json"
+
+
+def get_kb_version(ds_config, kb_id):
+    """캐시 무효화용 KB 버전 (가장 최근 ingestion job ID, 조회 실패 시 빈 문자열).
+
+    KB를 다시 동기화하면 새 ingestion job이 생기므로 이전 응답 캐시를 사용하지 않습니다.
+    """
+    ds_id = ds_config.get("ds_id", "")
+    if not ds_id:
+        return ""
+    try:
+        response = boto3.client("bedrock-agent").list_ingestion_jobs(
+            knowledgeBaseId=kb_id,
+            dataSourceId=ds_id,
+            sortBy={"attribute": "STARTED_AT", "order": "DESCENDING"},
+            maxResults=1,
+        )
+    except Exception as e:
+        print(f"  WARNING: ingestion job 조회 실패 — 캐시가 KB 재동기화를 감지하지 못합니다 ({e})")
+        return ""
+    jobs = response.get("ingestionJobSummaries", [])
+    return jobs[0]["ingestionJobId"] if jobs else ""
+
+
+def create_agent_runtime_client(workers=DEFAULT_WORKERS, region=None):
+    """bedrock-agent-runtime 클라이언트.
+
+    재시도 (스로틀링/5xx/네트워크 오류)는 call_with_retry가 처리하므로 botocore 재시도는 끕니다.
+    """
+    return boto3.client(
+        "bedrock-agent-runtime",
+        region_name=region,
+        config=Config(
+            max_pool_connections=max(10, workers),
+            retries={"max_attempts": 1, "mode": "standard"},
+        ),
+    )
+
+
+def cached_search(fn, cache=None, key_parts=()):
+    """재시도 + 응답 캐시를 적용한 검색 함수 생성.
+
+    Args:
+        fn: fn(query=..., category_filter=...) 형태의 KB 호출 (query_kb / query_kb_rag partial)
+        cache: ResponseCache (None이면 캐시 없이 매번 호출)
+        key_parts: 캐시 키 앞부분 (모드, kb_id, KB 버전, 검색 설정 등)
+
+    Returns:
+        (query, category_filter, timing=None) → (응답, 캐시 적중 여부) 함수
+        (timing은 call_with_retry 참고, 캐시 적중 시 기록되지 않음)
+    """
+    def search(query, category_filter, timing=None):
+        def call():
+            return call_with_retry(fn, query=query, category_filter=category_filter, timing=timing)
+
+        if cache is None:
+            return call(), False
+        return cache.get_or_call(ResponseCache.key(*key_parts, query, category_filter), call)
+
+    return search
+
+
+def run_cases(cases, search, workers=DEFAULT_WORKERS, use_filter=False):
+    """테스트 케이스를 동시에 실행하고 케이스 순서대로 결과를 yield.
+
+    Args:
+        cases: (query, expected_ids, category, description) 목록
+        search: (query, category_filter, timing) → (응답, 캐시 적중 여부) 함수
+        use_filter: 카테고리 메타데이터 필터 적용 여부 ("cross"는 필터 없음)
+
+    Yields:
+        {"case", "response", "error", "latency", "retries", "cached"}
+        (latency는 마지막 시도의 소요 시간으로, 재시도 백오프 대기는 포함하지 않음)
+    """
+    def run(case):
+        query, _, category, _ = case
+        cat_filter = category if use_filter and category != "cross" else None
+        timing = {}
+        started = time.perf_counter()
+        try:
+            response, cached = search(query, cat_filter, timing)
+            error = None
+        except Exception as e:
+            response, cached, error = None, False, str(e)
+        return {
+            "case": case,
+            "response": response,
+            "error": error,
+            "latency": timing.get("latency", time.perf_counter() - started),
+            "retries": timing.get("retries", 0),
+            "cached": cached,
+        }
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="eval") as pool:
+        # map은 제출 순서대로 결과를 돌려주므로 출력 순서가 유지됨
+        yield from pool.map(run, cases)
+
+
+def percentile(values, pct):
+    """선형 보간 백분위수 (값이 없으면 None)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def latency_stats(records):
+    """API를 실제로 호출한 (캐시 미적중, 성공) 요청의 지연 통계 (ms).
+
+    재시도된 요청은 마지막 (성공한) 시도만 포함합니다. 재시도 횟수는 count_retries()로 따로 집계합니다.
+    """
+    latencies = [r["latency"] * 1000 for r in records if not r["cached"] and r["error"] is None]
+    stats = {"count": len(latencies)}
+    if latencies:
+        stats.update({
+            "p50": percentile(latencies, 50),
+            "p90": percentile(latencies, 90),
+            "p99": percentile(latencies, 99),
+            "mean": sum(latencies) / len(latencies),
+            "max": max(latencies),
+        })
+    return stats
+
+
+def count_retries(records):
+    """전체 재시도 횟수 (스로틀링/일시적 오류)."""
+    return sum(r.get("retries", 0) for r in records)
+
+
+def summarize_records(records):
+    """Retrieve 평가 결과 집계 (top-1/3/5 정확도, 카테고리별, 실패 목록, 지연)."""
+    summary = {
+        "total": 0,
+        "top1_correct": 0,
+        "top3_correct": 0,
+        "top5_correct": 0,
+        "by_category": {},
+        "failures": [],
+        "cache_hits": sum(1 for r in records if r["cached"]),
+        "latency_ms": latency_stats(records),
+        "retries": count_retries(records),
+    }
+
+    for record in records:
+        query, expected_ids, category, _ = record["case"]
+        cat_stats = summary["by_category"].setdefault(category, {"total": 0, "top1": 0, "top3": 0, "top5": 0})
+        summary["total"] += 1
+        cat_stats["total"] += 1
+
+        if record["error"] is not None:
+            summary["failures"].append((query, category, record["error"]))
+            continue
+
+        results = record["response"]
+        top1, top3, top5 = evaluate_result(results, expected_ids)
+        for hit, key in ((top1, "top1"), (top3, "top3"), (top5, "top5")):
+            if hit:
+                summary[f"{key}_correct"] += 1
+                cat_stats[key] += 1
+        if not top5:
+            actual = results[0]["doc_id"] if results else "none"
+            summary["failures"].append((query, category, f"got {actual}"))
+
+    return summary
+
+
+def format_latency(stats):
+    """지연 통계 한 줄 요약."""
+    if not stats.get("count"):
+        return "API 호출 없음 (전체 캐시)"
+    return (f"p50 {stats['p50']:.0f}ms / p90 {stats['p90']:.0f}ms / p99 {stats['p99']:.0f}ms"
+            f" / max {stats['max']:.0f}ms ({stats['count']}건)")
+
+
+def open_cache(args, ds_config, kb_id):
+    """CLI 옵션에 따라 응답 캐시와 KB 버전 반환 (--no-cache면 (None, "")).
+
+    KB 버전을 알 수 있으면 다른 kb_id/버전의 캐시 항목은 버려 파일이 계속 커지지 않게 합니다.
+    """
+    if args.no_cache:
+        return None, ""
+    cache = ResponseCache(get_cache_path(ds_config))
+    if args.clear_cache:
+        cache.clear()
+    kb_version = get_kb_version(ds_config, kb_id)
+    if kb_version:
+        evicted = cache.evict_other_versions(kb_id, kb_version)
+        if evicted:
+            print(f"  이전 KB 버전 캐시 {evicted}개 삭제")
+    return cache, kb_version
+
+
+def write_json_report(path, summary, records):
+    """평가 결과를 JSON 파일로 저장 (튜닝 실행 간 비교용)."""
+    report = {
+        "summary": summary,
+        "cases": [
+            {
+                "query": r["case"][0],
+                "expected": r["case"][1],
+                "category": r["case"][2],
+                "description": r["case"][3],
+                "response": r["response"],
+                "error": r["error"],
+                "latency_ms": r["latency"] * 1000,
+                "retries": r.get("retries", 0),
+                "cached": r["cached"],
+            }
+            for r in records
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"  결과 저장: {path}")
+
+
 # ─── RetrieveAndGenerate (RAG) ──────────────────────────────────────────────
 
 
@@ -558,7 +922,7 @@ def query_kb_rag(client, kb_id, query, model_arn, num_results=5,
 def run_rag_mode(args, ds_config, kb_id):
     """RAG 모드 실행: RetrieveAndGenerate로 전체 답변 테스트."""
     model_arn, model_id, region = _get_rag_model_arn()
-    client = boto3.client("bedrock-agent-runtime", region_name=region)
+    client = create_agent_runtime_client(args.workers, region=region)
 
     print("=" * 70)
     print(f"RetrieveAndGenerate (RAG) 테스트 [{args.dataset}]")
@@ -605,43 +969,65 @@ def run_rag_mode(args, ds_config, kb_id):
         cases = limited_cases
         print(f"카테고리당 최대 {limit}개 → 총 {len(cases)}개 테스트")
 
+    print(f"동시 실행: {args.workers}")
     print()
 
-    current_category = None
-    for i, (query, expected_ids, category, description) in enumerate(cases):
-        if category != current_category:
-            current_category = category
-            print(f"\n{'━' * 70}")
-            print(f"  [{category.upper()}]")
-            print(f"{'━' * 70}")
-
-        print(f"\n  [{i+1}/{len(cases)}] {description}")
-        print(f"  Q: {query}")
-
-        try:
-            cat_filter = category if args.filter and category != "cross" else None
-            result = query_kb_rag(client, kb_id, query, model_arn,
-                                  category_filter=cat_filter,
-                                  dataset_name=args.dataset)
-        except Exception as e:
-            print(f"  ERROR: {e}")
-            continue
-
-        # Check if expected doc is in citations
-        cited_ids = [c["doc_id"] for c in result["citations"]]
-        if isinstance(expected_ids, str):
-            expected_ids = [expected_ids]
-        hit = any(eid in cited_ids for eid in expected_ids)
-        icon = "OK" if hit else "XX"
-
-        print(f"  A: {result['answer']}")
-        print(f"  [{icon}] 참조: {', '.join(cited_ids) if cited_ids else 'none'}"
-              f"  (expected: {expected_ids[0]})")
+    cache, kb_version = open_cache(args, ds_config, kb_id)
+    fn = functools.partial(query_kb_rag, client, kb_id, model_arn=model_arn,
+                           num_results=NUM_RESULTS, dataset_name=args.dataset)
+    search = cached_search(fn, cache, ("rag", kb_id, kb_version, model_arn, args.dataset, NUM_RESULTS))
 
+    records = []
+    hits = 0
+    current_category = None
+    try:
+        for i, record in enumerate(run_cases(cases, search, args.workers, args.filter)):
+            records.append(record)
+            query, expected_ids, category, description = record["case"]
+            if category != current_category:
+                current_category = category
+                print(f"\n{'━' * 70}")
+                print(f"  [{category.upper()}]")
+                print(f"{'━' * 70}")
+
+            print(f"\n  [{i+1}/{len(cases)}] {description}")
+            print(f"  Q: {query}")
+
+            if record["error"] is not None:
+                print(f"  ERROR: {record['error']}")
+                continue
+
+            # Check if expected doc is in citations
+            result = record["response"]
+            cited_ids = [c["doc_id"] for c in result["citations"]]
+            if isinstance(expected_ids, str):
+                expected_ids = [expected_ids]
+            hit = any(eid in cited_ids for eid in expected_ids)
+            hits += hit
+            icon = "OK" if hit else "XX"
+
+            print(f"  A: {result['answer']}")
+            print(f"  [{icon}] 참조: {', '.join(cited_ids) if cited_ids else 'none'}"
+                  f"  (expected: {expected_ids[0]})")
+    finally:
+        if cache is not None:
+            cache.save()
+
+    stats = latency_stats(records)
     print(f"\n{'=' * 70}")
     print(f"RAG 테스트 완료: {len(cases)}개 질문")
+    print(f"  참조 적중: {hits}/{len(cases)}")
+    print(f"  지연: {format_latency(stats)}")
+    print(f"  재시도: {count_retries(records)}회")
+    if cache is not None:
+        print(f"  캐시 적중: {cache.hits}/{len(cases)}")
     print(f"{'=' * 70}")
 
+    if args.json:
+        write_json_report(args.json, {"total": len(cases), "citation_hits": hits,
+                                      "cache_hits": sum(r["cached"] for r in records),
+                                      "latency_ms": stats, "retries": count_retries(records)}, records)
+
 
 def main():
     parser = argparse.ArgumentParser(description="KB 검색 정확도 평가")
@@ -653,6 +1039,12 @@ def main():
     parser.add_argument("--rag", action="store_true", help="RetrieveAndGenerate 모드 (LLM 답변 포함)")
     parser.add_argument("--query", type=str, default=None, help="단일 질문 (--rag와 함께 사용)")
     parser.add_argument("--limit", type=int, default=None, help="카테고리당 최대 테스트 수 (--rag와 함께 사용)")
+    # Concurrency / cache
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"동시 실행 수 (기본 {DEFAULT_WORKERS})")
+    parser.add_argument("--no-cache", action="store_true", help="응답 캐시 사용 안 함 (항상 API 호출)")
+    parser.add_argument("--clear-cache", action="store_true", help="응답 캐시를 비우고 실행")
+    parser.add_argument("--json", type=str, default=None, help="결과를 JSON 파일로 저장")
     args = parser.parse_args()
 
     ds_config = load_dataset_config(args.dataset)
@@ -663,14 +1055,14 @@ def main():
         run_rag_mode(args, ds_config, kb_id)
         return
 
-    client = boto3.client("bedrock-agent-runtime")
+    client = create_agent_runtime_client(args.workers)
 
     print("=" * 70)
     filter_label = " + Category Filter" if args.filter else ""
     print(f"Bedrock KB 검색 정확도 평가 [{args.dataset}] (HYBRID Search{filter_label})")
     print(f"KB ID: {kb_id}")
     all_cases = get_test_cases(args.dataset)
-    print(f"테스트 케이스: {len(all_cases)}개")
+    print(f"테스트 케이스: {len(all_cases)}개 (동시 실행: {args.workers})")
     print("=" * 70)
 
     # Filter by category if specified
@@ -680,79 +1072,59 @@ def main():
         print(f"카테고리 필터: {args.category} ({len(cases)}개)")
 
     # Run tests
-    results_summary = {
-        "total": 0,
-        "top1_correct": 0,
-        "top3_correct": 0,
-        "top5_correct": 0,
-        "by_category": {},
-        "failures": [],
-    }
+    cache, kb_version = open_cache(args, ds_config, kb_id)
+    fn = functools.partial(query_kb, client, kb_id, num_results=NUM_RESULTS)
+    search = cached_search(fn, cache, ("retrieve", kb_id, kb_version, NUM_RESULTS))
 
+    records = []
     current_category = None
-    for query, expected_ids, category, description in cases:
-        if category != current_category:
-            current_category = category
-            print(f"\n{'─' * 70}")
-            print(f"  [{category.upper()}]")
-            print(f"{'─' * 70}")
-            if category not in results_summary["by_category"]:
-                results_summary["by_category"][category] = {
-                    "total": 0, "top1": 0, "top3": 0, "top5": 0,
-                }
-
-        try:
-            cat_filter = category if args.filter and category != "cross" else None
-            results = query_kb(client, kb_id, query, category_filter=cat_filter)
-        except Exception as e:
-            print(f"  ERROR: {query} → {e}")
-            results_summary["total"] += 1
-            results_summary["by_category"][category]["total"] += 1
-            results_summary["failures"].append((query, category, str(e)))
-            continue
-
-        top1, top3, top5 = evaluate_result(results, expected_ids)
-
-        results_summary["total"] += 1
-        results_summary["by_category"][category]["total"] += 1
-
-        if top1:
-            results_summary["top1_correct"] += 1
-            results_summary["by_category"][category]["top1"] += 1
-        if top3:
-            results_summary["top3_correct"] += 1
-            results_summary["by_category"][category]["top3"] += 1
-        if top5:
-            results_summary["top5_correct"] += 1
-            results_summary["by_category"][category]["top5"] += 1
-
-        # Status icon
-        if top1:
-            icon = "OK"
-        elif top3:
-            icon = "~3"
-        elif top5:
-            icon = "~5"
-        else:
-            icon = "XX"
-            actual = results[0]["doc_id"] if results else "none"
-            results_summary["failures"].append((query, category, f"got {actual}"))
-
-        actual_id = results[0]["doc_id"] if results else "none"
-        score = results[0]["score"] if results else 0
-
-        print(f"  [{icon}] {description}")
-        print(f"       Q: {query}")
-        print(f"       → {actual_id} (score={score:.4f})", end="")
-        if not top1:
-            exp = expected_ids if isinstance(expected_ids, list) else [expected_ids]
-            print(f"  expected: {exp[0]}", end="")
-        print()
-
-        if args.verbose and results:
-            for i, r in enumerate(results[:3]):
-                marker = "*" if r["doc_id"] in (expected_ids if isinstance(expected_ids, list) else [expected_ids]) else " "
-                print(f"       {marker}[{i+1}] {r['doc_id']} (score={r['score']:.4f})")
+    try:
+        for record in run_cases(cases, search, args.workers, args.filter):
+            records.append(record)
+            query, expected_ids, category, description = record["case"]
+            if category != current_category:
+                current_category = category
+                print(f"\n{'─' * 70}")
+                print(f"  [{category.upper()}]")
+                print(f"{'─' * 70}")
+
+            if record["error"] is not None:
+                print(f"  ERROR: {query} → {record['error']}")
+                continue
+
+            results = record["response"]
+            top1, top3, top5 = evaluate_result(results, expected_ids)
+
+            # Status icon
+            if top1:
+                icon = "OK"
+            elif top3:
+                icon = "~3"
+            elif top5:
+                icon = "~5"
+            else:
+                icon = "XX"
+
+            actual_id = results[0]["doc_id"] if results else "none"
+            score = results[0]["score"] if results else 0
+
+            print(f"  [{icon}] {description}")
+            print(f"       Q: {query}")
+            print(f"       → {actual_id} (score={score:.4f})", end="")
+            if not top1:
+                exp = expected_ids if isinstance(expected_ids, list) else [expected_ids]
+                print(f"  expected: {exp[0]}", end="")
+            print()
+
+            if args.verbose and results:
+                for i, r in enumerate(results[:3]):
+                    marker = "*" if r["doc_id"] in (expected_ids if isinstance(expected_ids, list) else [expected_ids]) else " "
+                    print(f"       {marker}[{i+1}] {r['doc_id']} (score={r['score']:.4f})")
+    finally:
+        if cache is not None:
+            cache.save()
+
+    results_summary = summarize_records(records)
 
     # Summary
     total = results_summary["total"]
@@ -763,6 +1135,10 @@ def main():
     print(f"  Top-1 정확도: {results_summary['top1_correct']}/{total} ({results_summary['top1_correct']/total*100:.1f}%)")
     print(f"  Top-3 정확도: {results_summary['top3_correct']}/{total} ({results_summary['top3_correct']/total*100:.1f}%)")
     print(f"  Top-5 정확도: {results_summary['top5_correct']}/{total} ({results_summary['top5_correct']/total*100:.1f}%)")
+    print(f"  지연: {format_latency(results_summary['latency_ms'])}")
+    print(f"  재시도: {results_summary['retries']}회")
+    if cache is not None:
+        print(f"  캐시 적중: {results_summary['cache_hits']}/{total}")
 
     print(f"\n  카테고리별 Top-1 정확도:")
     for cat, stats in sorted(results_summary["by_category"].items()):
@@ -775,6 +1151,9 @@ def main():
         for query, cat, detail in results_summary["failures"]:
             print(f"    [{cat}] {query} → {detail}")
 
+    if args.json:
+        write_json_report(args.json, results_summary, records)
+
     print(f"\n{'=' * 70}")
 
 
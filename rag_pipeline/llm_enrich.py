@@ -2,9 +2,10 @@
 
 regex 대신 Claude를 사용하여 한국어 핵심 용어, 질문 변형, 키워드를 추출합니다.
 결과는 data/RAG/<dataset>_yaml/enriched/ 에 JSON으로 캐싱됩니다.
+enriched/_manifest.json에 엔트리별 입력 해시를 기록하여 입력이 바뀐 엔트리만 다시 처리합니다.
 
 사용법:
-    # 전체 enrichment (캐시에 없는 항목만 처리)
+    # 증분 enrichment (캐시에 없거나 입력이 바뀐 항목만 처리)
     uv run python rag_pipeline/llm_enrich.py --dataset refrigerator
 
     # 강제 재생성 (캐시 무시)
@@ -15,17 +16,33 @@ regex 대신 Claude를 사용하여 한국어 핵심 용어, 질문 변형, 키
 
     # dry-run (프롬프트만 확인)
     uv run python rag_pipeline/llm_enrich.py --dataset refrigerator --dry-run --category glossary
+
+    # 동시 호출 수 / 초당 호출 수 조정
+    uv run python rag_pipeline/llm_enrich.py --dataset refrigerator --force --workers 16 --rate 4
+
+동시성:
+    엔트리를 --workers 개의 스레드로 병렬 처리하고, 모든 Bedrock 호출은 공유 토큰 버킷
+    (--rate 초당 호출 수)을 통과합니다. ThrottlingException을 받으면 버킷 속도를 절반으로
+    낮추고 지수 백오프 후 재시도하며, 이후 성공할 때마다 설정 속도까지 천천히 회복합니다.
 """
 
 import argparse
+import hashlib
 import json
 import os
+import random
 import re
 import sys
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import boto3
 import yaml
+from botocore.config import Config
+from botocore.exceptions import ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotoConnectionError
 
 # Add project root to path for prompt template imports
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -40,10 +57,36 @@ DATASETS_CONFIG = os.path.join(CURRENT_DIR, "datasets.yaml")
 MODEL_ID = "global.anthropic.claude-sonnet-4-5-20250929-v1:0"
 AWS_REGION = "us-east-1"
 
+# Concurrency / rate limiting
+DEFAULT_WORKERS = 8
+DEFAULT_RATE = 2.0          # Bedrock 호출/초 (스로틀링 시 자동 감소)
+MIN_RATE = 0.2
+MAX_RETRIES = 6
+BACKOFF_BASE = 1.0          # 재시도 대기 (초): BACKOFF_BASE * 2^attempt (+ jitter)
+BACKOFF_MAX = 30.0
+THROTTLE_ERRORS = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ServiceUnavailableException",
+    "ModelNotReadyException",
+}
+# 스로틀링은 아니지만 재시도하면 성공할 수 있는 일시적 서버 오류 (limiter 속도는 유지)
+TRANSIENT_ERRORS = {
+    "InternalServerException",
+    "ModelErrorException",
+    "ModelTimeoutException",
+}
+# 연결 실패/끊김, 연결/읽기 타임아웃 (EndpointConnectionError, ConnectTimeoutError,
+# ConnectionClosedError, ReadTimeoutError 등)
+NETWORK_ERRORS = (BotoConnectionError, HTTPClientError)
+
 # Load prompt template from src/ops_agent/prompts/kb_enrichment.md
 _loader = PromptTemplateLoader()
 _template = _loader.load("kb_enrichment")
 
+# Incremental cache manifest ({entry_id: input hash}) in the enriched/ directory
+MANIFEST_NAME = "_manifest.json"
+
 
 def load_dataset_config(dataset_name):
     """datasets.yaml에서 데이터셋 설정 로드."""
@@ -76,14 +119,125 @@ def load_yaml_entries(yaml_dir, category_filter=None):
     return all_entries
 
 
-def call_bedrock(prompt, client):
-    """Bedrock Claude API 호출."""
-    response = client.converse(
-        modelId=MODEL_ID,
-        messages=[{"role": "user", "content": [{"text": prompt}]}],
-        inferenceConfig={"temperature": 0.0, "maxTokens": 1024},
+# ── Rate limiting ───────────────────────────────────────────────────────────
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 + AIMD 속도 조절.
+
+    acquire()는 토큰이 생길 때까지 대기합니다. 스로틀링 시 slow_down()으로 속도를 절반으로
+    낮추고 (multiplicative decrease), 성공 시 speed_up()으로 설정 속도까지 조금씩 올립니다
+    (additive increase). 여러 워커가 같은 구간에 스로틀링되면 감속은 한 번만 적용합니다.
+    """
+
+    def __init__(self, rate, capacity=None, min_rate=MIN_RATE):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """토큰 1개 획득 (필요하면 대기)."""
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def slow_down(self):
+        """스로틀링 발생: 속도 절반, 남은 버스트 토큰 제거.
+
+        마지막 감속 후 리필 간격 (1 / rate) 이내에 도착한 스로틀링은 같은 구간에서
+        동시에 보낸 요청의 응답이므로 무시합니다 (워커 수만큼 연속으로 절반이 되지 않도록).
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_decrease < 1 / self.rate:
+                return
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0)
+            self._last_decrease = now
+
+    def speed_up(self):
+        """호출 성공: 설정 속도까지 최대 속도의 10%씩 회복."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._refill(time.monotonic())
+                self.rate = min(self.max_rate, self.rate + self.max_rate * 0.1)
+
+
+def _error_code(error):
+    return error.response.get("Error", {}).get("Code") if isinstance(error, ClientError) else None
+
+
+def is_throttle_error(error):
+    """스로틀링/일시적 불가 ClientError 여부 (limiter 감속 대상)."""
+    return _error_code(error) in THROTTLE_ERRORS
+
+
+def is_retryable_error(error):
+    """재시도 대상 여부: 스로틀링, 일시적 서버 오류, 네트워크 오류."""
+    return (
+        is_throttle_error(error)
+        or _error_code(error) in TRANSIENT_ERRORS
+        or isinstance(error, NETWORK_ERRORS)
     )
-    return response["output"]["message"]["content"][0]["text"]
+
+
+def create_bedrock_client(workers=DEFAULT_WORKERS):
+    """bedrock-runtime 클라이언트 생성.
+
+    재시도는 call_bedrock이 토큰 버킷과 함께 처리하므로 botocore 재시도는 끕니다
+    (스로틀링/일시적 서버 오류/네트워크 오류 모두 call_bedrock에서 재시도).
+    """
+    return boto3.client(
+        "bedrock-runtime",
+        region_name=AWS_REGION,
+        config=Config(
+            max_pool_connections=max(10, workers),
+            retries={"max_attempts": 1, "mode": "standard"},
+            read_timeout=120,
+        ),
+    )
+
+
+def call_bedrock(prompt, client, limiter=None, max_retries=MAX_RETRIES, backoff=None):
+    """Bedrock Claude API 호출 (스로틀링/일시적 오류 시 백오프 재시도).
+
+    스로틀링일 때만 limiter 속도를 낮추고, 5xx/네트워크 오류는 백오프만 적용합니다.
+    """
+    backoff = BACKOFF_BASE if backoff is None else backoff
+    for attempt in range(max_retries + 1):
+        if limiter:
+            limiter.acquire()
+        try:
+            response = client.converse(
+                modelId=MODEL_ID,
+                messages=[{"role": "user", "content": [{"text": prompt}]}],
+                inferenceConfig={"temperature": 0.0, "maxTokens": 1024},
+            )
+        except (ClientError, *NETWORK_ERRORS) as e:
+            if not is_retryable_error(e) or attempt == max_retries:
+                raise
+            if limiter and is_throttle_error(e):
+                limiter.slow_down()
+            delay = min(BACKOFF_MAX, backoff * 2 ** attempt)
+            time.sleep(delay * random.uniform(0.5, 1.0))
+            continue
+
+        if limiter:
+            limiter.speed_up()
+        return response["output"]["message"]["content"][0]["text"]
 
 
 def parse_llm_response(text):
@@ -122,20 +276,42 @@ def parse_llm_response(text):
     return json.loads(text)
 
 
-def enrich_entry(entry, client, stop_words, siblings=None, total_docs=107, dry_run=False):
-    """단일 엔트리에 대해 LLM enrichment 실행."""
-    sibling_str = "없음"
-    if siblings:
-        sibling_titles = [f"- {s['id']}: {s['title']}" for s in siblings if s['id'] != entry['id']]
-        sibling_str = "\n".join(sibling_titles[:10]) if sibling_titles else "없음"
+def format_siblings(entry, siblings):
+    """프롬프트에 넣을 같은 카테고리 형제 항목 목록 (최대 10개)."""
+    sibling_titles = [f"- {s['id']}: {s['title']}" for s in siblings or [] if s["id"] != entry["id"]]
+    return "\n".join(sibling_titles[:10]) if sibling_titles else "없음"
+
+
+def entry_hash(entry, siblings, stop_words):
+    """enrichment 결과에 영향을 주는 입력의 해시 (manifest 키).
 
+    프롬프트에 들어가는 엔트리 필드, 형제 제목, stop_words, 프롬프트 버전, 모델을 포함합니다.
+    total_docs는 엔트리 추가/삭제마다 전체를 무효화하므로 제외합니다.
+    """
+    inputs = {
+        "title": entry["title"],
+        "category": entry["category_name"],
+        "answer": entry["answer"][:1500],
+        "keywords": entry.get("keywords", []),
+        "error_codes": entry.get("error_codes", []),
+        "siblings": format_siblings(entry, siblings),
+        "stop_words": stop_words,
+        "prompt_version": _template.metadata.get("version", ""),
+        "model": MODEL_ID,
+    }
+    payload = json.dumps(inputs, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def enrich_entry(entry, client, stop_words, siblings=None, total_docs=107, dry_run=False, limiter=None):
+    """단일 엔트리에 대해 LLM enrichment 실행."""
     prompt = _template.render(
         title=entry["title"],
         category=entry["category_name"],
         answer=entry["answer"][:1500].replace("\\", "\\\\"),
         keywords=", ".join(entry.get("keywords", [])),
         error_codes=", ".join(entry.get("error_codes", [])) or "없음",
-        siblings=sibling_str,
+        siblings=format_siblings(entry, siblings),
         total_docs=str(total_docs),
         stop_words=stop_words,
     )
@@ -148,7 +324,7 @@ def enrich_entry(entry, client, stop_words, siblings=None, total_docs=107, dry_r
         print("...")
         return None
 
-    response_text = call_bedrock(prompt, client)
+    response_text = call_bedrock(prompt, client, limiter=limiter)
     enriched = parse_llm_response(response_text)
 
     # Validate required fields
@@ -160,12 +336,113 @@ def enrich_entry(entry, client, stop_words, siblings=None, total_docs=107, dry_r
     return enriched
 
 
+# ── Enrichment engine ──────────────────────────────────────────────────────
+
+def write_json_atomic(path, data):
+    """임시 파일에 쓴 뒤 os.replace로 교체 (중단되어도 깨진 캐시 파일이 남지 않음)."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_manifest(path):
+    """enrichment manifest ({entry_id: 입력 해시}) 로드 (파일이 없으면 None)."""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def enrich_all(entries, client, stop_words, enriched_dir, force=False, workers=DEFAULT_WORKERS, limiter=None):
+    """엔트리를 병렬로 enrichment하고 enriched/<id>.json에 저장.
+
+    캐시 파일이 있고 manifest의 입력 해시가 같은 엔트리는 건너뜁니다.
+    캐시 파일은 있지만 manifest에 없는 엔트리 (이전 버전 캐시, 다른 --category 실행)는
+    현재 입력 기준으로 등록만 하고, 해시가 다른 엔트리만 다시 처리합니다.
+
+    Returns:
+        (성공, 스킵, 실패) 개수
+    """
+    by_category = {}
+    for entry in entries:
+        by_category.setdefault(entry["category_id"], []).append(entry)
+    total_docs = len(entries)
+
+    manifest_path = os.path.join(enriched_dir, MANIFEST_NAME)
+    manifest = load_manifest(manifest_path) or {}
+
+    pending = []
+    skipped = 0
+    changed = 0
+    adopted = 0
+    for entry in entries:
+        entry_id = entry["id"]
+        digest = entry_hash(entry, by_category[entry["category_id"]], stop_words)
+        cache_path = os.path.join(enriched_dir, f"{entry_id}.json")
+
+        if os.path.exists(cache_path) and not force:
+            if manifest.get(entry_id) == digest:
+                skipped += 1
+                continue
+            if entry_id not in manifest:
+                manifest[entry_id] = digest
+                adopted += 1
+                skipped += 1
+                continue
+            changed += 1
+        pending.append((entry, cache_path, digest))
+
+    if adopted:
+        write_json_atomic(manifest_path, manifest)
+        print(f"  manifest 갱신: 기존 캐시 {adopted}개 등록 (오래된 캐시는 --force로 재생성)")
+    if changed:
+        print(f"  입력 변경: {changed}개 재처리")
+
+    def process(entry, cache_path):
+        siblings = by_category.get(entry["category_id"], [])
+        enriched = enrich_entry(
+            entry, client, stop_words, siblings=siblings, total_docs=total_docs, limiter=limiter,
+        )
+        write_json_atomic(cache_path, enriched)
+        return enriched
+
+    success = 0
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="enrich") as pool:
+        futures = {
+            pool.submit(process, entry, path): (entry["id"], digest)
+            for entry, path, digest in pending
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            entry_id, digest = futures[future]
+            try:
+                enriched = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"  [{done}/{len(pending)}] {entry_id}: FAILED — {e}")
+                continue
+            success += 1
+            # 결과 파일을 쓴 뒤 manifest 갱신 (중단되어도 완료된 엔트리는 다시 처리하지 않음)
+            manifest[entry_id] = digest
+            write_json_atomic(manifest_path, manifest)
+            print(f"  [{done}/{len(pending)}] {entry_id}: {enriched['ko_core_term']} / {enriched['en_core_term']}")
+
+    return success, skipped, failed
+
+
 def main():
     parser = argparse.ArgumentParser(description="LLM 기반 엔트리 enrichment")
     parser.add_argument("--dataset", default="refrigerator", help="데이터셋 이름")
-    parser.add_argument("--force", action="store_true", help="캐시 무시하고 전체 재생성")
+    parser.add_argument("--force", action="store_true", help="캐시/manifest 무시하고 전체 재생성")
     parser.add_argument("--category", type=str, default=None, help="특정 카테고리만 처리")
     parser.add_argument("--dry-run", action="store_true", help="프롬프트만 확인 (API 호출 안함)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"동시 처리 엔트리 수 (기본: {DEFAULT_WORKERS})")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE, help=f"초당 Bedrock 호출 수 상한 (기본: {DEFAULT_RATE})")
     args = parser.parse_args()
 
     ds_config = load_dataset_config(args.dataset)
@@ -201,6 +478,8 @@ def main():
     print(f"엔트리: {total_docs}개, 카테고리: {len(by_category)}개")
     print(f"캐시 디렉토리: {enriched_dir}")
     print(f"강제 재생성: {args.force}")
+    if not args.dry_run:
+        print(f"동시 처리: {args.workers} workers, {args.rate}/s")
     print("=" * 60)
 
     if args.dry_run:
@@ -210,41 +489,18 @@ def main():
         print(f"\n[dry-run] 처음 3개 엔트리의 프롬프트만 표시했습니다.")
         return
 
-    client = boto3.client("bedrock-runtime", region_name=AWS_REGION)
+    client = create_bedrock_client(args.workers)
+    limiter = TokenBucket(args.rate)
 
-    success = 0
-    skipped = 0
-    failed = 0
-
-    for i, entry in enumerate(entries):
-        entry_id = entry["id"]
-        cache_path = os.path.join(enriched_dir, f"{entry_id}.json")
-
-        # Skip if cached (unless --force)
-        if os.path.exists(cache_path) and not args.force:
-            skipped += 1
-            continue
-
-        try:
-            siblings = by_category.get(entry["category_id"], [])
-            enriched = enrich_entry(entry, client, stop_words, siblings=siblings, total_docs=total_docs)
-
-            # Save to cache
-            with open(cache_path, "w") as f:
-                json.dump(enriched, f, ensure_ascii=False, indent=2)
-
-            success += 1
-            print(f"  [{i+1}/{len(entries)}] {entry_id}: {enriched['ko_core_term']} / {enriched['en_core_term']}")
-
-        except Exception as e:
-            failed += 1
-            print(f"  [{i+1}/{len(entries)}] {entry_id}: FAILED — {e}")
-
-        # Rate limiting: ~5 calls/sec to avoid throttling
-        time.sleep(0.2)
+    started = time.monotonic()
+    success, skipped, failed = enrich_all(
+        entries, client, stop_words, enriched_dir,
+        force=args.force, workers=args.workers, limiter=limiter,
+    )
+    elapsed = time.monotonic() - started
 
     print(f"\n{'=' * 60}")
-    print(f"완료: 성공={success}, 스킵={skipped}, 실패={failed}")
+    print(f"완료: 성공={success}, 스킵={skipped}, 실패={failed} ({elapsed:.1f}s, 최종 속도 {limiter.rate:.2f}/s)")
     print(f"{'=' * 60}")
 
 
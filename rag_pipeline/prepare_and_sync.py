@@ -11,23 +11,38 @@ data/RAG/<dataset>_yaml/*.yaml → .md + .metadata.json 쌍 생성 → S3 업로
 
     # 업로드 + 동기화만 (이미 변환된 파일)
     uv run python rag_pipeline/prepare_and_sync.py --dataset refrigerator --mode sync
+
+    # 전체 재업로드 (버킷 비우고 모든 파일 업로드)
+    uv run python rag_pipeline/prepare_and_sync.py --dataset refrigerator --mode sync --full-sync
+
+S3 동기화:
+    기본은 diff 모드입니다. 로컬 파일 MD5와 S3 ETag를 비교하여 바뀐 파일만 병렬 업로드하고,
+    로컬에서 사라진 문서만 삭제합니다. 변경이 없으면 KB 동기화 (ingestion job)를 건너뜁니다.
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import shutil
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 import yaml
+from botocore.config import Config
 
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.join(CURRENT_DIR, "..")
 DATASETS_CONFIG = os.path.join(CURRENT_DIR, "datasets.yaml")
 
+# Concurrency
+DEFAULT_PREPARE_WORKERS = 8
+DEFAULT_UPLOAD_WORKERS = 16
+DELETE_BATCH_SIZE = 1000    # delete_objects 요청당 최대 키 수
+
 
 # ── Module-level state (set by main() based on --dataset) ──────────────────
 _yaml_dir = None
@@ -312,27 +327,179 @@ def entry_to_metadata(entry):
     return {"metadataAttributes": attrs}
 
 
-def prepare_files(entries):
-    """모든 엔트리를 .md + .metadata.json 파일로 변환."""
-    os.makedirs(_output_dir, exist_ok=True)
+# ── File generation ─────────────────────────────────────────────────────────
+
+def render_entry_files(entry):
+    """엔트리 하나의 업로드 파일 렌더링.
+
+    Returns:
+        [(파일명, 내용 bytes)] — .md와 .md.metadata.json
+    """
+    entry_id = entry["id"]
+    metadata = json.dumps(entry_to_metadata(entry), ensure_ascii=False, indent=2)
+    return [
+        (f"{entry_id}.md", entry_to_md(entry).encode("utf-8")),
+        (f"{entry_id}.md.metadata.json", metadata.encode("utf-8")),
+    ]
+
+
+def write_if_changed(path, content):
+    """내용이 다를 때만 임시 파일에 쓴 뒤 교체 (같으면 mtime도 유지).
+
+    Returns:
+        파일을 썼으면 True
+    """
+    try:
+        if os.path.getsize(path) == len(content):
+            with open(path, "rb") as f:
+                if f.read() == content:
+                    return False
+    except FileNotFoundError:
+        pass
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return True
+
 
-    for entry in entries:
-        entry_id = entry["id"]
+def is_upload_artifact(filename):
+    """prepare_files가 생성하는 파일 여부 (.md / .md.metadata.json)."""
+    return filename.endswith(".md") or filename.endswith(".md.metadata.json")
 
-        md_path = os.path.join(_output_dir, f"{entry_id}.md")
-        with open(md_path, "w") as f:
-            f.write(entry_to_md(entry))
 
-        meta_path = os.path.join(_output_dir, f"{entry_id}.md.metadata.json")
-        with open(meta_path, "w") as f:
-            json.dump(entry_to_metadata(entry), f, ensure_ascii=False, indent=2)
+def prepare_files(entries, workers=DEFAULT_PREPARE_WORKERS):
+    """모든 엔트리를 .md + .metadata.json 파일로 변환.
 
+    엔트리별 렌더링/비교/쓰기를 스레드 풀에서 병렬로 처리하고, 내용이 바뀐 파일만 씁니다.
+    더 이상 없는 엔트리의 파일은 삭제하여 diff 업로드가 S3에서도 삭제하도록 합니다.
+
+    Returns:
+        {"written": 쓴 파일 수, "unchanged": 그대로 둔 파일 수, "removed": 삭제한 파일 수}
+    """
+    os.makedirs(_output_dir, exist_ok=True)
+
+    def process(entry):
+        return [
+            (filename, write_if_changed(os.path.join(_output_dir, filename), content))
+            for filename, content in render_entry_files(entry)
+        ]
+
+    written = 0
+    expected = set()
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="prepare") as pool:
+        for results in pool.map(process, entries):
+            for filename, changed in results:
+                expected.add(filename)
+                written += changed
+
+    removed = 0
+    for filename in os.listdir(_output_dir):
+        if is_upload_artifact(filename) and filename not in expected:
+            os.remove(os.path.join(_output_dir, filename))
+            removed += 1
+
+    counts = {"written": written, "unchanged": len(expected) - written, "removed": removed}
     print(f"  생성 완료: {len(entries)}개 엔트리 → {_output_dir}")
-    print(f"  파일 수: {len(entries) * 2} (.md + .metadata.json)")
+    print(f"  파일 수: {len(expected)} (.md + .metadata.json)")
+    print(f"  변경: {counts['written']}개, 변경 없음: {counts['unchanged']}개, 삭제: {counts['removed']}개")
+    return counts
+
+
+# ── S3 sync ─────────────────────────────────────────────────────────────────
+
+def file_md5(path):
+    """파일 MD5 (단일 파트 업로드 객체의 S3 ETag와 같은 값)."""
+    digest = hashlib.md5(usedforsecurity=False)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def list_upload_files(local_dir):
+    """업로드 대상 파일명 (정렬, 쓰다 남은 임시 파일 등은 제외)."""
+    return sorted(
+        name for name in os.listdir(local_dir)
+        if is_upload_artifact(name) and os.path.isfile(os.path.join(local_dir, name))
+    )
+
+
+def list_s3_etags(s3, bucket):
+    """버킷의 {key: ETag} (따옴표 제거)."""
+    etags = {}
+    paginator = s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket):
+        for obj in page.get("Contents", []):
+            etags[obj["Key"]] = obj["ETag"].strip('"')
+    return etags
 
 
-def upload_and_sync():
-    """S3에 업로드하고 KB 동기화."""
+def plan_s3_sync(s3, bucket, local_dir):
+    """로컬 디렉토리와 버킷을 비교하여 동기화 계획 생성.
+
+    멀티파트 ETag ("<md5>-<parts>")는 MD5와 비교할 수 없으므로 변경된 것으로 봅니다.
+
+    Returns:
+        {"upload": [파일명], "delete": [키], "unchanged": 개수}
+    """
+    remote = list_s3_etags(s3, bucket)
+    local = list_upload_files(local_dir)
+
+    upload = [name for name in local if remote.get(name) != file_md5(os.path.join(local_dir, name))]
+    local_set = set(local)
+    delete = sorted(key for key in remote if key not in local_set)
+    return {"upload": upload, "delete": delete, "unchanged": len(local) - len(upload)}
+
+
+def delete_s3_keys(s3, bucket, keys):
+    """키 목록을 delete_objects 배치로 삭제."""
+    for i in range(0, len(keys), DELETE_BATCH_SIZE):
+        batch = keys[i:i + DELETE_BATCH_SIZE]
+        s3.delete_objects(Bucket=bucket, Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True})
+
+
+def upload_s3_files(s3, bucket, local_dir, filenames, workers=DEFAULT_UPLOAD_WORKERS):
+    """파일을 병렬 업로드 (boto3 클라이언트는 스레드 간 공유 가능)."""
+    if not filenames:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(filenames))), thread_name_prefix="s3-upload") as pool:
+        # list()로 결과를 모아 업로드 오류를 호출자에게 전달
+        list(pool.map(lambda name: s3.upload_file(os.path.join(local_dir, name), bucket, name), filenames))
+
+
+def sync_s3(s3, bucket, local_dir, full=False, workers=DEFAULT_UPLOAD_WORKERS):
+    """로컬 디렉토리를 S3 버킷에 동기화.
+
+    Args:
+        full: True면 버킷을 비우고 모든 파일을 업로드 (이전 동작)
+        workers: 병렬 업로드 수
+
+    Returns:
+        {"upload": [파일명], "delete": [키], "unchanged": 개수}
+    """
+    if full:
+        plan = {
+            "upload": list_upload_files(local_dir),
+            "delete": sorted(list_s3_etags(s3, bucket)),
+            "unchanged": 0,
+        }
+    else:
+        plan = plan_s3_sync(s3, bucket, local_dir)
+
+    delete_s3_keys(s3, bucket, plan["delete"])
+    upload_s3_files(s3, bucket, local_dir, plan["upload"], workers=workers)
+    return plan
+
+
+def upload_and_sync(full=False, workers=DEFAULT_UPLOAD_WORKERS):
+    """S3에 업로드하고 KB 동기화.
+
+    Args:
+        full: True면 버킷을 비우고 전체 재업로드, False면 바뀐 파일만 업로드 (diff)
+        workers: 병렬 업로드 수
+    """
     kb_id = _ds_config.get("kb_id", "")
     ds_id = _ds_config.get("ds_id", "")
     s3_bucket = _ds_config.get("s3_bucket", "")
@@ -354,24 +521,17 @@ def upload_and_sync():
     print(f"  DS ID: {ds_id}")
     print(f"  S3 Bucket: {s3_bucket}")
 
-    # Clear existing S3 objects
-    s3 = boto3.client("s3")
-    print("\n  기존 S3 객체 삭제 중...")
-    paginator = s3.get_paginator("list_objects_v2")
-    for page in paginator.paginate(Bucket=s3_bucket):
-        if "Contents" in page:
-            objects = [{"Key": obj["Key"]} for obj in page["Contents"]]
-            s3.delete_objects(Bucket=s3_bucket, Delete={"Objects": objects})
-            print(f"    삭제: {len(objects)}개 객체")
-
-    # Upload new files
-    print(f"\n  새 파일 업로드 중...")
-    upload_count = 0
-    for filename in sorted(os.listdir(_output_dir)):
-        filepath = os.path.join(_output_dir, filename)
-        s3.upload_file(filepath, s3_bucket, filename)
-        upload_count += 1
-    print(f"    업로드 완료: {upload_count}개 파일")
+    s3 = boto3.client("s3", config=Config(max_pool_connections=max(10, workers)))
+    mode = "전체 재업로드" if full else "변경분만 (diff)"
+    print(f"\n  S3 업로드 중... [{mode}, {workers} workers]")
+    started = time.monotonic()
+    plan = sync_s3(s3, s3_bucket, _output_dir, full=full, workers=workers)
+    print(f"    업로드: {len(plan['upload'])}개, 삭제: {len(plan['delete'])}개, "
+          f"변경 없음: {plan['unchanged']}개 ({time.monotonic() - started:.1f}s)")
+
+    if not plan["upload"] and not plan["delete"]:
+        print("\n  변경된 파일이 없어 KB 동기화를 건너뜁니다.")
+        return
 
     # Sync KB
     print(f"\n  KB 동기화 시작...")
@@ -422,6 +582,15 @@ def main():
         choices=["prepare", "sync", "all"],
         help="실행 모드: prepare (파일 생성만), sync (업로드+동기화만), all (전체)",
     )
+    parser.add_argument("--full-sync", action="store_true", help="버킷을 비우고 모든 파일 재업로드 (기본: 변경분만)")
+    parser.add_argument(
+        "--workers", type=int, default=DEFAULT_UPLOAD_WORKERS,
+        help=f"병렬 S3 업로드 수 (기본: {DEFAULT_UPLOAD_WORKERS})",
+    )
+    parser.add_argument(
+        "--prepare-workers", type=int, default=DEFAULT_PREPARE_WORKERS,
+        help=f"병렬 파일 생성 수 (기본: {DEFAULT_PREPARE_WORKERS})",
+    )
     args = parser.parse_args()
 
     _ds_config = load_dataset_config(args.dataset)
@@ -445,11 +614,11 @@ def main():
 
     if args.mode in ("prepare", "all"):
         print(f"\n[Step 1] 파일 변환")
-        prepare_files(entries)
+        prepare_files(entries, workers=args.prepare_workers)
 
     if args.mode in ("sync", "all"):
         print(f"\n[Step 2] S3 업로드 + KB 동기화")
-        upload_and_sync()
+        upload_and_sync(full=args.full_sync, workers=args.workers)
 
     print(f"\n{'=' * 60}")
     print("완료!")
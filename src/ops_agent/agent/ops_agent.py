@@ -26,6 +26,7 @@ import os
 import uuid
 
 from strands import Agent
+from strands.agent import AgentResult
 from strands.models import BedrockModel
 
 # OTEL 스팬 래핑용 (트레이스 이름 커스터마이징)
@@ -37,10 +38,10 @@ except ImportError:
 
 from ops_agent.config import get_settings
 from ops_agent.graph.runner import OpsAgentGraph
-from ops_agent.telemetry import get_trace_attributes, setup_strands_observability
+from ops_agent.telemetry import cache_hit_rate, get_trace_attributes, setup_strands_observability
 from ops_agent.graph.state import WorkflowStatus
 from ops_agent.graph.util import Colors
-from ops_agent.prompts import get_system_prompt
+from ops_agent.prompts import PROMPT_CACHE_CONFIG, build_system_prompt
 from ops_agent.tools.cloudwatch import get_cloudwatch_tools
 from ops_agent.tools.knowledge_base import get_kb_tools
 
@@ -48,6 +49,18 @@ from ops_agent.tools.knowledge_base import get_kb_tools
 logger = logging.getLogger(__name__)
 
 
+def _format_cache_usage(result: AgentResult) -> str:
+    """에이전트 호출 전체의 프롬프트 캐시 사용량 (로그용, usage가 없으면 빈 문자열)."""
+    usage = result.metrics.accumulated_usage
+    rate = cache_hit_rate(usage)
+    if rate is None:
+        return ""
+    return (
+        f", 캐시 읽기 {usage.get('cacheReadInputTokens', 0)} / 쓰기 {usage.get('cacheWriteInputTokens', 0)}"
+        f" (적중률 {rate:.0%})"
+    )
+
+
 class OpsAgent:
     """운영 자동화 AI 에이전트.
 
@@ -328,7 +341,7 @@ class OpsAgent:
                 result = agent(prompt)
                 response = result.message["content"][0]["text"]
 
-            logger.info(f"{Colors.GREEN}[OpsAgent] 완료: {len(response)}자{Colors.END}")
+            logger.info(f"{Colors.GREEN}[OpsAgent] 완료: {len(response)}자{_format_cache_usage(result)}{Colors.END}")
             return response
 
         except Exception as e:
@@ -340,6 +353,8 @@ class OpsAgent:
 
         Reference: docs/research-guide-results.md - 7.1 Agent Factory Pattern
 
+        프롬프트 캐싱은 Graph ANALYZE 노드 (graph/nodes.py)와 같은 구성을 사용합니다.
+
         Args:
             messages: Message Injection용 대화 히스토리
 
@@ -351,9 +366,11 @@ class OpsAgent:
             region_name=self.settings.aws_region,
             temperature=self.settings.bedrock_temperature,
             max_tokens=self.settings.bedrock_max_tokens,
+            cache_config=PROMPT_CACHE_CONFIG,
+            cache_tools="default",
         )
 
-        system_prompt = get_system_prompt()
+        system_prompt = build_system_prompt()
 
         # Langfuse 트레이스 속성 생성 (관측성 활성화 시)
         # 세션별, 사용자별로 트레이스를 그룹화하기 위한 속성
@@ -421,7 +438,7 @@ class OpsAgent:
 
             response = result.message["content"][0]["text"]
 
-            logger.info(f"{Colors.GREEN}[OpsAgent] 완료: {len(response)}자{Colors.END}")
+            logger.info(f"{Colors.GREEN}[OpsAgent] 완료: {len(response)}자{_format_cache_usage(result)}{Colors.END}")
             return response
 
         except Exception as e:
@@ -77,6 +77,38 @@ class Settings(BaseSettings):
     datadog_mode: Literal["mock", "mcp"] = Field(default="mock", alias="DATADOG_MODE")
     kb_mode: Literal["mock", "mcp"] = Field(default="mock", alias="KB_MODE")
 
+    # ========== KB 검색 캐시 설정 ==========
+    # 재생성 루프의 동일 검색 재사용 (0이면 비활성화)
+    kb_cache_max_size: int = Field(default=256, alias="KB_CACHE_MAX_SIZE", ge=0)
+    kb_cache_ttl: float = Field(default=300.0, alias="KB_CACHE_TTL", ge=0.0)  # 초
+
+    # ========== 평가 설정 ==========
+    # 검사기(CloudWatch, KB, ...)를 스레드 풀에서 동시 실행할지 여부
+    # 기본 검사기는 GIL을 잡는 순수 Python 코드라 순차 실행이 더 빠름
+    # (I/O를 기다리는 검사기를 추가할 때만 켜기: EVALUATE 지연 = 가장 느린 검사기)
+    eval_parallel_checkers: bool = Field(default=False, alias="EVAL_PARALLEL_CHECKERS")
+    eval_checker_timeout: float = Field(
+        default=10.0,
+        alias="EVAL_CHECKER_TIMEOUT",
+        gt=0.0,  # 검사기별 제한 시간 (초)
+    )
+    # 재생성 시 이전 시도의 도구 호출/결과를 대화에 주입 (도구 재호출 없이 텍스트만 재생성)
+    eval_reuse_tool_results: bool = Field(default=True, alias="EVAL_REUSE_TOOL_RESULTS")
+    # ANALYZE 스트리밍 중 응답 청크로 검사기 매칭을 미리 수행 (EVALUATE는 집계만)
+    eval_streaming: bool = Field(default=True, alias="EVAL_STREAMING")
+
+    # ========== 동시 실행 제한 설정 (AgentCore entrypoint) ==========
+    # 동시 워크플로우 수를 제한하여 과부하를 Bedrock 스로틀링 대신 대기열 back-pressure로 처리
+    admission_max_in_flight: int = Field(default=8, alias="ADMISSION_MAX_IN_FLIGHT", ge=1)
+    admission_max_queue: int = Field(default=32, alias="ADMISSION_MAX_QUEUE", ge=0)
+    admission_queue_timeout: float = Field(
+        default=30.0,
+        alias="ADMISSION_QUEUE_TIMEOUT",
+        gt=0.0,  # 최대 대기 시간 (초)
+    )
+    # 세션별 동시 실행 최대 수 (0: 제한 없음, 대기열은 항상 세션 라운드 로빈)
+    admission_max_per_session: int = Field(default=2, alias="ADMISSION_MAX_PER_SESSION", ge=0)
+
     # ========== AgentCore Memory 설정 ==========
     agentcore_memory_enabled: bool = Field(default=False, alias="AGENTCORE_MEMORY_ENABLED")
     agentcore_memory_id: str | None = Field(default=None, alias="AGENTCORE_MEMORY_ID")
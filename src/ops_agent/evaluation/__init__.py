@@ -5,6 +5,7 @@
 Reference: docs/evaluation-design.md
 """
 
+from ops_agent.evaluation.cache import EvaluationCache
 from ops_agent.evaluation.evaluator import OpsAgentEvaluator
 from ops_agent.evaluation.models import (
     CheckResult,
@@ -13,9 +14,12 @@ from ops_agent.evaluation.models import (
     ToolResult,
     ToolType,
 )
+from ops_agent.evaluation.streaming import StreamingEvaluation
 
 __all__ = [
+    "EvaluationCache",
     "OpsAgentEvaluator",
+    "StreamingEvaluation",
     "CheckResult",
     "EvalResult",
     "EvalVerdict",
@@ -0,0 +1,118 @@
+"""Evaluation Cache.
+
+워크플로우 단위 평가 캐시.
+
+재생성(REGENERATE) 루프에서는 같은 도구 결과에 대해 평가가 반복됩니다.
+검사기가 도구 결과에서 뽑아내는 "기대값"(이벤트 수, 핵심 키워드, 서비스 이름 등)을
+도구 결과 내용 기준으로 한 번만 계산해 두고, 이후 시도에서는 새 응답과의 매칭만 수행합니다.
+
+사용법:
+    cache = EvaluationCache()
+    evaluator = OpsAgentEvaluator(cache=cache)
+
+    evaluator.evaluate(response_1, tool_results)  # 기대값 계산 + 매칭
+    evaluator.evaluate(response_2, tool_results)  # 매칭만 수행
+"""
+
+import json
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+from ops_agent.evaluation.models import ToolResult
+
+T = TypeVar("T")
+
+
+def fingerprint_tool_result(tool_result: ToolResult) -> str:
+    """도구 결과 내용 지문 (재시도 간 동일 결과 식별용).
+
+    재시도마다 도구를 다시 호출하므로 ToolResult 객체는 새로 만들어집니다.
+    따라서 객체 식별자가 아닌 출력 내용으로 비교합니다.
+
+    Args:
+        tool_result: 도구 결과
+
+    Returns:
+        str: 도구 유형 + 정렬된 출력 JSON
+    """
+    output = json.dumps(
+        tool_result.tool_output,
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return f"{tool_result.tool_type.value}:{output}"
+
+
+class EvaluationCache:
+    """도구 결과별 검사 기대값 캐시.
+
+    키는 (검사기 이름, 도구 결과 지문)이며 스레드 안전합니다.
+    (검사기가 공용 스레드 풀에서 동시에 실행되므로 잠금 사용)
+
+    Attributes:
+        hits: 캐시 적중 수
+        misses: 캐시 미스 수 (기대값 계산 횟수)
+    """
+
+    def __init__(self) -> None:
+        """캐시 초기화."""
+        self._entries: dict[tuple[str, Hashable], Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        tool_result: ToolResult,
+        compute: Callable[[ToolResult], T],
+    ) -> T:
+        """기대값 조회 (없으면 계산 후 저장).
+
+        Args:
+            namespace: 검사기 이름
+            tool_result: 도구 결과
+            compute: 기대값 계산 함수
+
+        Returns:
+            계산된(또는 캐시된) 기대값
+        """
+        key = (namespace, fingerprint_tool_result(tool_result))
+
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return self._entries[key]
+
+        # 계산은 잠금 밖에서 수행 (동시 계산 시 결과가 같으므로 마지막 값 저장)
+        value = compute(tool_result)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = value
+        return value
+
+    def clear(self) -> None:
+        """캐시 항목과 통계 초기화."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """캐시 통계.
+
+        Returns:
+            dict: hits, misses, size
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
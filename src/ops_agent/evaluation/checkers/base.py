@@ -6,9 +6,143 @@ Reference: docs/evaluation-design.md - Step 2
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from typing import TypeVar
 
+from ops_agent.evaluation.cache import EvaluationCache
 from ops_agent.evaluation.models import CheckResult, ToolResult
 
+T = TypeVar("T")
+
+
+# ==========================================================================
+# 스트리밍(증분) 검사
+# ==========================================================================
+
+class StreamingText:
+    """스트리밍 텍스트에서 부분 문자열 포함 여부를 증분 추적.
+
+    청크가 들어올 때마다 새로 추가된 구간(+ 청크 경계에 걸친 앞부분)만 검색하므로
+    생성이 끝났을 때는 모든 검색어의 포함 여부가 이미 결정되어 있습니다.
+
+    Example:
+        text = StreamingText(["timeout", "payment-service"])
+        text.feed("Connection time")
+        text.feed("out 발생")
+        text.contains("timeout")  # True
+    """
+
+    def __init__(self, needles: Iterable[str], normalize_whitespace: bool = False) -> None:
+        """추적기 초기화.
+
+        Args:
+            needles: 검색어 목록 (소문자, 빈 문자열 제외)
+            normalize_whitespace: 공백을 하나로 합치고 앞 공백 제거
+                (BaseChecker._normalize_text와 같은 결과)
+        """
+        self.normalize_whitespace = normalize_whitespace
+        # 긴 스트림에서 문자열 += 복사가 반복되지 않도록 청크 목록으로 모으고 필요할 때만 합침
+        self._chunks: list[str] = []        # 원문
+        self._lower_chunks: list[str] = []  # 소문자 (normalize_whitespace=True면 공백 정리)
+        self._pending = {n for n in needles if n}
+        self.found: set[str] = set()
+        self._pending_space = False
+        # 청크 경계에 걸친 매치를 위해 보관하는 소문자 텍스트 끝부분 (최대 검색어 길이 - 1)
+        self._overlap = max((len(n) for n in self._pending), default=1) - 1
+        self._tail = ""
+
+    @property
+    def text(self) -> str:
+        """지금까지의 원문."""
+        return _join_chunks(self._chunks)
+
+    @property
+    def lower(self) -> str:
+        """지금까지의 소문자 텍스트 (normalize_whitespace=True면 공백 정리)."""
+        return _join_chunks(self._lower_chunks)
+
+    def feed(self, chunk: str) -> None:
+        """텍스트 청크 추가 및 검색어 매칭.
+
+        Args:
+            chunk: 새로 생성된 텍스트
+        """
+        if not chunk:
+            return
+
+        self._chunks.append(chunk)
+        lowered = self._lower_chunk(chunk)
+        if not lowered:
+            return
+        self._lower_chunks.append(lowered)
+
+        if not self._pending:
+            return
+
+        # 새 청크 + 직전 텍스트 끝부분만 검색 (검색어별로 필요한 만큼만 앞에서부터)
+        window = self._tail + lowered
+        previous_length = len(self._tail)
+        for needle in list(self._pending):
+            start = max(0, previous_length - len(needle) + 1)
+            if needle in window[start:]:
+                self._pending.discard(needle)
+                self.found.add(needle)
+        self._tail = window[max(0, len(window) - self._overlap):]
+
+    def contains(self, needle: str) -> bool:
+        """검색어가 지금까지의 텍스트에 포함되었는지 여부."""
+        return needle in self.found
+
+    def _lower_chunk(self, chunk: str) -> str:
+        """청크 소문자 변환 (필요 시 공백 정리, 이전 청크와 이어서 처리)."""
+        lowered = chunk.lower()
+        if not self.normalize_whitespace:
+            return lowered
+
+        words = lowered.split()
+        if not words:
+            # 공백만 있는 청크: 다음 단어 앞에 공백 1개 (맨 앞 공백은 제거)
+            self._pending_space = self._pending_space or bool(self._lower_chunks)
+            return ""
+
+        prefix = " " if self._lower_chunks and (self._pending_space or lowered[0].isspace()) else ""
+        self._pending_space = lowered[-1].isspace()
+        return prefix + " ".join(words)
+
+
+def _join_chunks(chunks: list[str]) -> str:
+    """청크 목록을 합쳐 반환 (합친 결과로 목록을 교체하여 다음 호출은 새 청크만 합침)."""
+    if len(chunks) > 1:
+        chunks[:] = ["".join(chunks)]
+    return chunks[0] if chunks else ""
+
+
+class IncrementalCheck(ABC):
+    """스트리밍 중 텍스트 청크를 받아 매칭 상태를 유지하는 검사.
+
+    BaseChecker.start_incremental()이 반환하며,
+    생성이 끝나면 result()가 check()와 같은 결과를 반환합니다.
+    """
+
+    @abstractmethod
+    def feed(self, chunk: str) -> None:
+        """텍스트 청크 추가.
+
+        Args:
+            chunk: 새로 생성된 응답 텍스트
+        """
+
+    @abstractmethod
+    def result(self, final: bool = True) -> CheckResult:
+        """현재까지의 텍스트 기준 검사 결과.
+
+        Args:
+            final: 생성 완료 여부 (False면 중간 결과)
+
+        Returns:
+            CheckResult: 검사 결과
+        """
+
 
 class BaseChecker(ABC):
     """도구별 검사기를 위한 추상 기본 클래스.
@@ -26,6 +160,17 @@ class BaseChecker(ABC):
                 ...
     """
 
+    # 워크플로우 단위 기대값 캐시 (없으면 매번 계산)
+    cache: EvaluationCache | None = None
+
+    def __init__(self, cache: EvaluationCache | None = None) -> None:
+        """검사기 초기화.
+
+        Args:
+            cache: 도구 결과별 기대값 캐시 (재생성 시도 간 공유)
+        """
+        self.cache = cache
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -49,6 +194,35 @@ class BaseChecker(ABC):
         """
         pass
 
+    def start_incremental(self, _tool_results: list[ToolResult]) -> IncrementalCheck | None:
+        """스트리밍 중 증분 검사 시작 (지원하지 않으면 None).
+
+        Args:
+            _tool_results: 지금까지 캡처된 도구 결과 (기본 구현은 사용하지 않음)
+
+        Returns:
+            IncrementalCheck | None: 증분 검사 (None이면 생성 완료 후 check() 실행)
+        """
+        return None
+
+    def _expectations(
+        self,
+        tool_result: ToolResult,
+        compute: Callable[[ToolResult], T],
+    ) -> T:
+        """도구 결과에서 검사 기대값 추출 (캐시가 있으면 재사용).
+
+        Args:
+            tool_result: 도구 결과
+            compute: 기대값 계산 함수
+
+        Returns:
+            기대값
+        """
+        if self.cache is None:
+            return compute(tool_result)
+        return self.cache.get_or_compute(self.name, tool_result, compute)
+
     def _normalize_text(self, text: str) -> str:
         """텍스트 정규화 (비교용).
 
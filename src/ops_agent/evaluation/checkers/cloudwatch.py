@@ -12,10 +12,138 @@ Reference: docs/evaluation-design.md - Step 3
 """
 
 import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
 
-from ops_agent.evaluation.checkers.base import BaseChecker
+from ops_agent.evaluation.checkers.base import BaseChecker, IncrementalCheck, StreamingText
 from ops_agent.evaluation.models import CheckResult, ToolResult, ToolType
 
+# ==========================================================================
+# 사전 컴파일된 매처
+# ==========================================================================
+
+class KeywordScanner:
+    """여러 키워드를 정규식 한 번의 호출로 찾는 매처.
+
+    키워드 전체를 하나의 lookahead 정규식으로 컴파일하여 겹치는 매치까지 모두 찾습니다.
+    정규식 엔진은 텍스트의 각 위치에서 키워드 대안을 차례로 시도하므로
+    비용은 O(텍스트 길이 × 키워드 수)로 키워드별 `in` 검사와 같은 차수입니다.
+    이득은 키워드마다 Python 호출을 반복하지 않고 C 엔진 안에서 한 번에 처리한다는 점입니다.
+
+    Example:
+        scanner = KeywordScanner(["timeout", "Redis"])
+        scanner.scan("Redis connection timeout")  # ["timeout", "Redis"]
+    """
+
+    def __init__(self, keywords: list[str]) -> None:
+        """스캐너 초기화.
+
+        Args:
+            keywords: 검색할 키워드 목록 (대소문자 무시)
+        """
+        self.keywords = keywords
+        lowered = {k.lower() for k in keywords}
+        alternation = "|".join(
+            re.escape(k) for k in sorted(lowered, key=len, reverse=True)
+        )
+        # lookahead로 감싸 매치가 텍스트를 소비하지 않도록 함 (겹치는 키워드 허용)
+        self._pattern = re.compile(f"(?=({alternation}))")
+        # 같은 위치에서는 가장 긴 키워드만 매치되므로, 그 안에 포함된 키워드도 함께 발견 처리
+        self._implied = {k: {o for o in lowered if o in k} for k in lowered}
+
+    def found(self, text_lower: str) -> set[str]:
+        """텍스트에서 발견된 키워드 집합 (소문자).
+
+        Args:
+            text_lower: 소문자로 변환된 텍스트
+        """
+        found: set[str] = set()
+        for match in self._pattern.finditer(text_lower):
+            found |= self._implied[match.group(1)]
+        return found
+
+    def scan(self, text: str) -> list[str]:
+        """텍스트에 포함된 키워드를 등록 순서대로 반환.
+
+        Args:
+            text: 검색 대상 텍스트
+
+        Returns:
+            list[str]: 발견된 키워드 (원래 표기)
+        """
+        found = self.found(text.lower())
+        return [k for k in self.keywords if k.lower() in found]
+
+
+# 이벤트 수 패턴 (한글/영어) - 하나의 정규식으로 결합
+#   - "총 N"               : 접두어 + 숫자
+#   - "N건", "N개", "N errors", "N 에러", "N events", "N 이벤트" : 숫자 + 접미어
+# 접미어는 lookahead로 검사하여 소비하지 않으므로 인접한 매치가 누락되지 않습니다.
+_COUNT_REGEX = re.compile(
+    r"총\s*(\d+)"
+    r"|(\d+)(?=\s*(?:건|개|errors?|에러|events?|이벤트))",
+    re.IGNORECASE,
+)
+
+# "[ERROR] 500 - 메시지" 형식에서 에러 내용 추출
+_ERROR_MESSAGE_REGEX = re.compile(r'\[ERROR\]\s*\d*\s*[-:]?\s*(.+?)(?:[-:]|$)')
+
+
+def _scan_counts(text: str) -> frozenset[int]:
+    """텍스트에 언급된 이벤트 수를 한 번에 추출 (캐시 없음).
+
+    Args:
+        text: 응답 텍스트 또는 스트리밍 중인 응답 일부
+
+    Returns:
+        frozenset[int]: 언급된 숫자 집합
+    """
+    counts = set()
+    for match in _COUNT_REGEX.finditer(text):
+        num_str = match.group(1) or match.group(2)
+        try:
+            counts.add(int(num_str))
+        except ValueError:
+            continue
+    return frozenset(counts)
+
+
+@lru_cache(maxsize=128)
+def _extract_counts(response: str) -> frozenset[int]:
+    """완성된 응답에 언급된 이벤트 수 (응답별 캐시).
+
+    스트리밍 중간 텍스트는 캐시를 밀어내지 않도록 _scan_counts를 직접 사용합니다.
+    """
+    return _scan_counts(response)
+
+
+@lru_cache(maxsize=128)
+def _needle_scanner(needles: frozenset[str]) -> KeywordScanner:
+    """기대 키워드/서비스 이름 전체를 하나로 컴파일한 스캐너 (검색어 집합별 캐시)."""
+    return KeywordScanner(sorted(needles))
+
+
+@dataclass(frozen=True)
+class CloudWatchExpectation:
+    """CloudWatch 도구 결과에서 추출한 검사 기대값.
+
+    응답과 무관하게 도구 결과만으로 결정되므로 재생성 시도 간 재사용됩니다.
+
+    Attributes:
+        has_event_count: event_count 필드 존재 여부
+        event_count: 예상 이벤트 수
+        events: (메시지, 소문자 핵심 키워드) 목록
+        has_log_group: log_group 필드 존재 여부
+        service_name: 로그 그룹에서 추출한 서비스 이름
+    """
+
+    has_event_count: bool
+    event_count: int | None
+    events: tuple[tuple[str, tuple[str, ...]], ...]
+    has_log_group: bool
+    service_name: str | None
+
 
 class CloudWatchChecker(BaseChecker):
     """CloudWatch 데이터의 사실 정확성 검사기.
@@ -31,17 +159,23 @@ class CloudWatchChecker(BaseChecker):
     # 통과 임계값
     PASS_THRESHOLD = 0.7
 
-    # 이벤트 수 매칭 패턴 (한글/영어)
-    COUNT_PATTERNS = [
-        r"(\d+)\s*건",
-        r"(\d+)\s*개",
-        r"(\d+)\s*(errors?|에러)",
-        r"총\s*(\d+)",
-        r"(\d+)\s*(events?|이벤트)",
-        r"\*\*(\d+)건\*\*",
-        r"\*\*(\d+)개\*\*",
+    # 로그 메시지에서 추출할 일반적인 에러 키워드
+    KEYWORDS = [
+        "timeout",
+        "connection",
+        "failed",
+        "error",
+        "exception",
+        "refused",
+        "exhausted",
+        "Redis",
+        "Database",
+        "payment",
+        "gateway",
     ]
 
+    _keyword_scanner = KeywordScanner(KEYWORDS)
+
     @property
     def name(self) -> str:
         """검사기 이름."""
@@ -69,26 +203,76 @@ class CloudWatchChecker(BaseChecker):
 
         # CloudWatch 결과 없으면 스킵
         if not cw_results:
-            return CheckResult(
-                checker_name=self.name,
-                score=1.0,
-                passed=True,
-                issues=[],
-                details={"skipped": "no_cloudwatch_results"},
-            )
+            return self._skipped_result()
+
+        expectations = [self._expectations(r, self._build_expectation) for r in cw_results]
+
+        # 모든 이벤트 키워드와 서비스 이름을 한 번의 응답 스캔으로 매칭
+        needles = _expected_needles(expectations)
+        found = _needle_scanner(needles).found(response.lower()) if needles else set()
+
+        return self._score(
+            expectations,
+            has_count=lambda count: self._verify_count_mentioned(response, count),
+            contains=found.__contains__,
+        )
+
+    def start_incremental(self, tool_results: list[ToolResult]) -> IncrementalCheck | None:
+        """스트리밍 중 증분 검사 시작.
+
+        Args:
+            tool_results: 지금까지 캡처된 도구 결과
+
+        Returns:
+            IncrementalCheck: 청크 단위로 이벤트 수/키워드/서비스 이름을 매칭하는 검사
+        """
+        expectations = [
+            self._expectations(r, self._build_expectation)
+            for r in tool_results
+            if r.tool_type == ToolType.CLOUDWATCH
+        ]
+        return IncrementalCloudWatchCheck(self, expectations)
+
+    def _skipped_result(self) -> CheckResult:
+        """CloudWatch 결과가 없을 때의 결과."""
+        return CheckResult(
+            checker_name=self.name,
+            score=1.0,
+            passed=True,
+            issues=[],
+            details={"skipped": "no_cloudwatch_results"},
+        )
 
+    def _score(
+        self,
+        expectations: list[CloudWatchExpectation],
+        has_count: Callable[[int], bool],
+        contains: Callable[[str], bool],
+    ) -> CheckResult:
+        """기대값과 응답 매칭 결과로 점수 계산.
+
+        Args:
+            expectations: CloudWatch 결과별 기대값
+            has_count: 응답에 해당 이벤트 수가 언급되었는지 여부
+            contains: 응답(소문자)에 검색어(소문자)가 포함되었는지 여부
+
+        Returns:
+            CheckResult: 검사 결과
+        """
         issues: list[str] = []
         total_checks = 0
         passed_checks = 0
 
-        for result in cw_results:
-            output = result.tool_output
+        # 키워드 인용 여부는 메시지 단위로 재사용
+        cited_by_message: dict[str, bool] = {}
 
+        for expectation in expectations:
             # 검사 1: 이벤트 수 정확성
-            if "event_count" in output:
+            if expectation.has_event_count:
                 total_checks += 1
-                expected_count = output["event_count"]
-                if self._verify_count_mentioned(response, expected_count):
+                expected_count = expectation.event_count
+                # event_count가 null이면 응답에서 확인할 수 없으므로 불일치로 처리
+                if expected_count is not None and has_count(expected_count):
                     passed_checks += 1
                 else:
                     issues.append(
@@ -97,30 +281,26 @@ class CloudWatchChecker(BaseChecker):
                     )
 
             # 검사 2: 에러 메시지 인용 여부
-            if "events" in output and output["events"]:
-                events = output["events"]
-                cited_count = 0
-
-                for event in events:
-                    total_checks += 1
-                    message = event.get("message", "")
-                    key_phrases = self._extract_key_phrases(message)
-
-                    if self._any_phrase_in_response(key_phrases, response):
-                        passed_checks += 1
-                        cited_count += 1
-                    else:
-                        # 첫 50자만 표시
-                        short_msg = message[:50] + "..." if len(message) > 50 else message
-                        issues.append(f"에러 미인용: {short_msg}")
+            for message, phrases_lower in expectation.events:
+                total_checks += 1
+                cited = cited_by_message.get(message)
+                if cited is None:
+                    cited = any(contains(phrase) for phrase in phrases_lower)
+                    cited_by_message[message] = cited
+
+                if cited:
+                    passed_checks += 1
+                else:
+                    # 첫 50자만 표시
+                    short_msg = message[:50] + "..." if len(message) > 50 else message
+                    issues.append(f"에러 미인용: {short_msg}")
 
             # 검사 3: 서비스/로그 그룹 언급 여부
-            if "log_group" in output:
+            if expectation.has_log_group:
                 total_checks += 1
-                log_group = output["log_group"]
-                service_name = self._extract_service_name(log_group)
+                service_name = expectation.service_name
 
-                if service_name and service_name.lower() in response.lower():
+                if service_name and contains(service_name.lower()):
                     passed_checks += 1
                 else:
                     issues.append(f"서비스 미언급: {service_name}")
@@ -136,98 +316,57 @@ class CloudWatchChecker(BaseChecker):
             details={
                 "total_checks": total_checks,
                 "passed_checks": passed_checks,
-                "cw_results_count": len(cw_results),
+                "cw_results_count": len(expectations),
             },
         )
 
-    def _verify_count_mentioned(self, response: str, expected: int) -> bool:
-        """응답에 이벤트 수가 정확하게 언급되었는지 확인.
-
-        Args:
-            response: 응답 텍스트
-            expected: 예상 이벤트 수
-
-        Returns:
-            bool: 정확한 수가 언급되었으면 True
-        """
-        for pattern in self.COUNT_PATTERNS:
-            matches = re.findall(pattern, response, re.IGNORECASE)
-            for match in matches:
-                # 튜플이면 첫 번째 요소 (숫자 그룹)
-                num_str = match[0] if isinstance(match, tuple) else match
-                try:
-                    if int(num_str) == expected:
-                        return True
-                except ValueError:
-                    continue
-
-        return False
-
-    def _extract_key_phrases(self, message: str) -> list[str]:
-        """로그 메시지에서 핵심 키워드 추출.
+    def _build_expectation(self, result: ToolResult) -> CloudWatchExpectation:
+        """도구 결과에서 검사 기대값 추출 (응답과 무관).
 
         Args:
-            message: 로그 메시지
+            result: CloudWatch 도구 결과
 
         Returns:
-            list[str]: 핵심 키워드 목록
+            CloudWatchExpectation: 이벤트 수, 이벤트별 핵심 키워드, 서비스 이름
         """
-        phrases = []
-
-        # [ERROR] 500 - 형식에서 에러 내용 추출
-        error_match = re.search(
-            r'\[ERROR\]\s*\d*\s*[-:]?\s*(.+?)(?:[-:]|$)',
-            message,
+        output = result.tool_output
+
+        events: list[tuple[str, tuple[str, ...]]] = []
+        if "events" in output and output["events"]:
+            for event in output["events"]:
+                message = event.get("message", "")
+                phrases_lower = tuple(
+                    phrase.lower()
+                    for phrase in _extract_key_phrases_cached(message)
+                    if phrase  # 빈 문자열 제외
+                )
+                events.append((message, phrases_lower))
+
+        has_log_group = "log_group" in output
+        return CloudWatchExpectation(
+            has_event_count="event_count" in output,
+            event_count=output.get("event_count"),
+            events=tuple(events),
+            has_log_group=has_log_group,
+            service_name=(
+                self._extract_service_name(output["log_group"]) if has_log_group else None
+            ),
         )
-        if error_match:
-            error_text = error_match.group(1).strip()
-            # 콜론으로 분리된 첫 부분
-            parts = error_text.split(":")
-            if parts:
-                phrases.append(parts[0].strip())
-
-        # 일반적인 에러 키워드 추출
-        keywords = [
-            "timeout",
-            "connection",
-            "failed",
-            "error",
-            "exception",
-            "refused",
-            "exhausted",
-            "Redis",
-            "Database",
-            "payment",
-            "gateway",
-        ]
-
-        message_lower = message.lower()
-        for keyword in keywords:
-            if keyword.lower() in message_lower:
-                phrases.append(keyword)
 
-        return phrases
+    def _verify_count_mentioned(self, response: str, expected: int) -> bool:
+        """응답에 이벤트 수가 정확하게 언급되었는지 확인.
 
-    def _any_phrase_in_response(
-        self,
-        phrases: list[str],
-        response: str,
-    ) -> bool:
-        """키워드 중 하나라도 응답에 있는지 확인.
+        응답의 숫자는 결합 정규식으로 한 번만 추출하여 캐시하므로
+        여러 도구 결과를 검사해도 응답을 반복 스캔하지 않습니다.
 
         Args:
-            phrases: 검색할 키워드 목록
             response: 응답 텍스트
+            expected: 예상 이벤트 수
 
         Returns:
-            bool: 하나라도 발견되면 True
+            bool: 정확한 수가 언급되었으면 True
         """
-        response_lower = response.lower()
-        return any(
-            phrase.lower() in response_lower
-            for phrase in phrases
-            if phrase  # 빈 문자열 제외
-        )
+        return expected in _extract_counts(response)
 
     def _extract_service_name(self, log_group: str) -> str | None:
         """로그 그룹에서 서비스 이름 추출.
@@ -245,3 +384,132 @@ class CloudWatchChecker(BaseChecker):
         # /로 분리하여 마지막 부분 추출
         parts = log_group.strip("/").split("/")
         return parts[-1] if parts else None
+
+
+class IncrementalCloudWatchCheck(IncrementalCheck):
+    """CloudWatchChecker의 스트리밍(증분) 검사.
+
+    청크가 들어올 때마다 새 구간에서 이벤트 수와 키워드/서비스 이름을 찾아
+    매칭 상태를 유지합니다. 생성 완료 후 result()는 check()와 같은 결과입니다.
+    """
+
+    # 이벤트 수 매치가 청크 경계에 걸칠 수 있으므로 직전 구간을 다시 검사할 길이
+    COUNT_RESCAN = 64
+
+    def __init__(
+        self,
+        checker: CloudWatchChecker,
+        expectations: list[CloudWatchExpectation],
+    ) -> None:
+        """증분 검사 초기화.
+
+        Args:
+            checker: 점수 계산에 사용할 검사기
+            expectations: CloudWatch 결과별 기대값
+        """
+        self.checker = checker
+        self.expectations = expectations
+
+        self._text = StreamingText(_expected_needles(expectations))
+        self._counts: set[int] = set()
+        # 이벤트 수를 아직 확정하지 않은 텍스트 끝부분 (전체 텍스트를 다시 합치지 않음)
+        self._count_window = ""
+        self._count_before = ""  # _count_window 바로 앞 문자 (숫자 중간 매치 판별용)
+
+    def feed(self, chunk: str) -> None:
+        """텍스트 청크 추가 (키워드 매칭 + 확정된 이벤트 수 추출)."""
+        self._text.feed(chunk)
+        self._count_window += chunk
+        self._scan_counts(final=False)
+
+    def result(self, final: bool = True) -> CheckResult:
+        """현재까지의 텍스트 기준 검사 결과."""
+        if not self.expectations:
+            return self.checker._skipped_result()
+
+        counts = self._counts
+        if final:
+            self._scan_counts(final=True)
+        else:
+            # 중간 결과: 끝부분의 미확정 숫자도 포함 (상태는 변경하지 않음)
+            counts = counts | _scan_counts(self._count_window)
+
+        return self.checker._score(
+            self.expectations,
+            has_count=lambda count: count in counts,
+            contains=self._text.contains,
+        )
+
+    def _scan_counts(self, final: bool) -> None:
+        """마지막 확정 위치 이후의 이벤트 수 추출.
+
+        텍스트 끝에 닿은 매치는 숫자가 더 이어질 수 있으므로 생성 완료 전에는 보류합니다.
+        숫자 중간에서 시작하는 매치는 전체 텍스트 스캔에서는 나오지 않으므로 제외합니다.
+        검사 후에는 끝부분 COUNT_RESCAN자만 남겨 다음 청크와 이어서 검사합니다.
+        """
+        text = self._count_window
+        for match in _COUNT_REGEX.finditer(text):
+            if not final and match.end() >= len(text):
+                continue
+            group = 1 if match.group(1) is not None else 2
+            start = match.start(group)
+            previous = text[start - 1] if start > 0 else self._count_before
+            if group == 2 and previous.isdecimal():
+                continue
+            try:
+                self._counts.add(int(match.group(group)))
+            except ValueError:
+                continue
+
+        cut = len(text) - self.COUNT_RESCAN
+        if cut > 0:
+            self._count_before = text[cut - 1]
+            self._count_window = text[cut:]
+
+
+def _expected_needles(expectations: list[CloudWatchExpectation]) -> frozenset[str]:
+    """응답에서 찾아야 할 검색어 (이벤트 핵심 키워드 + 서비스 이름, 소문자).
+
+    Args:
+        expectations: CloudWatch 결과별 기대값
+
+    Returns:
+        frozenset[str]: 빈 문자열을 제외한 검색어 집합
+    """
+    needles: set[str] = set()
+    for expectation in expectations:
+        for _, phrases_lower in expectation.events:
+            needles.update(phrases_lower)
+        if expectation.service_name:
+            needles.add(expectation.service_name.lower())
+    needles.discard("")
+    return frozenset(needles)
+
+
+@lru_cache(maxsize=1024)
+def _extract_key_phrases_cached(message: str) -> tuple[str, ...]:
+    """로그 메시지 핵심 키워드 추출 (메시지별 캐시).
+
+    동일한 에러 메시지가 반복되는 로그가 많으므로 결과를 캐시합니다.
+
+    Args:
+        message: 로그 메시지
+
+    Returns:
+        tuple[str, ...]: 핵심 키워드 (에러 내용 → 일반 키워드 순)
+    """
+    phrases = []
+
+    # [ERROR] 500 - 형식에서 에러 내용 추출
+    error_match = _ERROR_MESSAGE_REGEX.search(message)
+    if error_match:
+        error_text = error_match.group(1).strip()
+        # 콜론으로 분리된 첫 부분
+        parts = error_text.split(":")
+        if parts:
+            phrases.append(parts[0].strip())
+
+    # 일반적인 에러 키워드 추출 (정규식 한 번 호출)
+    phrases.extend(CloudWatchChecker._keyword_scanner.scan(message))
+
+    return tuple(phrases)
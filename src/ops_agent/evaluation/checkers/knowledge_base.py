@@ -8,8 +8,9 @@ KB 도구 결과 대비 응답의 내용 반영 여부 검사.
 
 import json
 import re
+from collections.abc import Callable
 
-from ops_agent.evaluation.checkers.base import BaseChecker
+from ops_agent.evaluation.checkers.base import BaseChecker, IncrementalCheck, StreamingText
 from ops_agent.evaluation.models import CheckResult, ToolResult, ToolType
 
 
@@ -37,35 +38,57 @@ class KBChecker(BaseChecker):
         ]
 
         if not kb_results:
-            return CheckResult(
-                checker_name=self.name,
-                score=1.0,
-                passed=True,
-                issues=[],
-                details={"skipped": "no_kb_results"},
-            )
+            return self._skipped_result()
 
+        response_lower = self._normalize_text(response)
+
+        return self._score(
+            [self._expectations(r, self._build_expectation) for r in kb_results],
+            contains=lambda needle: needle in response_lower,
+        )
+
+    def start_incremental(self, tool_results: list[ToolResult]) -> IncrementalCheck | None:
+        """스트리밍 중 증분 검사 시작 (청크 단위로 핵심 구문 매칭)."""
+        expectations = [
+            self._expectations(r, self._build_expectation)
+            for r in tool_results
+            if r.tool_type == ToolType.KNOWLEDGE_BASE
+        ]
+        return IncrementalKBCheck(self, expectations)
+
+    def _skipped_result(self) -> CheckResult:
+        """KB 결과가 없을 때의 결과."""
+        return CheckResult(
+            checker_name=self.name,
+            score=1.0,
+            passed=True,
+            issues=[],
+            details={"skipped": "no_kb_results"},
+        )
+
+    def _score(
+        self,
+        expectations: list[tuple[str, ...] | None],
+        contains: Callable[[str], bool],
+    ) -> CheckResult:
+        """핵심 구문 반영 여부로 점수 계산.
+
+        Args:
+            expectations: KB 결과별 핵심 구문 (검색 결과 없으면 None)
+            contains: 정규화된 응답에 검색어(소문자)가 포함되었는지 여부
+        """
         issues: list[str] = []
         total_phrases = 0
         found_phrases = 0
-        response_lower = self._normalize_text(response)
-
-        for result in kb_results:
-            output = result.tool_output
-            results_list = output.get("results", [])
 
-            if not results_list:
+        for phrases in expectations:
+            if phrases is None:
                 issues.append("KB 검색 결과 없음")
                 continue
 
-            # 상위 결과에서 핵심 구문 추출 및 확인
-            top_result = results_list[0]
-            content = top_result.get("content", "")
-            phrases = self._extract_key_phrases(content)
-
             for phrase in phrases:
                 total_phrases += 1
-                if phrase.lower() in response_lower:
+                if contains(phrase.lower()):
                     found_phrases += 1
                 else:
                     issues.append(f"미반영: {phrase[:40]}")
@@ -80,10 +103,23 @@ class KBChecker(BaseChecker):
             details={
                 "total_phrases": total_phrases,
                 "found_phrases": found_phrases,
-                "kb_results_count": len(kb_results),
+                "kb_results_count": len(expectations),
             },
         )
 
+    def _build_expectation(self, result: ToolResult) -> tuple[str, ...] | None:
+        """상위 검색 결과의 핵심 구문 추출 (응답과 무관, 재생성 시 재사용).
+
+        Returns:
+            tuple[str, ...] | None: 핵심 구문 (검색 결과가 없으면 None)
+        """
+        results_list = result.tool_output.get("results", [])
+        if not results_list:
+            return None
+
+        content = results_list[0].get("content", "")
+        return tuple(self._extract_key_phrases(content))
+
     def _extract_key_phrases(self, content: str) -> list[str]:
         """KB 문서 content에서 핵심 구문 추출.
 
@@ -118,3 +154,40 @@ class KBChecker(BaseChecker):
                         break
 
         return phrases
+
+
+class IncrementalKBCheck(IncrementalCheck):
+    """KBChecker의 스트리밍(증분) 검사.
+
+    응답을 청크 단위로 정규화(소문자, 공백 정리)하면서 핵심 구문 포함 여부를 추적합니다.
+    """
+
+    def __init__(
+        self,
+        checker: KBChecker,
+        expectations: list[tuple[str, ...] | None],
+    ) -> None:
+        """증분 검사 초기화.
+
+        Args:
+            checker: 점수 계산에 사용할 검사기
+            expectations: KB 결과별 핵심 구문
+        """
+        self.checker = checker
+        self.expectations = expectations
+        needles = {
+            phrase.lower()
+            for phrases in expectations if phrases
+            for phrase in phrases
+        }
+        self._text = StreamingText(needles, normalize_whitespace=True)
+
+    def feed(self, chunk: str) -> None:
+        """텍스트 청크 추가."""
+        self._text.feed(chunk)
+
+    def result(self, final: bool = True) -> CheckResult:  # noqa: ARG002 - 호출부가 final= 키워드로 전달
+        """현재까지의 텍스트 기준 검사 결과 (KB 매칭은 보류 상태가 없어 final과 무관)."""
+        if not self.expectations:
+            return self.checker._skipped_result()
+        return self.checker._score(self.expectations, contains=self._text.contains)
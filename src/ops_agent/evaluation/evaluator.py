@@ -16,7 +16,10 @@ Reference: docs/evaluation-design.md - Step 4
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, wait
 
+from ops_agent.config import get_settings
+from ops_agent.evaluation.cache import EvaluationCache
 from ops_agent.evaluation.checkers.base import BaseChecker
 from ops_agent.evaluation.checkers.cloudwatch import CloudWatchChecker
 from ops_agent.evaluation.checkers.knowledge_base import KBChecker
@@ -38,6 +41,9 @@ class OpsAgentEvaluator:
     Attributes:
         pass_threshold: 통과 임계값 (기본: 0.7)
         block_threshold: 차단 임계값 (기본: 0.3)
+        parallel: 검사기 동시 실행 여부 (기본: EVAL_PARALLEL_CHECKERS)
+        checker_timeout: 검사기별 제한 시간 초 (기본: EVAL_CHECKER_TIMEOUT)
+        cache: 도구 결과별 기대값 캐시 (재생성 시도 간 공유)
         checkers: 등록된 검사기 목록
 
     Example:
@@ -54,65 +60,80 @@ class OpsAgentEvaluator:
         self,
         pass_threshold: float = 0.7,
         block_threshold: float = 0.3,
+        parallel: bool | None = None,
+        checker_timeout: float | None = None,
+        cache: EvaluationCache | None = None,
     ) -> None:
         """평가기 초기화.
 
         Args:
             pass_threshold: 통과 임계값 (0.0 - 1.0)
             block_threshold: 차단 임계값 (이 미만이면 BLOCK)
+            parallel: 검사기 동시 실행 여부 (None이면 설정값 사용)
+            checker_timeout: 검사기별 제한 시간 초 (None이면 설정값 사용)
+            cache: 도구 결과별 기대값 캐시 (워크플로우 단위로 전달하면
+                재생성 시 도구 결과 파싱을 건너뛰고 새 응답과의 매칭만 수행)
         """
+        settings = get_settings()
+
         self.pass_threshold = pass_threshold
         self.block_threshold = block_threshold
+        self.parallel = settings.eval_parallel_checkers if parallel is None else parallel
+        self.checker_timeout = (
+            settings.eval_checker_timeout if checker_timeout is None else checker_timeout
+        )
+        self.cache = cache
 
         # 검사기 등록
         self.checkers: list[BaseChecker] = [
-            CloudWatchChecker(),
-            KBChecker(),
+            CloudWatchChecker(cache=cache),
+            KBChecker(cache=cache),
             # DatadogChecker(),       # Phase 2
         ]
 
         logger.debug(
             f"[Evaluator] 초기화: pass={pass_threshold}, "
-            f"block={block_threshold}, checkers={len(self.checkers)}"
+            f"block={block_threshold}, checkers={len(self.checkers)}, "
+            f"parallel={self.parallel}"
         )
 
     def evaluate(
         self,
         response: str,
         tool_results: list[ToolResult],
+        precomputed: dict[str, CheckResult] | None = None,
     ) -> EvalResult:
         """응답 품질 평가.
 
         모든 검사기를 실행하고 결과를 종합합니다.
+        parallel=True이면 검사기를 동시에 실행하여 가장 느린 검사기만큼만 대기합니다.
 
         Args:
             response: LLM이 생성한 응답 텍스트
             tool_results: 에이전트 실행 중 캡처된 도구 결과 목록
+            precomputed: 이미 계산된 검사기별 결과 (스트리밍 증분 평가, 해당 검사기는 생략)
 
         Returns:
             EvalResult: 최종 평가 결과
         """
-        check_results: list[CheckResult] = []
-
-        # 모든 검사기 실행
-        for checker in self.checkers:
-            try:
-                result = checker.check(response, tool_results)
-                check_results.append(result)
-                logger.debug(
-                    f"[Evaluator] {checker.name}: "
-                    f"score={result.score:.2f}, passed={result.passed}"
-                )
-            except Exception as e:
-                logger.error(f"[Evaluator] {checker.name} 오류: {e}")
-                # 오류 시 중립 결과
-                check_results.append(CheckResult(
-                    checker_name=checker.name,
-                    score=0.5,
-                    passed=True,
-                    issues=[f"검사 오류: {e}"],
-                    details={"error": str(e)},
-                ))
+        precomputed = precomputed or {}
+        pending = [c for c in self.checkers if c.name not in precomputed]
+
+        # 미리 계산되지 않은 검사기 실행
+        if self.parallel and len(pending) > 1:
+            computed = self._run_checkers_parallel(response, tool_results, pending)
+        else:
+            computed = [
+                self._run_checker(checker, response, tool_results)
+                for checker in pending
+            ]
+
+        # 결과 순서는 self.checkers 순서 유지
+        computed_iter = iter(computed)
+        check_results = [
+            precomputed[checker.name] if checker.name in precomputed else next(computed_iter)
+            for checker in self.checkers
+        ]
 
         # 전체 점수 계산
         overall_score = self._calculate_overall_score(check_results)
@@ -137,6 +158,99 @@ class OpsAgentEvaluator:
             feedback=feedback,
         )
 
+    def _run_checker(
+        self,
+        checker: BaseChecker,
+        response: str,
+        tool_results: list[ToolResult],
+    ) -> CheckResult:
+        """단일 검사기 실행 (오류 시 중립 결과).
+
+        Args:
+            checker: 실행할 검사기
+            response: LLM 응답 텍스트
+            tool_results: 도구 결과 목록
+
+        Returns:
+            CheckResult: 검사 결과
+        """
+        try:
+            result = checker.check(response, tool_results)
+            logger.debug(
+                f"[Evaluator] {checker.name}: "
+                f"score={result.score:.2f}, passed={result.passed}"
+            )
+            return result
+        except Exception as e:
+            logger.error(f"[Evaluator] {checker.name} 오류: {e}")
+            return self._neutral_result(checker, f"검사 오류: {e}", str(e))
+
+    def _run_checkers_parallel(
+        self,
+        response: str,
+        tool_results: list[ToolResult],
+        checkers: list[BaseChecker] | None = None,
+    ) -> list[CheckResult]:
+        """검사기 동시 실행.
+
+        모든 검사기를 한 번에 제출하고 checker_timeout 동안 기다린 뒤,
+        끝나지 않은 검사기는 중립 결과로 대체합니다 (실행 중인 스레드는 중단할 수 없으므로
+        결과만 버림). 결과 순서는 검사기 순서를 유지합니다.
+
+        Args:
+            response: LLM 응답 텍스트
+            tool_results: 도구 결과 목록
+            checkers: 실행할 검사기 (None이면 self.checkers)
+
+        Returns:
+            list[CheckResult]: 검사 결과 목록
+        """
+        checkers = self.checkers if checkers is None else checkers
+        pool = ThreadPoolExecutor(max_workers=len(checkers), thread_name_prefix="ops-checker")
+        try:
+            futures = [
+                pool.submit(self._run_checker, checker, response, tool_results)
+                for checker in checkers
+            ]
+            wait(futures, timeout=self.checker_timeout)
+        finally:
+            # 시간 초과된 검사기를 기다리지 않고 반환
+            pool.shutdown(wait=False)
+
+        check_results: list[CheckResult] = []
+        for checker, future in zip(checkers, futures, strict=True):
+            if future.done():
+                check_results.append(future.result())
+                continue
+            logger.error(f"[Evaluator] {checker.name} 시간 초과 ({self.checker_timeout:.1f}s)")
+            check_results.append(self._neutral_result(
+                checker,
+                f"검사 시간 초과 ({self.checker_timeout:.1f}초)",
+                "timeout",
+            ))
+
+        return check_results
+
+    @staticmethod
+    def _neutral_result(checker: BaseChecker, issue: str, error: str) -> CheckResult:
+        """검사 실패 시 사용할 중립 결과 (점수 0.5, 통과).
+
+        Args:
+            checker: 실패한 검사기
+            issue: 이슈 메시지
+            error: details에 기록할 오류 내용
+
+        Returns:
+            CheckResult: 중립 결과
+        """
+        return CheckResult(
+            checker_name=checker.name,
+            score=0.5,
+            passed=True,
+            issues=[issue],
+            details={"error": error},
+        )
+
     def _calculate_overall_score(
         self,
         check_results: list[CheckResult],
@@ -0,0 +1,175 @@
+"""Streaming Evaluation.
+
+ANALYZE 스트리밍 중 응답 텍스트 청크를 검사기에 바로 전달하는 증분 평가.
+
+생성이 진행되는 동안 이벤트 수/키워드 매칭을 미리 수행하므로
+생성이 끝난 뒤 EVALUATE 단계에서는 점수 집계만 남습니다.
+중간 결과(is_failing, provisional_score)로 명백히 실패하는 응답을 조기에 알 수도 있습니다.
+
+사용법:
+    session = StreamingEvaluation(OpsAgentEvaluator())
+    session.add_tool_results(tool_results)   # 도구 결과 수신 시
+    session.feed("payment-service에서 ")      # 텍스트 청크 수신 시
+    session.end_message()                    # assistant 메시지 종료 시
+
+    result = session.evaluate(response, tool_results)
+"""
+
+import logging
+
+from ops_agent.evaluation.cache import fingerprint_tool_result
+from ops_agent.evaluation.checkers.base import IncrementalCheck
+from ops_agent.evaluation.evaluator import OpsAgentEvaluator
+from ops_agent.evaluation.models import CheckResult, EvalResult, ToolResult
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingEvaluation:
+    """스트리밍 응답의 증분 평가 세션.
+
+    응답은 마지막 assistant 메시지의 텍스트이므로, 새 assistant 메시지가 시작되면
+    (도구 호출 후 이어지는 생성) 텍스트와 매칭 상태를 처음부터 다시 쌓습니다.
+
+    evaluate() 시 스트리밍으로 본 텍스트/도구 결과가 최종 응답/도구 결과와 다르면
+    증분 결과를 버리고 일반 평가를 수행하므로 결과는 항상 evaluate()와 같습니다.
+
+    Attributes:
+        evaluator: 검사기와 판정 기준을 제공하는 평가기
+        tool_results: 지금까지 수신한 도구 결과
+    """
+
+    def __init__(
+        self,
+        evaluator: OpsAgentEvaluator,
+        tool_results: list[ToolResult] | None = None,
+    ) -> None:
+        """세션 초기화.
+
+        Args:
+            evaluator: 평가기
+            tool_results: 스트리밍 시작 전에 알려진 도구 결과 (재시도 주입 결과 등)
+        """
+        self.evaluator = evaluator
+        self.tool_results: list[ToolResult] = list(tool_results or [])
+        # 긴 스트림에서 문자열 += 복사가 반복되지 않도록 청크 목록으로 모음
+        self._chunks: list[str] = []
+        self._message_closed = False
+        self._failed = False
+        self._checks: list[IncrementalCheck | None] = []
+        self._restart()
+
+    def add_tool_results(self, tool_results: list[ToolResult]) -> None:
+        """도구 결과 추가 (기대값이 바뀌므로 증분 검사 재시작).
+
+        Args:
+            tool_results: 새로 수신한 도구 결과
+        """
+        if not tool_results:
+            return
+        self.tool_results.extend(tool_results)
+        self._restart()
+
+    def feed(self, chunk: str) -> None:
+        """응답 텍스트 청크 전달.
+
+        Args:
+            chunk: 새로 생성된 텍스트
+        """
+        if self._message_closed:
+            # 이전 assistant 메시지가 끝난 뒤의 텍스트 → 새 메시지
+            self._chunks = []
+            self._message_closed = False
+            self._restart()
+
+        self._chunks.append(chunk)
+        if self._failed:
+            return
+
+        try:
+            for check in self._checks:
+                if check is not None:
+                    check.feed(chunk)
+        except Exception as e:
+            logger.warning(f"[StreamingEvaluation] 증분 검사 오류, 일반 평가로 전환: {e}")
+            self._failed = True
+
+    def end_message(self) -> None:
+        """현재 assistant 메시지 종료."""
+        self._message_closed = True
+
+    def provisional_results(self) -> list[CheckResult]:
+        """지금까지의 텍스트 기준 중간 검사 결과 (증분 검사 지원 검사기만)."""
+        if self._failed:
+            return []
+        return [check.result(final=False) for check in self._checks if check is not None]
+
+    def provisional_score(self) -> float | None:
+        """지금까지의 텍스트 기준 중간 점수 (증분 검사가 없으면 None)."""
+        results = self.provisional_results()
+        if not results:
+            return None
+        return self.evaluator._calculate_overall_score(results)
+
+    def is_failing(self) -> bool:
+        """중간 결과가 BLOCK 기준(block_threshold 미만 검사 존재)에 해당하는지 여부."""
+        return any(
+            r.score < self.evaluator.block_threshold
+            for r in self.provisional_results()
+        )
+
+    def evaluate(self, response: str, tool_results: list[ToolResult]) -> EvalResult:
+        """최종 평가 (증분 결과 재사용, 불일치 시 일반 평가).
+
+        Args:
+            response: 최종 응답 텍스트
+            tool_results: 최종 도구 결과
+
+        Returns:
+            EvalResult: 평가 결과 (OpsAgentEvaluator.evaluate와 동일)
+        """
+        precomputed = self._final_results(response, tool_results)
+        return self.evaluator.evaluate(response, tool_results, precomputed=precomputed)
+
+    def _final_results(
+        self,
+        response: str,
+        tool_results: list[ToolResult],
+    ) -> dict[str, CheckResult] | None:
+        """증분 검사 최종 결과 (스트리밍 내용과 최종 입력이 같을 때만)."""
+        if self._failed or "".join(self._chunks) != response:
+            return None
+
+        streamed = [fingerprint_tool_result(r) for r in self.tool_results]
+        final = [fingerprint_tool_result(r) for r in tool_results]
+        if streamed != final:
+            return None
+
+        try:
+            return {
+                checker.name: check.result(final=True)
+                for checker, check in zip(self.evaluator.checkers, self._checks, strict=True)
+                if check is not None
+            }
+        except Exception as e:
+            logger.warning(f"[StreamingEvaluation] 증분 검사 결과 오류: {e}")
+            return None
+
+    def _restart(self) -> None:
+        """현재 도구 결과로 증분 검사를 다시 만들고 현재 텍스트를 다시 전달."""
+        if self._failed:
+            return
+
+        try:
+            self._checks = [
+                checker.start_incremental(self.tool_results)
+                for checker in self.evaluator.checkers
+            ]
+            if self._chunks:
+                text = "".join(self._chunks)
+                for check in self._checks:
+                    if check is not None:
+                        check.feed(text)
+        except Exception as e:
+            logger.warning(f"[StreamingEvaluation] 증분 검사 시작 오류, 일반 평가로 전환: {e}")
+            self._failed = True
@@ -13,13 +13,25 @@ Reference:
     result = graph.run("payment-service에서 500 에러 로그 보여줘")
 """
 
+from ops_agent.graph.admission import AdmissionController, AdmissionRejected
 from ops_agent.graph.function_node import FunctionNode
-from ops_agent.graph.runner import OpsAgentGraph, build_ops_graph
+from ops_agent.graph.runner import (
+    OpsAgentGraph,
+    build_ops_graph,
+    clear_graph_registry,
+    get_graph_registry_stats,
+    lease_ops_graph,
+)
 from ops_agent.graph.state import OpsWorkflowState
 
 __all__ = [
+    "AdmissionController",
+    "AdmissionRejected",
     "FunctionNode",
     "OpsAgentGraph",
     "OpsWorkflowState",
     "build_ops_graph",
+    "clear_graph_registry",
+    "get_graph_registry_stats",
+    "lease_ops_graph",
 ]
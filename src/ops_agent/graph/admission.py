@@ -0,0 +1,307 @@
+"""Admission Controller - 요청 단위 동시 실행 제한.
+
+워크플로우 하나는 Bedrock 호출과 도구 호출을 여러 번 수행하므로
+동시 요청을 제한 없이 받으면 Bedrock 스로틀링이 연쇄적으로 발생합니다.
+AdmissionController는 동시 실행 워크플로우 수를 제한하고,
+초과 요청은 크기 제한이 있는 대기열에서 기다리게 하여 과부하를 back-pressure로 바꿉니다.
+
+동작 방식:
+    admit() → 빈 슬롯이 있으면 즉시 실행
+            → 없으면 대기열에서 대기 (세션별 라운드 로빈으로 순서 결정)
+            → 대기열이 가득 찼거나 대기 시간 초과 시 AdmissionRejected
+    실행 종료 → 슬롯 반환 → 다음 세션의 대기 요청 실행
+
+세션 공정성:
+    대기열은 세션별로 나뉘며, 슬롯이 비면 세션을 돌아가며 하나씩 실행합니다.
+    max_per_session을 설정하면 한 세션이 동시에 차지할 수 있는 슬롯 수도 제한합니다.
+
+사용법:
+    from ops_agent.graph.admission import AdmissionController, AdmissionRejected
+
+    admission = AdmissionController(max_in_flight=8, max_queue=32, queue_timeout=30)
+
+    try:
+        async with admission.admit(session_id) as wait_seconds:
+            async for event in agent.stream_async(prompt):
+                ...
+    except AdmissionRejected as e:
+        ...  # e.reason: "queue_full" | "timeout"
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from ops_agent.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejected(RuntimeError):
+    """대기열 초과 또는 대기 시간 초과로 요청이 거부됨.
+
+    Attributes:
+        reason: 거부 사유 ("queue_full" | "timeout")
+        stats: 거부 시점의 컨트롤러 통계
+    """
+
+    def __init__(self, reason: str, message: str, stats: dict[str, Any]) -> None:
+        super().__init__(message)
+        self.reason = reason
+        self.stats = stats
+
+
+class _Waiter:
+    """대기 중인 요청 (슬롯 할당 여부는 컨트롤러 잠금 안에서만 변경)."""
+
+    __slots__ = ("key", "loop", "future", "enqueued_at", "granted")
+
+    def __init__(self, key: str, loop: asyncio.AbstractEventLoop) -> None:
+        self.key = key
+        self.loop = loop
+        self.future: asyncio.Future[None] = loop.create_future()
+        self.enqueued_at = time.monotonic()
+        self.granted = False
+
+
+class AdmissionController:
+    """동시 실행 워크플로우 수 제한 + 세션별 공정 대기열 (스레드 안전).
+
+    여러 이벤트 루프/스레드에서 호출되어도 안전하도록 상태는 threading.Lock으로 보호하고,
+    대기 중인 요청은 자신의 이벤트 루프에서 깨웁니다.
+
+    Attributes:
+        max_in_flight: 동시 실행 최대 워크플로우 수
+        max_queue: 최대 대기 요청 수
+        queue_timeout: 최대 대기 시간 (초)
+        max_per_session: 세션별 동시 실행 최대 수 (0이면 제한 없음)
+
+    Example:
+        admission = AdmissionController(max_in_flight=4)
+        async with admission.admit("session-1"):
+            ...
+        admission.stats()  # {"in_flight": 0, "queue_depth": 0, ...}
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 8,
+        max_queue: int = 32,
+        queue_timeout: float = 30.0,
+        max_per_session: int = 0,
+    ) -> None:
+        """컨트롤러 초기화.
+
+        Args:
+            max_in_flight: 동시 실행 최대 워크플로우 수
+            max_queue: 최대 대기 요청 수 (초과 시 즉시 거부)
+            queue_timeout: 최대 대기 시간 (초과 시 거부)
+            max_per_session: 세션별 동시 실행 최대 수 (0이면 제한 없음)
+        """
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.max_per_session = max_per_session
+
+        self._lock = threading.Lock()
+        # 세션 키 → 대기 요청 (삽입 순서 = 라운드 로빈 순서)
+        self._queues: OrderedDict[str, deque[_Waiter]] = OrderedDict()
+        self._queued = 0
+        self._in_flight = 0
+        self._session_in_flight: dict[str, int] = {}
+        self._anonymous_ids = itertools.count()
+
+        # 통계
+        self._admitted = 0
+        self._rejected = {"queue_full": 0, "timeout": 0}
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @classmethod
+    def from_settings(cls) -> "AdmissionController":
+        """ADMISSION_* 설정으로 컨트롤러 생성.
+
+        Returns:
+            AdmissionController: 설정값이 적용된 컨트롤러
+        """
+        settings = get_settings()
+        return cls(
+            max_in_flight=settings.admission_max_in_flight,
+            max_queue=settings.admission_max_queue,
+            queue_timeout=settings.admission_queue_timeout,
+            max_per_session=settings.admission_max_per_session,
+        )
+
+    # ========== 공개 API ==========
+
+    @asynccontextmanager
+    async def admit(self, session_id: str | None = None) -> AsyncIterator[float]:
+        """슬롯을 확보한 동안 실행 (종료 시 반환).
+
+        Args:
+            session_id: 세션 ID (없으면 요청마다 별도 세션으로 취급)
+
+        Yields:
+            float: 대기 시간 (초)
+
+        Raises:
+            AdmissionRejected: 대기열이 가득 찼거나 대기 시간이 초과된 경우
+        """
+        key = session_id or f"anonymous-{next(self._anonymous_ids)}"
+        wait_seconds = await self._acquire(key)
+        try:
+            yield wait_seconds
+        finally:
+            self._release(key)
+
+    @property
+    def in_flight(self) -> int:
+        """현재 실행 중인 워크플로우 수."""
+        with self._lock:
+            return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """현재 대기 중인 요청 수."""
+        with self._lock:
+            return self._queued
+
+    def stats(self) -> dict[str, Any]:
+        """컨트롤러 통계.
+
+        Returns:
+            dict: in_flight, queue_depth, admitted, rejected, avg/max 대기 시간 등
+        """
+        with self._lock:
+            return self._stats_locked()
+
+    # ========== 내부 구현 ==========
+
+    async def _acquire(self, key: str) -> float:
+        """슬롯 확보 (필요 시 대기)."""
+        waiter = _Waiter(key, asyncio.get_running_loop())
+
+        with self._lock:
+            self._queues.setdefault(key, deque()).append(waiter)
+            self._queued += 1
+            self._dispatch_locked()
+
+            if not waiter.granted and self._queued > self.max_queue:
+                self._remove_locked(waiter)
+                self._rejected["queue_full"] += 1
+                raise AdmissionRejected(
+                    "queue_full",
+                    f"대기열이 가득 찼습니다 (대기 {self.max_queue}건)",
+                    self._stats_locked(),
+                )
+
+        if not waiter.granted:
+            try:
+                await asyncio.wait_for(asyncio.shield(waiter.future), self.queue_timeout)
+            except (TimeoutError, asyncio.CancelledError) as e:
+                with self._lock:
+                    if not waiter.granted:
+                        self._remove_locked(waiter)
+                        if isinstance(e, asyncio.CancelledError):
+                            raise
+                        self._rejected["timeout"] += 1
+                        raise AdmissionRejected(
+                            "timeout",
+                            f"대기 시간이 초과되었습니다 ({self.queue_timeout:.0f}초)",
+                            self._stats_locked(),
+                        ) from None
+
+                # 제한 시간과 동시에 슬롯이 할당된 경우
+                if isinstance(e, asyncio.CancelledError):
+                    self._release(key)
+                    raise
+
+        wait_seconds = time.monotonic() - waiter.enqueued_at
+        with self._lock:
+            self._admitted += 1
+            self._total_wait += wait_seconds
+            self._max_wait = max(self._max_wait, wait_seconds)
+        return wait_seconds
+
+    def _release(self, key: str) -> None:
+        """슬롯 반환 후 다음 대기 요청 실행."""
+        with self._lock:
+            self._in_flight -= 1
+            remaining = self._session_in_flight.get(key, 0) - 1
+            if remaining > 0:
+                self._session_in_flight[key] = remaining
+            else:
+                self._session_in_flight.pop(key, None)
+            self._dispatch_locked()
+
+    def _dispatch_locked(self) -> None:
+        """빈 슬롯에 대기 요청 할당 (세션 라운드 로빈, 잠금 보유 상태에서 호출)."""
+        while self._in_flight < self.max_in_flight and self._queues:
+            for key in self._queues:
+                if self.max_per_session and self._session_in_flight.get(key, 0) >= self.max_per_session:
+                    continue
+                self._grant_locked(key)
+                break
+            else:
+                # 모든 대기 세션이 세션별 제한에 걸림
+                return
+
+    def _grant_locked(self, key: str) -> None:
+        """세션의 가장 오래된 대기 요청에 슬롯 할당."""
+        queue = self._queues[key]
+        waiter = queue.popleft()
+        if queue:
+            self._queues.move_to_end(key)  # 다음 차례는 다른 세션
+        else:
+            del self._queues[key]
+
+        self._queued -= 1
+        self._in_flight += 1
+        self._session_in_flight[key] = self._session_in_flight.get(key, 0) + 1
+        waiter.granted = True
+        waiter.loop.call_soon_threadsafe(_wake, waiter.future)
+
+    def _remove_locked(self, waiter: _Waiter) -> None:
+        """대기열에서 요청 제거."""
+        queue = self._queues.get(waiter.key)
+        if queue is None:
+            return
+        try:
+            queue.remove(waiter)
+        except ValueError:
+            return
+        self._queued -= 1
+        if not queue:
+            del self._queues[waiter.key]
+
+    def _stats_locked(self) -> dict[str, Any]:
+        """통계 (잠금 보유 상태에서 호출)."""
+        now = time.monotonic()
+        oldest_wait = max(
+            (now - q[0].enqueued_at for q in self._queues.values() if q),
+            default=0.0,
+        )
+        return {
+            "in_flight": self._in_flight,
+            "queue_depth": self._queued,
+            "waiting_sessions": len(self._queues),
+            "admitted": self._admitted,
+            "rejected": dict(self._rejected),
+            "avg_wait_seconds": self._total_wait / self._admitted if self._admitted else 0.0,
+            "max_wait_seconds": self._max_wait,
+            "oldest_wait_seconds": oldest_wait,
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+        }
+
+
+def _wake(future: asyncio.Future[None]) -> None:
+    """대기 요청 깨우기 (대기자의 이벤트 루프에서 실행)."""
+    if not future.done():
+        future.set_result(None)
@@ -0,0 +1,133 @@
+"""Agent Pool - ANALYZE 노드용 Strands Agent 재사용.
+
+매 ANALYZE 실행(재생성 루프 포함)마다 BedrockModel과 Agent를 새로 만들면
+boto3 클라이언트 생성, 도구 스펙 등록 비용이 요청마다 반복됩니다.
+AgentPool은 생성된 Agent를 보관해 두었다가 대화(messages)만 초기화하여 재사용합니다.
+
+동작 방식:
+    acquire() → 유휴 Agent 꺼내기 (없으면 factory로 생성) → 대화 초기화
+             → 사용 → 정상 종료 시 풀에 반환 / 오류 시 폐기
+
+Note:
+    Strands Agent는 동시 호출을 지원하지 않으므로 한 Agent는 한 번에 하나의 워크플로우만 사용합니다.
+    동시 요청 수만큼 Agent가 생성되고, 최대 max_idle개까지만 유휴 상태로 보관합니다.
+
+사용법:
+    from ops_agent.graph.agent_pool import AgentPool
+
+    pool = AgentPool(factory=_create_agent)
+    with pool.acquire() as agent:
+        async for event in agent.stream_async(prompt):
+            ...
+"""
+
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from strands.agent.state import AgentState
+from strands.telemetry.metrics import EventLoopMetrics
+
+logger = logging.getLogger(__name__)
+
+
+def reset_conversation(agent: Any) -> None:
+    """재사용 전 Agent의 대화 관련 상태 초기화.
+
+    모델 클라이언트와 도구 레지스트리는 유지하고,
+    이전 실행의 메시지/에이전트 상태/이벤트 루프 메트릭만 초기화합니다.
+
+    Args:
+        agent: Strands Agent
+    """
+    agent.messages = []
+    agent.state = AgentState()
+    agent.event_loop_metrics = EventLoopMetrics()
+
+
+class AgentPool:
+    """Strands Agent 풀 (스레드 안전).
+
+    Attributes:
+        max_idle: 보관할 최대 유휴 Agent 수
+        created: 생성된 Agent 수
+        reused: 재사용된 횟수
+
+    Example:
+        pool = AgentPool(factory=_create_agent, max_idle=4)
+        with pool.acquire() as agent:
+            result = agent("질문")
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        max_idle: int = 8,
+        reset: Callable[[Any], None] = reset_conversation,
+    ) -> None:
+        """풀 초기화.
+
+        Args:
+            factory: Agent 생성 함수
+            max_idle: 보관할 최대 유휴 Agent 수
+            reset: 재사용 전 초기화 함수 (기본: 대화 초기화)
+        """
+        self.factory = factory
+        self.max_idle = max_idle
+        self._reset = reset
+        self._idle: list[Any] = []
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    @contextmanager
+    def acquire(self) -> Iterator[Any]:
+        """Agent 대여.
+
+        정상 종료 시 풀에 반환하고, 예외(취소 포함) 발생 시 Agent를 폐기합니다.
+
+        Yields:
+            대화가 초기화된 Agent
+        """
+        agent = self._checkout()
+        try:
+            yield agent
+        except BaseException:
+            logger.debug("[AgentPool] 오류 발생 - Agent 폐기")
+            raise
+        else:
+            self._checkin(agent)
+
+    def _checkout(self) -> Any:
+        """유휴 Agent를 꺼내거나 새로 생성."""
+        with self._lock:
+            agent = self._idle.pop() if self._idle else None
+            if agent is None:
+                self.created += 1
+            else:
+                self.reused += 1
+
+        if agent is None:
+            agent = self.factory()
+        else:
+            self._reset(agent)
+        return agent
+
+    def _checkin(self, agent: Any) -> None:
+        """사용이 끝난 Agent 반환 (max_idle 초과 시 폐기)."""
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(agent)
+
+    @property
+    def idle_count(self) -> int:
+        """유휴 Agent 수."""
+        with self._lock:
+            return len(self._idle)
+
+    def clear(self) -> None:
+        """유휴 Agent 모두 폐기 (설정 변경 시 사용)."""
+        with self._lock:
+            self._idle.clear()
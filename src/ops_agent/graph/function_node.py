@@ -31,6 +31,10 @@ from typing import Any, Callable
 from strands.agent.agent_result import AgentResult
 from strands.multiagent.base import MultiAgentBase, MultiAgentResult, NodeResult, Status
 from strands.types.content import ContentBlock, Message
+from strands.types.event_loop import Usage
+
+from ops_agent.graph.state import get_current_workflow_state
+from ops_agent.telemetry.node_metrics import NodeMetrics, NodeTimer, export_node_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -90,11 +94,19 @@ class FunctionNode(MultiAgentBase):
         Returns:
             MultiAgentResult: 래핑된 함수 출력
         """
+        timer = self._start_timer()
+
         # 함수 실행 (sync 또는 async)
-        if asyncio.iscoroutinefunction(self.func):
-            response = await self.func(task=task, **kwargs)
-        else:
-            response = self.func(task=task, **kwargs)
+        # 취소(CancelledError)도 Exception이 아니므로 finally에서 기록
+        completed = False
+        try:
+            if asyncio.iscoroutinefunction(self.func):
+                response = await self.func(task=task, **kwargs)
+            else:
+                response = self.func(task=task, **kwargs)
+            completed = True
+        finally:
+            metrics = self._record_metrics(timer, failed=not completed)
 
         # 응답이 {"text": ...} 형태인지 확인
         if not isinstance(response, dict):
@@ -116,7 +128,8 @@ class FunctionNode(MultiAgentBase):
         # MultiAgentResult 반환
         return MultiAgentResult(
             status=Status.COMPLETED,
-            results={self.name: NodeResult(result=agent_result)},
+            results={self.name: self._node_result(agent_result, metrics)},
+            execution_time=int(metrics.wall_time * 1000),
         )
 
     async def stream_async(
@@ -144,13 +157,21 @@ class FunctionNode(MultiAgentBase):
         if inspect.isasyncgenfunction(self.func):
             # Async generator function - yield events from it
             final_response = None
-            async for event in self.func(task=task, **kwargs):
-                # Check if this is the final result (dict with "text" key and "_final" marker)
-                if isinstance(event, dict) and event.get("_final"):
-                    final_response = event
-                else:
-                    # Yield streaming event as-is
-                    yield event
+            timer = self._start_timer()
+            # 소비자가 중간에 닫거나(GeneratorExit) 취소(CancelledError)해도 메트릭을 남기도록 finally에서 기록
+            completed = False
+            try:
+                async for event in self.func(task=task, **kwargs):
+                    # Check if this is the final result (dict with "text" key and "_final" marker)
+                    if isinstance(event, dict) and event.get("_final"):
+                        final_response = event
+                    else:
+                        # Yield streaming event as-is
+                        timer.on_event(event)
+                        yield event
+                completed = True
+            finally:
+                metrics = self._record_metrics(timer, failed=not completed)
 
             # Build final MultiAgentResult from the captured response
             if final_response is None:
@@ -174,7 +195,8 @@ class FunctionNode(MultiAgentBase):
             yield {
                 "result": MultiAgentResult(
                     status=Status.COMPLETED,
-                    results={self.name: NodeResult(result=agent_result)},
+                    results={self.name: self._node_result(agent_result, metrics)},
+                    execution_time=int(metrics.wall_time * 1000),
                 )
             }
         else:
@@ -182,3 +204,35 @@ class FunctionNode(MultiAgentBase):
             result = await self.invoke_async(task=task, invocation_state=invocation_state, **kwargs)
             # Wrap in dict with "result" key for Graph compatibility
             yield {"result": result}
+
+    def _start_timer(self) -> NodeTimer:
+        """노드 메트릭 수집 시작 (현재 워크플로우 시도 번호 기록)."""
+        state = get_current_workflow_state()
+        return NodeTimer(self.name, attempt=state.attempt if state else 0)
+
+    def _record_metrics(self, timer: NodeTimer, failed: bool = False) -> NodeMetrics:
+        """노드 메트릭을 state.metadata["node_metrics"]에 추가하고 OTEL로 내보내기."""
+        metrics = timer.finish(failed=failed)
+        state = get_current_workflow_state()
+        if state is not None:
+            state.metadata.setdefault("node_metrics", []).append(metrics.to_dict())
+        export_node_metrics(metrics)
+        return metrics
+
+    def _node_result(self, agent_result: AgentResult, metrics: NodeMetrics) -> NodeResult:
+        """실행 시간과 토큰 사용량을 포함한 NodeResult 생성."""
+        usage: Usage = {
+            "inputTokens": metrics.input_tokens,
+            "outputTokens": metrics.output_tokens,
+            "totalTokens": metrics.input_tokens + metrics.output_tokens,
+        }
+        if metrics.cache_read_tokens:
+            usage["cacheReadInputTokens"] = metrics.cache_read_tokens
+        if metrics.cache_write_tokens:
+            usage["cacheWriteInputTokens"] = metrics.cache_write_tokens
+
+        return NodeResult(
+            result=agent_result,
+            execution_time=int(metrics.wall_time * 1000),
+            accumulated_usage=usage,
+        )
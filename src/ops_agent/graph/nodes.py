@@ -15,20 +15,22 @@ import logging
 from typing import Any
 
 from strands import Agent
-from strands.models import BedrockModel
-from strands.types.content import SystemContentBlock
+from strands.models import BedrockModel, Model
 
 from ops_agent.config import get_settings
 from ops_agent.evaluation.evaluator import OpsAgentEvaluator
 from ops_agent.evaluation.models import EvalVerdict
-from ops_agent.graph.state import get_current_workflow_state, WorkflowStatus
+from ops_agent.evaluation.streaming import StreamingEvaluation
+from ops_agent.graph.agent_pool import AgentPool, reset_conversation
+from ops_agent.graph.state import OpsWorkflowState, WorkflowStatus, get_current_workflow_state
 from ops_agent.graph.util import (
     Colors,
     ToolResultExtractor,
     build_retry_prompt,
+    build_tool_history,
     step_printer,
 )
-from ops_agent.prompts import get_system_prompt
+from ops_agent.prompts import PROMPT_CACHE_CONFIG, build_system_prompt
 from ops_agent.telemetry import get_trace_attributes
 from ops_agent.tools.cloudwatch import cloudwatch_filter_log_events
 from ops_agent.tools.knowledge_base import get_kb_tools
@@ -39,30 +41,27 @@ logger = logging.getLogger(__name__)
 # ==========================================================================
 # 에이전트 생성
 # ==========================================================================
-def _create_agent() -> Agent:
+def _create_agent(model: Model | None = None) -> Agent:
     """Strands Agent 생성.
 
-    프롬프트 캐싱 적용:
-        - 시스템 프롬프트에 cachePoint 추가 (최대 90% 비용 절감)
-        - 도구 정의에도 캐싱 적용 (cache_tools)
+    프롬프트 캐싱 적용 (OpsAgent._create_agent와 같은 구성):
+        - 시스템 프롬프트: 고정 부분 뒤 cachePoint, 현재 시간은 그 뒤 (build_system_prompt)
+        - 도구 정의 cachePoint (cache_tools) + 마지막 assistant 메시지 자동 cachePoint (PROMPT_CACHE_CONFIG)
+
+    Args:
+        model: 사용할 모델 (기본: BedrockModel, 벤치마크/테스트에서 가짜 모델 주입용)
     """
     settings = get_settings()
 
-    model = BedrockModel(
-        model_id=settings.bedrock_model_id,
-        region_name=settings.aws_region,
-        temperature=settings.bedrock_temperature,
-        max_tokens=settings.bedrock_max_tokens,
-        cache_tools="default",
-    )
-
-    system_prompt_text = get_system_prompt()
-
-    # 프롬프트 캐싱: SystemContentBlock + cachePoint
-    system_prompt = [
-        SystemContentBlock(text=system_prompt_text),
-        SystemContentBlock(cachePoint={"type": "default"}),
-    ]
+    if model is None:
+        model = BedrockModel(
+            model_id=settings.bedrock_model_id,
+            region_name=settings.aws_region,
+            temperature=settings.bedrock_temperature,
+            max_tokens=settings.bedrock_max_tokens,
+            cache_config=PROMPT_CACHE_CONFIG,
+            cache_tools="default",
+        )
 
     tools = [
         cloudwatch_filter_log_events,
@@ -74,11 +73,38 @@ def _create_agent() -> Agent:
     return Agent(
         model=model,
         tools=tools,
-        system_prompt=system_prompt,
+        system_prompt=build_system_prompt(),
         trace_attributes=get_trace_attributes(),
     )
 
 
+def _reset_agent(agent: Agent) -> None:
+    """풀에서 꺼낸 Agent 초기화.
+
+    BedrockModel 클라이언트와 도구 레지스트리는 재사용하고,
+    대화 기록을 비운 뒤 시스템 프롬프트만 다시 렌더링합니다 (CURRENT_TIME 갱신).
+    CURRENT_TIME은 cachePoint 뒤에 있으므로 캐시된 앞부분은 그대로 유지됩니다.
+    """
+    reset_conversation(agent)
+    agent.system_prompt = build_system_prompt()
+
+
+# 요청/재시도마다 BedrockModel + Agent를 새로 만들지 않도록 풀링
+_agent_pool = AgentPool(factory=lambda: _create_agent(), reset=_reset_agent)
+
+
+def use_model(model: Model) -> None:
+    """ANALYZE 노드가 사용할 모델 교체 (Agent 풀 재생성).
+
+    오프라인 런타임 (AGENTCORE_OFFLINE)에서 BedrockModel 대신 가짜 모델을 주입할 때 사용합니다.
+
+    Args:
+        model: 모든 ANALYZE Agent가 공유할 모델
+    """
+    global _agent_pool
+    _agent_pool = AgentPool(factory=lambda: _create_agent(model=model), reset=_reset_agent)
+
+
 # ==========================================================================
 # 노드 구현
 # ==========================================================================
@@ -117,32 +143,46 @@ async def analyze_node(task=None, **kwargs):
         else:
             current_prompt = state.prompt
 
-        # Strands Agent 스트리밍 실행
-        agent = _create_agent()
-
-        async for event in agent.stream_async(current_prompt):
-            yield event
-
-        # 응답 추출 (마지막 assistant 메시지)
-        response = ""
-        if hasattr(agent, "messages") and agent.messages:
-            for msg in reversed(agent.messages):
-                if msg.get("role") == "assistant":
-                    for content in msg.get("content", []):
-                        if isinstance(content, dict) and "text" in content:
-                            response = content["text"]
+        # 재시도 시 이전 도구 호출/결과 주입 (도구 재호출 없이 텍스트만 재생성)
+        history = _build_retry_history(state)
+
+        # 스트리밍 중 증분 평가 (EVALUATE에서는 집계만 수행)
+        stream_eval = _start_stream_eval(state, history)
+
+        # Strands Agent 스트리밍 실행 (풀에서 대여, 정상 종료 시 반환)
+        with _agent_pool.acquire() as agent:
+            if history:
+                agent.messages = history
+                logger.info(
+                    f"{Colors.YELLOW}[ANALYZE] 이전 도구 결과 {len(state.previous_tool_results)}건 "
+                    f"재사용{Colors.END}"
+                )
+            async for event in agent.stream_async(current_prompt):
+                if stream_eval is not None:
+                    _track_stream_event(stream_eval, event)
+                yield event
+
+            # 응답 추출 (마지막 assistant 메시지)
+            response = ""
+            if hasattr(agent, "messages") and agent.messages:
+                for msg in reversed(agent.messages):
+                    if msg.get("role") == "assistant":
+                        for content in msg.get("content", []):
+                            if isinstance(content, dict) and "text" in content:
+                                response = content["text"]
+                                break
+                        if response:
                             break
-                    if response:
-                        break
 
-        # 도구 결과 추출
-        tool_results = []
-        if hasattr(agent, "messages") and agent.messages:
-            tool_results = ToolResultExtractor.from_messages(agent.messages)
+            # 도구 결과 추출
+            tool_results = []
+            if hasattr(agent, "messages") and agent.messages:
+                tool_results = ToolResultExtractor.from_messages(agent.messages)
 
         # 상태 업데이트
         state.response = response
         state.tool_results = tool_results
+        state.stream_eval = stream_eval
 
         step_printer.result("ANALYZE", {
             "응답 길이": f"{len(response)}자",
@@ -163,6 +203,68 @@ async def analyze_node(task=None, **kwargs):
         raise
 
 
+def _build_retry_history(state: OpsWorkflowState) -> list[dict] | None:
+    """재시도 대화에 주입할 이전 시도 히스토리 (없으면 None).
+
+    EVAL_REUSE_TOOL_RESULTS가 켜져 있고, 이전 시도에 도구 결과와 응답이 있을 때만 생성합니다.
+    """
+    if state.attempt == 0 or not get_settings().eval_reuse_tool_results:
+        return None
+    if not state.previous_tool_results or not state.previous_response:
+        return None
+    return build_tool_history(
+        state.prompt,
+        state.previous_tool_results,
+        state.previous_response,
+    )
+
+
+def _start_stream_eval(
+    state: OpsWorkflowState,
+    history: list[dict] | None,
+) -> StreamingEvaluation | None:
+    """ANALYZE 스트리밍용 증분 평가 세션 생성 (EVAL_STREAMING=false면 None).
+
+    재시도 대화에 주입한 이전 도구 결과는 스트림 이벤트로 오지 않으므로 미리 전달합니다.
+    """
+    if not get_settings().eval_streaming:
+        return None
+    evaluator = OpsAgentEvaluator(cache=state.eval_cache)
+    return StreamingEvaluation(
+        evaluator,
+        tool_results=state.previous_tool_results if history else None,
+    )
+
+
+def _track_stream_event(stream_eval: StreamingEvaluation, event: dict) -> None:
+    """스트림 이벤트를 증분 평가에 전달.
+
+    - {"data": 텍스트}: 응답 텍스트 청크
+    - {"message": assistant 메시지}: 메시지 종료 (텍스트 응답이면 중간 결과 확인)
+    - {"message": toolResult 메시지}: 도구 결과
+    """
+    if isinstance(event.get("data"), str):
+        stream_eval.feed(event["data"])
+        return
+
+    message = event.get("message")
+    if not isinstance(message, dict):
+        return
+
+    if message.get("role") == "assistant":
+        stream_eval.end_message()
+        contents = message.get("content", [])
+        if any("toolUse" in c for c in contents):
+            return
+        if stream_eval.is_failing():
+            logger.warning(
+                f"{Colors.YELLOW}[ANALYZE] 조기 경고: 도구 결과 미인용 응답 "
+                f"(중간 점수 {stream_eval.provisional_score():.2f}){Colors.END}"
+            )
+    elif message.get("role") == "user":
+        stream_eval.add_tool_results(ToolResultExtractor.from_messages([message]))
+
+
 def evaluate_node(task=None, **kwargs) -> dict[str, Any]:
     """EVALUATE: 응답 품질 평가.
 
@@ -176,11 +278,19 @@ def evaluate_node(task=None, **kwargs) -> dict[str, Any]:
     step_printer.header("EVALUATE", "응답 품질 평가")
 
     try:
-        evaluator = OpsAgentEvaluator()
-        eval_result = evaluator.evaluate(
-            response=state.response or "",
-            tool_results=state.tool_results,
-        )
+        if state.stream_eval is not None:
+            # 스트리밍 중 매칭한 결과 재사용 (내용이 다르면 일반 평가로 대체)
+            eval_result = state.stream_eval.evaluate(
+                response=state.response or "",
+                tool_results=state.tool_results,
+            )
+        else:
+            # 워크플로우 캐시 공유: 재생성 시 동일 도구 결과의 기대값 재계산 생략
+            evaluator = OpsAgentEvaluator(cache=state.eval_cache)
+            eval_result = evaluator.evaluate(
+                response=state.response or "",
+                tool_results=state.tool_results,
+            )
 
         state.eval_result = eval_result
         state.check_results = eval_result.check_results
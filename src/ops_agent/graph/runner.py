@@ -13,9 +13,13 @@ Reference:
 """
 
 import logging
+import threading
 import uuid
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
 
 from strands.multiagent import GraphBuilder
+from strands.multiagent.graph import Graph
 
 from ops_agent.graph.conditions import should_finalize, should_regenerate
 from ops_agent.graph.function_node import FunctionNode
@@ -36,11 +40,12 @@ from ops_agent.graph.state import (
     get_current_workflow_state,
 )
 from ops_agent.graph.util import Colors
+from ops_agent.telemetry import summarize_node_metrics
 
 logger = logging.getLogger(__name__)
 
 
-def build_ops_graph(max_node_executions: int = 15) -> "Graph":
+def build_ops_graph(max_node_executions: int = 15) -> Graph:
     """Build OpsAgent evaluation graph.
 
     Graph Structure:
@@ -92,6 +97,93 @@ def build_ops_graph(max_node_executions: int = 15) -> "Graph":
     return builder.build()
 
 
+# ==========================================================================
+# 컴파일된 Graph 레지스트리 (프로세스 단위)
+# ==========================================================================
+# Strands Graph는 실행 중 상태(GraphState, 노드 실행 상태)를 인스턴스에 보관하므로
+# 동시에 실행되는 워크플로우끼리 하나의 Graph를 공유할 수는 없습니다.
+# 대신 실행이 끝난 Graph를 max_node_executions별로 보관했다가 다음 실행에 재사용합니다.
+#   - GraphState는 Graph.stream_async() 시작 시 새로 생성됨
+#   - 노드 실행 상태는 반환 시 초기화
+#   - FunctionNode 래퍼는 상태가 없으므로 그대로 재사용
+# 따라서 GraphBuilder 비용은 "동시 실행 최대치"만큼만 발생합니다.
+
+_graph_registry: dict[int, list[Graph]] = {}
+_graph_registry_lock = threading.Lock()
+_graph_registry_stats = {"built": 0, "reused": 0}
+
+# max_node_executions별 보관할 최대 유휴 Graph 수
+MAX_IDLE_GRAPHS = 16
+
+
+def acquire_ops_graph(max_node_executions: int = 15) -> Graph:
+    """레지스트리에서 유휴 Graph를 꺼내거나 새로 빌드.
+
+    Args:
+        max_node_executions: 최대 노드 실행 횟수
+
+    Returns:
+        다른 실행과 공유되지 않는 Graph 인스턴스
+    """
+    with _graph_registry_lock:
+        idle = _graph_registry.get(max_node_executions)
+        if idle:
+            _graph_registry_stats["reused"] += 1
+            return idle.pop()
+        _graph_registry_stats["built"] += 1
+
+    return build_ops_graph(max_node_executions=max_node_executions)
+
+
+def release_ops_graph(graph: Graph, max_node_executions: int = 15) -> None:
+    """실행이 끝난 Graph를 초기화하여 레지스트리에 반환.
+
+    레지스트리 키는 Graph.max_node_executions(제한 없음이면 None) 대신
+    acquire_ops_graph()에 전달한 값을 사용합니다.
+
+    Args:
+        graph: acquire_ops_graph()로 얻은 Graph
+        max_node_executions: acquire_ops_graph()에 전달한 최대 노드 실행 횟수
+    """
+    for node in graph.nodes.values():
+        node.reset_executor_state()
+
+    with _graph_registry_lock:
+        idle = _graph_registry.setdefault(max_node_executions, [])
+        if len(idle) < MAX_IDLE_GRAPHS:
+            idle.append(graph)
+
+
+@contextmanager
+def lease_ops_graph(max_node_executions: int = 15) -> Iterator[Graph]:
+    """Graph 대여 (정상 종료 시 반환, 오류/취소 시 폐기).
+
+    Args:
+        max_node_executions: 최대 노드 실행 횟수
+
+    Yields:
+        Graph 인스턴스
+    """
+    graph = acquire_ops_graph(max_node_executions)
+    yield graph
+    # 예외 발생 시 여기에 도달하지 않으므로 실행 상태가 불확실한 Graph는 반환되지 않음
+    release_ops_graph(graph, max_node_executions)
+
+
+def get_graph_registry_stats() -> dict[str, int]:
+    """레지스트리 통계 (built: 빌드 횟수, reused: 재사용 횟수, idle: 유휴 Graph 수)."""
+    with _graph_registry_lock:
+        idle = sum(len(graphs) for graphs in _graph_registry.values())
+        return {**_graph_registry_stats, "idle": idle}
+
+
+def clear_graph_registry() -> None:
+    """레지스트리 초기화 (테스트/노드 구성 변경 시 사용)."""
+    with _graph_registry_lock:
+        _graph_registry.clear()
+        _graph_registry_stats.update(built=0, reused=0)
+
+
 class OpsAgentGraph:
     """그래프 기반 OpsAgent 워크플로우.
 
@@ -127,8 +219,14 @@ class OpsAgentGraph:
         self.max_node_executions = max_node_executions
         self.verbose = verbose
 
-        # Build the graph
-        self._graph = build_ops_graph(max_node_executions=max_node_executions)
+    def _lease_graph(self) -> AbstractContextManager[Graph]:
+        """실행별 Graph 대여.
+
+        Strands Graph는 실행 상태(GraphState, 노드 실행 상태)를 인스턴스에 보관하므로
+        동시에 실행되는 워크플로우끼리 하나의 Graph를 공유할 수 없습니다.
+        프로세스 단위 레지스트리에서 유휴 Graph를 재사용합니다.
+        """
+        return lease_ops_graph(max_node_executions=self.max_node_executions)
 
     def run(self, prompt: str) -> OpsWorkflowState:
         """워크플로우 실행.
@@ -159,7 +257,8 @@ class OpsAgentGraph:
 
         try:
             # Execute graph
-            result = self._graph(prompt)
+            with self._lease_graph() as graph:
+                result = graph(prompt)
 
             if self.verbose:
                 self._print_result(result)
@@ -217,8 +316,9 @@ class OpsAgentGraph:
 
         try:
             # Execute graph with streaming
-            async for event in self._graph.stream_async(prompt):
-                yield event
+            with self._lease_graph() as graph:
+                async for event in graph.stream_async(prompt):
+                    yield event
 
             if self.verbose:
                 logger.info(f"{Colors.GREEN}[Graph] 스트리밍 워크플로우 완료{Colors.END}")
@@ -264,6 +364,17 @@ class OpsAgentGraph:
         if state.eval_result:
             print(f"  Score: {state.eval_result.overall_score:.2f}")
         print(f"  Response Length: {len(state.final_response or '')} chars")
+        node_summary = summarize_node_metrics(state.metadata.get("node_metrics", []))
+        if node_summary:
+            print("  Node Timing:")
+            for node, stats in node_summary.items():
+                tokens = stats["input_tokens"] + stats["output_tokens"]
+                line = f"    {node:<10} {stats['wall_time'] * 1000:8.1f}ms  x{stats['executions']}"
+                if tokens:
+                    line += f"  tokens {stats['input_tokens']}/{stats['output_tokens']} (cache read {stats['cache_read_tokens']})"
+                if stats["cache_hit_rate"] is not None:
+                    line += f"  cache hit {stats['cache_hit_rate']:.0%}"
+                print(line)
         print(f"{'=' * 60}")
         print()
 
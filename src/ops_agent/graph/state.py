@@ -6,17 +6,20 @@ Reference:
     - https://github.com/gonsoomoon-ml/Self-Correcting-Explainable-Translation-Agent/src/utils/workflow_state.py
 """
 
+import contextvars
 import threading
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from ops_agent.evaluation.cache import EvaluationCache
 from ops_agent.evaluation.models import (
     CheckResult,
     EvalResult,
     EvalVerdict,
     ToolResult,
 )
+from ops_agent.evaluation.streaming import StreamingEvaluation
 
 
 class WorkflowStatus(Enum):
@@ -41,9 +44,13 @@ class OpsWorkflowState:
         tool_results: 캡처된 도구 결과
         eval_result: 평가 결과
         check_results: 개별 검사 결과
+        eval_cache: 도구 결과별 평가 기대값 캐시 (재시도 간 유지)
+        stream_eval: ANALYZE 스트리밍 중 진행한 증분 평가 (현재 시도)
         verdict: 최종 판정
         feedback: 재생성 피드백
         attempt: 현재 시도 횟수
+        previous_response: 직전 시도의 응답 (재시도 대화 주입용)
+        previous_tool_results: 직전 시도의 도구 결과 (재시도 대화 주입용)
         max_attempts: 최대 시도 횟수
         final_response: 최종 응답
         final_status: 최종 상태
@@ -61,6 +68,8 @@ class OpsWorkflowState:
     # Evaluation
     eval_result: EvalResult | None = None
     check_results: list[CheckResult] = field(default_factory=list)
+    eval_cache: EvaluationCache = field(default_factory=EvaluationCache)
+    stream_eval: StreamingEvaluation | None = None
 
     # Decision
     verdict: EvalVerdict | None = None
@@ -69,6 +78,8 @@ class OpsWorkflowState:
     # Control
     attempt: int = 0
     max_attempts: int = 2
+    previous_response: str | None = None
+    previous_tool_results: list[ToolResult] = field(default_factory=list)
 
     # Output
     final_response: str | None = None
@@ -81,11 +92,17 @@ class OpsWorkflowState:
     metadata: dict[str, Any] = field(default_factory=dict)
 
     def reset_for_retry(self) -> None:
-        """재시도를 위한 상태 초기화 (attempt, feedback 유지)."""
+        """재시도를 위한 상태 초기화 (attempt, feedback, eval_cache 유지).
+
+        직전 응답과 도구 결과는 previous_*로 옮겨 재시도 대화에 주입할 수 있게 합니다.
+        """
+        self.previous_response = self.response
+        self.previous_tool_results = self.tool_results
         self.response = None
         self.tool_results = []
         self.eval_result = None
         self.check_results = []
+        self.stream_eval = None
         self.verdict = None
 
     def to_dict(self) -> dict[str, Any]:
@@ -155,31 +172,36 @@ def delete_workflow_state(workflow_id: str) -> None:
 
 
 # Current workflow ID for node access
-# Note: Using module-level variable because async contexts don't share threading.local
-_current_workflow_id: str | None = None
+# Note: ContextVar를 사용하여 동시에 실행되는 워크플로우마다 독립된 값을 유지합니다.
+#   - asyncio Task는 생성 시점의 컨텍스트를 복사하므로 요청(Task)별로 격리됨
+#   - Strands Graph는 노드를 asyncio.create_task / run_async(copy_context)로 실행하므로
+#     워크플로우 시작 시 설정한 값이 해당 실행의 노드와 조건 함수로 그대로 전파됨
+_current_workflow_id: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "ops_current_workflow_id",
+    default=None,
+)
 
 
 def set_current_workflow_id(workflow_id: str | None) -> None:
-    """현재 워크플로우 ID 설정.
+    """현재 실행 컨텍스트의 워크플로우 ID 설정.
 
     Args:
         workflow_id: 워크플로우 고유 ID (None으로 초기화)
     """
-    global _current_workflow_id
-    _current_workflow_id = workflow_id
+    _current_workflow_id.set(workflow_id)
 
 
 def get_current_workflow_id() -> str | None:
-    """현재 워크플로우 ID 조회.
+    """현재 실행 컨텍스트의 워크플로우 ID 조회.
 
     Returns:
         str | None: 현재 워크플로우 ID
     """
-    return _current_workflow_id
+    return _current_workflow_id.get()
 
 
 def get_current_workflow_state() -> OpsWorkflowState | None:
-    """현재 스레드의 워크플로우 상태 조회.
+    """현재 실행 컨텍스트의 워크플로우 상태 조회.
 
     Returns:
         OpsWorkflowState | None: 현재 워크플로우 상태
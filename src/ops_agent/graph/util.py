@@ -10,8 +10,10 @@ Classes:
 Functions:
     infer_tool_type: 출력 구조에서 도구 유형 추론
     build_retry_prompt: 재시도용 프롬프트 생성
+    build_tool_history: 재시도용 도구 호출 히스토리 생성 (Message Injection)
 """
 
+import contextvars
 import json
 from typing import Any
 
@@ -73,6 +75,67 @@ def build_retry_prompt(prompt: str, feedback: str) -> str:
 도구 결과의 데이터를 정확하게 인용하고, 구체적인 분석을 제공해주세요."""
 
 
+def build_tool_history(
+    prompt: str,
+    tool_results: list[ToolResult],
+    previous_response: str,
+) -> list[dict]:
+    """재시도용 대화 히스토리 생성 (Message Injection).
+
+    이전 시도의 도구 호출과 결과를 대화에 주입하여 재시도 시
+    같은 도구를 다시 호출하지 않고 텍스트만 재생성하도록 합니다.
+    (OpsAgent._build_mock_messages와 같은 방식)
+
+    대화 구조 (user/assistant 교대):
+        user: 원본 질문
+        assistant: toolUse (이전 시도의 모든 도구 호출)
+        user: toolResult (이전 시도의 모든 도구 결과)
+        assistant: 이전 응답
+        → 이후 재시도 프롬프트가 user 메시지로 추가됨
+
+    Args:
+        prompt: 원본 사용자 프롬프트
+        tool_results: 이전 시도의 도구 결과
+        previous_response: 이전 시도의 응답
+
+    Returns:
+        에이전트 messages로 사용할 메시지 목록
+    """
+    tool_uses = []
+    tool_result_blocks = []
+
+    for i, result in enumerate(tool_results):
+        tool_use_id = f"reuse_{i:03d}"
+        output = result.tool_output
+        # 파싱 실패했던 결과는 원문 그대로 전달
+        if set(output) == {"raw"}:
+            text = output["raw"]
+        else:
+            text = json.dumps(output, ensure_ascii=False, indent=2)
+
+        tool_uses.append({
+            "toolUse": {
+                "toolUseId": tool_use_id,
+                "name": result.tool_name,
+                "input": result.tool_input,
+            }
+        })
+        tool_result_blocks.append({
+            "toolResult": {
+                "toolUseId": tool_use_id,
+                "status": "success",
+                "content": [{"text": text}],
+            }
+        })
+
+    return [
+        {"role": "user", "content": [{"text": prompt}]},
+        {"role": "assistant", "content": tool_uses},
+        {"role": "user", "content": tool_result_blocks},
+        {"role": "assistant", "content": [{"text": previous_response}]},
+    ]
+
+
 # ==========================================================================
 # 도구 결과 추출
 # ==========================================================================
@@ -97,8 +160,17 @@ class ToolResultExtractor:
             추출된 ToolResult 목록
         """
         tool_results = []
+        # toolUseId → toolUse (assistant 메시지의 도구 이름/입력)
+        tool_uses: dict[str, dict] = {}
 
         for msg in messages:
+            if msg.get("role") == "assistant":
+                for content in msg.get("content", []):
+                    if "toolUse" in content:
+                        tool_use = content["toolUse"]
+                        tool_uses[tool_use.get("toolUseId", "")] = tool_use
+                continue
+
             if msg.get("role") != "user":
                 continue
 
@@ -106,23 +178,30 @@ class ToolResultExtractor:
                 if "toolResult" not in content:
                     continue
 
-                tool_result = ToolResultExtractor._parse_tool_result(content["toolResult"])
+                tool_result = ToolResultExtractor._parse_tool_result(
+                    content["toolResult"], tool_uses
+                )
                 if tool_result:
                     tool_results.append(tool_result)
 
         return tool_results
 
     @staticmethod
-    def _parse_tool_result(tool_result_data: dict) -> ToolResult | None:
+    def _parse_tool_result(
+        tool_result_data: dict,
+        tool_uses: dict[str, dict] | None = None,
+    ) -> ToolResult | None:
         """단일 도구 결과 파싱.
 
         Args:
             tool_result_data: toolResult 딕셔너리
+            tool_uses: toolUseId별 toolUse 딕셔너리 (도구 이름/입력 복원용)
 
         Returns:
             ToolResult 또는 None
         """
         tool_use_id = tool_result_data.get("toolUseId", "")
+        tool_use = (tool_uses or {}).get(tool_use_id, {})
         content_list = tool_result_data.get("content", [])
 
         # 텍스트 콘텐츠 추출
@@ -143,8 +222,8 @@ class ToolResultExtractor:
 
         return ToolResult(
             tool_type=tool_type,
-            tool_name=tool_use_id,
-            tool_input={},
+            tool_name=tool_use.get("name", tool_use_id),
+            tool_input=tool_use.get("input") or {},
             tool_output=output,
         )
 
@@ -152,6 +231,15 @@ class ToolResultExtractor:
 # ==========================================================================
 # 단계 출력
 # ==========================================================================
+# 워크플로우별 단계 카운터
+# reset()에서 새 카운터를 현재 컨텍스트에 설정하면, 노드 Task는 복사된 컨텍스트를 통해
+# 같은 카운터 객체를 공유하고 다른 워크플로우와는 격리됩니다.
+_step_counter: contextvars.ContextVar[list[int] | None] = contextvars.ContextVar(
+    "ops_step_counter",
+    default=None,
+)
+
+
 class StepPrinter:
     """노드 실행 단계 출력기.
 
@@ -172,12 +260,18 @@ class StepPrinter:
         "FINALIZE": Colors.GREEN,
     }
 
-    def __init__(self) -> None:
-        self._step_counter = 0
-
     def reset(self) -> None:
-        """단계 카운터 초기화."""
-        self._step_counter = 0
+        """단계 카운터 초기화 (현재 워크플로우 컨텍스트)."""
+        _step_counter.set([0])
+
+    def _next_step(self) -> int:
+        """현재 워크플로우의 다음 단계 번호."""
+        counter = _step_counter.get()
+        if counter is None:
+            counter = [0]
+            _step_counter.set(counter)
+        counter[0] += 1
+        return counter[0]
 
     def header(self, node_name: str, description: str) -> None:
         """단계 헤더 출력.
@@ -186,12 +280,12 @@ class StepPrinter:
             node_name: 노드 이름 (ANALYZE, EVALUATE, 등)
             description: 단계 설명
         """
-        self._step_counter += 1
+        step = self._next_step()
         color = self.NODE_COLORS.get(node_name, Colors.END)
 
         print()
         print(f"{color}{'-' * 60}{Colors.END}")
-        print(f"{color}[{self._step_counter}] {node_name} - {description}{Colors.END}")
+        print(f"{color}[{step}] {node_name} - {description}{Colors.END}")
         print(f"{color}{'-' * 60}{Colors.END}")
 
     def result(self, node_name: str, results: dict[str, Any]) -> None:
@@ -8,11 +8,16 @@
     # 설정된 언어로 시스템 프롬프트 가져오기
     prompt = get_system_prompt()
 
+    # 프롬프트 캐싱용 블록 (고정 프롬프트 + cachePoint + Context)
+    system_prompt = build_system_prompt()
+
     # 특정 템플릿 로드
     custom_prompt = load_prompt("ops_agent_ko", CURRENT_TIME="2024-01-01")
 """
 
 from ops_agent.prompts.system_prompt import (
+    PROMPT_CACHE_CONFIG,
+    build_system_prompt,
     get_system_prompt,
     get_system_prompt_en,
     get_system_prompt_ko,
@@ -21,6 +26,8 @@ from ops_agent.prompts.template import PromptTemplate, PromptTemplateLoader, loa
 
 __all__ = [
     "get_system_prompt",
+    "build_system_prompt",
+    "PROMPT_CACHE_CONFIG",
     "get_system_prompt_ko",
     "get_system_prompt_en",
     "load_prompt",
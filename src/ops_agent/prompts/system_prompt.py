@@ -7,13 +7,33 @@
     from ops_agent.prompts import get_system_prompt
 
     prompt = get_system_prompt()  # 설정된 언어로 프롬프트 반환
+
+    # 프롬프트 캐싱용 (Agent system_prompt, BedrockModel cache_config/cache_tools)
+    agent = Agent(
+        model=BedrockModel(..., cache_config=PROMPT_CACHE_CONFIG, cache_tools="default"),
+        system_prompt=build_system_prompt(),
+    )
 """
 
+from typing import Any
+
+from strands.models import CacheConfig
+from strands.types.content import SystemContentBlock
+
 from ops_agent.config import get_settings
 from ops_agent.prompts.template import load_prompt
 
+# ========== 프롬프트 캐싱 ==========
+# Bedrock 캐시는 요청 앞부분(tools → system → messages)이 바이트 단위로 같아야 적중합니다.
+# 요청마다 달라지는 내용(현재 시간)은 템플릿 마지막 Context 섹션에 두고 cachePoint 뒤로 보냅니다.
+CONTEXT_SECTION = "## Context"
+
+# 마지막 assistant 메시지 자동 cachePoint (에이전트 루프의 이전 대화 재사용)
+# 도구 정의 cachePoint는 BedrockModel의 cache_tools="default"로 함께 설정합니다.
+PROMPT_CACHE_CONFIG = CacheConfig(strategy="auto")
 
-def get_system_prompt(**kwargs) -> str:
+
+def get_system_prompt(**kwargs: Any) -> str:
     """설정된 언어에 따른 시스템 프롬프트 반환.
 
     Args:
@@ -30,7 +50,7 @@ def get_system_prompt(**kwargs) -> str:
     return load_prompt(template_name, **kwargs)
 
 
-def get_system_prompt_ko(**kwargs) -> str:
+def get_system_prompt_ko(**kwargs: Any) -> str:
     """한국어 시스템 프롬프트 반환.
 
     Args:
@@ -42,7 +62,7 @@ def get_system_prompt_ko(**kwargs) -> str:
     return load_prompt("ops_agent_ko", **kwargs)
 
 
-def get_system_prompt_en(**kwargs) -> str:
+def get_system_prompt_en(**kwargs: Any) -> str:
     """영어 시스템 프롬프트 반환.
 
     Args:
@@ -52,3 +72,26 @@ def get_system_prompt_en(**kwargs) -> str:
         렌더링된 영어 시스템 프롬프트 문자열
     """
     return load_prompt("ops_agent_en", **kwargs)
+
+
+def build_system_prompt(**kwargs: Any) -> list[SystemContentBlock]:
+    """프롬프트 캐싱용 시스템 프롬프트 블록 생성.
+
+    [고정 프롬프트, cachePoint, Context 섹션] 순서로 반환하여
+    CURRENT_TIME이 바뀌어도 cachePoint 앞부분은 요청 간에 동일하게 유지합니다.
+
+    Args:
+        **kwargs: 템플릿에 전달할 추가 변수
+
+    Returns:
+        Agent system_prompt로 사용할 SystemContentBlock 목록
+    """
+    static, section, context = get_system_prompt(**kwargs).partition(CONTEXT_SECTION)
+
+    blocks = [
+        SystemContentBlock(text=static.strip()),
+        SystemContentBlock(cachePoint={"type": "default"}),
+    ]
+    if section:
+        blocks.append(SystemContentBlock(text=(section + context).strip()))
+    return blocks
@@ -25,8 +25,19 @@ Langfuse 또는 AWS 네이티브 관측성을 설정할 수 있습니다.
     from ops_agent.telemetry import get_agentcore_observability_env_vars
     env_vars = get_agentcore_observability_env_vars()
     runtime.launch(env_vars=env_vars)
+
+    # Graph 노드 메트릭 (FunctionNode가 자동 수집)
+    from ops_agent.telemetry import summarize_node_metrics
+    summary = summarize_node_metrics(state.metadata["node_metrics"])
 """
 
+from ops_agent.telemetry.node_metrics import (
+    NodeMetrics,
+    NodeTimer,
+    cache_hit_rate,
+    export_node_metrics,
+    summarize_node_metrics,
+)
 from ops_agent.telemetry.setup import (
     get_agentcore_observability_env_vars,
     get_trace_attributes,
@@ -37,4 +48,9 @@ __all__ = [
     "setup_strands_observability",
     "get_agentcore_observability_env_vars",
     "get_trace_attributes",
+    "NodeMetrics",
+    "NodeTimer",
+    "cache_hit_rate",
+    "export_node_metrics",
+    "summarize_node_metrics",
 ]
@@ -0,0 +1,271 @@
+"""Graph 노드 메트릭 모듈.
+
+노드 실행마다 실행 시간, 첫 이벤트까지 시간, 이벤트 수, Bedrock 토큰 사용량
+(입력/출력/캐시 읽기/캐시 쓰기)을 수집하고 OTEL span 속성과 히스토그램으로 내보냅니다.
+모델 호출마다 프롬프트 캐시 적중률 (캐시 읽기 / 전체 입력 토큰)도 기록합니다.
+
+OTEL TracerProvider/MeterProvider가 설정되지 않은 경우 (로컬 개발) OTEL API가
+no-op으로 동작하므로 수집 비용만 발생합니다.
+
+사용법:
+    timer = NodeTimer("analyze", attempt=0)
+    async for event in stream:
+        timer.on_event(event)
+    metrics = timer.finish()
+    export_node_metrics(metrics)
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from opentelemetry import metrics as otel_metrics
+from opentelemetry import trace
+from opentelemetry.util.types import AttributeValue
+
+logger = logging.getLogger(__name__)
+
+INSTRUMENTATION_NAME = "ops_agent.graph"
+
+# Bedrock usage 키 → NodeMetrics 필드
+USAGE_FIELDS = {
+    "inputTokens": "input_tokens",
+    "outputTokens": "output_tokens",
+    "cacheReadInputTokens": "cache_read_tokens",
+    "cacheWriteInputTokens": "cache_write_tokens",
+}
+
+
+# ========== Node Metrics ==========
+
+def cache_hit_rate(usage: Mapping[str, Any]) -> float | None:
+    """Bedrock usage의 프롬프트 캐시 적중률 (입력 토큰이 없으면 None).
+
+    Bedrock inputTokens는 캐시되지 않은 입력만 포함하므로
+    전체 입력 = inputTokens + cacheReadInputTokens + cacheWriteInputTokens 입니다.
+
+    Args:
+        usage: Bedrock usage (inputTokens, cacheReadInputTokens, cacheWriteInputTokens)
+
+    Returns:
+        0.0 ~ 1.0 적중률 또는 None
+    """
+    cache_read = usage.get("cacheReadInputTokens") or 0
+    total = (usage.get("inputTokens") or 0) + cache_read + (usage.get("cacheWriteInputTokens") or 0)
+    if not total:
+        return None
+    return cache_read / total
+
+
+@dataclass
+class NodeMetrics:
+    """노드 한 번 실행의 메트릭.
+
+    Attributes:
+        node: 노드 이름
+        attempt: 워크플로우 시도 번호 (0부터, 재시도 구분용)
+        started_at: 시작 시각 (epoch 초)
+        wall_time: 실행 시간 (초)
+        time_to_first_event: 첫 스트리밍 이벤트까지 시간 (초, 비스트리밍 노드는 None)
+        events: 전달한 스트리밍 이벤트 수
+        input_tokens: 입력 토큰 수
+        output_tokens: 출력 토큰 수
+        cache_read_tokens: 프롬프트 캐시에서 읽은 입력 토큰 수
+        cache_write_tokens: 프롬프트 캐시에 기록한 입력 토큰 수
+        cache_hit_rates: 모델 호출별 프롬프트 캐시 적중률
+        status: "completed" 또는 "failed"
+    """
+
+    node: str
+    attempt: int
+    started_at: float
+    wall_time: float = 0.0
+    time_to_first_event: float | None = None
+    events: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    cache_hit_rates: list[float] = field(default_factory=list)
+    status: str = "completed"
+
+    @property
+    def cache_hit_rate(self) -> float | None:
+        """노드 실행 전체의 프롬프트 캐시 적중률 (모델 호출이 없으면 None)."""
+        return cache_hit_rate({
+            "inputTokens": self.input_tokens,
+            "cacheReadInputTokens": self.cache_read_tokens,
+            "cacheWriteInputTokens": self.cache_write_tokens,
+        })
+
+    def to_dict(self) -> dict[str, Any]:
+        """딕셔너리로 변환 (state.metadata 저장용)."""
+        return {**asdict(self), "cache_hit_rate": self.cache_hit_rate}
+
+
+class NodeTimer:
+    """노드 실행 중 메트릭 수집기.
+
+    Args:
+        node: 노드 이름
+        attempt: 워크플로우 시도 번호
+    """
+
+    def __init__(self, node: str, attempt: int = 0) -> None:
+        self._metrics = NodeMetrics(node=node, attempt=attempt, started_at=time.time())
+        self._start = time.perf_counter()
+
+    def on_event(self, event: Any) -> None:
+        """스트리밍 이벤트 기록 (Bedrock metadata 이벤트의 usage 포함)."""
+        metrics = self._metrics
+        if metrics.events == 0:
+            metrics.time_to_first_event = time.perf_counter() - self._start
+        metrics.events += 1
+
+        usage = _extract_usage(event)
+        if usage:
+            for key, field_name in USAGE_FIELDS.items():
+                value = usage.get(key)
+                if value:
+                    setattr(metrics, field_name, getattr(metrics, field_name) + value)
+            rate = cache_hit_rate(usage)
+            if rate is not None:
+                metrics.cache_hit_rates.append(rate)
+
+    def finish(self, failed: bool = False) -> NodeMetrics:
+        """실행 종료 기록 후 메트릭 반환."""
+        self._metrics.wall_time = time.perf_counter() - self._start
+        if failed:
+            self._metrics.status = "failed"
+        return self._metrics
+
+
+def _extract_usage(event: Any) -> dict[str, Any] | None:
+    """Strands 모델 스트림 이벤트 {"event": {"metadata": {"usage": ...}}}에서 usage 추출."""
+    if not isinstance(event, dict):
+        return None
+    raw = event.get("event")
+    if not isinstance(raw, dict):
+        return None
+    metadata = raw.get("metadata")
+    if not isinstance(metadata, dict):
+        return None
+    return metadata.get("usage")
+
+
+def summarize_node_metrics(records: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """노드별 메트릭 합계 (state.metadata["node_metrics"] 입력).
+
+    Args:
+        records: NodeMetrics.to_dict() 목록
+
+    Returns:
+        {노드 이름: {"executions", "wall_time", "retry_wall_time", 토큰 합계..., "cache_hit_rate"}}
+    """
+    summary: dict[str, dict[str, Any]] = {}
+    for record in records:
+        node = summary.setdefault(record["node"], {
+            "executions": 0,
+            "wall_time": 0.0,
+            "retry_wall_time": 0.0,
+            **dict.fromkeys(USAGE_FIELDS.values(), 0),
+        })
+        node["executions"] += 1
+        node["wall_time"] += record["wall_time"]
+        if record["attempt"] > 0:
+            node["retry_wall_time"] += record["wall_time"]
+        for field_name in USAGE_FIELDS.values():
+            node[field_name] += record[field_name]
+
+    for node in summary.values():
+        node["cache_hit_rate"] = cache_hit_rate({key: node[name] for key, name in USAGE_FIELDS.items()})
+    return summary
+
+
+# ========== OTEL Export ==========
+
+class _Instruments:
+    """노드 메트릭 히스토그램 (최초 사용 시 생성)."""
+
+    def __init__(self, meter: otel_metrics.Meter | None = None) -> None:
+        meter = meter or otel_metrics.get_meter(INSTRUMENTATION_NAME)
+        self.duration = meter.create_histogram(
+            "ops_agent.node.duration", unit="s", description="Graph node wall time",
+        )
+        self.time_to_first_event = meter.create_histogram(
+            "ops_agent.node.time_to_first_event", unit="s", description="Time until a node yields its first event",
+        )
+        self.tokens = meter.create_histogram(
+            "ops_agent.node.tokens", unit="{token}", description="Bedrock tokens used by a node execution",
+        )
+        self.cache_hit_rate = meter.create_histogram(
+            "ops_agent.model.cache_hit_rate", unit="1", description="Prompt cache hit rate per model call",
+        )
+
+
+_instruments: _Instruments | None = None
+_instruments_lock = threading.Lock()
+
+
+def _get_instruments() -> _Instruments:
+    global _instruments
+    if _instruments is None:
+        with _instruments_lock:
+            if _instruments is None:
+                _instruments = _Instruments()
+    return _instruments
+
+
+def export_node_metrics(metrics: NodeMetrics) -> None:
+    """노드 메트릭을 OTEL span과 히스토그램으로 내보내기.
+
+    현재 컨텍스트 (Graph span) 아래에 노드 실행 구간의 span을 기록합니다.
+    스트리밍 노드는 async generator라 실행 중 span을 현재 컨텍스트로 유지할 수 없으므로
+    종료 시 시작/종료 시각을 지정해 span을 생성합니다.
+
+    Args:
+        metrics: 노드 메트릭
+    """
+    attributes: dict[str, AttributeValue] = {
+        "ops_agent.node": metrics.node,
+        "ops_agent.attempt": metrics.attempt,
+    }
+
+    try:
+        span_attributes: dict[str, AttributeValue] = {
+            **attributes,
+            "ops_agent.node.status": metrics.status,
+            "ops_agent.node.wall_time": metrics.wall_time,
+            "ops_agent.node.events": metrics.events,
+            **{f"ops_agent.node.{name}": getattr(metrics, name) for name in USAGE_FIELDS.values()},
+        }
+        if metrics.time_to_first_event is not None:
+            span_attributes["ops_agent.node.time_to_first_event"] = metrics.time_to_first_event
+        if metrics.cache_hit_rate is not None:
+            span_attributes["ops_agent.node.cache_hit_rate"] = metrics.cache_hit_rate
+
+        start_ns = int(metrics.started_at * 1e9)
+        span = trace.get_tracer(INSTRUMENTATION_NAME).start_span(
+            f"ops_agent.node.{metrics.node}",
+            start_time=start_ns,
+            attributes=span_attributes,
+        )
+        span.end(end_time=start_ns + int(metrics.wall_time * 1e9))
+
+        instruments = _get_instruments()
+        instruments.duration.record(metrics.wall_time, attributes)
+        if metrics.time_to_first_event is not None:
+            instruments.time_to_first_event.record(metrics.time_to_first_event, attributes)
+        for name in USAGE_FIELDS.values():
+            value = getattr(metrics, name)
+            if value:
+                instruments.tokens.record(value, {**attributes, "ops_agent.token_type": name})
+        for rate in metrics.cache_hit_rates:
+            instruments.cache_hit_rate.record(rate, attributes)
+
+    except Exception as e:
+        # 관측성 오류가 워크플로우를 중단시키지 않도록 로그만 남김
+        logger.warning(f"[Telemetry] 노드 메트릭 내보내기 실패: {e}")
@@ -0,0 +1,29 @@
+"""오프라인 실행용 가짜 모델 모듈.
+
+AWS 자격 증명 없이 전체 워크플로우를 실행하기 위한 BedrockModel 대역입니다.
+테스트, 오프라인 벤치마크, AGENTCORE_OFFLINE 런타임에서 사용합니다.
+
+사용법:
+    from ops_agent.testing import FakeModel, ops_responder
+    from ops_agent.graph import nodes
+
+    nodes.use_model(FakeModel(ops_responder, token_delay=0.005))
+"""
+
+from ops_agent.testing.fake_model import (
+    FakeModel,
+    FakeModelStats,
+    FakeTurn,
+    ToolCall,
+    ops_responder,
+    scripted,
+)
+
+__all__ = [
+    "FakeModel",
+    "FakeModelStats",
+    "FakeTurn",
+    "ToolCall",
+    "ops_responder",
+    "scripted",
+]
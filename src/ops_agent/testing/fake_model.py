@@ -0,0 +1,238 @@
+"""BedrockModel 호환 가짜 모델 (테스트/벤치마크/오프라인 런타임용).
+
+Bedrock Converse 스트림 이벤트 형식으로 스크립트된 응답을 스트리밍합니다.
+토큰 지연을 설정할 수 있어 LLM 시간과 Graph 프레임워크 오버헤드를 분리해 측정할 수 있습니다.
+ops_responder는 Mock CloudWatch/KB 도구를 호출하고 결과를 인용하는 운영 응답 스크립트입니다
+(AGENTCORE_OFFLINE 런타임과 오프라인 벤치마크에서 사용).
+
+사용법:
+    model = FakeModel(scripted(
+        FakeTurn(tool_calls=(ToolCall("cloudwatch_filter_log_events", {...}),)),
+        FakeTurn(text="payment-service에서 4건의 에러가 발생했습니다."),
+    ), token_delay=0.001)
+    agent = Agent(model=model, tools=[...])
+
+응답 선택:
+    - respond(messages) 함수가 대화 기록을 보고 다음 턴을 결정
+    - scripted(*turns): 마지막 사용자 텍스트 이후 도구 결과 라운드 수로 턴 선택
+"""
+
+import asyncio
+import itertools
+import json
+import re
+import threading
+import time
+from collections.abc import AsyncGenerator, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+from strands.models.model import Model
+from strands.types.content import Message, Messages, SystemContentBlock
+from strands.types.event_loop import Usage
+from strands.types.streaming import StreamEvent
+from strands.types.tools import ToolChoice, ToolSpec
+
+T = TypeVar("T", bound=BaseModel)
+
+TOKEN_PATTERN = re.compile(r"\s*\S+|\s+")
+
+
+@dataclass(frozen=True)
+class ToolCall:
+    """모델이 요청할 도구 호출."""
+
+    name: str
+    input: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class FakeTurn:
+    """모델 응답 한 턴 (텍스트 + 도구 호출)."""
+
+    text: str = ""
+    tool_calls: tuple[ToolCall, ...] = ()
+
+
+Responder = Callable[[list[Message]], FakeTurn]
+
+
+@dataclass
+class FakeModelStats:
+    """모델 호출 통계 (여러 Agent가 같은 모델을 공유해도 합산).
+
+    Attributes:
+        calls: stream 호출 수
+        llm_time: 스트리밍에 걸린 총 시간 (초, 토큰 지연 포함)
+        output_tokens: 스트리밍한 텍스트 토큰 수
+    """
+
+    calls: int = 0
+    llm_time: float = 0.0
+    output_tokens: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, elapsed: float, tokens: int) -> None:
+        with self._lock:
+            self.calls += 1
+            self.llm_time += elapsed
+            self.output_tokens += tokens
+
+
+def _tool_rounds(messages: list[Message]) -> int:
+    """마지막 사용자 텍스트 메시지 이후의 도구 결과 라운드 수."""
+    rounds = 0
+    for message in reversed(messages):
+        if message["role"] != "user":
+            continue
+        if any("toolResult" in block for block in message["content"]):
+            rounds += 1
+        else:
+            break
+    return rounds
+
+
+def scripted(*turns: FakeTurn) -> Responder:
+    """도구 결과 라운드 수로 턴을 고르는 응답 함수 (마지막 턴 반복)."""
+
+    def respond(messages: list[Message]) -> FakeTurn:
+        return turns[min(_tool_rounds(messages), len(turns) - 1)]
+
+    return respond
+
+
+class FakeModel(Model):
+    """스크립트된 응답을 스트리밍하는 Strands Model.
+
+    structured_output()은 스크립트된 턴의 텍스트를 output_model JSON으로 검증해 반환합니다.
+
+    Args:
+        respond: 대화 기록 → 다음 턴 함수, 또는 scripted()에 넘길 턴 목록
+        token_delay: 텍스트 토큰 사이 지연 (초)
+        first_token_delay: 첫 이벤트 전 지연 (초, TTFT 모사)
+        usage: metadata 이벤트 usage에 추가할 값 (예: {"inputTokens": 100, "cacheReadInputTokens": 80})
+    """
+
+    def __init__(
+        self,
+        respond: Responder | Sequence[FakeTurn],
+        token_delay: float = 0.0,
+        first_token_delay: float = 0.0,
+        usage: dict[str, int] | None = None,
+    ) -> None:
+        self._respond = respond if callable(respond) else scripted(*respond)
+        self.token_delay = token_delay
+        self.first_token_delay = first_token_delay
+        self.usage = usage or {}
+        self.stats = FakeModelStats()
+        # 같은 모델을 공유하는 동시 스트림에서도 toolUseId가 겹치지 않도록 인스턴스 단위 카운터 사용
+        self._tool_use_ids = itertools.count()
+        self._config: dict[str, Any] = {"model_id": "fake-model"}
+
+    def update_config(self, **model_config: Any) -> None:
+        self._config.update(model_config)
+
+    def get_config(self) -> dict[str, Any]:
+        return self._config
+
+    async def structured_output(
+        self,
+        output_model: type[T],
+        prompt: Messages,
+        system_prompt: str | None = None,  # noqa: ARG002 - 응답은 스크립트로 결정
+        **kwargs: Any,  # noqa: ARG002
+    ) -> AsyncGenerator[dict[str, T | Any], None]:
+        turn = self._respond(prompt)
+        yield {"output": output_model.model_validate_json(turn.text)}
+
+    async def stream(
+        self,
+        messages: Messages,
+        tool_specs: list[ToolSpec] | None = None,  # noqa: ARG002 - 응답은 스크립트로 결정
+        system_prompt: str | None = None,  # noqa: ARG002
+        *,
+        tool_choice: ToolChoice | None = None,  # noqa: ARG002
+        system_prompt_content: list[SystemContentBlock] | None = None,  # noqa: ARG002
+        invocation_state: dict[str, Any] | None = None,  # noqa: ARG002
+        **kwargs: Any,  # noqa: ARG002
+    ) -> AsyncGenerator[StreamEvent, None]:
+        started = time.perf_counter()
+        turn = self._respond(messages)
+        tokens = TOKEN_PATTERN.findall(turn.text)
+
+        if self.first_token_delay:
+            await asyncio.sleep(self.first_token_delay)
+
+        yield {"messageStart": {"role": "assistant"}}
+
+        if tokens:
+            yield {"contentBlockStart": {"start": {}}}
+            for token in tokens:
+                if self.token_delay:
+                    await asyncio.sleep(self.token_delay)
+                yield {"contentBlockDelta": {"delta": {"text": token}}}
+            yield {"contentBlockStop": {}}
+
+        for call in turn.tool_calls:
+            tool_use_id = f"fake-{next(self._tool_use_ids)}"
+            yield {"contentBlockStart": {"start": {"toolUse": {"toolUseId": tool_use_id, "name": call.name}}}}
+            yield {"contentBlockDelta": {"delta": {"toolUse": {"input": json.dumps(call.input, ensure_ascii=False)}}}}
+            yield {"contentBlockStop": {}}
+
+        yield {"messageStop": {"stopReason": "tool_use" if turn.tool_calls else "end_turn"}}
+
+        elapsed = time.perf_counter() - started
+        self.stats.record(elapsed, len(tokens))
+        input_tokens = self.usage.get("inputTokens", 0)
+        output_tokens = self.usage.get("outputTokens", len(tokens))
+        usage: Usage = {
+            "inputTokens": input_tokens,
+            "outputTokens": output_tokens,
+            "totalTokens": input_tokens + output_tokens,
+        }
+        if "cacheReadInputTokens" in self.usage:
+            usage["cacheReadInputTokens"] = self.usage["cacheReadInputTokens"]
+        if "cacheWriteInputTokens" in self.usage:
+            usage["cacheWriteInputTokens"] = self.usage["cacheWriteInputTokens"]
+        yield {
+            "metadata": {
+                "usage": usage,
+                "metrics": {"latencyMs": int(elapsed * 1000)},
+            }
+        }
+
+
+# ========== 운영 응답 스크립트 ==========
+
+OPS_LOG_QUERY = {"log_group_name": "/aws/lambda/payment-service", "filter_pattern": "500"}
+OPS_KB_QUERY = {"query": "에러 코드 해결 방법", "category": "diagnostics"}
+
+
+def ops_responder(messages: list[Message]) -> FakeTurn:
+    """첫 턴은 CloudWatch/KB 도구 호출, 도구 결과를 받으면 결과를 인용한 답변.
+
+    답변은 도구 결과의 이벤트 수와 메시지를 그대로 인용하므로 평가를 통과합니다.
+    """
+    outputs = [
+        json.loads(block["toolResult"]["content"][0]["text"])
+        for message in messages if message["role"] == "user"
+        for block in message["content"] if "toolResult" in block
+    ]
+    if not outputs:
+        return FakeTurn(
+            text="로그와 KB를 확인하겠습니다.",
+            tool_calls=(
+                ToolCall("cloudwatch_filter_log_events", OPS_LOG_QUERY),
+                ToolCall("kb_retrieve", OPS_KB_QUERY),
+            ),
+        )
+
+    lines = []
+    for output in outputs:
+        if "event_count" in output:
+            lines.append(f"{output['log_group']}에서 {output['event_count']}건의 에러가 발생했습니다.")
+            lines.extend(f"- {event['message']}" for event in output["events"])
+        for result in output.get("results", [])[:1]:
+            lines.append(result["content"])
+    return FakeTurn(text="\n".join(lines))
@@ -14,15 +14,25 @@ MCP 서버 설치:
     - get_active_alarms: 활성 알람 조회
     - get_alarm_history: 알람 이력 조회
 
+세션 관리:
+    MCP 서버(stdio 서브프로세스)는 프로세스당 한 번만 실행하고 모든 요청이 공유합니다.
+    도구 수집 시 세션 상태를 확인하여, 서버가 종료되었으면 자동으로 재시작합니다.
+    Agent에는 MCPClient(ToolProvider) 대신 MCP 도구 목록을 전달하므로
+    Agent가 정리될 때 공유 세션이 종료되지 않습니다.
+
 Reference:
     - https://awslabs.github.io/mcp/servers/cloudwatch-mcp-server
     - https://strandsagents.com/latest/documentation/docs/user-guide/concepts/tools/mcp-tools/
 """
 
+import atexit
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from mcp import stdio_client, StdioServerParameters
-from strands.tools.mcp import MCPClient
+from mcp import StdioServerParameters, stdio_client
+from strands.tools.mcp import MCPAgentTool, MCPClient
 
 from ops_agent.tools.util import Colors
 
@@ -31,31 +41,199 @@ logger = logging.getLogger(__name__)
 # MCP 서버 설정
 CLOUDWATCH_MCP_SERVER = "awslabs.cloudwatch-mcp-server@latest"
 
+# 재시작 최소 간격 (초) - 서버가 즉시 종료되는 경우 재시작 폭주 방지
+RESTART_BACKOFF_SECONDS = 5.0
 
-def get_cloudwatch_mcp_client() -> MCPClient:
-    """CloudWatch MCP 클라이언트 생성.
 
-    Returns:
-        MCPClient: CloudWatch MCP 서버에 연결된 클라이언트
-    """
-    logger.info(
-        f"{Colors.GREEN}[MCP] CloudWatch MCP 서버 연결: {CLOUDWATCH_MCP_SERVER}{Colors.END}"
+def get_server_parameters() -> StdioServerParameters:
+    """CloudWatch MCP 서버 실행 파라미터."""
+    return StdioServerParameters(
+        command="uvx",
+        args=[CLOUDWATCH_MCP_SERVER],
     )
 
-    return MCPClient(
-        lambda: stdio_client(
-            StdioServerParameters(
-                command="uvx",
-                args=[CLOUDWATCH_MCP_SERVER],
+
+# ==========================================================================
+# 공유 MCP 세션
+# ==========================================================================
+
+class MCPSession:
+    """프로세스 단위로 공유하는 MCP 세션.
+
+    최초 사용 시 서버를 시작하고 도구 목록을 캐시합니다.
+    이후 요청은 같은 세션과 도구 객체를 재사용하며,
+    세션이 끊기면 다음 요청에서 같은 MCPClient를 재시작합니다.
+    (MCPAgentTool은 MCPClient를 참조하므로 재시작 후에도 도구 객체가 유효)
+
+    Attributes:
+        starts: 서버 시작 횟수 (최초 시작 + 재시작)
+
+    Example:
+        session = MCPSession(get_server_parameters(), name="CloudWatch")
+        tools = session.get_tools()
+        agent = Agent(tools=tools)
+    """
+
+    def __init__(
+        self,
+        server_params: StdioServerParameters,
+        name: str = "MCP",
+        startup_timeout: int = 30,
+        restart_backoff: float = RESTART_BACKOFF_SECONDS,
+        health_check_timeout: float = 5.0,
+    ) -> None:
+        """세션 초기화 (서버는 get_tools() 최초 호출 시 시작).
+
+        Args:
+            server_params: stdio 서버 실행 파라미터
+            name: 로그 표시용 이름
+            startup_timeout: 서버 초기화 제한 시간 (초)
+            restart_backoff: 재시작 최소 간격 (초)
+            health_check_timeout: 상태 확인(도구 목록 조회) 응답 제한 시간 (초)
+        """
+        self.server_params = server_params
+        self.name = name
+        self.restart_backoff = restart_backoff
+        self.health_check_timeout = health_check_timeout
+        self.client = MCPClient(
+            lambda: stdio_client(self.server_params),
+            startup_timeout=startup_timeout,
+        )
+        self.starts = 0
+        self._tools: list[MCPAgentTool] | None = None
+        self._last_start = 0.0
+        self._lock = threading.Lock()
+        # list_tools_sync()는 제한 시간을 받지 않으므로 별도 스레드에서 실행하고 결과를 기다림
+        self._health_check_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"mcp-health-{name}"
+        )
+
+    def is_healthy(self) -> bool:
+        """세션 상태 확인.
+
+        서버 프로세스가 종료되어도 MCPClient 백그라운드 스레드는 살아 있을 수 있으므로
+        공개 API인 list_tools_sync()로 실제 연결을 확인합니다 (로컬 stdio 왕복).
+        health_check_timeout 안에 응답이 없거나 오류가 발생하면 끊긴 것으로 판단합니다.
+        """
+        if self._tools is None:
+            return False
+        try:
+            self._health_check_pool.submit(self.client.list_tools_sync).result(
+                timeout=self.health_check_timeout
             )
+            return True
+        except Exception as e:
+            logger.debug(f"[MCP] {self.name} 상태 확인 실패: {e!r}")
+            return False
+
+    def get_tools(self) -> list[MCPAgentTool]:
+        """세션의 MCP 도구 목록 반환 (필요 시 시작/재시작).
+
+        Returns:
+            list: MCPAgentTool 목록
+
+        Raises:
+            RuntimeError: 재시작 간격 이내에 다시 실패한 경우
+        """
+        tools = self._tools
+        if tools is not None and self.is_healthy():
+            return tools
+
+        with self._lock:
+            tools = self._tools
+            if tools is not None and self.is_healthy():
+                return tools
+
+            if tools is not None:
+                logger.warning(
+                    f"{Colors.YELLOW}[MCP] {self.name} 세션 끊김 - 재시작{Colors.END}"
+                )
+            return self._restart()
+
+    def _restart(self) -> list[MCPAgentTool]:
+        """기존 세션 정리 후 서버 시작 및 도구 목록 로드.
+
+        Returns:
+            list: 새로 로드한 MCPAgentTool 목록
+        """
+        elapsed = time.monotonic() - self._last_start
+        if self.starts and elapsed < self.restart_backoff:
+            raise RuntimeError(
+                f"{self.name} MCP 서버 재시작 대기 중 ({self.restart_backoff - elapsed:.1f}s)"
+            )
+
+        self._stop_client()
+        self._tools = None
+        self._last_start = time.monotonic()
+        self.starts += 1
+
+        logger.info(
+            f"{Colors.GREEN}[MCP] {self.name} MCP 서버 시작: "
+            f"{self.server_params.command} {' '.join(self.server_params.args)}{Colors.END}"
         )
-    )
+        self.client.start()
 
+        tools: list[MCPAgentTool] = []
+        pagination_token = None
+        while True:
+            page = self.client.list_tools_sync(pagination_token)
+            tools.extend(page)
+            pagination_token = page.pagination_token
+            if pagination_token is None:
+                break
+        self._tools = tools
+        return tools
 
-def get_mcp_tools() -> list:
+    def _stop_client(self) -> None:
+        """MCPClient 정리 (이미 종료된 경우 발생하는 예외는 무시)."""
+        try:
+            self.client.stop(None, None, None)
+        except Exception as e:
+            logger.debug(f"[MCP] {self.name} 세션 정리 중 오류 (무시): {e}")
+
+    def close(self) -> None:
+        """세션 종료 (서버 프로세스 종료)."""
+        with self._lock:
+            self._stop_client()
+            self._tools = None
+
+
+_session: MCPSession | None = None
+_session_lock = threading.Lock()
+
+
+def get_cloudwatch_mcp_session() -> MCPSession:
+    """공유 CloudWatch MCP 세션 반환 (lazy singleton).
+
+    Returns:
+        MCPSession: 프로세스 단위 CloudWatch MCP 세션
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = MCPSession(get_server_parameters(), name="CloudWatch")
+                atexit.register(_session.close)
+    return _session
+
+
+def get_cloudwatch_mcp_client() -> MCPClient:
+    """공유 CloudWatch MCP 클라이언트 반환 (세션 시작 보장).
+
+    Returns:
+        MCPClient: CloudWatch MCP 서버에 연결된 클라이언트
+    """
+    session = get_cloudwatch_mcp_session()
+    session.get_tools()
+    return session.client
+
+
+def get_mcp_tools() -> list[MCPAgentTool]:
     """MCP 모드에서 사용할 도구 목록 반환.
 
+    공유 세션의 MCP 도구를 반환하므로 요청마다 서버를 새로 실행하지 않습니다.
+
     Returns:
-        list: MCPClient를 포함한 도구 목록
+        list: CloudWatch MCP 도구 목록
     """
-    return [get_cloudwatch_mcp_client()]
+    return list(get_cloudwatch_mcp_session().get_tools())
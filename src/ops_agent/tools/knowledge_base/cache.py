@@ -0,0 +1,213 @@
+"""Knowledge Base 검색 결과 캐시.
+
+재생성(REGENERATE) 루프에서 같은 (query, category, num_results) 검색이 반복되므로
+검색 결과를 LRU + TTL 캐시에 보관하여 Bedrock Retrieve 호출을 줄입니다.
+Mock / Bedrock 백엔드 모두 같은 캐시 계층을 사용합니다.
+
+캐시 키:
+    (백엔드, 정규화된 질문, 카테고리, 결과 수)
+    - Bedrock: 질문은 NFKC 정규화 + 소문자 변환 + 공백 정리 후 비교 (make_cache_key)
+    - Mock: 로컬 검색과 같은 정규화 (공백 토큰화 + 소문자)만 적용
+      (data_loader.search_cache_key, 검색 결과가 다를 수 있는 질문은 키도 다름)
+
+사용법:
+    from ops_agent.tools.knowledge_base.cache import get_kb_cache, make_cache_key
+
+    cache = get_kb_cache()
+    key = make_cache_key("bedrock", query, category, num_results)
+    results = cache.get(key)
+    if results is None:
+        results = retrieve(...)
+        cache.set(key, results)
+"""
+
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from ops_agent.config import get_settings
+
+# Mock 백엔드 키 접두어 (data_loader.clear_cache()가 이 백엔드 항목을 무효화)
+MOCK_BACKEND = "mock"
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 질문 정규화.
+
+    Args:
+        query: 검색 질문
+
+    Returns:
+        str: NFKC 정규화, 소문자 변환, 공백 정리된 질문
+    """
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+def make_cache_key(
+    backend: str,
+    query: str,
+    category: str | None,
+    num_results: int,
+) -> tuple:
+    """검색 캐시 키 생성.
+
+    Args:
+        backend: 검색 백엔드 식별자 (예: 'mock', 'bedrock:<kb_id>')
+        query: 검색 질문
+        category: 카테고리 필터
+        num_results: 최대 결과 수
+
+    Returns:
+        tuple: 캐시 키
+    """
+    return (backend, normalize_query(query), (category or "").strip(), num_results)
+
+
+class RetrievalCache:
+    """스레드 안전 LRU + TTL 캐시.
+
+    Attributes:
+        max_size: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+        ttl: 항목 유효 시간 (초)
+        hits / misses / evictions / expirations: 통계 카운터
+
+    Example:
+        cache = RetrievalCache(max_size=128, ttl=300)
+        cache.set(key, results)
+        cache.get(key)  # TTL 이내면 results, 아니면 None
+    """
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """캐시 초기화.
+
+        Args:
+            max_size: 최대 항목 수
+            ttl: 항목 유효 시간 (초)
+            clock: 시간 함수 (테스트용 교체 가능)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """캐시 조회 (만료된 항목은 제거 후 None).
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시된 값 또는 None
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = item
+            if self._clock() >= expires_at:
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """캐시 저장 (max_size 초과 시 LRU 제거).
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+        """
+        if self.max_size <= 0 or self.ttl <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (self._clock() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """캐시 항목과 통계 초기화."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def invalidate(self, backend: str) -> int:
+        """특정 백엔드의 캐시 항목 제거 (통계는 유지).
+
+        Args:
+            backend: 캐시 키의 백엔드 식별자 (키의 첫 번째 요소)
+
+        Returns:
+            int: 제거한 항목 수
+        """
+        with self._lock:
+            keys = [k for k in self._data if isinstance(k, tuple) and k and k[0] == backend]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def stats(self) -> dict[str, Any]:
+        """캐시 통계.
+
+        Returns:
+            dict: hits, misses, evictions, expirations, size, hit_rate
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._data),
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+_kb_cache: RetrievalCache | None = None
+_kb_cache_lock = threading.Lock()
+
+
+def get_kb_cache() -> RetrievalCache:
+    """KB 검색 결과 캐시 반환 (lazy singleton).
+
+    KB_CACHE_MAX_SIZE, KB_CACHE_TTL 설정을 사용합니다 (0이면 캐시 비활성화).
+
+    Returns:
+        RetrievalCache: 프로세스 공용 캐시
+    """
+    global _kb_cache
+    if _kb_cache is None:
+        with _kb_cache_lock:
+            if _kb_cache is None:
+                settings = get_settings()
+                _kb_cache = RetrievalCache(
+                    max_size=settings.kb_cache_max_size,
+                    ttl=settings.kb_cache_ttl,
+                )
+    return _kb_cache
@@ -7,34 +7,208 @@ YAML 기반 KB 데이터를 로드하고 검색 기능을 제공합니다.
 
     index = load_index()
     results = search_entries("에러 코드 22E")
+
+검색 구조:
+    search_entries()는 전체 카테고리를 순회하지 않고 KBIndex(역색인)를 사용합니다.
+    점수는 토큰별 점수의 합이므로 토큰별 posting(항목 → 가중치)을 한 번만 계산해 두면
+    이후 같은 토큰이 포함된 질의는 dict 조회만으로 처리됩니다.
+
+스냅샷:
+    YAML 파싱 결과를 pickle 스냅샷(data/RAG/refrigerator_yaml.snapshot.pkl)으로 저장하여
+    콜드 스타트 시 PyYAML 파싱을 건너뜁니다. 원본 YAML의 mtime/크기가 바뀌면
+    SHA-256 해시를 비교하고, 내용이 바뀌었으면 스냅샷을 자동으로 다시 생성합니다.
+    AgentCore 배포 시 agentcore/scripts/deploy.py가 스냅샷을 미리 만들어 YAML과 함께
+    이미지에 넣으므로, 컨테이너 콜드 스타트에서도 YAML을 파싱하지 않습니다.
 """
 
+import hashlib
+import heapq
 import logging
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 import yaml
 
+from ops_agent.tools.knowledge_base.cache import MOCK_BACKEND, get_kb_cache
+
 logger = logging.getLogger(__name__)
 
-# YAML 데이터 디렉토리
-DATA_DIR = Path(__file__).parents[4] / "data" / "RAG" / "refrigerator_yaml"
+# YAML 데이터 디렉토리 (상대 경로)
+DATA_SUBDIR = Path("data") / "RAG" / "refrigerator_yaml"
+
+
+def _find_data_dir() -> Path:
+    """YAML 데이터 디렉토리 찾기.
+
+    로컬: <프로젝트 루트>/data/... (src/ops_agent 기준 parents[4])
+    AgentCore 이미지: /app/data/... (ops_agent가 /app 바로 아래로 복사됨, parents[3])
+    """
+    module_path = Path(__file__)
+    candidates = [module_path.parents[4] / DATA_SUBDIR, module_path.parents[3] / DATA_SUBDIR]
+    return next((path for path in candidates if path.is_dir()), candidates[0])
+
+
+DATA_DIR = _find_data_dir()
+
+
+# ==========================================================================
+# YAML 스냅샷
+# ==========================================================================
+
+# 스냅샷은 이 모듈이 직접 생성한 로컬 파일만 읽습니다 (pickle이므로 외부 파일 사용 금지).
+# 스냅샷 형식 버전 (구조 변경 시 증가 → 기존 스냅샷 무시)
+SNAPSHOT_VERSION = 1
+
+
+def get_snapshot_path() -> Path:
+    """스냅샷 파일 경로 (YAML 디렉토리 옆: <dir>.snapshot.pkl)."""
+    return DATA_DIR.with_name(f"{DATA_DIR.name}.snapshot.pkl")
+
+
+def _source_files() -> dict[str, Path]:
+    """스냅샷 대상 YAML 파일 (파일명 → 경로)."""
+    if not DATA_DIR.is_dir():
+        return {}
+    return {path.name: path for path in sorted(DATA_DIR.glob("*.yaml"))}
+
+
+def _file_hash(path: Path) -> str:
+    """파일 내용 SHA-256 해시."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _file_stat(path: Path) -> tuple[int, int]:
+    """(mtime_ns, size) - 해시 계산 없이 변경 여부를 빠르게 확인."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_snapshot(sources: dict[str, Path]) -> dict[str, Any] | None:
+    """유효한 스냅샷 읽기.
+
+    mtime/크기가 같으면 그대로 사용하고, 다르면 해시를 비교합니다.
+    내용은 같고 mtime만 바뀐 경우(git checkout 등) 메타데이터만 갱신하여 다시 저장합니다.
+
+    Args:
+        sources: 현재 YAML 파일 목록
+
+    Returns:
+        스냅샷 dict 또는 None (없음/손상/내용 변경)
+    """
+    path = get_snapshot_path()
+    if not path.exists():
+        return None
+
+    try:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"[KB] 스냅샷 읽기 실패, 다시 생성: {e}")
+        return None
+
+    if (
+        not isinstance(snapshot, dict)
+        or snapshot.get("version") != SNAPSHOT_VERSION
+        or set(snapshot.get("files", {})) != set(sources)
+    ):
+        return None
+
+    stale_stats = False
+    for name, source in sources.items():
+        meta = snapshot["files"][name]
+        stat = _file_stat(source)
+        if stat == meta["stat"]:
+            continue
+        if _file_hash(source) != meta["sha256"]:
+            logger.info(f"[KB] YAML 변경 감지 ({name}), 스냅샷 다시 생성")
+            return None
+        meta["stat"] = stat
+        stale_stats = True
+
+    if stale_stats:
+        _write_snapshot(snapshot)
+    return snapshot
+
+
+def _write_snapshot(snapshot: dict[str, Any]) -> None:
+    """스냅샷 원자적 저장 (임시 파일 → rename). 쓰기 실패 시 건너뜀."""
+    path = get_snapshot_path()
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        # 읽기 전용 컨테이너 (non-root 사용자) 등: 메모리 데이터만 사용
+        logger.debug(f"[KB] 스냅샷 저장 건너뜀 (메모리 데이터 사용): {e}")
+
+
+def build_snapshot() -> dict[str, Any]:
+    """YAML을 파싱하여 스냅샷 생성 및 저장.
+
+    agentcore/scripts/deploy.py가 이미지 빌드 전에 실행하여 스냅샷을 이미지에 포함합니다.
+
+    Returns:
+        dict: 생성된 스냅샷
+    """
+    sources = _source_files()
+    files: dict[str, dict[str, Any]] = {}
+    documents: dict[str, Any] = {}
+
+    for name, source in sources.items():
+        # 파싱 전에 메타데이터 기록 (파싱 중 변경되면 다음 로드에서 다시 생성)
+        files[name] = {"stat": _file_stat(source), "sha256": _file_hash(source)}
+        with open(source, encoding="utf-8") as f:
+            documents[name] = yaml.safe_load(f)
+
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "files": files,
+        "documents": documents,
+    }
+    _write_snapshot(snapshot)
+    logger.debug(f"[KB] 스냅샷 생성: {len(documents)}개 파일 → {get_snapshot_path()}")
+    return snapshot
 
 
 @lru_cache(maxsize=1)
-def load_index() -> dict:
+def load_documents() -> dict[str, Any]:
+    """YAML 문서 전체 로드 (스냅샷 우선, 캐시됨).
+
+    Returns:
+        dict: 파일명 → 파싱된 YAML
+    """
+    snapshot = _read_snapshot(_source_files()) or build_snapshot()
+    documents: dict[str, Any] = snapshot["documents"]
+    return documents
+
+
+def load_index() -> dict[str, Any]:
     """인덱스 YAML 로드 (캐시됨).
 
     Returns:
         dict: 카테고리 인덱스 정보
+
+    Raises:
+        FileNotFoundError: index.yaml이 없을 때
     """
-    index_path = DATA_DIR / "index.yaml"
-    with open(index_path, encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    documents = load_documents()
+    if "index.yaml" not in documents:
+        raise FileNotFoundError(f"인덱스 파일 없음: {DATA_DIR / 'index.yaml'}")
+    return documents["index.yaml"]
 
 
-@lru_cache(maxsize=16)
-def load_category(category_id: str) -> dict:
+def load_category(category_id: str) -> dict[str, Any]:
     """카테고리 YAML 로드 (캐시됨).
 
     Args:
@@ -46,15 +220,14 @@ def load_category(category_id: str) -> dict:
     Raises:
         FileNotFoundError: 카테고리 파일이 없을 때
     """
-    category_path = DATA_DIR / f"{category_id}.yaml"
-    if not category_path.exists():
-        raise FileNotFoundError(f"카테고리 파일 없음: {category_path}")
+    documents = load_documents()
+    file_name = f"{category_id}.yaml"
+    if file_name not in documents:
+        raise FileNotFoundError(f"카테고리 파일 없음: {DATA_DIR / file_name}")
+    return documents[file_name]
 
-    with open(category_path, encoding="utf-8") as f:
-        return yaml.safe_load(f)
 
-
-def _score_entry(entry: dict, query_tokens: list[str]) -> float:
+def _score_entry(entry: dict[str, Any], query_tokens: list[str]) -> float:
     """항목의 검색 점수 계산.
 
     가중치:
@@ -107,13 +280,296 @@ def _score_entry(entry: dict, query_tokens: list[str]) -> float:
     return score
 
 
+# ==========================================================================
+# 역색인 (Inverted Index)
+# ==========================================================================
+
+# 토큰별 posting 캐시 최대 크기
+TOKEN_CACHE_SIZE = 4096
+
+
+class KBIndex:
+    """KB 항목 역색인.
+
+    _score_entry()와 동일한 점수를 내도록 필드별 매칭 규칙을 그대로 따릅니다.
+        - title / question_variants / answer: 부분 문자열 매칭 (3x / 3x / 1x)
+        - keywords: 양방향 부분 문자열 매칭 (2x)
+        - error_codes: 정확 매칭 (5x, 해시 맵)
+
+    lookup_error_code()용 에러 코드 테이블도 함께 생성합니다.
+
+    부분 문자열 매칭은 문자/바이그램 posting으로 후보 항목을 좁힌 뒤 검증하고,
+    결과는 토큰별로 캐시합니다. 항목 ID는 (카테고리 순서, 항목 순서)이므로
+    ID 순 정렬이 기존 순회 순서와 같습니다.
+
+    Example:
+        index = KBIndex.build()
+        index.search("에러 22E", max_results=3)
+    """
+
+    def __init__(self, categories: list[tuple[str, list[dict[str, Any]]]]) -> None:
+        """역색인 생성.
+
+        Args:
+            categories: (카테고리 ID, 항목 목록) 리스트 (검색 순서대로)
+        """
+        self.entries: list[dict[str, Any]] = []
+        self.entry_category: list[str] = []
+        self.category_order: list[str] = []
+
+        # 소문자 변환된 필드 (검증용)
+        self._titles: list[str] = []
+        self._answers: list[str] = []
+        self._variants: list[list[str]] = []
+        self._keywords: list[list[str]] = []
+
+        # posting: 문자/바이그램 → 항목 ID 집합, 키워드/에러 코드 → 항목 ID 목록
+        self._gram_postings: dict[str, set[int]] = {}
+        self._keyword_postings: dict[str, list[int]] = {}
+        self._keyword_lengths: set[int] = set()  # "kw in token" 조회 시 만들 부분 문자열 길이
+        self._error_code_postings: dict[str, list[int]] = {}
+
+        # 에러 코드 조회 테이블: 원본 표기 그대로 → 항목 목록 (lookup_error_code용)
+        self.error_code_table: dict[str, list[dict[str, Any]]] = {}
+
+        self._token_cache: OrderedDict[str, tuple[tuple[int, float], ...]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        for category_id, entries in categories:
+            self.category_order.append(category_id)
+            for entry in entries:
+                self._add_entry(category_id, entry)
+
+    @classmethod
+    def build(cls) -> "KBIndex":
+        """index.yaml 순서대로 모든 카테고리를 로드하여 역색인 생성.
+
+        Returns:
+            KBIndex: 생성된 역색인
+        """
+        categories = []
+        for cat in load_index()["categories"]:
+            try:
+                cat_data = load_category(cat["id"])
+            except FileNotFoundError:
+                continue
+            categories.append((cat["id"], cat_data.get("entries", [])))
+
+        index = cls(categories)
+        logger.debug(f"[KB] 역색인 생성: {len(index.entries)}개 항목, {len(categories)}개 카테고리")
+        return index
+
+    def _add_entry(self, category_id: str, entry: dict[str, Any]) -> None:
+        """항목 하나를 색인에 추가."""
+        entry_id = len(self.entries)
+        self.entries.append(entry)
+        self.entry_category.append(category_id)
+
+        title = entry.get("title", "").lower()
+        answer = entry.get("answer", "").lower()
+        variants = [q.lower() for q in entry.get("question_variants", [])]
+        keywords = [k.lower() for k in entry.get("keywords", [])]
+
+        self._titles.append(title)
+        self._answers.append(answer)
+        self._variants.append(variants)
+        self._keywords.append(keywords)
+
+        grams: set[str] = set()
+        for text in (title, answer, *variants, *keywords):
+            grams |= self._grams(text)
+        for gram in grams:
+            postings = self._gram_postings.get(gram)
+            if postings is None:
+                self._gram_postings[gram] = {entry_id}
+            else:
+                postings.add(entry_id)
+
+        for kw in dict.fromkeys(keywords):
+            self._keyword_postings.setdefault(kw, []).append(entry_id)
+            self._keyword_lengths.add(len(kw))
+
+        error_codes = entry.get("error_codes", [])
+        for code in dict.fromkeys(c.lower() for c in error_codes):
+            self._error_code_postings.setdefault(code, []).append(entry_id)
+        for code in dict.fromkeys(error_codes):
+            self.error_code_table.setdefault(code, []).append(entry)
+
+    @staticmethod
+    def _grams(text: str) -> set[str]:
+        """텍스트의 문자(1-gram)와 바이그램 집합."""
+        return set(text) | {text[i:i + 2] for i in range(len(text) - 1)}
+
+    def _candidates(self, token: str) -> set[int]:
+        """token을 부분 문자열로 포함할 수 있는 항목 ID 후보."""
+        grams = [token] if len(token) == 1 else [token[i:i + 2] for i in range(len(token) - 1)]
+        postings: list[set[int]] = []
+        for gram in set(grams):
+            posting = self._gram_postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        return set.intersection(*postings)
+
+    def _compute_postings(self, token: str) -> tuple[tuple[int, float], ...]:
+        """토큰 하나의 항목별 점수 계산 (_score_entry의 토큰 단위 로직과 동일)."""
+        scores: dict[int, float] = {}
+
+        # title (3x), question_variants (3x), answer (1x), keywords의 "token in kw" (2x)
+        keyword_hits: set[int] = set()
+        for entry_id in self._candidates(token):
+            score = 0.0
+            if token in self._titles[entry_id]:
+                score += 3.0
+            if any(token in variant for variant in self._variants[entry_id]):
+                score += 3.0
+            if any(token in kw for kw in self._keywords[entry_id]):
+                keyword_hits.add(entry_id)
+            if token in self._answers[entry_id]:
+                score += 1.0
+            if score:
+                scores[entry_id] = score
+
+        # keywords의 "kw in token" (2x): 색인된 키워드 길이의 부분 문자열만 키워드 맵에서 조회
+        # (URL, ARN처럼 공백 없는 긴 토큰도 O(토큰 길이 × 키워드 길이 종류)로 제한)
+        substrings = {
+            token[i:i + length]
+            for length in self._keyword_lengths
+            for i in range(len(token) - length + 1)
+        }
+        for sub in substrings:
+            keyword_hits.update(self._keyword_postings.get(sub, ()))
+
+        for entry_id in keyword_hits:
+            scores[entry_id] = scores.get(entry_id, 0.0) + 2.0
+
+        # error_codes (5x, 정확 매칭)
+        for entry_id in self._error_code_postings.get(token, ()):
+            scores[entry_id] = scores.get(entry_id, 0.0) + 5.0
+
+        return tuple(sorted(scores.items()))
+
+    def token_postings(self, token: str) -> tuple[tuple[int, float], ...]:
+        """토큰의 (항목 ID, 점수) posting 반환 (LRU 캐시).
+
+        Args:
+            token: 검색 토큰
+
+        Returns:
+            tuple: (항목 ID, 점수) 목록
+        """
+        token_lower = token.lower()
+        with self._cache_lock:
+            postings = self._token_cache.get(token_lower)
+            if postings is not None:
+                self._token_cache.move_to_end(token_lower)
+                return postings
+
+        postings = self._compute_postings(token_lower)
+
+        with self._cache_lock:
+            self._token_cache[token_lower] = postings
+            if len(self._token_cache) > TOKEN_CACHE_SIZE:
+                self._token_cache.popitem(last=False)
+        return postings
+
+    def lookup_error_code(self, code: str) -> list[dict[str, Any]]:
+        """에러 코드 정확 조회 (O(1)).
+
+        Args:
+            code: 에러 코드 (대소문자 무관, 대문자로 변환 후 조회)
+
+        Returns:
+            list[dict]: 해당 에러 코드를 포함하는 항목 목록 (색인 순서)
+        """
+        return list(self.error_code_table.get(code.upper(), ()))
+
+    def search(
+        self,
+        query_tokens: list[str],
+        category: str | None = None,
+        max_results: int = 5,
+    ) -> list[dict[str, Any]]:
+        """토큰 목록으로 항목 검색.
+
+        Args:
+            query_tokens: 검색 쿼리 토큰 목록 (중복 토큰은 중복 가산)
+            category: 카테고리 필터 (None이면 전체 검색)
+            max_results: 최대 결과 수
+
+        Returns:
+            list[dict]: 관련성 점수 순으로 정렬된 항목 목록 (동점은 색인 순서)
+        """
+        if category and category not in self.category_order:
+            return []
+
+        scores: dict[int, float] = {}
+        for token in query_tokens:
+            for entry_id, score in self.token_postings(token):
+                scores[entry_id] = scores.get(entry_id, 0.0) + score
+
+        if category:
+            entry_category = self.entry_category
+            candidates = [
+                (-score, entry_id) for entry_id, score in scores.items()
+                if entry_category[entry_id] == category
+            ]
+        else:
+            candidates = [(-score, entry_id) for entry_id, score in scores.items()]
+
+        # 점수 내림차순, 동점은 색인 순서 (기존 stable sort와 동일)
+        top = heapq.nsmallest(max_results, candidates)
+        return [self.entries[entry_id] for _, entry_id in top]
+
+
+@lru_cache(maxsize=1)
+def get_kb_index() -> KBIndex:
+    """KB 역색인 반환 (최초 호출 시 생성, 캐시됨).
+
+    Returns:
+        KBIndex: 전체 카테고리 역색인
+    """
+    return KBIndex.build()
+
+
+def clear_cache() -> None:
+    """로드된 YAML, 역색인, Mock kb_retrieve 결과 캐시 초기화 (데이터 변경 시 사용)."""
+    load_documents.cache_clear()
+    get_kb_index.cache_clear()
+    get_kb_cache().invalidate(MOCK_BACKEND)
+
+
+def tokenize_query(query: str) -> list[str]:
+    """검색 쿼리 토큰화 (공백 기준)."""
+    return [t.strip() for t in query.split() if t.strip()]
+
+
+def search_cache_key(query: str, category: str | None) -> tuple[tuple[str, ...], str | None]:
+    """search_entries() 결과 캐시 키.
+
+    KBIndex는 토큰을 소문자로만 비교하고 카테고리는 그대로 사용하므로,
+    키도 같은 정규화만 적용합니다 (키가 같으면 검색 결과도 같음).
+
+    Args:
+        query: 검색 쿼리
+        category: 카테고리 필터
+
+    Returns:
+        tuple: (소문자 토큰 목록, 카테고리)
+    """
+    return tuple(t.lower() for t in tokenize_query(query)), category or None
+
+
 def search_entries(
     query: str,
     category: str | None = None,
     max_results: int = 5,
-) -> list[dict]:
+) -> list[dict[str, Any]]:
     """KB 항목 검색.
 
+    KBIndex를 사용하며 _score_entry() 기반 전체 순회와 동일한 순위를 반환합니다.
+
     Args:
         query: 검색 쿼리
         category: 카테고리 필터 (None이면 전체 검색)
@@ -122,58 +578,19 @@ def search_entries(
     Returns:
         list[dict]: 관련성 점수 순으로 정렬된 항목 목록
     """
-    index = load_index()
-
-    # 쿼리 토큰화 (공백 + 특수문자 기준)
-    query_tokens = [t.strip() for t in query.split() if t.strip()]
-
-    results: list[tuple[float, dict]] = []
+    return get_kb_index().search(tokenize_query(query), category=category, max_results=max_results)
 
-    # 검색 대상 카테고리 결정
-    if category:
-        categories = [c for c in index["categories"] if c["id"] == category]
-    else:
-        categories = index["categories"]
-
-    for cat in categories:
-        try:
-            cat_data = load_category(cat["id"])
-        except FileNotFoundError:
-            continue
 
-        for entry in cat_data.get("entries", []):
-            score = _score_entry(entry, query_tokens)
-            if score > 0:
-                results.append((score, entry))
-
-    # 점수 순 정렬
-    results.sort(key=lambda x: x[0], reverse=True)
-
-    return [entry for _, entry in results[:max_results]]
-
-
-def lookup_error_code(code: str) -> list[dict]:
+def lookup_error_code(code: str) -> list[dict[str, Any]]:
     """에러 코드로 항목 검색.
 
+    역색인 생성 시 함께 만든 error_code → 항목 테이블을 조회하므로
+    전체 카테고리를 순회하지 않습니다 (clear_cache() 시 함께 무효화).
+
     Args:
         code: 에러 코드 (예: '22E', '5E', '84C')
 
     Returns:
         list[dict]: 해당 에러 코드를 포함하는 항목 목록
     """
-    index = load_index()
-    code_upper = code.upper()
-    results = []
-
-    for cat in index["categories"]:
-        try:
-            cat_data = load_category(cat["id"])
-        except FileNotFoundError:
-            continue
-
-        for entry in cat_data.get("entries", []):
-            error_codes = entry.get("error_codes", [])
-            if code_upper in error_codes:
-                results.append(entry)
-
-    return results
+    return get_kb_index().lookup_error_code(code)
@@ -14,6 +14,7 @@ import boto3
 from strands import tool
 
 from ops_agent.config import get_settings
+from ops_agent.tools.knowledge_base.cache import get_kb_cache, make_cache_key
 from ops_agent.tools.util import Colors, log_tool_io
 
 logger = logging.getLogger(__name__)
@@ -64,6 +65,28 @@ def kb_retrieve(
             "message": "BEDROCK_KNOWLEDGE_BASE_ID가 설정되지 않았습니다. .env 파일을 확인하세요.",
         }, ensure_ascii=False)
 
+    # 캐시 조회 (재생성 루프의 동일 검색 재사용)
+    cache = get_kb_cache()
+    cache_key = make_cache_key(f"bedrock:{kb_id}", query, category, num_results)
+    results = cache.get(cache_key)
+    if results is not None:
+        logger.debug(f"{Colors.YELLOW}[KB] 캐시 적중: {query!r}{Colors.END}")
+        return _format_results(kb_id, query, results)
+
+    results = _retrieve(kb_id, query, category, num_results)
+    if isinstance(results, str):
+        return results
+
+    cache.set(cache_key, results)
+    return _format_results(kb_id, query, results)
+
+
+def _retrieve(kb_id: str, query: str, category: str, num_results: int) -> list[dict] | str:
+    """Bedrock Retrieve 호출 및 결과 파싱.
+
+    Returns:
+        list[dict]: 검색 결과 목록 (실패 시 오류 JSON 문자열)
+    """
     client = _get_client()
 
     # HYBRID 검색 설정
@@ -103,6 +126,11 @@ def kb_retrieve(
             "content": r.get("content", {}).get("text", ""),
         })
 
+    return results
+
+
+def _format_results(kb_id: str, query: str, results: list[dict]) -> str:
+    """검색 결과를 도구 응답 JSON으로 변환."""
     return json.dumps({
         "status": "success",
         "mode": "bedrock",
@@ -9,7 +9,8 @@ import logging
 
 from strands import tool
 
-from ops_agent.tools.knowledge_base.data_loader import search_entries
+from ops_agent.tools.knowledge_base.cache import MOCK_BACKEND, get_kb_cache
+from ops_agent.tools.knowledge_base.data_loader import search_cache_key, search_entries
 from ops_agent.tools.util import Colors, log_tool_io
 
 logger = logging.getLogger(__name__)
@@ -36,16 +37,23 @@ def kb_retrieve(
     """
     logger.debug(f"{Colors.YELLOW}[Mock] kb_retrieve 모의 데이터 사용{Colors.END}")
 
-    entries = search_entries(query, category=category or None, max_results=num_results)
+    cache = get_kb_cache()
+    # 로컬 검색과 같은 정규화로 키 생성 (검색 결과가 다른 질문이 캐시를 공유하지 않도록)
+    cache_key = (MOCK_BACKEND, *search_cache_key(query, category), num_results)
+    results = cache.get(cache_key)
 
-    results = []
-    for entry in entries:
-        results.append({
-            "doc_id": entry.get("id", "unknown"),
-            "score": 1.0,
-            "category": entry.get("category", ""),
-            "content": entry.get("answer", "")[:500],
-        })
+    if results is None:
+        entries = search_entries(query, category=category or None, max_results=num_results)
+
+        results = []
+        for entry in entries:
+            results.append({
+                "doc_id": entry.get("id", "unknown"),
+                "score": 1.0,
+                "category": entry.get("category", ""),
+                "content": entry.get("answer", "")[:500],
+            })
+        cache.set(cache_key, results)
 
     return json.dumps({
         "status": "success",
@@ -130,27 +130,41 @@ class TestMCPMode:
         reason="MCP 모드 테스트는 CLOUDWATCH_MODE=mcp 설정 필요"
     )
     def test_get_mcp_tools(self):
-        """MCP 도구 목록 반환 테스트."""
+        """MCP 도구 목록 반환 테스트 (공유 세션의 MCP 도구 객체)."""
         from ops_agent.tools.cloudwatch.mcp_tools import get_mcp_tools
 
         tools = get_mcp_tools()
 
-        assert len(tools) == 1
-        # MCPClient 타입 확인
-        assert "MCPClient" in type(tools[0]).__name__
+        assert len(tools) > 0
+        # MCPClient가 아닌 MCPAgentTool 목록
+        assert all("MCPAgentTool" in type(t).__name__ for t in tools)
+        tool_names = {t.tool_name for t in tools}
+        assert "describe_log_groups" in tool_names
+
+        # 다시 호출해도 같은 세션의 같은 도구 객체
+        again = get_mcp_tools()
+        assert [id(t) for t in again] == [id(t) for t in tools]
 
     @pytest.mark.skipif(
         os.environ.get("CLOUDWATCH_MODE") != "mcp",
         reason="MCP 모드 테스트는 CLOUDWATCH_MODE=mcp 설정 필요"
     )
     def test_mcp_client_creation(self):
-        """MCP 클라이언트 생성 테스트."""
-        from ops_agent.tools.cloudwatch.mcp_tools import get_cloudwatch_mcp_client
+        """MCP 클라이언트 테스트 (이미 시작된 공유 클라이언트)."""
+        from ops_agent.tools.cloudwatch.mcp_tools import (
+            get_cloudwatch_mcp_client,
+            get_cloudwatch_mcp_session,
+        )
 
         client = get_cloudwatch_mcp_client()
+        session = get_cloudwatch_mcp_session()
 
-        assert client is not None
         assert "MCPClient" in type(client).__name__
+        assert client is session.client
+        assert get_cloudwatch_mcp_client() is client
+        # 세션이 시작되어 있으므로 with 블록 없이 바로 호출 가능
+        assert session.is_healthy()
+        assert session.starts == 1
 
 
 class TestSettingsIntegration:
@@ -65,10 +65,11 @@ def test_tool_factory() -> bool:
         tool_info = []
 
         for t in tools:
+            # Mock: 함수 (__name__), MCP: MCPAgentTool (tool_name)
             if hasattr(t, "__name__"):
                 tool_info.append(t.__name__)
             else:
-                tool_info.append(type(t).__name__)
+                tool_info.append(getattr(t, "tool_name", type(t).__name__))
 
         print_result("get_cloudwatch_tools()", True, f"tools={tool_info}")
         return True
@@ -135,26 +136,34 @@ def test_mcp_tools() -> bool:
         return True
 
     try:
-        from ops_agent.tools.cloudwatch.mcp_tools import get_cloudwatch_mcp_client
+        from ops_agent.tools.cloudwatch.mcp_tools import (
+            get_cloudwatch_mcp_client,
+            get_cloudwatch_mcp_session,
+            get_mcp_tools,
+        )
 
+        # 공유 세션의 클라이언트는 이미 시작된 상태로 반환됨 (with 블록 불필요)
         client = get_cloudwatch_mcp_client()
-        client_type = type(client).__name__
-
-        print_result("MCP 클라이언트 생성", True, f"type={client_type}")
+        session = get_cloudwatch_mcp_session()
+        print_result(
+            "MCP 공유 클라이언트",
+            session.is_healthy(),
+            f"type={type(client).__name__}, starts={session.starts}",
+        )
 
-        # MCP 서버 연결 테스트
+        # get_mcp_tools()는 MCPClient가 아닌 MCP 도구 객체 목록을 반환
+        tools = get_mcp_tools()
         print("\n  MCP 서버 도구 목록:")
-        print("  (MCP 서버가 제공하는 도구는 Agent 실행 시 자동 로드됩니다)")
-        print("  - describe_log_groups")
-        print("  - analyze_log_group")
-        print("  - execute_log_insights_query")
-        print("  - get_metric_data")
-        print("  - get_active_alarms")
-        print("  - get_alarm_history")
+        for tool in tools:
+            print(f"  - {tool.tool_name}")
 
-        return True
+        reused = get_mcp_tools()
+        same_tools = [id(t) for t in reused] == [id(t) for t in tools]
+        print_result("도구 재사용 (같은 세션)", same_tools and session.starts == 1)
+
+        return bool(tools) and same_tools
     except Exception as e:
-        print_result("MCP 클라이언트 생성", False, str(e))
+        print_result("MCP 도구 로드", False, str(e))
         return False
 
 
@@ -170,10 +179,11 @@ def test_ops_agent_tools() -> bool:
 
         tool_info = []
         for t in tools:
+            # Mock: 함수 (__name__), MCP: MCPAgentTool (tool_name)
             if hasattr(t, "__name__"):
                 tool_info.append(t.__name__)
             else:
-                tool_info.append(type(t).__name__)
+                tool_info.append(getattr(t, "tool_name", type(t).__name__))
 
         print_result("OpsAgent.tools", True, f"tools={tool_info}")
         return True
@@ -0,0 +1,53 @@
+"""CloudWatch MCP 서버 대역 (테스트용).
+
+awslabs.cloudwatch-mcp-server 대신 stdio로 실행되는 최소 MCP 서버입니다.
+AWS 자격 증명이나 uvx 없이 MCP 세션 관리 로직을 테스트할 수 있습니다.
+
+실행 방법:
+    python tests/fixtures/fake_cloudwatch_mcp_server.py
+
+제공 도구:
+    - describe_log_groups: 고정된 로그 그룹 목록
+    - get_active_alarms: 고정된 알람 목록
+    - server_pid: 서버 프로세스 PID (재시작 확인용)
+    - crash: 서버 프로세스 즉시 종료 (장애 재현용)
+"""
+
+import json
+import os
+
+try:
+    from mcp.server.fastmcp import FastMCP as MCPServer  # mcp 1.x
+except ImportError:
+    from mcp.server.mcpserver import MCPServer  # mcp 2.x
+
+server = MCPServer("fake-cloudwatch")
+
+
+@server.tool()
+def describe_log_groups(prefix: str = "") -> str:
+    """로그 그룹 목록 조회."""
+    groups = ["/aws/lambda/payment-service", "/aws/lambda/order-service"]
+    return json.dumps([g for g in groups if g.startswith(prefix)])
+
+
+@server.tool()
+def get_active_alarms() -> str:
+    """활성 알람 목록 조회."""
+    return json.dumps([{"name": "payment-5xx", "state": "ALARM"}])
+
+
+@server.tool()
+def server_pid() -> str:
+    """서버 프로세스 PID."""
+    return str(os.getpid())
+
+
+@server.tool()
+def crash() -> str:
+    """서버 프로세스 강제 종료."""
+    os._exit(1)
+
+
+if __name__ == "__main__":
+    server.run()
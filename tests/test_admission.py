@@ -0,0 +1,162 @@
+"""AdmissionController 테스트.
+
+동시 실행 제한, 대기열 크기/시간 제한, 세션별 공정성을 검증합니다.
+
+실행 방법:
+    uv run pytest tests/test_admission.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from ops_agent.graph.admission import AdmissionController, AdmissionRejected
+
+
+async def hold(admission: AdmissionController, session: str | None, release: asyncio.Event,
+               order: list[str] | None = None, label: str = "") -> float:
+    """슬롯을 확보하고 release까지 유지."""
+    async with admission.admit(session) as wait:
+        if order is not None:
+            order.append(label)
+        await release.wait()
+        return wait
+
+
+# ========== 동시 실행 제한 ==========
+
+class TestConcurrencyLimit:
+    """max_in_flight / 대기열 테스트."""
+
+    async def test_limits_in_flight_and_queues_rest(self):
+        """동시 실행 수를 넘는 요청은 대기 후 실행."""
+        admission = AdmissionController(max_in_flight=2, max_queue=10, queue_timeout=5)
+        release = asyncio.Event()
+        tasks = [asyncio.create_task(hold(admission, None, release)) for _ in range(5)]
+        await asyncio.sleep(0.01)
+
+        assert admission.in_flight == 2
+        assert admission.queue_depth == 3
+
+        release.set()
+        waits = await asyncio.gather(*tasks)
+
+        stats = admission.stats()
+        assert stats["in_flight"] == 0
+        assert stats["queue_depth"] == 0
+        assert stats["admitted"] == 5
+        assert sum(1 for w in waits if w > 0) >= 3
+
+    async def test_queue_full_rejects_immediately(self):
+        """대기열이 가득 차면 즉시 거부."""
+        admission = AdmissionController(max_in_flight=1, max_queue=1, queue_timeout=5)
+        release = asyncio.Event()
+        running = asyncio.create_task(hold(admission, None, release))
+        queued = asyncio.create_task(hold(admission, None, release))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(AdmissionRejected) as exc_info:
+            async with admission.admit():
+                pass
+
+        assert exc_info.value.reason == "queue_full"
+        assert exc_info.value.stats["queue_depth"] == 1
+
+        release.set()
+        await asyncio.gather(running, queued)
+        assert admission.stats()["rejected"] == {"queue_full": 1, "timeout": 0}
+
+    async def test_queue_timeout_rejects(self):
+        """대기 시간 초과 시 거부하고 대기열에서 제거."""
+        admission = AdmissionController(max_in_flight=1, max_queue=5, queue_timeout=0.05)
+        release = asyncio.Event()
+        running = asyncio.create_task(hold(admission, None, release))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(AdmissionRejected) as exc_info:
+            async with admission.admit():
+                pass
+
+        assert exc_info.value.reason == "timeout"
+        assert admission.queue_depth == 0
+
+        release.set()
+        await running
+        assert admission.stats()["rejected"]["timeout"] == 1
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        """대기 중 취소된 요청은 슬롯을 차지하지 않음."""
+        admission = AdmissionController(max_in_flight=1, max_queue=5, queue_timeout=5)
+        release = asyncio.Event()
+        running = asyncio.create_task(hold(admission, None, release))
+        waiting = asyncio.create_task(hold(admission, None, release))
+        await asyncio.sleep(0.01)
+
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert admission.queue_depth == 0
+
+        release.set()
+        await running
+        assert admission.in_flight == 0
+
+    async def test_slot_released_on_error(self):
+        """실행 중 예외가 나도 슬롯 반환."""
+        admission = AdmissionController(max_in_flight=1)
+        with pytest.raises(ValueError):
+            async with admission.admit("s"):
+                raise ValueError("boom")
+        assert admission.in_flight == 0
+
+
+# ========== 세션 공정성 ==========
+
+class TestSessionFairness:
+    """세션별 라운드 로빈 / 세션 제한 테스트."""
+
+    async def test_round_robin_across_sessions(self):
+        """한 세션이 먼저 많이 대기해도 다른 세션이 번갈아 실행."""
+        admission = AdmissionController(max_in_flight=1, max_queue=20, queue_timeout=5)
+        gate = asyncio.Event()
+        order: list[str] = []
+        blocker = asyncio.create_task(hold(admission, "blocker", gate))
+        await asyncio.sleep(0.01)
+
+        # 순차 실행되도록 각 요청은 바로 종료
+        done = asyncio.Event()
+        done.set()
+        tasks = []
+        for i in range(4):
+            tasks.append(asyncio.create_task(hold(admission, "heavy", done, order, f"heavy-{i}")))
+        await asyncio.sleep(0.01)
+        for i in range(2):
+            tasks.append(asyncio.create_task(hold(admission, "light", done, order, f"light-{i}")))
+        await asyncio.sleep(0.01)
+
+        gate.set()
+        await asyncio.gather(blocker, *tasks)
+
+        assert order[:4] == ["heavy-0", "light-0", "heavy-1", "light-1"]
+        assert order[4:] == ["heavy-2", "heavy-3"]
+
+    async def test_max_per_session_leaves_slots_for_others(self):
+        """세션별 제한에 걸린 세션 대신 다른 세션이 슬롯 사용."""
+        admission = AdmissionController(max_in_flight=3, max_queue=10, queue_timeout=5, max_per_session=1)
+        release = asyncio.Event()
+        heavy = [asyncio.create_task(hold(admission, "heavy", release)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        assert admission.in_flight == 1
+        assert admission.queue_depth == 2
+
+        other = asyncio.create_task(hold(admission, "other", release))
+        await asyncio.sleep(0.01)
+        assert admission.in_flight == 2
+
+        release.set()
+        await asyncio.gather(*heavy, other)
+        assert admission.stats()["admitted"] == 4
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,155 @@
+"""AsyncAgentCoreClient 테스트.
+
+로컬 가짜 AgentCore HTTP 엔드포인트에 여러 스트림을 동시에 호출하여
+연결 풀 크기만큼 병렬로 실행되고 스트림별 메트릭이 기록되는지 검증합니다.
+
+실행 방법:
+    uv run pytest tests/test_async_agentcore_client.py -v
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "agentcore" / "scripts"))
+
+from util import AsyncAgentCoreClient  # noqa: E402
+
+ARN = "arn:aws:bedrock-agentcore:us-east-1:123456789012:runtime/ops-agent"
+TOKEN_DELAY = 0.02
+
+
+# ========== Fake Endpoint ==========
+
+class FakeRuntimeHandler(BaseHTTPRequestHandler):
+    """invoke_agent_runtime을 흉내 내는 SSE 핸들러.
+
+    프롬프트를 공백 단위 토큰으로 나누어 delta 이벤트로 천천히 전송합니다.
+    프롬프트가 "fail"이면 AccessDeniedException을 반환합니다.
+    """
+
+    def do_POST(self) -> None:
+        server = self.server
+        length = int(self.headers.get("Content-Length", 0))
+        prompt = json.loads(self.rfile.read(length))["prompt"]
+
+        if prompt == "fail":
+            body = json.dumps({"message": "denied"}).encode()
+            self.send_response(403)
+            self.send_header("x-amzn-ErrorType", "AccessDeniedException")
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        with server.lock:
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+            server.sessions.append(self.headers["X-Amzn-Bedrock-AgentCore-Runtime-Session-Id"])
+
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            for token in prompt.split(" "):
+                time.sleep(TOKEN_DELAY)
+                event = json.dumps({"type": "delta", "content": token + " "}, ensure_ascii=False)
+                self.wfile.write(f"data: {event}\n\n".encode())
+                self.wfile.flush()
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def endpoint(monkeypatch):
+    """로컬 가짜 AgentCore 엔드포인트 실행."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.delenv("AWS_SESSION_TOKEN", raising=False)
+    monkeypatch.delenv("AWS_PROFILE", raising=False)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeRuntimeHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.active = server.peak = 0
+    server.sessions = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def _client(server, max_pool_connections: int) -> AsyncAgentCoreClient:
+    return AsyncAgentCoreClient(
+        ARN,
+        "us-east-1",
+        max_pool_connections=max_pool_connections,
+        endpoint_url=f"http://127.0.0.1:{server.server_port}",
+    )
+
+
+# ========== Stream Tests ==========
+
+class TestAsyncStream:
+    """비동기 스트림 테스트."""
+
+    async def test_stream_yields_tokens_with_metrics(self, endpoint):
+        """토큰이 순서대로 전달되고 메트릭에 기록되어야 함."""
+        async with _client(endpoint, 2) as client:
+            result = await client.run("payment-service 에러 로그 보여줘")
+
+        assert result.ok
+        assert result.text == "payment-service 에러 로그 보여줘 "
+        assert result.metrics.tokens == 4
+        assert result.metrics.first_token is not None
+        assert result.metrics.ttft <= result.metrics.total
+        assert endpoint.sessions == [result.session_id]
+
+    async def test_client_error_is_reported_per_stream(self, endpoint):
+        """실패한 호출은 다른 호출에 영향 없이 결과의 error로 반환되어야 함."""
+        async with _client(endpoint, 2) as client:
+            failed, succeeded = await client.run_many(["fail", "ok"])
+
+        assert failed.error == "접근 거부"
+        assert succeeded.ok and succeeded.text == "ok "
+
+
+# ========== Concurrency Tests ==========
+
+class TestParallelInvocation:
+    """병렬 호출 테스트."""
+
+    async def test_streams_run_concurrently_up_to_pool_size(self, endpoint):
+        """동시 스트림 수는 max_pool_connections까지 늘어나고 그 이상은 넘지 않아야 함."""
+        prompts = [f"svc-{i} a b c d e" for i in range(12)]
+
+        started = time.perf_counter()
+        async with _client(endpoint, 4) as client:
+            results = await client.run_many(prompts)
+        elapsed = time.perf_counter() - started
+
+        assert [r.text for r in results] == [p + " " for p in prompts]
+        assert all(r.metrics.tokens == 6 for r in results)
+        assert endpoint.peak == 4
+        assert len(set(endpoint.sessions)) == len(prompts)
+
+        # 직렬 실행 (12 × 6 × TOKEN_DELAY ≈ 1.44초)보다 충분히 빨라야 함
+        assert elapsed < len(prompts) * 6 * TOKEN_DELAY / 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
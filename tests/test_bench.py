@@ -0,0 +1,192 @@
+"""invoke.py bench 부하 테스트 하네스 테스트.
+
+실제 런타임 엔트리포인트(agentcore/runtime/entrypoint.py)를 오프라인 모드
+(AGENTCORE_OFFLINE=true: FakeModel + Mock CloudWatch/KB 도구)로 띄워 부하를 걸고
+백분위 집계, 오류율, JSON/CSV 리포트를 검증합니다. AWS 자격 증명 없이 실행됩니다.
+
+실행 방법:
+    uv run pytest tests/test_bench.py -v
+"""
+
+import csv
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+RUNTIME_DIR = PROJECT_ROOT / "agentcore" / "runtime"
+SCRIPTS_DIR = PROJECT_ROOT / "agentcore" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from util import AsyncAgentCoreClient, percentile, run_load  # noqa: E402
+
+PROMPT = "payment-service 에러 로그 분석해줘"
+
+
+# ========== Local App ==========
+
+def _start_entrypoint(**env: str):
+    """오프라인 모드 엔트리포인트를 uvicorn 서브프로세스로 실행."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "--app-dir", str(RUNTIME_DIR), "entrypoint:app",
+            "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning",
+        ],
+        env={**os.environ, "AGENTCORE_OFFLINE": "true", **env},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+
+    deadline = time.monotonic() + 60
+    while True:
+        assert proc.poll() is None, "entrypoint exited during startup"
+        assert time.monotonic() < deadline, "entrypoint did not start"
+        try:
+            with urllib.request.urlopen(f"{url}/ping", timeout=1):
+                break
+        except OSError:
+            time.sleep(0.1)
+
+    return proc, url
+
+
+def _stop_entrypoint(proc) -> None:
+    proc.terminate()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+@pytest.fixture(scope="module")
+def local_app():
+    """기본 admission 설정의 오프라인 엔트리포인트."""
+    proc, url = _start_entrypoint()
+    yield url
+    _stop_entrypoint(proc)
+
+
+@pytest.fixture(scope="module")
+def saturated_app():
+    """동시 실행 1, 대기열 0인 오프라인 엔트리포인트 (초과 요청은 즉시 거부)."""
+    proc, url = _start_entrypoint(
+        ADMISSION_MAX_IN_FLIGHT="1",
+        ADMISSION_MAX_QUEUE="0",
+        AGENTCORE_OFFLINE_TOKEN_DELAY="0.02",
+    )
+    yield url
+    _stop_entrypoint(proc)
+
+
+# ========== Aggregation Tests ==========
+
+class TestPercentile:
+    """백분위 계산 테스트."""
+
+    def test_linear_interpolation(self):
+        """선형 보간 백분위수를 계산해야 함."""
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 50) == pytest.approx(50.5)
+        assert percentile(values, 90) == pytest.approx(90.1)
+        assert percentile(values, 99) == pytest.approx(99.01)
+        assert percentile([3.0], 99) == 3.0
+        assert percentile([], 50) == 0.0
+
+
+# ========== Load Tests ==========
+
+class TestRunLoad:
+    """오프라인 엔트리포인트 대상 부하 생성 테스트."""
+
+    async def test_concurrency_mode_aggregates_latency(self, local_app):
+        """동시 실행 수를 유지하며 모든 요청의 지연 시간을 집계해야 함."""
+        async with AsyncAgentCoreClient.local(local_app, max_pool_connections=4) as client:
+            report = await run_load(client, [PROMPT], requests=8, concurrency=4)
+
+        summary = report.summary()
+        assert summary["requests"] == 8
+        assert summary["errors"] == 0
+        assert summary["tokens"] > 0
+        assert 0 < summary["ttft"]["p50"] <= summary["total"]["p50"] <= summary["total"]["p99"]
+        # FakeModel 응답은 Mock CloudWatch/KB 도구 결과를 인용
+        for result in report.results:
+            assert "4건" in result.text
+            assert "payment-service" in result.text
+
+    async def test_rps_mode_counts_stream_errors(self, saturated_app):
+        """admission 거부로 스트림 중 전달된 오류 이벤트는 오류율에 반영되어야 함."""
+        async with AsyncAgentCoreClient.local(saturated_app) as client:
+            report = await run_load(client, [PROMPT], requests=4, rps=200)
+
+        summary = report.summary()
+        assert summary["mode"] == "rps"
+        # 첫 요청이 유일한 슬롯을 점유하는 동안 나머지 3개는 queue_full로 거부
+        assert summary["errors"] == 3
+        assert summary["error_rate"] == 0.75
+        assert summary["errors_by_reason"] == {"overloaded": 3}
+        # open loop: 4개 요청을 200rps로 시작하므로 최소 0.015초
+        assert report.elapsed >= 3 / 200
+
+    async def test_requires_exactly_one_load_mode(self, local_app):
+        """concurrency와 rps는 하나만 지정해야 함."""
+        async with AsyncAgentCoreClient.local(local_app) as client:
+            with pytest.raises(ValueError):
+                await run_load(client, ["a"], requests=1)
+            with pytest.raises(ValueError):
+                await run_load(client, ["a"], requests=1, concurrency=1, rps=1)
+
+
+# ========== CLI Tests ==========
+
+class TestBenchCommand:
+    """invoke.py bench 서브커맨드 테스트."""
+
+    def test_bench_writes_json_and_csv(self, local_app, tmp_path):
+        """bench 서브커맨드가 코퍼스를 재생하고 JSON/CSV 리포트를 저장해야 함."""
+        corpus = tmp_path / "corpus.jsonl"
+        corpus.write_text(
+            json.dumps({"prompt": "payment-service 에러 로그"}, ensure_ascii=False) + "\n"
+            + json.dumps({"prompt": "CloudWatch 에러 확인"}, ensure_ascii=False) + "\n",
+            encoding="utf-8",
+        )
+        json_path, csv_path = tmp_path / "report.json", tmp_path / "report.csv"
+
+        completed = subprocess.run(
+            [
+                sys.executable, str(SCRIPTS_DIR / "invoke.py"), "bench",
+                "--local-url", local_app, "--corpus", str(corpus),
+                "--requests", "6", "--concurrency", "3",
+                "--json", str(json_path), "--csv", str(csv_path),
+            ],
+            capture_output=True, text=True, timeout=60,
+        )
+
+        assert completed.returncode == 0, completed.stderr
+        assert "BENCHMARK" in completed.stdout
+
+        report = json.loads(json_path.read_text(encoding="utf-8"))
+        assert report["summary"]["requests"] == 6
+        assert report["summary"]["errors"] == 0
+        assert len(report["requests"]) == 6
+
+        with open(csv_path, encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["prompt"] for row in rows[:2]] == ["payment-service 에러 로그", "CloudWatch 에러 확인"]
+        assert all(not row["error"] for row in rows)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,169 @@
+"""CloudWatchChecker 사전 컴파일 매처 테스트.
+
+결합 정규식/키워드 스캐너가 기존 패턴별 검사와 같은 결과를 내는지,
+대량 이벤트 응답에서도 빠르게 동작하는지 검증합니다.
+
+실행 방법:
+    uv run pytest tests/test_cloudwatch_matcher.py -v -s
+"""
+
+import random
+import re
+import time
+
+import pytest
+
+from ops_agent.evaluation import ToolResult, ToolType
+from ops_agent.evaluation.checkers.cloudwatch import (
+    CloudWatchChecker,
+    KeywordScanner,
+    _extract_key_phrases_cached,
+)
+
+# ========== 기존 구현 (참조용) ==========
+
+# 결합 정규식 (_COUNT_REGEX) 도입 전 패턴별 이벤트 수 매칭
+LEGACY_COUNT_PATTERNS = [
+    r"(\d+)\s*건",
+    r"(\d+)\s*개",
+    r"(\d+)\s*(errors?|에러)",
+    r"총\s*(\d+)",
+    r"(\d+)\s*(events?|이벤트)",
+    r"\*\*(\d+)건\*\*",
+    r"\*\*(\d+)개\*\*",
+]
+
+def _legacy_verify_count(response: str, expected: int) -> bool:
+    """패턴별 re.findall 기반 기존 구현."""
+    for pattern in LEGACY_COUNT_PATTERNS:
+        for match in re.findall(pattern, response, re.IGNORECASE):
+            num_str = match[0] if isinstance(match, tuple) else match
+            if int(num_str) == expected:
+                return True
+    return False
+
+
+def _legacy_key_phrases(message: str) -> list[str]:
+    """키워드별 lowercase 스캔 기반 기존 구현."""
+    phrases = []
+    error_match = re.search(r'\[ERROR\]\s*\d*\s*[-:]?\s*(.+?)(?:[-:]|$)', message)
+    if error_match:
+        phrases.append(error_match.group(1).strip().split(":")[0].strip())
+    message_lower = message.lower()
+    phrases.extend(k for k in CloudWatchChecker.KEYWORDS if k.lower() in message_lower)
+    return phrases
+
+
+def _random_text(rng: random.Random, length: int) -> str:
+    tokens = [
+        "총", "건", "개", "errors", "Error", "에러", "events", "EVENT", "이벤트",
+        "**", " ", " ", "\n", "-", ":", "[ERROR]", "timeout", "Redis", "gateway",
+        "connectionrefused", "payment", "failed", "exhausted", "Database",
+    ]
+    parts = []
+    for _ in range(length):
+        if rng.random() < 0.3:
+            parts.append(str(rng.randint(0, 120)))
+        else:
+            parts.append(rng.choice(tokens))
+    return "".join(parts)
+
+
+# ========== Equivalence Tests ==========
+
+class TestMatcherEquivalence:
+    """기존 구현과의 결과 동일성 테스트."""
+
+    def test_count_matches_legacy(self):
+        """결합 정규식이 패턴별 findall과 같은 판정을 내려야 함."""
+        checker = CloudWatchChecker()
+        rng = random.Random(5)
+
+        for _ in range(500):
+            text = _random_text(rng, rng.randint(1, 30))
+            for expected in range(0, 121, 3):
+                assert checker._verify_count_mentioned(text, expected) == _legacy_verify_count(
+                    text, expected
+                ), text
+
+    def test_key_phrases_match_legacy(self):
+        """키워드 스캐너가 키워드별 스캔과 같은 결과를 내야 함."""
+        rng = random.Random(11)
+
+        for _ in range(500):
+            message = _random_text(rng, rng.randint(1, 20))
+            assert list(_extract_key_phrases_cached(message)) == _legacy_key_phrases(message)
+
+    def test_scanner_finds_overlapping_and_nested_keywords(self):
+        """겹치거나 포함 관계인 키워드도 모두 찾아야 함."""
+        scanner = KeywordScanner(["error", "errors", "rsync", "Sync"])
+
+        assert scanner.scan("ERRORSYNC") == ["error", "errors", "rsync", "Sync"]
+        assert scanner.scan("no match") == []
+
+    def test_single_pass_check_matches_per_phrase_scan(self):
+        """응답 단일 스캔 결과가 키워드별 `in` 검사와 같은 점수/이슈를 내야 함."""
+        checker = CloudWatchChecker()
+        rng = random.Random(17)
+
+        for _ in range(200):
+            tool_result = ToolResult(
+                tool_type=ToolType.CLOUDWATCH,
+                tool_name="cloudwatch_filter_log_events",
+                tool_input={},
+                tool_output={
+                    "log_group": rng.choice(["/aws/lambda/payment", "/aws/lambda/redis", "/"]),
+                    "events": [{"message": _random_text(rng, rng.randint(1, 10))} for _ in range(3)],
+                },
+            )
+            response = _random_text(rng, rng.randint(1, 30))
+            response_lower = response.lower()
+            legacy = checker._score(
+                [checker._build_expectation(tool_result)],
+                has_count=lambda _count: False,
+                contains=response_lower.__contains__,
+            )
+
+            result = checker.check(response, [tool_result])
+
+            assert (result.score, result.issues) == (legacy.score, legacy.issues), response
+
+
+# ========== Performance Tests ==========
+
+class TestMatcherPerformance:
+    """대량 이벤트 응답 성능 테스트."""
+
+    def test_hundreds_of_events_are_checked_quickly(self):
+        """수백 개 이벤트를 인용한 응답도 빠르게 검사해야 함."""
+        events = [
+            {"message": f"[ERROR] 500 - Connection timeout to shard-{i % 40}"}
+            for i in range(500)
+        ]
+        tool_result = ToolResult(
+            tool_type=ToolType.CLOUDWATCH,
+            tool_name="cloudwatch_filter_log_events",
+            tool_input={},
+            tool_output={
+                "event_count": len(events),
+                "log_group": "/aws/lambda/payment-service",
+                "events": events,
+            },
+        )
+        response = "payment-service에서 총 500건 발생.\n" + "\n".join(
+            f"- shard-{i}: Connection timeout" for i in range(40)
+        ) * 20
+
+        checker = CloudWatchChecker()
+        start = time.perf_counter()
+        for _ in range(20):
+            result = checker.check(response, [tool_result])
+        elapsed = time.perf_counter() - start
+
+        print(f"\n  [CloudWatchChecker] 500 events x20: {elapsed * 1000:.1f}ms")
+        assert result.score == 1.0
+        assert elapsed < 1.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
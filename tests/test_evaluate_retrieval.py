@@ -0,0 +1,387 @@
+"""rag_pipeline/evaluate_retrieval.py 동시 평가 엔진 테스트.
+
+테스트 케이스를 동시에 실행하면서 순서를 유지하는지, 스로틀링/일시적 오류를 재시도하는지,
+(kb_id, query, filter) 키 응답 캐시로 재실행 시 API를 호출하지 않는지,
+Top-1/3/5 정확도와 지연 백분위수를 집계하는지 검증합니다.
+메모리 기반 가짜 bedrock-agent-runtime 클라이언트로 실행되어 AWS 자격 증명이 필요 없습니다.
+
+실행 방법:
+    uv run pytest tests/test_evaluate_retrieval.py -v
+"""
+
+import functools
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "rag_pipeline"))
+
+import evaluate_retrieval  # noqa: E402
+from evaluate_retrieval import (  # noqa: E402
+    ResponseCache,
+    cached_search,
+    call_with_retry,
+    percentile,
+    query_kb,
+    query_kb_rag,
+    run_cases,
+    summarize_records,
+)
+
+KB_ID = "KB123"
+
+CASES = [
+    ("22E 에러", "REF-001", "diagnostics", "에러 코드"),
+    ("펌웨어 업데이트", ["REF-010", "REF-011"], "firmware", "펌웨어"),
+    ("SmartThings 연결", "REF-020", "smart", "스마트"),
+    ("없는 문서", "REF-999", "cross", "교차"),
+]
+
+# query → 검색 결과 doc_id 순서
+RANKINGS = {
+    "22E 에러": ["REF-001", "REF-002"],
+    "펌웨어 업데이트": ["REF-012", "REF-013", "REF-011"],
+    "SmartThings 연결": ["REF-021", "REF-022", "REF-023", "REF-020"],
+    "없는 문서": ["REF-001"],
+}
+
+
+def _throttle():
+    return ClientError({"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}, "Retrieve")
+
+
+class FakeAgentRuntime:
+    """retrieve / retrieve_and_generate만 구현한 가짜 bedrock-agent-runtime 클라이언트.
+
+    Args:
+        latency: 호출당 지연 (초)
+        throttle_first: 쿼리별로 처음 N번은 ThrottlingException
+        barrier: 호출마다 대기할 Barrier (parties개 호출이 동시에 진행 중이어야 통과)
+        kb_id: 요청에 들어 있어야 하는 Knowledge Base ID
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        throttle_first: int = 0,
+        barrier: threading.Barrier | None = None,
+        kb_id: str = KB_ID,
+    ):
+        self.kb_id = kb_id
+        self.latency = latency
+        self.throttle_first = throttle_first
+        self.barrier = barrier
+        self.calls: list[tuple[str, dict | None]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._attempts: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _enter(self, query: str, vector_config: dict) -> None:
+        with self._lock:
+            self._attempts[query] = self._attempts.get(query, 0) + 1
+            if self._attempts[query] <= self.throttle_first:
+                raise _throttle()
+            self.calls.append((query, vector_config.get("filter")))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.barrier is not None:
+                self.barrier.wait()
+            time.sleep(self.latency)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def retrieve(self, knowledgeBaseId, retrievalQuery, retrievalConfiguration):
+        assert knowledgeBaseId == self.kb_id
+        query = retrievalQuery["text"]
+        vector_config = retrievalConfiguration["vectorSearchConfiguration"]
+        self._enter(query, vector_config)
+        doc_ids = RANKINGS.get(query, [])[:vector_config["numberOfResults"]]
+        return {"retrievalResults": [
+            {
+                "content": {"text": f"{doc_id} 본문"},
+                "score": 1.0 - rank * 0.1,
+                "metadata": {"x-amz-bedrock-kb-source-uri": f"s3://bucket/{doc_id}.md"},
+            }
+            for rank, doc_id in enumerate(doc_ids)
+        ]}
+
+    def retrieve_and_generate(self, input, retrieveAndGenerateConfiguration):
+        query = input["text"]
+        kb_config = retrieveAndGenerateConfiguration["knowledgeBaseConfiguration"]
+        assert kb_config["knowledgeBaseId"] == self.kb_id
+        self._enter(query, kb_config["retrievalConfiguration"]["vectorSearchConfiguration"])
+        return {
+            "output": {"text": f"{query} 답변"},
+            "citations": [{"retrievedReferences": [
+                {"location": {"s3Location": {"uri": f"s3://bucket/{doc_id}.md"}}, "content": {"text": doc_id}}
+                for doc_id in RANKINGS.get(query, [])[:1]
+            ]}],
+        }
+
+
+def _retrieve_search(client, cache=None):
+    fn = functools.partial(query_kb, client, KB_ID)
+    return cached_search(fn, cache, ("retrieve", KB_ID, "job-1", 5))
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    """재시도 대기를 없앰."""
+    monkeypatch.setattr(evaluate_retrieval, "BACKOFF_BASE", 0.0)
+
+
+# ========== Concurrency Tests ==========
+
+class TestRunCases:
+    """동시 실행 테스트."""
+
+    def test_runs_concurrently_and_keeps_case_order(self):
+        """여러 케이스를 동시에 호출하되 결과는 케이스 순서대로 반환해야 함."""
+        # 8개 호출이 동시에 진행 중이어야 Barrier를 통과 (직렬이면 BrokenBarrierError)
+        client = FakeAgentRuntime(latency=0.01, barrier=threading.Barrier(8, timeout=5.0))
+        cases = CASES * 4
+
+        records = list(run_cases(cases, _retrieve_search(client), workers=8))
+
+        assert [r["case"] for r in records] == cases
+        assert all(r["error"] is None for r in records)
+        assert client.max_in_flight == 8
+        assert all(r["latency"] >= 0.01 for r in records)
+
+    def test_filter_applied_per_category_except_cross(self):
+        """use_filter면 카테고리 필터를 적용하고 cross는 필터 없이 검색해야 함."""
+        client = FakeAgentRuntime()
+
+        list(run_cases(CASES, _retrieve_search(client), workers=2, use_filter=True))
+
+        filters = dict(client.calls)
+        assert filters["22E 에러"] == {"equals": {"key": "category", "value": "diagnostics"}}
+        assert filters["없는 문서"] is None
+
+    def test_error_is_recorded_without_stopping_run(self):
+        """재시도 대상이 아닌 오류는 해당 케이스 오류로만 기록해야 함."""
+        def search(query, _category_filter, _timing=None):
+            if query == "펌웨어 업데이트":
+                raise ValueError("boom")
+            return [], False
+
+        records = list(run_cases(CASES, search, workers=4))
+
+        assert [r["error"] for r in records] == [None, "boom", None, None]
+
+
+# ========== Retry Tests ==========
+
+class TestRetry:
+    """스로틀링/일시적 오류 재시도 테스트."""
+
+    def test_throttled_calls_are_retried(self):
+        """ThrottlingException은 재시도 후 성공해야 함."""
+        client = FakeAgentRuntime(throttle_first=2)
+
+        records = list(run_cases(CASES, _retrieve_search(client), workers=4))
+
+        assert all(r["error"] is None for r in records)
+        assert len(client.calls) == len(CASES)
+
+    def test_gives_up_after_max_retries(self):
+        """최대 재시도 후에는 스로틀링 오류를 그대로 전달해야 함."""
+        attempts = []
+
+        def always_throttled():
+            attempts.append(1)
+            raise _throttle()
+
+        with pytest.raises(ClientError):
+            call_with_retry(always_throttled, max_retries=3)
+        assert len(attempts) == 4
+
+    def test_other_client_errors_are_not_retried(self):
+        """스로틀링이 아닌 ClientError는 즉시 전달해야 함."""
+        attempts = []
+
+        def denied():
+            attempts.append(1)
+            raise ClientError({"Error": {"Code": "AccessDeniedException"}}, "Retrieve")
+
+        with pytest.raises(ClientError):
+            call_with_retry(denied)
+        assert len(attempts) == 1
+
+    def test_transient_server_and_network_errors_are_retried(self):
+        """5xx 오류와 연결 실패는 재시도 후 성공해야 함."""
+        errors = [
+            ClientError({"Error": {"Code": "InternalServerException"}}, "Retrieve"),
+            ClientError({"Error": {"Code": "BadGatewayException"}}, "Retrieve"),
+            EndpointConnectionError(endpoint_url="https://bedrock-agent-runtime.us-east-1.amazonaws.com"),
+        ]
+
+        def flaky():
+            if errors:
+                raise errors.pop(0)
+            return "ok"
+
+        timing = {}
+        assert call_with_retry(flaky, timing=timing) == "ok"
+        assert timing["retries"] == 3
+
+    def test_latency_excludes_backoff(self, monkeypatch):
+        """지연은 마지막 시도만 측정하고 재시도 횟수는 따로 집계해야 함."""
+        monkeypatch.setattr(evaluate_retrieval, "BACKOFF_BASE", 0.2)
+        client = FakeAgentRuntime(throttle_first=1)
+
+        records = list(run_cases(CASES, _retrieve_search(client), workers=4))
+
+        # 백오프 대기 (0.1~0.2초)는 지연에 포함되지 않음
+        assert all(r["retries"] == 1 for r in records)
+        assert all(r["latency"] < 0.05 for r in records)
+        assert summarize_records(records)["retries"] == len(CASES)
+
+
+# ========== Response Cache Tests ==========
+
+class TestResponseCache:
+    """응답 캐시 테스트."""
+
+    def test_second_run_uses_cache(self, tmp_path):
+        """저장된 캐시로 재실행하면 API를 호출하지 않고 같은 결과를 내야 함."""
+        path = tmp_path / "eval.retrieval_cache.json"
+        client = FakeAgentRuntime()
+
+        cache = ResponseCache(str(path))
+        first = list(run_cases(CASES, _retrieve_search(client, cache), workers=4))
+        cache.save()
+        assert len(client.calls) == len(CASES)
+        assert not any(r["cached"] for r in first)
+
+        rerun_client = FakeAgentRuntime()
+        cache = ResponseCache(str(path))
+        second = list(run_cases(CASES, _retrieve_search(rerun_client, cache), workers=4))
+
+        assert rerun_client.calls == []
+        assert all(r["cached"] for r in second)
+        assert [r["response"] for r in second] == [r["response"] for r in first]
+        assert cache.hits == len(CASES)
+
+    def test_key_includes_filter(self):
+        """같은 질문이라도 필터가 다르면 캐시를 공유하지 않아야 함."""
+        client = FakeAgentRuntime()
+        cache = ResponseCache()
+        search = _retrieve_search(client, cache)
+
+        list(run_cases(CASES, search, workers=4, use_filter=False))
+        list(run_cases(CASES, search, workers=4, use_filter=True))
+        list(run_cases(CASES, search, workers=4, use_filter=True))
+
+        # 필터 적용 실행은 cross 케이스만 캐시 적중
+        assert len(client.calls) == len(CASES) + len(CASES) - 1
+
+    def test_key_includes_kb_version(self):
+        """KB 버전 (ingestion job)이 바뀌면 캐시를 사용하지 않아야 함."""
+        client = FakeAgentRuntime()
+        cache = ResponseCache()
+        fn = functools.partial(query_kb, client, KB_ID)
+
+        list(run_cases(CASES, cached_search(fn, cache, ("retrieve", KB_ID, "job-1")), workers=4))
+        list(run_cases(CASES, cached_search(fn, cache, ("retrieve", KB_ID, "job-2")), workers=4))
+
+        assert len(client.calls) == 2 * len(CASES)
+
+    def test_other_kb_versions_are_evicted(self, tmp_path, monkeypatch):
+        """open_cache는 다른 kb_id/KB 버전의 항목을 버리고 현재 버전만 남겨야 함."""
+        path = tmp_path / "eval.retrieval_cache.json"
+        cache = ResponseCache(str(path))
+        for parts in [("retrieve", KB_ID, "job-1"), ("rag", KB_ID, "job-2"), ("retrieve", "KB999", "job-2")]:
+            cache.get_or_call(ResponseCache.key(*parts, "q", None), lambda: ["doc"])
+        cache.save()
+        monkeypatch.setattr(evaluate_retrieval, "get_cache_path", lambda _ds_config: str(path))
+        monkeypatch.setattr(evaluate_retrieval, "get_kb_version", lambda _ds_config, _kb_id: "job-2")
+        args = SimpleNamespace(no_cache=False, clear_cache=False)
+
+        cache, kb_version = evaluate_retrieval.open_cache(args, {}, KB_ID)
+
+        assert kb_version == "job-2"
+        assert list(cache._data) == [ResponseCache.key("rag", KB_ID, "job-2", "q", None)]
+
+    def test_errors_are_not_cached(self):
+        """실패한 호출은 캐시하지 않아 재실행 시 다시 호출해야 함."""
+        cache = ResponseCache()
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise ValueError("boom")
+            return ["ok"]
+
+        with pytest.raises(ValueError):
+            cache.get_or_call("k", flaky)
+        assert cache.get_or_call("k", flaky) == (["ok"], False)
+        assert cache.get_or_call("k", flaky) == (["ok"], True)
+        assert len(calls) == 2
+
+    def test_rag_responses_are_cached(self):
+        """RetrieveAndGenerate 응답도 같은 방식으로 캐시해야 함."""
+        client = FakeAgentRuntime()
+        cache = ResponseCache()
+        fn = functools.partial(query_kb_rag, client, KB_ID, model_arn="arn:model", dataset_name="refrigerator")
+        search = cached_search(fn, cache, ("rag", KB_ID, "job-1", "arn:model", "refrigerator"))
+
+        first = list(run_cases(CASES, search, workers=4))
+        second = list(run_cases(CASES, search, workers=4))
+
+        assert len(client.calls) == len(CASES)
+        assert first[0]["response"]["citations"][0]["doc_id"] == "REF-001"
+        assert all(r["cached"] for r in second)
+
+
+# ========== Summary Tests ==========
+
+class TestSummary:
+    """정확도 / 지연 집계 테스트."""
+
+    def test_top_k_accuracy_and_failures(self):
+        """Top-1/3/5 정확도와 카테고리별 집계, 실패 목록을 계산해야 함."""
+        records = list(run_cases(CASES, _retrieve_search(FakeAgentRuntime()), workers=4))
+
+        summary = summarize_records(records)
+
+        assert summary["total"] == 4
+        assert (summary["top1_correct"], summary["top3_correct"], summary["top5_correct"]) == (1, 2, 3)
+        assert summary["by_category"]["smart"] == {"total": 1, "top1": 0, "top3": 0, "top5": 1}
+        assert summary["failures"] == [("없는 문서", "cross", "got REF-001")]
+
+    def test_latency_excludes_cached_and_failed_requests(self):
+        """지연 통계는 실제 API를 호출해 성공한 요청만 포함해야 함."""
+        def record(latency, cached=False, error=None):
+            return {"case": CASES[0], "response": [], "error": error, "latency": latency, "cached": cached}
+
+        records = [record(0.1 * i) for i in range(1, 11)]
+        records += [record(0.0, cached=True), record(5.0, error="boom")]
+
+        summary = summarize_records(records)
+
+        latency = summary["latency_ms"]
+        assert latency["count"] == 10
+        assert latency["p50"] == pytest.approx(550)
+        assert latency["max"] == pytest.approx(1000)
+        assert summary["cache_hits"] == 1
+
+    def test_percentile(self):
+        """선형 보간 백분위수."""
+        assert percentile([], 50) is None
+        assert percentile([3.0], 99) == 3.0
+        assert percentile([1, 2, 3, 4], 50) == pytest.approx(2.5)
+        assert percentile([4, 1, 3, 2], 100) == 4
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,172 @@
+"""워크플로우 단위 평가 캐시 테스트.
+
+재생성 시도 간 도구 결과 기대값을 재사용하면서
+캐시 없는 평가와 같은 결과를 내는지 검증합니다.
+
+실행 방법:
+    uv run pytest tests/test_evaluation_cache.py -v -s
+"""
+
+import time
+
+import pytest
+
+from ops_agent.evaluation import EvaluationCache, OpsAgentEvaluator, ToolResult, ToolType
+from ops_agent.evaluation.checkers.knowledge_base import KBChecker
+from ops_agent.graph.state import OpsWorkflowState
+
+KB_CONTENT = (
+    "# 에러 코드 22E\n\n"
+    "## 답변\n냉장실 팬 모터 이상입니다. 전원을 재연결하고 서비스센터에 문의하세요.\n\n"
+    "## 핵심 키워드\n22E, 팬 모터, 냉장실, 전원 재연결, 서비스센터\n"
+)
+
+
+def make_tool_results(event_count: int = 50) -> list[ToolResult]:
+    """CloudWatch + KB 도구 결과 (호출마다 새 객체 생성, 재시도 상황 재현)."""
+    messages = [
+        "[ERROR] 500 - Connection timeout to payment gateway",
+        "[ERROR] 503 - Redis connection refused: pool exhausted",
+        "[ERROR] Database query failed: deadlock detected",
+    ]
+    return [
+        ToolResult(
+            tool_type=ToolType.CLOUDWATCH,
+            tool_name="cloudwatch_filter_log_events",
+            tool_input={"log_group_name": "/aws/lambda/payment-service"},
+            tool_output={
+                "event_count": event_count,
+                "log_group": "/aws/lambda/payment-service",
+                "events": [
+                    {"message": f"{messages[i % len(messages)]} (req-{i})"}
+                    for i in range(event_count)
+                ],
+            },
+        ),
+        ToolResult(
+            tool_type=ToolType.KNOWLEDGE_BASE,
+            tool_name="kb_retrieve",
+            tool_input={"query": "22E", "category": "diagnostics"},
+            tool_output={"results": [{"doc_id": "diagnostics-001", "content": KB_CONTENT}]},
+        ),
+    ]
+
+
+RESPONSES = [
+    "payment-service에서 총 50건의 에러가 발생했습니다. Connection timeout, Redis 문제입니다.",
+    "에러 코드 22E는 냉장실 팬 모터 이상입니다. 전원 재연결 후 서비스센터에 문의하세요.",
+    "확인된 로그가 없습니다.",
+    "50 errors: Database deadlock, gateway timeout. 22E 팬 모터 점검 필요.",
+]
+
+
+# ========== 결과 동일성 ==========
+
+class TestEvaluationCacheEquivalence:
+    """캐시 사용 여부와 관계없이 같은 평가 결과."""
+
+    @pytest.mark.parametrize("response", RESPONSES)
+    def test_same_result_with_and_without_cache(self, response):
+        """첫 시도 / 캐시 재사용 시도 모두 캐시 없는 평가와 동일."""
+        plain = OpsAgentEvaluator(parallel=False)
+        cached = OpsAgentEvaluator(parallel=False, cache=EvaluationCache())
+
+        expected = plain.evaluate(response, make_tool_results())
+        first = cached.evaluate(response, make_tool_results())
+        second = cached.evaluate(response, make_tool_results())
+
+        for result in (first, second):
+            assert result.verdict == expected.verdict
+            assert result.overall_score == expected.overall_score
+            assert result.check_results == expected.check_results
+
+    def test_empty_kb_results(self):
+        """KB 검색 결과 없음도 캐시 후 동일하게 처리."""
+        tool_result = ToolResult(
+            tool_type=ToolType.KNOWLEDGE_BASE,
+            tool_name="kb_retrieve",
+            tool_input={},
+            tool_output={"results": []},
+        )
+        checker = KBChecker(cache=EvaluationCache())
+        for _ in range(2):
+            result = checker.check("응답", [tool_result])
+            assert result.issues == ["KB 검색 결과 없음"]
+
+
+# ========== 캐시 재사용 ==========
+
+class TestEvaluationCacheReuse:
+    """재생성 시도 간 기대값 재사용."""
+
+    def test_second_attempt_skips_extraction(self, monkeypatch):
+        """같은 내용의 도구 결과는 핵심 구문을 다시 추출하지 않음."""
+        calls: list[str] = []
+        original = KBChecker._extract_key_phrases
+
+        def counting(self, content):
+            calls.append(content)
+            return original(self, content)
+
+        monkeypatch.setattr(KBChecker, "_extract_key_phrases", counting)
+
+        cache = EvaluationCache()
+        evaluator = OpsAgentEvaluator(parallel=False, cache=cache)
+        evaluator.evaluate(RESPONSES[0], make_tool_results())
+        evaluator.evaluate(RESPONSES[1], make_tool_results())
+
+        assert len(calls) == 1
+        assert cache.stats() == {"hits": 2, "misses": 2, "size": 2}
+
+    def test_changed_tool_output_is_recomputed(self):
+        """도구 결과 내용이 바뀌면 새로 계산."""
+        cache = EvaluationCache()
+        evaluator = OpsAgentEvaluator(parallel=False, cache=cache)
+        evaluator.evaluate(RESPONSES[0], make_tool_results(event_count=50))
+        evaluator.evaluate(RESPONSES[0], make_tool_results(event_count=49))
+
+        assert cache.stats()["hits"] == 1  # KB 결과만 재사용
+        assert cache.stats()["misses"] == 3
+
+    def test_workflow_state_keeps_cache_across_retry(self):
+        """reset_for_retry 후에도 평가 캐시 유지."""
+        state = OpsWorkflowState(prompt="q")
+        cache = state.eval_cache
+        OpsAgentEvaluator(parallel=False, cache=cache).evaluate("응답", make_tool_results())
+
+        state.reset_for_retry()
+
+        assert state.eval_cache is cache
+        assert len(state.eval_cache) == 2
+        assert OpsWorkflowState(prompt="q").eval_cache is not cache
+
+    def test_second_attempt_is_faster(self):
+        """재시도 평가가 첫 평가보다 빠름 (도구 결과 파싱 생략)."""
+        # 다른 메시지로 lru_cache 효과를 배제
+        def fresh_results(run: int) -> list[ToolResult]:
+            results = make_tool_results(event_count=400)
+            for i, event in enumerate(results[0].tool_output["events"]):
+                event["message"] = f"[ERROR] {run}-{i} - worker {i} timeout: pool exhausted"
+            return results
+
+        first_total = second_total = 0.0
+        runs = 5
+        for run in range(runs):
+            evaluator = OpsAgentEvaluator(parallel=False, cache=EvaluationCache())
+            start = time.perf_counter()
+            evaluator.evaluate(RESPONSES[0], fresh_results(run))
+            first_total += time.perf_counter() - start
+
+            start = time.perf_counter()
+            evaluator.evaluate(RESPONSES[1], fresh_results(run))
+            second_total += time.perf_counter() - start
+
+        print(
+            f"\n  첫 시도 {first_total / runs * 1000:.2f}ms, "
+            f"재시도 {second_total / runs * 1000:.2f}ms"
+        )
+        assert second_total < first_total
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
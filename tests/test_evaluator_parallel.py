@@ -0,0 +1,202 @@
+"""OpsAgentEvaluator 병렬 검사기 실행 테스트.
+
+실행 순서와 동시성은 sleep 대신 Event/Barrier로 검증합니다.
+
+실행 방법:
+    uv run pytest tests/test_evaluator_parallel.py -v
+"""
+
+import threading
+
+import pytest
+
+from ops_agent.evaluation import CheckResult, EvalVerdict, OpsAgentEvaluator, ToolResult, ToolType
+from ops_agent.evaluation.checkers.base import BaseChecker
+
+# 테스트가 멈추지 않도록 모든 대기에 적용하는 안전 제한 시간 (초)
+WAIT = 5.0
+
+
+# ========== Fake Checkers ==========
+
+class GatedChecker(BaseChecker):
+    """시작 시 started를 알리고, gate가 열릴 때까지 대기 후 고정 점수를 반환하는 검사기.
+
+    Args:
+        name: 검사기 이름
+        gate: 대기할 Event 또는 Barrier (None이면 바로 반환)
+        score: 반환할 점수
+        done: 반환 직전에 set할 Event
+    """
+
+    def __init__(
+        self,
+        name: str,
+        gate: threading.Event | threading.Barrier | None = None,
+        score: float = 1.0,
+        done: threading.Event | None = None,
+    ) -> None:
+        self._name = name
+        self.gate = gate
+        self.score = score
+        self.done = done
+        self.started = threading.Event()
+        self.thread_name: str | None = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def check(self, _response: str, _tool_results: list[ToolResult]) -> CheckResult:
+        self.thread_name = threading.current_thread().name
+        self.started.set()
+        if isinstance(self.gate, threading.Barrier):
+            self.gate.wait()
+        elif self.gate is not None:
+            assert self.gate.wait(WAIT)
+        if self.done is not None:
+            self.done.set()
+        return CheckResult(checker_name=self.name, score=self.score, passed=self.score >= 0.7)
+
+
+class BrokenChecker(BaseChecker):
+    """항상 예외를 던지는 검사기."""
+
+    @property
+    def name(self) -> str:
+        return "broken"
+
+    def check(self, _response: str, _tool_results: list[ToolResult]) -> CheckResult:
+        raise ValueError("parse failed")
+
+
+# ========== Fixtures ==========
+
+@pytest.fixture
+def tool_result() -> ToolResult:
+    """CloudWatch 도구 결과 샘플."""
+    return ToolResult(
+        tool_type=ToolType.CLOUDWATCH,
+        tool_name="cloudwatch_filter_log_events",
+        tool_input={},
+        tool_output={
+            "event_count": 2,
+            "log_group": "/aws/lambda/payment-service",
+            "events": [{"message": "[ERROR] Connection timeout to payment gateway"}],
+        },
+    )
+
+
+def _evaluator(checkers: list[BaseChecker], **kwargs) -> OpsAgentEvaluator:
+    evaluator = OpsAgentEvaluator(**kwargs)
+    evaluator.checkers = checkers
+    return evaluator
+
+
+# ========== Parallel Execution Tests ==========
+
+class TestParallelCheckers:
+    """검사기 동시 실행 테스트."""
+
+    def test_checkers_run_concurrently(self, tool_result: ToolResult):
+        """모든 검사기가 동시에 실행되어야 함 (순차 실행이면 Barrier가 깨져 중립 결과)."""
+        barrier = threading.Barrier(4, timeout=WAIT)
+        checkers = [GatedChecker(f"c{i}", gate=barrier) for i in range(4)]
+        evaluator = _evaluator(checkers, parallel=True, checker_timeout=WAIT * 2)
+
+        result = evaluator.evaluate("response", [tool_result])
+
+        assert [r.score for r in result.check_results] == [1.0] * 4
+        assert result.verdict == EvalVerdict.PASS
+        assert all(c.thread_name.startswith("ops-checker") for c in checkers)
+
+    def test_results_keep_checker_order(self, tool_result: ToolResult):
+        """결과 순서는 완료 순서가 아닌 검사기 등록 순서여야 함."""
+        fast_done = threading.Event()
+        checkers = [
+            GatedChecker("slow", gate=fast_done),
+            GatedChecker("fast", done=fast_done),
+        ]
+        result = _evaluator(checkers, parallel=True, checker_timeout=WAIT * 2).evaluate(
+            "response", [tool_result]
+        )
+
+        assert [r.checker_name for r in result.check_results] == ["slow", "fast"]
+        assert [r.score for r in result.check_results] == [1.0, 1.0]
+
+    def test_timeout_falls_back_to_neutral_result(self, tool_result: ToolResult):
+        """제한 시간을 넘긴 검사기는 중립 결과(0.5)로 대체되어야 함."""
+        release = threading.Event()
+        checkers = [GatedChecker("fast"), GatedChecker("hung", gate=release)]
+        evaluator = _evaluator(checkers, parallel=True, checker_timeout=0.05)
+
+        try:
+            result = evaluator.evaluate("response", [tool_result])
+        finally:
+            release.set()
+
+        hung = result.check_results[1]
+        assert hung.checker_name == "hung"
+        assert hung.score == 0.5
+        assert hung.passed is True
+        assert hung.details == {"error": "timeout"}
+        assert "시간 초과" in hung.issues[0]
+        assert result.check_results[0].score == 1.0
+
+    def test_hung_checker_does_not_block_next_evaluation(self, tool_result: ToolResult):
+        """시간 초과 후에도 실행 중인 검사기가 다음 평가를 막지 않아야 함."""
+        release = threading.Event()
+        hung = GatedChecker("hung", gate=release)
+        try:
+            _evaluator([GatedChecker("ok"), hung], parallel=True, checker_timeout=0.05).evaluate(
+                "response", [tool_result]
+            )
+            assert hung.started.wait(WAIT) and not release.is_set()
+
+            barrier = threading.Barrier(2, timeout=WAIT)
+            checkers = [GatedChecker("a", gate=barrier), GatedChecker("b", gate=barrier)]
+            result = _evaluator(checkers, parallel=True, checker_timeout=WAIT * 2).evaluate(
+                "response", [tool_result]
+            )
+        finally:
+            release.set()
+
+        assert [r.score for r in result.check_results] == [1.0, 1.0]
+
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_checker_error_falls_back_to_neutral_result(self, tool_result: ToolResult, parallel: bool):
+        """검사기 예외는 실행 모드와 관계없이 중립 결과(0.5)로 대체되어야 함."""
+        checkers = [GatedChecker("ok"), BrokenChecker()]
+        result = _evaluator(checkers, parallel=parallel).evaluate("response", [tool_result])
+
+        broken = result.check_results[1]
+        assert broken.score == 0.5
+        assert broken.passed is True
+        assert broken.issues == ["검사 오류: parse failed"]
+        assert broken.details == {"error": "parse failed"}
+
+    def test_default_runs_checkers_on_calling_thread(self, tool_result: ToolResult):
+        """기본 설정은 스레드 풀 없이 호출 스레드에서 순차 실행해야 함."""
+        checkers = [GatedChecker("a"), GatedChecker("b")]
+        evaluator = _evaluator(checkers)
+
+        evaluator.evaluate("response", [tool_result])
+
+        assert evaluator.parallel is False
+        assert {c.thread_name for c in checkers} == {threading.current_thread().name}
+
+    def test_parallel_matches_sequential(self, tool_result: ToolResult):
+        """기본 검사기 구성에서 병렬/순차 실행 결과가 같아야 함."""
+        response = "payment-service에서 3건의 에러 발생: Connection timeout"
+
+        sequential = OpsAgentEvaluator(parallel=False).evaluate(response, [tool_result])
+        parallel = OpsAgentEvaluator(parallel=True).evaluate(response, [tool_result])
+
+        assert parallel.verdict == sequential.verdict
+        assert parallel.overall_score == sequential.overall_score
+        assert parallel.feedback == sequential.feedback
+        assert parallel.check_results == sequential.check_results
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
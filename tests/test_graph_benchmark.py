@@ -0,0 +1,219 @@
+"""OpsAgentGraph 오프라인 벤치마크.
+
+BedrockModel 대신 스크립트된 FakeModel (ops_agent.testing)을 주입하고
+Mock CloudWatch/KB 도구로 전체 워크플로우를 실행합니다.
+노드별 실행 시간을 LLM 시간과 프레임워크 오버헤드 (FunctionNode, 상태 레지스트리,
+평가, 이벤트 전달)로 나누어 보고합니다. AWS 자격 증명 없이 실행됩니다.
+
+실행 방법:
+    uv run pytest tests/test_graph_benchmark.py -v -s
+    uv run pytest tests/test_graph_benchmark.py --benchmark-only   # pytest-benchmark 설치 시
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+
+import pytest
+from pydantic import BaseModel
+
+from ops_agent.graph import nodes
+from ops_agent.graph.agent_pool import AgentPool
+from ops_agent.graph.runner import OpsAgentGraph
+from ops_agent.graph.state import WorkflowStatus
+from ops_agent.testing import FakeModel, FakeTurn, ToolCall, ops_responder, scripted
+
+PROMPT = "payment-service에서 500 에러 로그 보여주고 에러 코드 해결 방법도 알려줘"
+RUNS = 10
+
+
+# ========== Fake Model ==========
+
+def _install_fake_model(monkeypatch, token_delay: float) -> FakeModel:
+    """ANALYZE 노드의 Agent 풀을 FakeModel을 사용하는 풀로 교체."""
+    model = FakeModel(ops_responder, token_delay=token_delay)
+    pool = AgentPool(factory=lambda: nodes._create_agent(model=model), reset=nodes._reset_agent)
+    monkeypatch.setattr(nodes, "_agent_pool", pool)
+    return model
+
+
+@pytest.fixture
+def fake_model(monkeypatch) -> FakeModel:
+    """토큰 지연 1ms의 FakeModel."""
+    return _install_fake_model(monkeypatch, token_delay=0.001)
+
+
+@pytest.fixture
+def instant_model(monkeypatch) -> FakeModel:
+    """지연 없는 FakeModel (순수 프레임워크 오버헤드 측정용)."""
+    return _install_fake_model(monkeypatch, token_delay=0.0)
+
+
+async def _stream_node_times(graph: OpsAgentGraph, prompt: str) -> tuple[dict[str, float], float]:
+    """stream_async 한 번 실행 후 (노드별 실행 시간 합계, 전체 시간) 반환 (초).
+
+    노드 시간은 multiagent_node_start → multiagent_node_stop 이벤트 수신 시각으로 측정합니다.
+    """
+    node_times: dict[str, float] = defaultdict(float)
+    node_started: dict[str, float] = {}
+    started = time.perf_counter()
+    async for event in graph.stream_async(prompt):
+        event_type = event.get("type")
+        if event_type == "multiagent_node_start":
+            node_started[event["node_id"]] = time.perf_counter()
+        elif event_type == "multiagent_node_stop":
+            node_times[event["node_id"]] += time.perf_counter() - node_started.pop(event["node_id"])
+    return node_times, time.perf_counter() - started
+
+
+# ========== Fake Model Tests ==========
+
+class TestFakeModel:
+    """FakeModel 스크립트 테스트."""
+
+    def test_scripted_turns_follow_tool_rounds(self):
+        """도구 결과 라운드 수에 따라 다음 턴을 선택해야 함."""
+        first, second = FakeTurn(tool_calls=(ToolCall("t", {}),)), FakeTurn(text="done")
+        respond = scripted(first, second)
+        prompt = {"role": "user", "content": [{"text": "q"}]}
+        tool_result = {"role": "user", "content": [{"toolResult": {"toolUseId": "1", "content": []}}]}
+
+        assert respond([prompt]) is first
+        assert respond([prompt, {"role": "assistant", "content": []}, tool_result]) is second
+        # 재시도 프롬프트가 추가되면 처음 턴부터 다시 시작
+        assert respond([prompt, tool_result, prompt]) is first
+
+    async def test_streams_tokens_with_delay(self):
+        """텍스트를 토큰 단위로 지연을 두고 스트리밍해야 함."""
+        model = FakeModel([FakeTurn(text="a b c")], token_delay=0.01)
+
+        events = [e async for e in model.stream([{"role": "user", "content": [{"text": "q"}]}])]
+        deltas = [e["contentBlockDelta"]["delta"]["text"] for e in events if "contentBlockDelta" in e]
+
+        assert deltas == ["a", " b", " c"]
+        assert model.stats.output_tokens == 3
+        assert model.stats.llm_time >= 0.03
+
+    async def test_structured_output_validates_scripted_text(self):
+        """structured_output은 턴 텍스트를 output_model JSON으로 검증해 반환해야 함."""
+
+        class Answer(BaseModel):
+            count: int
+
+        model = FakeModel([FakeTurn(text='{"count": 4}')])
+
+        events = [e async for e in model.structured_output(Answer, [])]
+
+        assert events == [{"output": Answer(count=4)}]
+
+    async def test_overlapping_streams_get_unique_tool_use_ids(self):
+        """같은 모델의 동시 스트림도 서로 다른 toolUseId를 받아야 함."""
+        model = FakeModel([FakeTurn(tool_calls=(ToolCall("a", {}), ToolCall("b", {})))], token_delay=0.001)
+        messages = [{"role": "user", "content": [{"text": "q"}]}]
+
+        async def tool_use_ids() -> list[str]:
+            return [
+                e["contentBlockStart"]["start"]["toolUse"]["toolUseId"]
+                async for e in model.stream(messages)
+                if "toolUse" in e.get("contentBlockStart", {}).get("start", {})
+            ]
+
+        first, second = await asyncio.gather(tool_use_ids(), tool_use_ids())
+
+        assert len(set(first + second)) == 4
+
+
+# ========== Workflow Tests ==========
+
+class TestOfflineWorkflow:
+    """FakeModel + Mock 도구 전체 워크플로우 테스트."""
+
+    def test_run_over_mock_tools(self, fake_model):
+        """run()이 두 Mock 도구 결과로 평가를 통과해야 함."""
+        state = OpsAgentGraph(verbose=False).run(PROMPT)
+
+        assert state.final_status == WorkflowStatus.PUBLISHED, state.error
+        assert {r.tool_name for r in state.tool_results} == {
+            "cloudwatch_filter_log_events",
+            "kb_retrieve",
+        }
+        assert "4건" in state.final_response
+        assert fake_model.stats.calls == 2
+
+    async def test_stream_async_reports_per_node_time(self, fake_model):
+        """노드별 시간을 LLM 시간과 프레임워크 오버헤드로 나누어 보고해야 함."""
+        graph = OpsAgentGraph(verbose=False)
+        totals: dict[str, float] = defaultdict(float)
+        wall = 0.0
+
+        for _ in range(RUNS):
+            node_times, elapsed = await _stream_node_times(graph, PROMPT)
+            for node_id, seconds in node_times.items():
+                totals[node_id] += seconds
+            wall += elapsed
+
+        llm = fake_model.stats.llm_time
+        node_total = sum(totals.values())
+
+        print(f"\n{'node':<12}{'mean ms':>10}")
+        for node_id, seconds in totals.items():
+            print(f"{node_id:<12}{seconds / RUNS * 1000:>10.2f}")
+        print(f"{'LLM (fake)':<12}{llm / RUNS * 1000:>10.2f}")
+        print(f"{'overhead':<12}{(wall - llm) / RUNS * 1000:>10.2f}  (graph wall - LLM)")
+        print(f"{'plumbing':<12}{(wall - node_total) / RUNS * 1000:>10.2f}  (graph wall - node time)")
+
+        assert set(totals) == {"analyze", "evaluate", "decide", "finalize"}
+        assert fake_model.stats.calls == 2 * RUNS
+        # LLM 시간은 ANALYZE 노드 안에서만 발생
+        assert totals["analyze"] >= llm
+        assert wall >= node_total
+
+
+# ========== pytest-benchmark ==========
+
+def _benchmark(request):
+    """pytest-benchmark가 설치된 경우에만 benchmark fixture 반환."""
+    pytest.importorskip("pytest_benchmark")
+    return request.getfixturevalue("benchmark")
+
+
+class TestGraphBenchmark:
+    """pytest-benchmark 기반 프레임워크 오버헤드 벤치마크 (토큰 지연 없음)."""
+
+    @pytest.mark.usefixtures("instant_model")
+    def test_benchmark_run(self, request):
+        """OpsAgentGraph.run 벤치마크."""
+        benchmark = _benchmark(request)
+        graph = OpsAgentGraph(verbose=False)
+
+        state = benchmark(graph.run, PROMPT)
+
+        assert state.final_status == WorkflowStatus.PUBLISHED
+
+    @pytest.mark.usefixtures("instant_model")
+    def test_benchmark_stream_async(self, request):
+        """OpsAgentGraph.stream_async 벤치마크 (노드별 시간은 extra_info에 기록)."""
+        benchmark = _benchmark(request)
+        graph = OpsAgentGraph(verbose=False)
+        node_totals: dict[str, float] = defaultdict(float)
+        # 보정/워밍업 호출도 포함되므로 rounds가 아닌 실제 호출 수로 평균
+        calls = 0
+
+        def run_once() -> float:
+            nonlocal calls
+            node_times, elapsed = asyncio.run(_stream_node_times(graph, PROMPT))
+            for node_id, seconds in node_times.items():
+                node_totals[node_id] += seconds
+            calls += 1
+            return elapsed
+
+        benchmark(run_once)
+
+        benchmark.extra_info["node_ms"] = {
+            node_id: round(seconds / calls * 1000, 3) for node_id, seconds in node_totals.items()
+        }
+        assert set(node_totals) == {"analyze", "evaluate", "decide", "finalize"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
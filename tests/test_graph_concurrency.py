@@ -0,0 +1,205 @@
+"""Graph 동시 실행 테스트.
+
+하나의 프로세스에서 여러 OpsAgentGraph 워크플로우가 동시에 실행될 때
+워크플로우 상태가 서로 섞이지 않는지 검증합니다.
+
+LLM 대신 FakeAgent를 주입하므로 AWS 자격 증명 없이 실행됩니다.
+
+실행 방법:
+    uv run pytest tests/test_graph_concurrency.py -v
+"""
+
+import asyncio
+import json
+import random
+import re
+
+import pytest
+
+from ops_agent.graph import nodes
+from ops_agent.graph.agent_pool import AgentPool
+from ops_agent.graph.runner import OpsAgentGraph
+from ops_agent.graph.state import _state_registry, get_current_workflow_id
+
+WORKFLOW_COUNT = 100
+
+
+# ========== Fake Agent ==========
+
+class FakeAgent:
+    """프롬프트에 따라 결정적인 응답과 도구 결과를 만드는 가짜 Agent.
+
+    - 프롬프트 "workflow-{i}" → 서비스 svc-{i}, 이벤트 수 (i % 5) + 1
+    - 홀수 i의 첫 시도는 잘못된 이벤트 수를 답변 → REGENERATE 유도
+    - 재시도 (build_retry_prompt) 응답에는 "(retry)" 표시
+    """
+
+    def __init__(self, rng: random.Random) -> None:
+        self.messages: list[dict] = []
+        self._rng = rng
+
+    async def stream_async(self, prompt: str):
+        index = int(re.search(r"workflow-(\d+)", prompt).group(1))
+        is_retry = prompt.startswith("이전 질문:")
+        count = index % 5 + 1
+
+        tool_output = {
+            "status": "success",
+            "log_group": f"/aws/lambda/svc-{index}",
+            "event_count": count,
+            "events": [{"message": "[ERROR] Disk quota exceeded"}],
+        }
+
+        if is_retry:
+            response = f"svc-{index}에서 {count}건 발생: Disk quota exceeded (retry)"
+        elif index % 2:
+            response = f"svc-{index} 로그를 확인했습니다. 이상 징후 {count + 10}건."
+        else:
+            response = f"svc-{index}에서 {count}건 발생: Disk quota exceeded"
+
+        # 다른 워크플로우와 실행 순서가 섞이도록 임의 지연
+        for chunk in (response[: len(response) // 2], response[len(response) // 2 :]):
+            await asyncio.sleep(self._rng.uniform(0, 0.005))
+            yield {"data": chunk}
+
+        self.messages = [
+            {"role": "user", "content": [{"text": prompt}]},
+            {"role": "assistant", "content": [{"toolUse": {"toolUseId": "t1", "name": "cw", "input": {}}}]},
+            {
+                "role": "user",
+                "content": [{
+                    "toolResult": {
+                        "toolUseId": "t1",
+                        "status": "success",
+                        "content": [{"text": json.dumps(tool_output)}],
+                    }
+                }],
+            },
+            {"role": "assistant", "content": [{"text": response}]},
+        ]
+
+
+@pytest.fixture
+def fake_agent(monkeypatch):
+    """ANALYZE 노드의 Agent 풀을 FakeAgent 풀로 교체."""
+    rng = random.Random(42)
+    pool = AgentPool(factory=lambda: FakeAgent(rng))
+    monkeypatch.setattr(nodes, "_agent_pool", pool)
+    return pool
+
+
+def _expected_response(index: int) -> str:
+    count = index % 5 + 1
+    suffix = " (retry)" if index % 2 else ""
+    return f"svc-{index}에서 {count}건 발생: Disk quota exceeded{suffix}"
+
+
+def _final_text(events: list) -> str | None:
+    """finalize 노드 결과에서 최종 응답 텍스트 추출."""
+    for event in events:
+        if event.get("type") != "multiagent_node_stream" or event.get("node_id") != "finalize":
+            continue
+        result = event["event"].get("result")
+        if result is not None:
+            return result.results["finalize"].result.message["content"][0]["text"]
+    return None
+
+
+# ========== AgentPool Tests ==========
+
+class TestAgentPool:
+    """AgentPool 재사용/초기화 테스트."""
+
+    def test_reuses_agent_and_resets_conversation(self):
+        """반환된 Agent는 대화가 초기화된 상태로 재사용되어야 함."""
+        pool = AgentPool(factory=lambda: FakeAgent(random.Random(0)))
+
+        with pool.acquire() as first:
+            first.messages = [{"role": "user", "content": [{"text": "old"}]}]
+
+        with pool.acquire() as second:
+            assert second is first
+            assert second.messages == []
+
+        assert (pool.created, pool.reused) == (1, 1)
+
+    def test_discards_agent_on_error(self):
+        """실행 중 오류가 난 Agent는 풀에 반환하지 않아야 함."""
+        pool = AgentPool(factory=lambda: FakeAgent(random.Random(0)))
+
+        with pytest.raises(RuntimeError), pool.acquire():
+            raise RuntimeError("model error")
+
+        assert pool.idle_count == 0
+
+    def test_max_idle_limits_pool_size(self):
+        """max_idle을 넘는 유휴 Agent는 폐기되어야 함."""
+        pool = AgentPool(factory=lambda: FakeAgent(random.Random(0)), max_idle=1)
+
+        with pool.acquire(), pool.acquire():
+            pass
+
+        assert pool.created == 2
+        assert pool.idle_count == 1
+
+
+# ========== Concurrency Tests ==========
+
+class TestConcurrentWorkflows:
+    """동시 워크플로우 격리 테스트."""
+
+    async def test_overlapping_stream_workflows_do_not_leak_state(self, fake_agent):
+        """100개의 겹치는 stream_async 실행이 각자의 상태만 사용해야 함."""
+        graph = OpsAgentGraph(max_attempts=2, verbose=False)
+
+        async def run_one(index: int) -> tuple[int, list]:
+            events = [event async for event in graph.stream_async(f"workflow-{index}")]
+            return index, events
+
+        results = await asyncio.gather(*(run_one(i) for i in range(WORKFLOW_COUNT)))
+
+        for index, events in results:
+            executed = [
+                e["node_id"] for e in events
+                if e.get("type") == "multiagent_node_start"
+            ]
+            assert _final_text(events) == _expected_response(index)
+
+            # 홀수는 REGENERATE 루프를 한 번 거쳐야 함 (조건 함수가 자신의 상태를 읽음)
+            if index % 2:
+                assert executed.count("analyze") == 2
+                assert "regenerate" in executed
+            else:
+                assert executed.count("analyze") == 1
+                assert "regenerate" not in executed
+
+        assert _state_registry == {}
+        assert get_current_workflow_id() is None
+
+        # 재생성 루프를 포함한 150회의 ANALYZE 실행이 풀의 Agent를 재사용해야 함
+        assert fake_agent.created + fake_agent.reused == WORKFLOW_COUNT + WORKFLOW_COUNT // 2
+        assert fake_agent.reused > 0
+
+    @pytest.mark.usefixtures("fake_agent")
+    def test_sync_run_in_threads_does_not_leak_state(self):
+        """스레드에서 동시에 실행한 run()도 각자의 상태를 반환해야 함."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        graph = OpsAgentGraph(max_attempts=2, verbose=False)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            states = list(executor.map(
+                lambda i: (i, graph.run(f"workflow-{i}")),
+                range(16),
+            ))
+
+        for index, state in states:
+            assert state.prompt == f"workflow-{index}"
+            assert state.final_response == _expected_response(index)
+            assert state.attempt == index % 2
+
+        assert _state_registry == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
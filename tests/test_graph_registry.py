@@ -0,0 +1,129 @@
+"""컴파일된 Graph 레지스트리 테스트.
+
+OpsAgentGraph 실행이 GraphBuilder를 매번 호출하지 않고
+프로세스 단위 레지스트리의 Graph를 재사용하는지 검증합니다.
+
+실행 방법:
+    uv run pytest tests/test_graph_registry.py -v -s   # -s: 벤치마크 결과 출력
+"""
+
+import random
+import time
+
+import pytest
+
+from ops_agent.graph import nodes
+from ops_agent.graph.agent_pool import AgentPool
+from ops_agent.graph.runner import (
+    OpsAgentGraph,
+    build_ops_graph,
+    clear_graph_registry,
+    get_graph_registry_stats,
+    lease_ops_graph,
+)
+from tests.test_graph_concurrency import FakeAgent, _expected_response
+
+# ========== Fixtures ==========
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    """테스트마다 빈 레지스트리에서 시작."""
+    clear_graph_registry()
+    yield
+    clear_graph_registry()
+
+
+@pytest.fixture
+def fake_agent(monkeypatch):
+    """ANALYZE 노드의 Agent 풀을 FakeAgent 풀로 교체."""
+    pool = AgentPool(factory=lambda: FakeAgent(random.Random(7)))
+    monkeypatch.setattr(nodes, "_agent_pool", pool)
+
+
+# ========== Registry Tests ==========
+
+class TestGraphRegistry:
+    """Graph 레지스트리 재사용 테스트."""
+
+    @pytest.mark.usefixtures("fake_agent")
+    def test_sequential_runs_build_graph_once(self):
+        """여러 OpsAgentGraph 인스턴스의 순차 실행은 Graph 하나를 재사용해야 함."""
+        for index in range(5):
+            state = OpsAgentGraph(max_attempts=2, verbose=False).run(f"workflow-{index}")
+            assert state.final_response == _expected_response(index)
+
+        stats = get_graph_registry_stats()
+        assert stats["built"] == 1
+        assert stats["reused"] == 4
+        assert stats["idle"] == 1
+
+    def test_registry_is_keyed_by_max_node_executions(self):
+        """max_node_executions가 다르면 별도의 Graph를 사용해야 함."""
+        with lease_ops_graph(15) as default_graph:
+            pass
+        with lease_ops_graph(30) as larger_graph:
+            pass
+
+        assert default_graph is not larger_graph
+        assert larger_graph.max_node_executions == 30
+
+        with lease_ops_graph(15) as reused:
+            assert reused is default_graph
+
+    def test_concurrent_leases_get_distinct_graphs(self):
+        """동시에 대여한 Graph는 서로 달라야 함 (실행 상태 공유 방지)."""
+        with lease_ops_graph() as first, lease_ops_graph() as second:
+            assert first is not second
+
+        assert get_graph_registry_stats()["built"] == 2
+
+    def test_graph_discarded_on_error(self):
+        """실행 중 오류가 난 Graph는 레지스트리에 반환하지 않아야 함."""
+        with pytest.raises(RuntimeError), lease_ops_graph():
+            raise RuntimeError("node failed")
+
+        assert get_graph_registry_stats()["idle"] == 0
+
+    @pytest.mark.usefixtures("fake_agent")
+    def test_released_graph_nodes_are_reset(self):
+        """반환된 Graph의 노드 실행 상태는 초기화되어야 함."""
+        OpsAgentGraph(max_attempts=2, verbose=False).run("workflow-1")
+
+        with lease_ops_graph() as graph:
+            assert all(node.result is None for node in graph.nodes.values())
+            assert {node.execution_status.value for node in graph.nodes.values()} == {"pending"}
+
+
+# ========== Startup Benchmark ==========
+
+class TestGraphStartupBenchmark:
+    """Graph 준비 비용 벤치마크 (매 실행 빌드 vs 레지스트리 재사용)."""
+
+    ITERATIONS = 200
+
+    def test_registry_is_cheaper_than_rebuilding(self):
+        """레지스트리 재사용이 매번 GraphBuilder를 호출하는 것보다 빨라야 함."""
+        start = time.perf_counter()
+        for _ in range(self.ITERATIONS):
+            build_ops_graph()
+        rebuild_sec = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(self.ITERATIONS):
+            with lease_ops_graph():
+                pass
+        registry_sec = time.perf_counter() - start
+
+        print(
+            f"\n  [Graph startup x{self.ITERATIONS}] "
+            f"rebuild: {rebuild_sec * 1000:.1f}ms, "
+            f"registry: {registry_sec * 1000:.1f}ms "
+            f"({rebuild_sec / registry_sec:.1f}x)"
+        )
+
+        assert get_graph_registry_stats()["built"] == 1
+        assert registry_sec < rebuild_sec
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,230 @@
+"""KB 검색 결과 캐시 테스트.
+
+LRU + TTL 캐시의 적중/만료/제거 동작과
+Bedrock(boto3 스텁) / Mock 백엔드의 캐시 적용을 검증합니다.
+
+실행 방법:
+    uv run pytest tests/test_kb_cache.py -v
+"""
+
+import json
+
+import pytest
+
+from ops_agent.config import get_settings
+from ops_agent.tools.knowledge_base import data_loader, kb_tools, mock_tools
+from ops_agent.tools.knowledge_base.cache import (
+    RetrievalCache,
+    make_cache_key,
+    normalize_query,
+)
+
+# ========== Fixtures ==========
+
+class FakeClock:
+    """테스트용 수동 시계."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StubRetrieveClient:
+    """bedrock-agent-runtime retrieve 스텁 (호출 횟수 기록)."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.calls: list[dict] = []
+        self.fail = fail
+
+    def retrieve(self, **kwargs) -> dict:
+        self.calls.append(kwargs)
+        if self.fail:
+            raise RuntimeError("throttled")
+        return {
+            "retrievalResults": [
+                {
+                    "score": 0.9,
+                    "content": {"text": "에러 코드 22E 해결 방법"},
+                    "metadata": {
+                        "x-amz-bedrock-kb-source-uri": "s3://bucket/diagnostics-001.md",
+                        "category": "diagnostics",
+                    },
+                }
+            ]
+        }
+
+
+@pytest.fixture
+def kb_cache(monkeypatch) -> RetrievalCache:
+    """도구가 사용할 새 캐시 주입."""
+    cache = RetrievalCache(max_size=16, ttl=60)
+    monkeypatch.setattr(kb_tools, "get_kb_cache", lambda: cache)
+    monkeypatch.setattr(mock_tools, "get_kb_cache", lambda: cache)
+    monkeypatch.setattr(data_loader, "get_kb_cache", lambda: cache)
+    return cache
+
+
+@pytest.fixture
+def bedrock_env(monkeypatch):
+    """BEDROCK_KNOWLEDGE_BASE_ID 설정."""
+    monkeypatch.setenv("BEDROCK_KNOWLEDGE_BASE_ID", "TESTKB")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+# ========== RetrievalCache ==========
+
+class TestRetrievalCache:
+    """LRU + TTL 캐시 단위 테스트."""
+
+    def test_hit_and_miss_counters(self):
+        """조회 결과에 따라 hit/miss 카운터 증가."""
+        cache = RetrievalCache(max_size=4, ttl=60)
+        assert cache.get("a") is None
+        cache.set("a", [1])
+        assert cache.get("a") == [1]
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_ttl_expiry(self):
+        """TTL이 지난 항목은 제거되고 miss로 집계."""
+        clock = FakeClock()
+        cache = RetrievalCache(max_size=4, ttl=10, clock=clock)
+        cache.set("a", [1])
+
+        clock.now = 9.9
+        assert cache.get("a") == [1]
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert cache.expirations == 1
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """최근에 사용하지 않은 항목부터 제거."""
+        cache = RetrievalCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # a를 최근 사용으로 갱신
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.evictions == 1
+
+    def test_disabled_when_ttl_zero(self):
+        """TTL 0이면 저장하지 않음."""
+        cache = RetrievalCache(max_size=4, ttl=0)
+        cache.set("a", 1)
+        assert len(cache) == 0
+
+    def test_normalized_query_key(self):
+        """공백/대소문자/전각 문자 차이는 같은 키로 취급."""
+        assert normalize_query("  TSS   Activation\t이 뭐야 ") == "tss activation 이 뭐야"
+        assert normalize_query("ＴＳＳ") == "tss"
+        assert make_cache_key("mock", "Error 22E", "diagnostics", 5) == make_cache_key(
+            "mock", "  error   22e ", "diagnostics", 5
+        )
+        assert make_cache_key("mock", "q", "a", 5) != make_cache_key("mock", "q", "b", 5)
+
+
+# ========== Bedrock 백엔드 ==========
+
+class TestBedrockKbRetrieveCache:
+    """boto3 스텁으로 Bedrock kb_retrieve 캐시 검증."""
+
+    @pytest.mark.usefixtures("bedrock_env")
+    def test_repeated_query_skips_retrieve(self, kb_cache, monkeypatch):
+        """정규화 후 같은 질문은 Retrieve를 한 번만 호출."""
+        client = StubRetrieveClient()
+        monkeypatch.setattr(kb_tools, "_client", client)
+
+        first = json.loads(kb_tools.kb_retrieve(query="에러 코드 22E", category="diagnostics"))
+        second = json.loads(kb_tools.kb_retrieve(query="  에러   코드 22e ", category="diagnostics"))
+
+        assert len(client.calls) == 1
+        assert first["results"] == second["results"]
+        assert second["query"] == "  에러   코드 22e "
+        assert second["kb_id"] == "TESTKB"
+        assert kb_cache.stats()["hits"] == 1
+
+    @pytest.mark.usefixtures("kb_cache", "bedrock_env")
+    def test_different_category_is_separate_entry(self, monkeypatch):
+        """카테고리가 다르면 별도로 검색."""
+        client = StubRetrieveClient()
+        monkeypatch.setattr(kb_tools, "_client", client)
+
+        kb_tools.kb_retrieve(query="22E", category="diagnostics")
+        kb_tools.kb_retrieve(query="22E", category="glossary")
+        assert len(client.calls) == 2
+
+    @pytest.mark.usefixtures("bedrock_env")
+    def test_errors_are_not_cached(self, kb_cache, monkeypatch):
+        """Retrieve 실패 응답은 캐시하지 않음."""
+        client = StubRetrieveClient(fail=True)
+        monkeypatch.setattr(kb_tools, "_client", client)
+
+        for _ in range(2):
+            result = json.loads(kb_tools.kb_retrieve(query="22E", category="diagnostics"))
+            assert result["status"] == "error"
+
+        assert len(client.calls) == 2
+        assert len(kb_cache) == 0
+
+
+# ========== Mock 백엔드 ==========
+
+class TestMockKbRetrieveCache:
+    """Mock kb_retrieve 캐시 검증."""
+
+    def test_repeated_query_skips_search(self, kb_cache, monkeypatch):
+        """같은 질문은 로컬 검색을 한 번만 수행."""
+        calls: list[str] = []
+        original = mock_tools.search_entries
+
+        def counting_search(query, **kwargs):
+            calls.append(query)
+            return original(query, **kwargs)
+
+        monkeypatch.setattr(mock_tools, "search_entries", counting_search)
+
+        first = json.loads(mock_tools.kb_retrieve(query="에러 코드", category="diagnostics"))
+        second = json.loads(mock_tools.kb_retrieve(query="에러  코드", category="diagnostics"))
+
+        assert calls == ["에러 코드"]
+        assert first["results"] == second["results"]
+        assert kb_cache.stats()["hits"] == 1
+
+    def test_key_follows_search_normalization(self, kb_cache):
+        """로컬 검색 결과가 다를 수 있는 질문 (NFKC/대소문자 접기 차이)은 캐시를 공유하지 않음."""
+        queries = ["에러 22E", "에러 ２２Ｅ", "에러 22e"]
+
+        for query in queries:
+            payload = json.loads(mock_tools.kb_retrieve(query=query, category="diagnostics"))
+            expected = data_loader.search_entries(query, category="diagnostics", max_results=5)
+            assert [r["doc_id"] for r in payload["results"]] == [e["id"] for e in expected], query
+
+        # "22E"와 "22e"는 검색에서도 같은 토큰 (소문자 비교)이므로 캐시 공유
+        assert kb_cache.stats()["hits"] == 1
+        assert len(kb_cache) == 2
+
+    def test_clear_cache_invalidates_mock_results(self, kb_cache):
+        """data_loader.clear_cache()는 Mock 검색 결과만 무효화해야 함."""
+        mock_tools.kb_retrieve(query="에러 코드", category="diagnostics")
+        bedrock_key = make_cache_key("bedrock:TESTKB", "에러 코드", "diagnostics", 5)
+        kb_cache.set(bedrock_key, [])
+
+        data_loader.clear_cache()
+
+        assert len(kb_cache) == 1
+        assert kb_cache.get(bedrock_key) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
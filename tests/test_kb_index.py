@@ -0,0 +1,221 @@
+"""KB 역색인 테스트.
+
+KBIndex 검색 순위가 기존 전체 순회(_score_entry)와 같은지,
+대규모 데이터셋에서도 빠르게 조회되는지 검증합니다.
+
+실행 방법:
+    uv run pytest tests/test_kb_index.py -v -s
+"""
+
+import random
+import time
+
+import pytest
+
+from ops_agent.tools.knowledge_base import data_loader
+from ops_agent.tools.knowledge_base.data_loader import (
+    KBIndex,
+    _score_entry,
+    load_category,
+    load_index,
+    lookup_error_code,
+    search_entries,
+)
+
+# ========== 기존 구현 (참조용) ==========
+
+def _legacy_search(query: str, category: str | None = None, max_results: int = 5) -> list[dict]:
+    """전체 카테고리를 순회하며 _score_entry로 점수를 매기는 기존 구현."""
+    index = load_index()
+    query_tokens = [t.strip() for t in query.split() if t.strip()]
+    if category:
+        categories = [c for c in index["categories"] if c["id"] == category]
+    else:
+        categories = index["categories"]
+
+    results = []
+    for cat in categories:
+        try:
+            cat_data = load_category(cat["id"])
+        except FileNotFoundError:
+            continue
+        for entry in cat_data.get("entries", []):
+            score = _score_entry(entry, query_tokens)
+            if score > 0:
+                results.append((score, entry))
+
+    results.sort(key=lambda x: x[0], reverse=True)
+    return [entry for _, entry in results[:max_results]]
+
+
+def _legacy_lookup_error_code(code: str) -> list[dict]:
+    """전체 카테고리를 순회하는 기존 에러 코드 조회."""
+    results = []
+    for cat in load_index()["categories"]:
+        for entry in load_category(cat["id"]).get("entries", []):
+            if code.upper() in entry.get("error_codes", []):
+                results.append(entry)
+    return results
+
+
+# ========== Fixtures ==========
+
+@pytest.fixture(scope="module")
+def vocabulary() -> list[str]:
+    """실제 KB 데이터에서 추출한 검색어 후보."""
+    words: set[str] = set()
+    for cat in load_index()["categories"]:
+        for entry in load_category(cat["id"]).get("entries", []):
+            words.update(entry.get("title", "").split())
+            words.update(entry.get("keywords", []))
+            words.update(entry.get("error_codes", []))
+            for variant in entry.get("question_variants", []):
+                words.update(variant.split())
+    words.update(["22e", "5E", "냉", "에러", "방법", "없는단어", "SmartThings", "a"])
+    return sorted(w for w in words if w.strip())
+
+
+# ========== Equivalence Tests ==========
+
+class TestKBIndexRanking:
+    """기존 순회 방식과 순위 동일성 테스트."""
+
+    def test_random_queries_match_legacy_ranking(self, vocabulary: list[str]):
+        """임의 질의의 결과 순서가 기존 구현과 같아야 함."""
+        rng = random.Random(3)
+        categories = [None] + [c["id"] for c in load_index()["categories"]] + ["unknown"]
+
+        for _ in range(300):
+            query = " ".join(rng.choices(vocabulary, k=rng.randint(1, 5)))
+            category = rng.choice(categories)
+            max_results = rng.choice([1, 5, 20])
+
+            expected = _legacy_search(query, category, max_results)
+            actual = search_entries(query, category=category, max_results=max_results)
+            assert [e["id"] for e in actual] == [e["id"] for e in expected], (query, category)
+
+    def test_error_code_query_ranks_code_entry_first(self):
+        """에러 코드 정확 매칭 항목이 검색되어야 함."""
+        results = search_entries("에러 코드 22E", max_results=3)
+
+        assert results
+        assert any("22E" in e.get("error_codes", []) for e in results)
+
+    def test_bidirectional_keyword_matching(self):
+        """키워드가 토큰에 포함되거나 토큰이 키워드에 포함되면 모두 매칭."""
+        entries = [
+            {"id": "a", "title": "", "answer": "", "keywords": ["펌웨어"]},
+            {"id": "b", "title": "", "answer": "", "keywords": ["펌웨어 업데이트"]},
+            {"id": "c", "title": "", "answer": "", "keywords": ["서비스"]},
+        ]
+        index = KBIndex([("cat", entries)])
+
+        assert [e["id"] for e in index.search(["펌웨어업데이트"])] == ["a"]
+        assert [e["id"] for e in index.search(["펌웨"])] == ["a", "b"]
+        assert index.search(["없음"]) == []
+
+    def test_long_token_matches_legacy(self):
+        """공백 없는 긴 토큰 (URL, ARN, 스택 트레이스)도 기존 구현과 같은 결과여야 함."""
+        entries = [
+            {"id": "a", "title": "", "answer": "", "keywords": ["timeout"]},
+            {"id": "b", "title": "", "answer": "", "keywords": ["arn:aws:lambda"]},
+            {"id": "c", "title": "", "answer": "", "keywords": ["없는키워드"]},
+        ]
+        index = KBIndex([("cat", entries)])
+        token = "arn:aws:lambda:us-east-1:123456789012:function:payment" + "x" * 1500 + "Timeout"
+
+        expected = [e["id"] for e in entries if _score_entry(e, [token]) > 0]
+        assert [e["id"] for e in index.search([token])] == expected == ["a", "b"]
+
+    def test_clear_cache_rebuilds_index(self):
+        """clear_cache() 후에는 새 역색인을 생성해야 함."""
+        first = data_loader.get_kb_index()
+        data_loader.clear_cache()
+        assert data_loader.get_kb_index() is not first
+
+
+# ========== Error Code Lookup Tests ==========
+
+class TestErrorCodeLookup:
+    """에러 코드 조회 테이블 테스트."""
+
+    def test_lookup_matches_legacy_scan(self):
+        """모든 에러 코드에 대해 기존 순회 결과와 같아야 함."""
+        codes = {
+            code
+            for cat in load_index()["categories"]
+            for entry in load_category(cat["id"]).get("entries", [])
+            for code in entry.get("error_codes", [])
+        }
+        assert codes
+
+        for code in sorted(codes) + ["22e", "84c", "5e", "ZZZ"]:
+            assert lookup_error_code(code) == _legacy_lookup_error_code(code), code
+
+    def test_lookup_is_case_insensitive_and_returns_copy(self):
+        """소문자 입력도 조회되고, 반환 목록 수정이 테이블에 영향을 주지 않아야 함."""
+        results = lookup_error_code("22e")
+        assert results
+
+        results.clear()
+        assert lookup_error_code("22E")
+
+    def test_table_invalidated_with_index(self):
+        """clear_cache() 시 에러 코드 테이블도 새로 생성되어야 함."""
+        table = data_loader.get_kb_index().error_code_table
+        data_loader.clear_cache()
+        assert data_loader.get_kb_index().error_code_table is not table
+
+
+# ========== Performance Tests ==========
+
+class TestKBIndexPerformance:
+    """대규모 데이터셋 조회 성능 테스트."""
+
+    def test_large_dataset_lookup_is_fast(self, vocabulary: list[str]):
+        """50배 확장한 데이터셋에서도 캐시된 조회는 1ms 미만이어야 함."""
+        base = [
+            (cat["id"], load_category(cat["id"]).get("entries", []))
+            for cat in load_index()["categories"]
+        ]
+        categories = [
+            (f"{cat_id}_{copy}", [{**e, "id": f"{e['id']}_{copy}"} for e in entries])
+            for copy in range(50)
+            for cat_id, entries in base
+        ]
+
+        start = time.perf_counter()
+        index = KBIndex(categories)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        rng = random.Random(9)
+        queries = [rng.choices(vocabulary, k=3) for _ in range(200)]
+        for tokens in queries:  # 토큰 posting 준비
+            index.search(tokens)
+
+        start = time.perf_counter()
+        for tokens in queries:
+            index.search(tokens)
+        per_query_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+        print(
+            f"\n  [KBIndex] {len(index.entries)} entries, build {build_ms:.0f}ms, "
+            f"lookup {per_query_ms:.3f}ms/query"
+        )
+        assert per_query_ms < 1.0
+
+    def test_long_token_is_fast(self):
+        """공백 없는 긴 토큰도 캐시 없이 빠르게 조회해야 함 (부분 문자열 폭증 방지)."""
+        index = data_loader.get_kb_index()
+        token = "https://example.com/" + "a1b2c3d4" * 250  # 2,020자
+
+        start = time.perf_counter()
+        index.search([token])
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\n  [KBIndex] {len(token)}-char token: {elapsed_ms:.1f}ms")
+        assert elapsed_ms < 100
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
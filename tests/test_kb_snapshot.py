@@ -0,0 +1,178 @@
+"""KB YAML 스냅샷 테스트.
+
+스냅샷이 YAML 변경 시에만 다시 생성되고,
+YAML 파싱보다 빠르게 로드되는지 검증합니다.
+
+실행 방법:
+    uv run pytest tests/test_kb_snapshot.py -v -s
+"""
+
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from ops_agent.tools.knowledge_base import data_loader
+
+SOURCE_DIR = data_loader.DATA_DIR
+
+
+# ========== Fixtures ==========
+
+@pytest.fixture
+def kb_dir(tmp_path: Path, monkeypatch) -> Path:
+    """실제 KB YAML을 임시 디렉토리로 복사하여 DATA_DIR로 사용."""
+    data_dir = tmp_path / "refrigerator_yaml"
+    data_dir.mkdir()
+    for source in SOURCE_DIR.glob("*.yaml"):
+        shutil.copy2(source, data_dir / source.name)
+
+    monkeypatch.setattr(data_loader, "DATA_DIR", data_dir)
+    data_loader.clear_cache()
+    yield data_dir
+    data_loader.clear_cache()
+
+
+@pytest.fixture
+def count_yaml_parses(monkeypatch) -> list[int]:
+    """yaml.safe_load 호출 횟수 기록."""
+    calls = [0]
+    original = yaml.safe_load
+
+    def counting_safe_load(stream):
+        calls[0] += 1
+        return original(stream)
+
+    monkeypatch.setattr(data_loader.yaml, "safe_load", counting_safe_load)
+    return calls
+
+
+def _reload() -> dict:
+    data_loader.clear_cache()
+    return data_loader.load_documents()
+
+
+# ========== Snapshot Tests ==========
+
+class TestKBSnapshot:
+    """스냅샷 생성/재사용/무효화 테스트."""
+
+    def test_snapshot_written_next_to_yaml_dir(self, kb_dir: Path):
+        """첫 로드 시 YAML 디렉토리 옆에 스냅샷이 생성되어야 함."""
+        data_loader.load_index()
+
+        assert data_loader.get_snapshot_path() == kb_dir.parent / "refrigerator_yaml.snapshot.pkl"
+        assert data_loader.get_snapshot_path().exists()
+
+    def test_valid_snapshot_skips_yaml_parsing(self, kb_dir: Path, count_yaml_parses: list[int]):
+        """유효한 스냅샷이 있으면 YAML을 파싱하지 않아야 함."""
+        first = _reload()
+        parses = count_yaml_parses[0]
+        assert parses == len(list(kb_dir.glob("*.yaml")))
+
+        second = _reload()
+        assert count_yaml_parses[0] == parses
+        assert second == first
+
+    def test_mtime_change_without_content_change_reuses_snapshot(
+        self, kb_dir: Path, count_yaml_parses: list[int]
+    ):
+        """내용 변경 없이 mtime만 바뀌면 해시 비교 후 스냅샷을 재사용해야 함."""
+        _reload()
+        parses = count_yaml_parses[0]
+
+        target = kb_dir / "glossary.yaml"
+        os.utime(target, ns=(time.time_ns(), time.time_ns() + 10_000_000_000))
+
+        _reload()
+        assert count_yaml_parses[0] == parses
+
+    def test_content_change_regenerates_snapshot(self, kb_dir: Path):
+        """YAML 내용이 바뀌면 스냅샷을 다시 생성해야 함."""
+        _reload()
+
+        target = kb_dir / "glossary.yaml"
+        data = yaml.safe_load(target.read_text(encoding="utf-8"))
+        data["entries"][0]["title"] = "스냅샷 갱신 확인"
+        target.write_text(yaml.safe_dump(data, allow_unicode=True), encoding="utf-8")
+
+        data_loader.clear_cache()
+        assert data_loader.load_category("glossary")["entries"][0]["title"] == "스냅샷 갱신 확인"
+
+    def test_new_or_removed_file_regenerates_snapshot(self, kb_dir: Path):
+        """YAML 파일이 추가/삭제되면 스냅샷을 다시 생성해야 함."""
+        _reload()
+        shutil.copy2(kb_dir / "glossary.yaml", kb_dir / "extra.yaml")
+        data_loader.clear_cache()
+        assert data_loader.load_category("extra")
+
+        (kb_dir / "extra.yaml").unlink()
+        data_loader.clear_cache()
+        with pytest.raises(FileNotFoundError):
+            data_loader.load_category("extra")
+
+    @pytest.mark.usefixtures("kb_dir")
+    def test_corrupt_snapshot_is_rebuilt(self):
+        """손상된 스냅샷은 무시하고 다시 생성해야 함."""
+        expected = _reload()
+        data_loader.get_snapshot_path().write_bytes(b"not a pickle")
+
+        assert _reload() == expected
+
+    @pytest.mark.usefixtures("kb_dir")
+    def test_unwritable_location_falls_back_to_memory(self, monkeypatch, caplog):
+        """스냅샷을 저장할 수 없어도 데이터는 정상 로드되고 경고는 남기지 않아야 함."""
+        def fail(*, dir: Path, prefix: str) -> tuple[int, str]:
+            assert Path(dir) == data_loader.get_snapshot_path().parent
+            assert prefix.startswith(".")
+            raise PermissionError("read-only file system")
+
+        monkeypatch.setattr(data_loader.tempfile, "mkstemp", fail)
+
+        assert data_loader.load_index()["categories"]
+        assert not data_loader.get_snapshot_path().exists()
+        assert not [record for record in caplog.records if record.levelno >= logging.WARNING]
+
+    def test_prebuilt_snapshot_in_copied_image_skips_yaml(
+        self, kb_dir: Path, tmp_path: Path, count_yaml_parses: list[int], monkeypatch
+    ):
+        """배포 시 mtime을 유지해 복사한 YAML + 스냅샷은 파싱 없이 로드되어야 함."""
+        data_loader.build_snapshot()
+        snapshot_path = data_loader.get_snapshot_path()
+        image_dir = tmp_path / "image" / "refrigerator_yaml"
+        shutil.copytree(kb_dir, image_dir)
+        shutil.copy2(snapshot_path, image_dir.with_name(snapshot_path.name))
+        monkeypatch.setattr(data_loader, "DATA_DIR", image_dir)
+        count_yaml_parses[0] = 0
+
+        assert _reload()["index.yaml"]["categories"]
+        assert count_yaml_parses[0] == 0
+
+
+# ========== Performance Tests ==========
+
+class TestKBSnapshotPerformance:
+    """콜드 로드 성능 테스트."""
+
+    @pytest.mark.usefixtures("kb_dir")
+    def test_snapshot_load_is_faster_than_yaml(self):
+        """스냅샷 로드가 YAML 파싱보다 빨라야 함."""
+        start = time.perf_counter()
+        data_loader.clear_cache()
+        data_loader.build_snapshot()
+        yaml_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        _reload()
+        snapshot_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\n  [KB cold load] yaml: {yaml_ms:.1f}ms, snapshot: {snapshot_ms:.1f}ms")
+        assert snapshot_ms < yaml_ms
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,393 @@
+"""rag_pipeline/llm_enrich.py 병렬 enrichment 테스트.
+
+가짜 bedrock-runtime 클라이언트 (converse만 구현)로 병렬 처리, 토큰 버킷 속도 제한,
+스로틀링 재시도, 원자적 캐시 쓰기를 검증합니다. AWS 자격 증명 없이 실행됩니다.
+
+실행 방법:
+    uv run pytest tests/test_llm_enrich.py -v
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError, ReadTimeoutError
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "rag_pipeline"))
+
+import llm_enrich  # noqa: E402
+from llm_enrich import TokenBucket, call_bedrock, enrich_all, write_json_atomic  # noqa: E402
+
+
+def _entry(entry_id: str, category: str = "diagnostics") -> dict:
+    return {
+        "id": entry_id,
+        "title": f"{entry_id} 에러 코드",
+        "category_id": category,
+        "category_name": "진단",
+        "answer": f"{entry_id} 에러는 센서 문제입니다.",
+        "keywords": ["에러"],
+    }
+
+
+def _throttle() -> ClientError:
+    return ClientError({"Error": {"Code": "ThrottlingException", "Message": "Too many requests"}}, "Converse")
+
+
+def _check_request(modelId: str, messages: list[dict], inferenceConfig: dict) -> str:
+    """converse 요청이 llm_enrich가 보내야 하는 형식인지 확인하고 프롬프트 반환."""
+    assert modelId == llm_enrich.MODEL_ID
+    assert inferenceConfig == {"temperature": 0.0, "maxTokens": 1024}
+    [message] = messages
+    assert message["role"] == "user"
+    return message["content"][0]["text"]
+
+
+class FlakyBedrockRuntime:
+    """처음 몇 번은 지정한 오류를 던진 뒤 성공하는 가짜 클라이언트."""
+
+    def __init__(self, *errors: Exception):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def converse(self, modelId, messages, inferenceConfig):
+        _check_request(modelId, messages, inferenceConfig)
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {"output": {"message": {"content": [{"text": '{"en_core_term": "error"}'}]}}}
+
+
+class FakeBedrockRuntime:
+    """converse만 구현한 가짜 bedrock-runtime 클라이언트.
+
+    Args:
+        latency: 호출당 지연 (초)
+        throttle_first: 처음 N번 호출은 ThrottlingException
+        fail_ids: 잘못된 응답 (JSON 아님)을 돌려줄 엔트리 ID
+        barrier: 호출마다 대기할 Barrier (parties개 호출이 동시에 진행 중이어야 통과)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        throttle_first: int = 0,
+        fail_ids: tuple[str, ...] = (),
+        barrier: threading.Barrier | None = None,
+    ):
+        self.latency = latency
+        self.throttle_first = throttle_first
+        self.fail_ids = fail_ids
+        self.barrier = barrier
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def converse(self, modelId, messages, inferenceConfig):
+        prompt = _check_request(modelId, messages, inferenceConfig)
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if self.barrier is not None:
+                self.barrier.wait()
+            time.sleep(self.latency)
+            if call <= self.throttle_first:
+                raise _throttle()
+            # 형제 목록에는 제목만 들어가므로 답변 본문으로 엔트리 구분
+            entry_id = next((i for i in self.fail_ids if f"{i} 에러는" in prompt), None)
+            text = "죄송합니다" if entry_id else json.dumps({
+                "ko_core_term": "에러",
+                "en_core_term": "error",
+                "ko_nouns": ["에러"],
+                "question_variants": ["에러 해결"],
+                "search_keywords": ["에러"],
+            }, ensure_ascii=False)
+            return {"output": {"message": {"content": [{"text": text}]}}}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def fast_backoff(monkeypatch):
+    """재시도 대기를 짧게 (테스트 시간 단축)."""
+    monkeypatch.setattr(llm_enrich, "BACKOFF_BASE", 0.001)
+
+
+@pytest.fixture
+def clock(monkeypatch) -> list[float]:
+    """TokenBucket이 보는 time.monotonic을 수동 시계로 교체 (clock[0] = 현재 시각)."""
+    now = [1000.0]
+    monkeypatch.setattr(llm_enrich.time, "monotonic", lambda: now[0])
+    return now
+
+
+# ========== TokenBucket Tests ==========
+
+class TestTokenBucket:
+    """토큰 버킷 속도 제한 테스트."""
+
+    def test_limits_rate_after_burst(self):
+        """버스트 이후에는 초당 rate개만 허용해야 함."""
+        bucket = TokenBucket(rate=50, capacity=1)
+        started = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        # 첫 토큰은 즉시, 나머지 5개는 50/s → 약 0.1초
+        assert time.monotonic() - started >= 0.09
+
+    def test_slow_down_and_recover(self, clock):
+        """스로틀링 시 절반으로 줄고, 성공 시 최대 속도까지만 회복해야 함."""
+        bucket = TokenBucket(rate=4.0)
+        bucket.slow_down()
+        clock[0] += 1.0
+        bucket.slow_down()
+        assert bucket.rate == pytest.approx(1.0)
+
+        for _ in range(20):
+            bucket.speed_up()
+        assert bucket.rate == pytest.approx(4.0)
+
+    def test_rate_has_floor(self, clock):
+        """연속 스로틀링에도 최소 속도 아래로 내려가지 않아야 함."""
+        bucket = TokenBucket(rate=1.0, min_rate=0.5)
+        for _ in range(5):
+            bucket.slow_down()
+            clock[0] += 10.0
+        assert bucket.rate == 0.5
+
+    def test_simultaneous_throttles_slow_down_once(self, clock):
+        """리필 간격 이내에 도착한 스로틀링은 한 번만 감속해야 함."""
+        bucket = TokenBucket(rate=4.0)
+        for _ in range(8):
+            bucket.slow_down()
+        assert bucket.rate == pytest.approx(2.0)
+
+        # 새 속도의 리필 간격 (0.5초)이 지나면 다시 감속
+        clock[0] += 0.5
+        bucket.slow_down()
+        assert bucket.rate == pytest.approx(1.0)
+
+
+# ========== call_bedrock Tests ==========
+
+class TestCallBedrock:
+    """Bedrock 호출 재시도 테스트."""
+
+    def test_retries_throttling_and_slows_limiter(self):
+        """ThrottlingException은 재시도하고 limiter 속도를 낮춰야 함."""
+        client = FakeBedrockRuntime(throttle_first=2)
+        limiter = TokenBucket(rate=1000)
+
+        text = call_bedrock("prompt", client, limiter=limiter)
+
+        assert json.loads(text)["en_core_term"] == "error"
+        assert client.calls == 3
+        assert limiter.rate < 1000
+
+    def test_gives_up_after_max_retries(self):
+        """재시도 횟수를 넘으면 마지막 오류를 전달해야 함."""
+        client = FakeBedrockRuntime(throttle_first=10)
+
+        with pytest.raises(ClientError):
+            call_bedrock("prompt", client, max_retries=2, backoff=0.001)
+        assert client.calls == 3
+
+    def test_other_errors_are_not_retried(self):
+        """스로틀링이 아닌 오류는 바로 전달해야 함."""
+        class BadRequest(FakeBedrockRuntime):
+            def converse(self, modelId, messages, inferenceConfig):
+                _check_request(modelId, messages, inferenceConfig)
+                self.calls += 1
+                raise ClientError({"Error": {"Code": "ValidationException", "Message": "bad"}}, "Converse")
+
+        client = BadRequest()
+        with pytest.raises(ClientError):
+            call_bedrock("prompt", client)
+        assert client.calls == 1
+
+    def test_transient_server_errors_are_retried_without_slowing(self):
+        """5xx 계열 일시적 오류는 재시도하되 limiter 속도는 유지해야 함."""
+        client = FlakyBedrockRuntime(
+            ClientError({"Error": {"Code": "InternalServerException", "Message": "boom"}}, "Converse"),
+            ClientError({"Error": {"Code": "ModelErrorException", "Message": "boom"}}, "Converse"),
+        )
+        limiter = TokenBucket(rate=1000)
+
+        text = call_bedrock("prompt", client, limiter=limiter)
+
+        assert json.loads(text)["en_core_term"] == "error"
+        assert client.calls == 3
+        assert limiter.rate == 1000
+
+    def test_network_errors_are_retried(self):
+        """연결 실패/읽기 타임아웃도 재시도해야 함."""
+        client = FlakyBedrockRuntime(
+            EndpointConnectionError(endpoint_url="https://bedrock-runtime.us-east-1.amazonaws.com"),
+            ReadTimeoutError(endpoint_url="https://bedrock-runtime.us-east-1.amazonaws.com"),
+        )
+
+        assert json.loads(call_bedrock("prompt", client))["en_core_term"] == "error"
+        assert client.calls == 3
+
+
+# ========== enrich_all Tests ==========
+
+class TestEnrichAll:
+    """병렬 enrichment 엔진 테스트."""
+
+    def test_processes_entries_concurrently(self, tmp_path):
+        """모든 엔트리를 병렬로 처리하고 캐시 파일을 써야 함."""
+        entries = [_entry(f"E{i:02d}") for i in range(12)]
+        # 6개 호출이 동시에 진행 중이어야 Barrier를 통과 (직렬이면 BrokenBarrierError로 실패)
+        client = FakeBedrockRuntime(barrier=threading.Barrier(6, timeout=5.0))
+
+        counts = enrich_all(entries, client, "", str(tmp_path), workers=6, limiter=TokenBucket(rate=1000, capacity=12))
+
+        assert counts == (12, 0, 0)
+        assert client.max_active == 6
+        assert sorted(p.name for p in tmp_path.glob("E*.json")) == [f"E{i:02d}.json" for i in range(12)]
+        assert json.loads((tmp_path / "E00.json").read_text(encoding="utf-8"))["ko_core_term"] == "에러"
+
+    def test_skips_cached_unless_forced(self, tmp_path):
+        """캐시된 엔트리는 건너뛰고, force면 다시 처리해야 함."""
+        (tmp_path / "E00.json").write_text("{}", encoding="utf-8")
+        entries = [_entry("E00"), _entry("E01")]
+
+        assert enrich_all(entries, FakeBedrockRuntime(), "", str(tmp_path)) == (1, 1, 0)
+        assert enrich_all(entries, FakeBedrockRuntime(), "", str(tmp_path), force=True) == (2, 0, 0)
+
+    def test_failures_are_counted_without_stopping(self, tmp_path):
+        """파싱 실패 엔트리는 실패로 집계하고 캐시를 쓰지 않아야 함."""
+        entries = [_entry("E00"), _entry("BAD01"), _entry("E02")]
+
+        counts = enrich_all(entries, FakeBedrockRuntime(fail_ids=("BAD01",)), "", str(tmp_path), workers=3)
+
+        assert counts == (2, 0, 1)
+        assert not (tmp_path / "BAD01.json").exists()
+
+    def test_throttled_run_completes(self, tmp_path):
+        """스로틀링이 섞여도 모든 엔트리를 처리해야 함."""
+        entries = [_entry(f"E{i:02d}") for i in range(8)]
+        client = FakeBedrockRuntime(throttle_first=4)
+        limiter = TokenBucket(rate=1000)
+
+        assert enrich_all(entries, client, "", str(tmp_path), workers=4, limiter=limiter) == (8, 0, 0)
+        assert client.calls == 12
+
+
+# ========== Manifest Tests ==========
+
+class TestEnrichManifest:
+    """입력 해시 manifest 기반 증분 enrichment 테스트."""
+
+    @pytest.fixture
+    def entries(self) -> list[dict]:
+        return [_entry("E00"), _entry("E01"), _entry("E02", category="glossary")]
+
+    def test_first_run_records_hashes(self, tmp_path, entries):
+        """처리한 엔트리의 입력 해시를 manifest에 기록해야 함."""
+        enrich_all(entries, FakeBedrockRuntime(), "", str(tmp_path))
+
+        manifest = json.loads((tmp_path / llm_enrich.MANIFEST_NAME).read_text(encoding="utf-8"))
+        assert set(manifest) == {"E00", "E01", "E02"}
+
+    def test_unchanged_entries_are_skipped(self, tmp_path, entries):
+        """입력이 같으면 LLM을 호출하지 않아야 함."""
+        enrich_all(entries, FakeBedrockRuntime(), "", str(tmp_path))
+        client = FakeBedrockRuntime()
+
+        assert enrich_all(entries, client, "", str(tmp_path)) == (0, 3, 0)
+        assert client.calls == 0
+
+    def test_edited_answer_is_reenriched(self, tmp_path, entries):
+        """답변이 바뀐 엔트리만 다시 처리해야 함."""
+        enrich_all(entries, FakeBedrockRuntime(), "", str(tmp_path))
+        entries[2]["answer"] += " 필터를 교체하세요."
+        client = FakeBedrockRuntime()
+
+        assert enrich_all(entries, client, "", str(tmp_path)) == (1, 2, 0)
+        assert client.calls == 1
+
+    def test_sibling_title_change_invalidates_category(self, tmp_path, entries):
+        """형제 제목이 바뀌면 같은 카테고리의 다른 엔트리도 다시 처리해야 함."""
+        enrich_all(entries, FakeBedrockRuntime(), "", str(tmp_path))
+        entries[0]["title"] = "E00 센서 에러"
+
+        assert enrich_all(entries, FakeBedrockRuntime(), "", str(tmp_path)) == (2, 1, 0)
+
+    def test_stop_words_and_prompt_version_are_hashed(self, entries, monkeypatch):
+        """stop_words나 프롬프트 버전이 바뀌면 해시가 달라져야 함."""
+        siblings = entries[:2]
+        base = llm_enrich.entry_hash(entries[0], siblings, "냉장고")
+
+        assert llm_enrich.entry_hash(entries[0], siblings, "냉장고, 삼성") != base
+        monkeypatch.setitem(llm_enrich._template.metadata, "version", "99.0")
+        assert llm_enrich.entry_hash(entries[0], siblings, "냉장고") != base
+
+    def test_existing_cache_without_manifest_is_adopted(self, tmp_path, entries):
+        """manifest에 없는 기존 캐시 파일은 재처리하지 않고 등록만 해야 함."""
+        (tmp_path / "E00.json").write_text("{}", encoding="utf-8")
+        client = FakeBedrockRuntime()
+
+        assert enrich_all(entries, client, "", str(tmp_path)) == (2, 1, 0)
+        assert client.calls == 2
+        manifest = json.loads((tmp_path / llm_enrich.MANIFEST_NAME).read_text(encoding="utf-8"))
+        assert set(manifest) == {"E00", "E01", "E02"}
+
+    def test_category_run_does_not_invalidate_other_categories(self, tmp_path, entries):
+        """--category 실행으로 manifest가 생겨도 다른 카테고리의 기존 캐시는 등록만 해야 함."""
+        for entry in entries:
+            (tmp_path / f"{entry['id']}.json").write_text("{}", encoding="utf-8")
+        enrich_all(entries[2:], FakeBedrockRuntime(), "", str(tmp_path), force=True)
+        client = FakeBedrockRuntime()
+
+        assert enrich_all(entries, client, "", str(tmp_path)) == (0, 3, 0)
+        assert client.calls == 0
+        manifest = json.loads((tmp_path / llm_enrich.MANIFEST_NAME).read_text(encoding="utf-8"))
+        assert set(manifest) == {"E00", "E01", "E02"}
+
+    def test_failed_entry_is_retried_next_run(self, tmp_path, entries):
+        """실패한 엔트리는 manifest에 기록되지 않아 다음 실행에서 다시 처리해야 함."""
+        enrich_all(entries, FakeBedrockRuntime(fail_ids=("E01",)), "", str(tmp_path))
+        client = FakeBedrockRuntime()
+
+        assert enrich_all(entries, client, "", str(tmp_path)) == (1, 2, 0)
+        assert client.calls == 1
+
+
+# ========== write_json_atomic Tests ==========
+
+class TestWriteJsonAtomic:
+    """원자적 캐시 쓰기 테스트."""
+
+    def test_replaces_without_temp_files(self, tmp_path):
+        """쓰기 후 임시 파일이 남지 않아야 함."""
+        path = tmp_path / "E00.json"
+        write_json_atomic(str(path), {"a": 1})
+        write_json_atomic(str(path), {"a": 2})
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"a": 2}
+        assert [p.name for p in tmp_path.iterdir()] == ["E00.json"]
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        """직렬화 실패 시 기존 캐시 파일은 그대로 남아야 함."""
+        path = tmp_path / "E00.json"
+        write_json_atomic(str(path), {"a": 1})
+
+        with pytest.raises(TypeError):
+            write_json_atomic(str(path), {"a": object()})
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"a": 1}
+        assert [p.name for p in tmp_path.iterdir()] == ["E00.json"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,150 @@
+"""공유 MCP 세션 테스트.
+
+tests/fixtures/fake_cloudwatch_mcp_server.py(MCP 서버 대역)를 stdio로 실행하여
+세션 재사용, 상태 확인, 장애 후 재시작을 검증합니다.
+
+실행 방법:
+    uv run pytest tests/test_mcp_session.py -v
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from mcp import StdioServerParameters
+from strands.tools.mcp import MCPClient
+
+from ops_agent.tools.cloudwatch import mcp_tools
+from ops_agent.tools.cloudwatch.mcp_tools import MCPSession
+
+FAKE_SERVER = Path(__file__).parent / "fixtures" / "fake_cloudwatch_mcp_server.py"
+
+
+# ========== Fixtures ==========
+
+@pytest.fixture
+def session():
+    """MCP 서버 대역에 연결하는 세션."""
+    session = MCPSession(
+        StdioServerParameters(command=sys.executable, args=[str(FAKE_SERVER)]),
+        name="FakeCloudWatch",
+        restart_backoff=0.0,
+    )
+    yield session
+    session.close()
+
+
+def _call(session: MCPSession, name: str) -> str:
+    result = session.client.call_tool_sync("t1", name, {})
+    assert result["status"] == "success", result
+    return result["content"][0]["text"]
+
+
+def _wait_until_unhealthy(session: MCPSession, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while session.is_healthy() and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+# ========== Session Tests ==========
+
+class TestMCPSession:
+    """MCP 세션 재사용/재시작 테스트."""
+
+    def test_tools_are_loaded_once_and_shared(self, session: MCPSession):
+        """여러 번 도구를 수집해도 서버는 한 번만 시작되어야 함."""
+        first = session.get_tools()
+        second = session.get_tools()
+
+        assert session.starts == 1
+        assert [t.tool_name for t in first] == [t.tool_name for t in second]
+        assert {"describe_log_groups", "get_active_alarms"} <= {t.tool_name for t in first}
+        assert _call(session, "server_pid") == _call(session, "server_pid")
+
+    def test_restarts_after_server_crash(self, session: MCPSession):
+        """서버가 종료되면 다음 도구 수집 시 재시작해야 함."""
+        tools = session.get_tools()
+        pid_before = _call(session, "server_pid")
+
+        session.client.call_tool_sync("t2", "crash", {})
+        _wait_until_unhealthy(session)
+        assert not session.is_healthy()
+
+        restarted = session.get_tools()
+        assert session.starts == 2
+        assert session.is_healthy()
+        assert _call(session, "server_pid") != pid_before
+
+        # 이전에 받은 도구 객체도 같은 MCPClient를 참조하므로 계속 사용 가능
+        assert tools[0].mcp_client is restarted[0].mcp_client
+
+    def test_restart_backoff_limits_crash_loops(self, session: MCPSession):
+        """재시작 간격 이내의 재시작 요청은 거부해야 함."""
+        session.restart_backoff = 60.0
+        session.get_tools()
+        session.client.call_tool_sync("t3", "crash", {})
+        _wait_until_unhealthy(session)
+
+        with pytest.raises(RuntimeError, match="재시작 대기"):
+            session.get_tools()
+
+    def test_close_stops_server(self, session: MCPSession):
+        """close() 후에는 세션이 비활성 상태여야 함."""
+        session.get_tools()
+        session.close()
+
+        assert not session.is_healthy()
+
+
+    def test_unresponsive_server_triggers_restart(self, session: MCPSession, monkeypatch):
+        """상태 확인이 제한 시간 안에 응답하지 않으면 세션을 재시작해야 함."""
+        session.get_tools()
+        session.health_check_timeout = 0.05
+        release = threading.Event()
+        list_tools = MCPClient.list_tools_sync
+
+        def hung_list_tools(_self, *args, **kwargs):
+            # 재시작 전까지 서버가 응답하지 않는 상황 (재시작 후 도구 로드는 통과)
+            if session.starts == 1:
+                release.wait(5.0)
+            return list_tools(_self, *args, **kwargs)
+
+        monkeypatch.setattr(MCPClient, "list_tools_sync", hung_list_tools)
+        try:
+            assert session.is_healthy() is False
+            tools = session.get_tools()
+        finally:
+            release.set()
+
+        assert session.starts == 2
+        assert tools
+
+
+# ========== Module Singleton Tests ==========
+
+class TestCloudWatchMCPTools:
+    """get_mcp_tools() 공유 세션 테스트."""
+
+    def test_get_mcp_tools_reuses_process_session(self, monkeypatch):
+        """get_mcp_tools()는 호출마다 같은 세션을 사용해야 함."""
+        monkeypatch.setattr(
+            mcp_tools,
+            "get_server_parameters",
+            lambda: StdioServerParameters(command=sys.executable, args=[str(FAKE_SERVER)]),
+        )
+        monkeypatch.setattr(mcp_tools, "_session", None)
+
+        try:
+            first = mcp_tools.get_mcp_tools()
+            second = mcp_tools.get_mcp_tools()
+
+            assert mcp_tools.get_cloudwatch_mcp_session().starts == 1
+            assert first == second
+        finally:
+            mcp_tools.get_cloudwatch_mcp_session().close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
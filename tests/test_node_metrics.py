@@ -0,0 +1,206 @@
+"""Graph 노드 메트릭 테스트.
+
+FunctionNode가 노드 실행마다 실행 시간, 첫 이벤트까지 시간, 이벤트 수, 토큰 사용량을
+state.metadata["node_metrics"]에 기록하고 OTEL span/히스토그램으로 내보내는지 검증합니다.
+FakeModel (ops_agent.testing)을 사용하므로 AWS 자격 증명 없이 실행됩니다.
+
+실행 방법:
+    uv run pytest tests/test_node_metrics.py -v
+"""
+
+import json
+
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from ops_agent.graph import nodes
+from ops_agent.graph.agent_pool import AgentPool
+from ops_agent.graph.function_node import FunctionNode
+from ops_agent.graph.runner import OpsAgentGraph
+from ops_agent.graph.state import WorkflowStatus
+from ops_agent.telemetry import NodeTimer, node_metrics, summarize_node_metrics
+from ops_agent.testing import FakeModel, FakeTurn, ToolCall
+
+PROMPT = "payment-service에서 500 에러 로그 보여줘"
+USAGE = {"inputTokens": 1200, "cacheReadInputTokens": 1000, "cacheWriteInputTokens": 0}
+
+
+def _responder(answer_first_attempt: bool):
+    """도구 호출 → (첫 시도 오답) → 도구 결과 인용 답변 순서로 응답."""
+    calls = {"text": 0}
+
+    def respond(messages: list[dict]) -> FakeTurn:
+        outputs = [
+            json.loads(block["toolResult"]["content"][0]["text"])
+            for message in messages if message["role"] == "user"
+            for block in message["content"] if "toolResult" in block
+        ]
+        if not outputs:
+            return FakeTurn(tool_calls=(ToolCall(
+                "cloudwatch_filter_log_events",
+                {"log_group_name": "/aws/lambda/payment-service", "filter_pattern": "500"},
+            ),))
+
+        calls["text"] += 1
+        if calls["text"] == 1 and not answer_first_attempt:
+            return FakeTurn(text="로그를 확인했지만 특이사항은 없습니다.")
+
+        output = outputs[0]
+        lines = [f"{output['log_group']}에서 {output['event_count']}건의 에러가 발생했습니다."]
+        lines.extend(f"- {event['message']}" for event in output["events"])
+        return FakeTurn(text="\n".join(lines))
+
+    return respond
+
+
+def _install(monkeypatch, answer_first_attempt: bool = True) -> FakeModel:
+    model = FakeModel(_responder(answer_first_attempt), usage=USAGE)
+    pool = AgentPool(factory=lambda: nodes._create_agent(model=model), reset=nodes._reset_agent)
+    monkeypatch.setattr(nodes, "_agent_pool", pool)
+    return model
+
+
+@pytest.fixture
+def otel(monkeypatch):
+    """노드 메트릭을 메모리 exporter/reader로 수집."""
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    reader = InMemoryMetricReader()
+    meter_provider = MeterProvider(metric_readers=[reader])
+
+    monkeypatch.setattr(node_metrics.trace, "get_tracer", tracer_provider.get_tracer)
+    monkeypatch.setattr(
+        node_metrics,
+        "_instruments",
+        node_metrics._Instruments(meter_provider.get_meter(node_metrics.INSTRUMENTATION_NAME)),
+    )
+    return exporter, reader
+
+
+# ========== NodeTimer Tests ==========
+
+class TestNodeTimer:
+    """NodeTimer 수집 테스트."""
+
+    def test_accumulates_usage_from_metadata_events(self):
+        """Bedrock metadata 이벤트의 usage를 누적해야 함."""
+        timer = NodeTimer("analyze", attempt=1)
+        timer.on_event({"data": "a"})
+        timer.on_event({"event": {"metadata": {"usage": {"inputTokens": 10, "outputTokens": 2}}}})
+        timer.on_event({"event": {"metadata": {"usage": {
+            "inputTokens": 5, "outputTokens": 3, "cacheReadInputTokens": 4,
+        }}}})
+
+        metrics = timer.finish()
+
+        assert metrics.events == 3
+        assert metrics.time_to_first_event is not None
+        assert metrics.time_to_first_event <= metrics.wall_time
+        assert (metrics.input_tokens, metrics.output_tokens, metrics.cache_read_tokens) == (15, 5, 4)
+        assert metrics.attempt == 1
+
+    def test_non_streaming_node_has_no_first_event_time(self):
+        """이벤트가 없으면 첫 이벤트 시간은 None이어야 함."""
+        metrics = NodeTimer("decide").finish(failed=True)
+
+        assert metrics.time_to_first_event is None
+        assert metrics.status == "failed"
+
+
+# ========== Workflow Metrics Tests ==========
+
+class TestWorkflowNodeMetrics:
+    """워크플로우 실행 시 노드 메트릭 수집 테스트."""
+
+    def test_run_collects_metrics_into_state(self, monkeypatch):
+        """모든 노드 실행이 state.metadata에 기록되어야 함."""
+        model = _install(monkeypatch)
+
+        state = OpsAgentGraph(verbose=False).run(PROMPT)
+
+        assert state.final_status == WorkflowStatus.PUBLISHED
+        records = state.metadata["node_metrics"]
+        assert [r["node"] for r in records] == ["analyze", "evaluate", "decide", "finalize"]
+
+        analyze = records[0]
+        assert analyze["events"] > 0
+        assert 0 <= analyze["time_to_first_event"] <= analyze["wall_time"]
+        # 모델 호출 2회 (도구 호출 + 최종 답변)의 usage 합계
+        assert model.stats.calls == 2
+        assert analyze["input_tokens"] == 2 * USAGE["inputTokens"]
+        assert analyze["cache_read_tokens"] == 2 * USAGE["cacheReadInputTokens"]
+        assert analyze["output_tokens"] == model.stats.output_tokens
+        assert all(r["input_tokens"] == 0 for r in records[1:])
+
+    def test_retry_attempts_are_recorded_separately(self, monkeypatch):
+        """재시도 노드 실행은 attempt로 구분되고 요약에 재시도 시간이 집계되어야 함."""
+        _install(monkeypatch, answer_first_attempt=False)
+
+        state = OpsAgentGraph(max_attempts=2, verbose=False).run(PROMPT)
+
+        records = state.metadata["node_metrics"]
+        analyze_attempts = [r["attempt"] for r in records if r["node"] == "analyze"]
+        assert analyze_attempts == [0, 1]
+        assert "regenerate" in [r["node"] for r in records]
+
+        summary = summarize_node_metrics(records)
+        assert summary["analyze"]["executions"] == 2
+        assert 0 < summary["analyze"]["retry_wall_time"] < summary["analyze"]["wall_time"]
+
+    async def test_stream_async_exports_spans_and_histograms(self, monkeypatch, otel):
+        """노드별 span과 히스토그램이 OTEL로 내보내져야 함."""
+        _install(monkeypatch)
+        exporter, reader = otel
+
+        events = [e async for e in OpsAgentGraph(verbose=False).stream_async(PROMPT)]
+
+        # NodeResult에도 실행 시간이 채워져야 함
+        stops = [e for e in events if e.get("type") == "multiagent_node_stop"]
+        assert all(e["node_result"].execution_time >= 0 for e in stops)
+
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        analyze = spans["ops_agent.node.analyze"]
+        assert analyze.attributes["ops_agent.node.cache_read_tokens"] == 2 * USAGE["cacheReadInputTokens"]
+        assert analyze.attributes["ops_agent.node.events"] > 0
+        assert analyze.end_time >= analyze.start_time
+        assert {"ops_agent.node.evaluate", "ops_agent.node.decide", "ops_agent.node.finalize"} <= set(spans)
+
+        metric_data = reader.get_metrics_data()
+        names = {
+            metric.name
+            for resource in metric_data.resource_metrics
+            for scope in resource.scope_metrics
+            for metric in scope.metrics
+        }
+        assert names == {
+            "ops_agent.node.duration",
+            "ops_agent.node.time_to_first_event",
+            "ops_agent.node.tokens",
+            "ops_agent.model.cache_hit_rate",
+        }
+
+    async def test_closed_stream_records_failed_span(self, otel):
+        """소비자가 스트림을 중간에 닫아도 failed 상태로 span을 남겨야 함."""
+        exporter, _ = otel
+
+        async def streaming_node(**_kwargs):
+            yield {"data": "first"}
+            yield {"data": "never consumed"}
+            yield {"text": "done", "_final": True}
+
+        stream = FunctionNode(streaming_node, name="stream").stream_async("q")
+        assert await anext(stream) == {"data": "first"}
+        await stream.aclose()
+
+        spans = exporter.get_finished_spans()
+        assert [span.name for span in spans] == ["ops_agent.node.stream"]
+        assert spans[0].attributes["ops_agent.node.status"] == "failed"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
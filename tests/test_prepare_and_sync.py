@@ -0,0 +1,296 @@
+"""rag_pipeline/prepare_and_sync.py 파일 생성 및 S3 diff 동기화 테스트.
+
+prepare_files가 내용이 바뀐 파일만 쓰는지, 로컬 파일 MD5와 S3 ETag를 비교하여
+바뀐 파일만 업로드하고 사라진 문서만 삭제하는지 검증합니다.
+메모리 기반 가짜 S3 클라이언트로 실행되며, moto가 설치되어 있으면 moto S3로도 같은 시나리오를 실행합니다.
+
+실행 방법:
+    uv run pytest tests/test_prepare_and_sync.py -v
+"""
+
+import hashlib
+import sys
+import threading
+import time
+from pathlib import Path
+
+import boto3
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "rag_pipeline"))
+
+import prepare_and_sync  # noqa: E402
+from prepare_and_sync import file_md5, plan_s3_sync, prepare_files, sync_s3, write_if_changed  # noqa: E402
+
+BUCKET = "kb-bucket"
+
+
+class FakeS3:
+    """업로드/목록/삭제만 구현한 메모리 S3 클라이언트.
+
+    Args:
+        page_size: list_objects_v2 페이지 크기 (페이지네이션 검증용)
+        upload_barrier: 업로드마다 대기할 Barrier (parties개 업로드가 동시에 진행 중이어야 통과)
+    """
+
+    def __init__(self, page_size: int = 1000, upload_barrier: threading.Barrier | None = None):
+        self.objects: dict[str, bytes] = {}
+        self.page_size = page_size
+        self.upload_barrier = upload_barrier
+        self.uploads: list[str] = []
+        self.delete_calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def upload_file(self, filename, bucket, key):
+        assert bucket == BUCKET
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if self.upload_barrier is not None:
+                self.upload_barrier.wait()
+        finally:
+            with self._lock:
+                self.active -= 1
+        with self._lock:
+            self.objects[key] = Path(filename).read_bytes()
+            self.uploads.append(key)
+
+    def delete_objects(self, Bucket, Delete):
+        assert Bucket == BUCKET
+        self.delete_calls += 1
+        for obj in Delete["Objects"]:
+            self.objects.pop(obj["Key"], None)
+
+    def get_paginator(self, name):
+        assert name == "list_objects_v2"
+        return self
+
+    def paginate(self, Bucket):
+        assert Bucket == BUCKET
+        keys = sorted(self.objects)
+        for i in range(0, max(len(keys), 1), self.page_size):
+            contents = [
+                {"Key": key, "ETag": f'"{hashlib.md5(self.objects[key]).hexdigest()}"'}
+                for key in keys[i:i + self.page_size]
+            ]
+            yield {"Contents": contents} if contents else {}
+
+
+def _write(directory: Path, files: dict[str, str]) -> None:
+    for name, content in files.items():
+        (directory / name).write_text(content, encoding="utf-8")
+
+
+@pytest.fixture
+def upload_dir(tmp_path) -> Path:
+    """bedrock_upload 디렉토리 (문서 3개)."""
+    _write(tmp_path, {
+        "a.md": "# A",
+        "a.md.metadata.json": '{"doc_id": "a"}',
+        "b.md": "# B",
+        "b.md.metadata.json": '{"doc_id": "b"}',
+        "c.md": "# C",
+        "c.md.metadata.json": '{"doc_id": "c"}',
+    })
+    return tmp_path
+
+
+def _entry(entry_id: str, answer: str = "센서 문제입니다.") -> dict:
+    return {
+        "id": entry_id,
+        "title": f"{entry_id} 에러",
+        "answer": answer,
+        "category_id": "diagnostics",
+        "category_name": "Diagnostics",
+        "keywords": ["에러"],
+        "error_codes": ["22E"],
+    }
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch) -> Path:
+    """prepare_files 출력 디렉토리 (enrichment 캐시 없음 → regex fallback)."""
+    out = tmp_path / "bedrock_upload"
+    monkeypatch.setattr(prepare_and_sync, "_output_dir", str(out))
+    monkeypatch.setattr(prepare_and_sync, "_enriched_dir", str(tmp_path / "enriched"))
+    monkeypatch.setattr(prepare_and_sync, "_category_names", {"Diagnostics": "진단"})
+    return out
+
+
+# ========== prepare_files Tests ==========
+
+class TestPrepareFiles:
+    """변경분만 쓰는 파일 생성 테스트."""
+
+    def test_first_run_writes_all_files(self, output_dir):
+        """처음에는 엔트리당 2개 파일을 모두 써야 함."""
+        counts = prepare_files([_entry("E00"), _entry("E01")], workers=2)
+
+        assert counts == {"written": 4, "unchanged": 0, "removed": 0}
+        assert sorted(p.name for p in output_dir.iterdir()) == [
+            "E00.md", "E00.md.metadata.json", "E01.md", "E01.md.metadata.json",
+        ]
+        assert "# E00 에러" in (output_dir / "E00.md").read_text(encoding="utf-8")
+
+    def test_unchanged_files_keep_mtime(self, output_dir):
+        """내용이 같으면 다시 쓰지 않아 mtime이 유지되어야 함."""
+        entries = [_entry("E00"), _entry("E01")]
+        prepare_files(entries)
+        mtimes = {p.name: p.stat().st_mtime_ns for p in output_dir.iterdir()}
+        time.sleep(0.01)
+
+        entries[1]["answer"] = "필터를 교체하세요."
+        counts = prepare_files(entries)
+
+        assert counts == {"written": 1, "unchanged": 3, "removed": 0}
+        changed = {p.name for p in output_dir.iterdir() if p.stat().st_mtime_ns != mtimes[p.name]}
+        assert changed == {"E01.md"}
+
+    def test_removed_entries_are_deleted(self, output_dir):
+        """사라진 엔트리 파일은 삭제하고, 다른 파일은 건드리지 않아야 함."""
+        prepare_files([_entry("E00"), _entry("E01")])
+        (output_dir / "notes.txt").write_text("keep", encoding="utf-8")
+
+        counts = prepare_files([_entry("E00")])
+
+        assert counts["removed"] == 2
+        assert sorted(p.name for p in output_dir.iterdir()) == ["E00.md", "E00.md.metadata.json", "notes.txt"]
+
+    def test_write_if_changed(self, tmp_path):
+        """같은 내용이면 False, 다르면 교체 후 True."""
+        path = tmp_path / "a.md"
+        assert write_if_changed(str(path), b"a") is True
+        assert write_if_changed(str(path), b"a") is False
+        assert write_if_changed(str(path), b"b") is True
+        assert path.read_bytes() == b"b"
+        assert [p.name for p in tmp_path.iterdir()] == ["a.md"]
+
+
+# ========== Plan Tests ==========
+
+class TestPlanS3Sync:
+    """동기화 계획 테스트."""
+
+    def test_md5_matches_s3_etag(self, upload_dir):
+        """file_md5는 단일 파트 ETag와 같아야 함."""
+        assert file_md5(str(upload_dir / "a.md")) == hashlib.md5(b"# A").hexdigest()
+
+    def test_empty_bucket_uploads_everything(self, upload_dir):
+        """빈 버킷이면 모든 파일을 업로드해야 함."""
+        plan = plan_s3_sync(FakeS3(), BUCKET, str(upload_dir))
+        assert len(plan["upload"]) == 6
+        assert plan["delete"] == []
+
+    def test_non_artifacts_are_ignored(self, upload_dir):
+        """임시 파일 등 업로드 대상이 아닌 파일은 제외해야 함."""
+        (upload_dir / "a.md.tmp").write_text("partial", encoding="utf-8")
+        assert "a.md.tmp" not in plan_s3_sync(FakeS3(), BUCKET, str(upload_dir))["upload"]
+
+    def test_multipart_etag_is_treated_as_changed(self, upload_dir):
+        """멀티파트 ETag는 MD5와 비교할 수 없으므로 다시 업로드해야 함."""
+        s3 = FakeS3()
+        sync_s3(s3, BUCKET, str(upload_dir))
+        s3.paginate = lambda **_kwargs: iter([{"Contents": [
+            {"Key": key, "ETag": '"0123-2"' if key == "a.md" else f'"{hashlib.md5(body).hexdigest()}"'}
+            for key, body in s3.objects.items()
+        ]}])
+
+        assert plan_s3_sync(s3, BUCKET, str(upload_dir))["upload"] == ["a.md"]
+
+
+# ========== Sync Tests ==========
+
+class TestSyncS3:
+    """diff/full 동기화 테스트."""
+
+    def test_second_sync_uploads_nothing(self, upload_dir):
+        """변경이 없으면 업로드/삭제가 없어야 함."""
+        s3 = FakeS3(page_size=2)
+        sync_s3(s3, BUCKET, str(upload_dir))
+        s3.uploads.clear()
+
+        plan = sync_s3(s3, BUCKET, str(upload_dir))
+
+        assert plan == {"upload": [], "delete": [], "unchanged": 6}
+        assert s3.uploads == []
+        assert s3.delete_calls == 0
+
+    def test_only_changed_and_removed_files(self, upload_dir):
+        """바뀐 파일만 업로드하고 사라진 문서만 삭제해야 함."""
+        s3 = FakeS3(page_size=2)
+        sync_s3(s3, BUCKET, str(upload_dir))
+        s3.uploads.clear()
+
+        _write(upload_dir, {"b.md": "# B (수정)", "d.md": "# D", "d.md.metadata.json": "{}"})
+        (upload_dir / "c.md").unlink()
+        (upload_dir / "c.md.metadata.json").unlink()
+
+        plan = sync_s3(s3, BUCKET, str(upload_dir))
+
+        assert plan["upload"] == ["b.md", "d.md", "d.md.metadata.json"]
+        assert plan["delete"] == ["c.md", "c.md.metadata.json"]
+        assert plan["unchanged"] == 3
+        assert sorted(s3.uploads) == plan["upload"]
+        assert sorted(s3.objects) == sorted(p.name for p in upload_dir.iterdir())
+        assert s3.objects["b.md"] == "# B (수정)".encode()
+
+    def test_uploads_run_in_parallel(self, upload_dir):
+        """업로드는 여러 스레드에서 동시에 실행되어야 함."""
+        # 6개 업로드가 동시에 진행 중이어야 Barrier를 통과 (직렬이면 BrokenBarrierError)
+        s3 = FakeS3(upload_barrier=threading.Barrier(6, timeout=5.0))
+
+        sync_s3(s3, BUCKET, str(upload_dir), workers=6)
+
+        assert s3.max_active == 6
+        assert len(s3.uploads) == 6
+
+    def test_full_sync_reuploads_everything(self, upload_dir):
+        """full=True면 버킷을 비우고 모든 파일을 업로드해야 함."""
+        s3 = FakeS3()
+        sync_s3(s3, BUCKET, str(upload_dir))
+        s3.objects["stale.md"] = b"old"
+        s3.uploads.clear()
+
+        plan = sync_s3(s3, BUCKET, str(upload_dir), full=True)
+
+        assert len(s3.uploads) == 6
+        assert "stale.md" in plan["delete"]
+        assert "stale.md" not in s3.objects
+
+
+# ========== moto ==========
+
+class TestMotoS3:
+    """moto S3에서 diff 동기화 (moto 설치 시에만 실행)."""
+
+    @pytest.fixture
+    def s3(self, monkeypatch):
+        moto = pytest.importorskip("moto")
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        with moto.mock_aws():
+            client = boto3.client("s3", region_name="us-east-1")
+            client.create_bucket(Bucket=BUCKET)
+            yield client
+
+    def test_diff_sync_against_moto(self, s3, upload_dir):
+        """실제 S3 API ETag로 변경분만 동기화해야 함."""
+        assert len(sync_s3(s3, BUCKET, str(upload_dir))["upload"]) == 6
+
+        _write(upload_dir, {"a.md": "# A (수정)"})
+        (upload_dir / "c.md").unlink()
+
+        plan = sync_s3(s3, BUCKET, str(upload_dir))
+
+        assert plan["upload"] == ["a.md"]
+        assert plan["delete"] == ["c.md"]
+        keys = {obj["Key"] for obj in s3.list_objects_v2(Bucket=BUCKET)["Contents"]}
+        assert keys == {p.name for p in upload_dir.iterdir()}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
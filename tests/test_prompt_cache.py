@@ -0,0 +1,149 @@
+"""프롬프트 캐싱 테스트.
+
+시스템 프롬프트의 cachePoint 앞부분이 요청 간에 동일하게 유지되는지,
+BedrockModel 요청에 cachePoint가 의도한 위치에 들어가는지,
+모델 호출별 캐시 적중률이 노드 메트릭에 기록되는지 검증합니다.
+AWS 호출 없이 실행됩니다 (BedrockModel._format_request는 요청 dict만 생성).
+
+실행 방법:
+    uv run pytest tests/test_prompt_cache.py -v
+"""
+
+import pytest
+from strands.models import BedrockModel
+
+from ops_agent.graph import nodes
+from ops_agent.graph.agent_pool import AgentPool
+from ops_agent.graph.runner import OpsAgentGraph
+from ops_agent.prompts import PROMPT_CACHE_CONFIG, build_system_prompt
+from ops_agent.telemetry import NodeTimer, cache_hit_rate, summarize_node_metrics
+from ops_agent.testing import FakeModel, FakeTurn, ToolCall
+
+MODEL_ID = "global.anthropic.claude-sonnet-4-5-20250929-v1:0"
+TOOL_SPEC = {"name": "tool", "description": "test tool", "inputSchema": {"json": {"type": "object"}}}
+
+
+# ========== build_system_prompt Tests ==========
+
+class TestBuildSystemPrompt:
+    """캐시 친화적 시스템 프롬프트 블록 테스트."""
+
+    def test_static_prefix_is_stable_across_times(self):
+        """CURRENT_TIME이 달라도 cachePoint 앞 블록은 같아야 함."""
+        first = build_system_prompt(CURRENT_TIME="2024-01-01 00:00:00")
+        second = build_system_prompt(CURRENT_TIME="2024-01-01 00:00:01")
+
+        assert first[0] == second[0]
+        assert first[1] == {"cachePoint": {"type": "default"}}
+        assert first[2] != second[2]
+
+    def test_current_time_is_after_cache_point(self):
+        """현재 시간은 cachePoint 뒤 Context 블록에만 있어야 함."""
+        blocks = build_system_prompt(CURRENT_TIME="2024-01-01 09:30:00")
+
+        assert "2024-01-01 09:30:00" not in blocks[0]["text"]
+        assert "2024-01-01 09:30:00" in blocks[2]["text"]
+        assert blocks[2]["text"].startswith("## Context")
+
+
+# ========== BedrockModel Request Tests ==========
+
+class TestBedrockCachePoints:
+    """PROMPT_CACHE_CONFIG + cache_tools로 생성한 Bedrock 요청의 cachePoint 위치 테스트."""
+
+    @pytest.fixture
+    def model(self) -> BedrockModel:
+        return BedrockModel(
+            model_id=MODEL_ID,
+            region_name="us-east-1",
+            cache_config=PROMPT_CACHE_CONFIG,
+            cache_tools="default",
+        )
+
+    def test_request_cache_points(self, model):
+        """tools, 시스템 고정 부분 끝에 cachePoint가 있고, 첫 요청 메시지에는 없어야 함."""
+        request = model._format_request(
+            [{"role": "user", "content": [{"text": "질문"}]}],
+            tool_specs=[TOOL_SPEC],
+            system_prompt_content=build_system_prompt(),
+        )
+
+        assert request["toolConfig"]["tools"][-1] == {"cachePoint": {"type": "default"}}
+        assert [list(block) for block in request["system"]] == [["text"], ["cachePoint"], ["text"]]
+        assert request["messages"][-1]["content"] == [{"text": "질문"}]
+
+    def test_message_cache_point_moves_to_last_assistant_message(self, model):
+        """에이전트 루프에서는 마지막 assistant 메시지 (도구 호출)에만 cachePoint가 있어야 함."""
+        messages = [
+            {"role": "user", "content": [{"text": "질문"}]},
+            {"role": "assistant", "content": [{"toolUse": {"toolUseId": "t1", "name": "tool", "input": {}}}]},
+            {"role": "user", "content": [{"toolResult": {"toolUseId": "t1", "content": [{"text": "{}"}]}}]},
+        ]
+
+        request = model._format_request(messages, tool_specs=[TOOL_SPEC], system_prompt_content=build_system_prompt())
+
+        cache_points = [
+            index
+            for index, message in enumerate(request["messages"])
+            for block in message["content"] if "cachePoint" in block
+        ]
+        assert cache_points == [1]
+
+
+# ========== Cache Hit Rate Tests ==========
+
+class TestCacheHitRate:
+    """프롬프트 캐시 적중률 계산 테스트."""
+
+    def test_hit_rate_uses_total_input(self):
+        """적중률 = 캐시 읽기 / (입력 + 캐시 읽기 + 캐시 쓰기)."""
+        usage = {"inputTokens": 100, "cacheReadInputTokens": 800, "cacheWriteInputTokens": 100}
+        assert cache_hit_rate(usage) == pytest.approx(0.8)
+
+    def test_no_input_tokens(self):
+        """입력 토큰이 없으면 None."""
+        assert cache_hit_rate({"outputTokens": 10}) is None
+
+    def test_timer_records_rate_per_model_call(self):
+        """모델 호출 (metadata 이벤트)마다 적중률을 기록해야 함."""
+        timer = NodeTimer("analyze")
+        timer.on_event({"event": {"metadata": {"usage": {"inputTokens": 1000, "cacheWriteInputTokens": 1000}}}})
+        timer.on_event({"event": {"metadata": {"usage": {"inputTokens": 200, "cacheReadInputTokens": 1800}}}})
+
+        metrics = timer.finish()
+
+        assert metrics.cache_hit_rates == [0.0, pytest.approx(0.9)]
+        assert metrics.cache_hit_rate == pytest.approx(1800 / 4000)
+        assert metrics.to_dict()["cache_hit_rate"] == metrics.cache_hit_rate
+
+
+# ========== Workflow Tests ==========
+
+class TestWorkflowCacheMetrics:
+    """워크플로우 실행 시 캐시 적중률 수집 테스트."""
+
+    def test_analyze_records_cache_hit_rate(self, monkeypatch):
+        """ANALYZE 노드 메트릭과 노드 요약에 캐시 적중률이 있어야 함."""
+        model = FakeModel(
+            [
+                FakeTurn(tool_calls=(ToolCall(
+                    "cloudwatch_filter_log_events",
+                    {"log_group_name": "/aws/lambda/payment-service", "filter_pattern": "500"},
+                ),)),
+                FakeTurn(text="payment-service에서 에러가 발생했습니다."),
+            ],
+            usage={"inputTokens": 500, "cacheReadInputTokens": 1500},
+        )
+        pool = AgentPool(factory=lambda: nodes._create_agent(model=model), reset=nodes._reset_agent)
+        monkeypatch.setattr(nodes, "_agent_pool", pool)
+
+        state = OpsAgentGraph(max_attempts=1, verbose=False).run("payment-service 500 에러 로그 보여줘")
+
+        analyze = state.metadata["node_metrics"][0]
+        assert analyze["node"] == "analyze"
+        assert analyze["cache_hit_rates"] == [0.75, 0.75]
+        assert summarize_node_metrics(state.metadata["node_metrics"])["analyze"]["cache_hit_rate"] == 0.75
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,151 @@
+"""재생성 시 도구 결과 재사용 테스트.
+
+REGENERATE 후 재시도에서 이전 시도의 도구 호출/결과가 대화에 주입되어
+도구를 다시 호출하지 않고 텍스트만 재생성하는지 검증합니다.
+
+LLM 대신 FakeAgent를 주입하므로 AWS 자격 증명 없이 실행됩니다.
+
+실행 방법:
+    uv run pytest tests/test_retry_tool_reuse.py -v
+"""
+
+import json
+
+import pytest
+
+from ops_agent.config import get_settings
+from ops_agent.evaluation import ToolResult, ToolType
+from ops_agent.graph import nodes
+from ops_agent.graph.agent_pool import AgentPool
+from ops_agent.graph.runner import OpsAgentGraph
+from ops_agent.graph.util import ToolResultExtractor, build_tool_history
+
+TOOL_OUTPUT = {
+    "status": "success",
+    "log_group": "/aws/lambda/order-api",
+    "event_count": 3,
+    "events": [{"message": "[ERROR] Disk quota exceeded"}],
+}
+
+
+# ========== Fake Agent ==========
+
+class ToolAwareFakeAgent:
+    """주입된 도구 결과가 있으면 도구를 호출하지 않는 가짜 Agent.
+
+    - 대화에 toolResult가 없으면 도구 호출 (tool_calls 증가)
+    - 첫 시도는 잘못된 이벤트 수를 답변 → REGENERATE 유도
+    """
+
+    def __init__(self, log: dict) -> None:
+        self.messages: list[dict] = []
+        self._log = log
+
+    async def stream_async(self, prompt: str):
+        history = list(self.messages)
+        self._log["histories"].append(history)
+        has_tool_results = any(
+            "toolResult" in block
+            for msg in history
+            for block in msg.get("content", [])
+        )
+
+        messages = history + [{"role": "user", "content": [{"text": prompt}]}]
+        if not has_tool_results:
+            self._log["tool_calls"] += 1
+            messages += [
+                {"role": "assistant", "content": [{"toolUse": {
+                    "toolUseId": "t1",
+                    "name": "cloudwatch_filter_log_events",
+                    "input": {"log_group_name": "/aws/lambda/order-api"},
+                }}]},
+                {"role": "user", "content": [{"toolResult": {
+                    "toolUseId": "t1",
+                    "status": "success",
+                    "content": [{"text": json.dumps(TOOL_OUTPUT)}],
+                }}]},
+            ]
+
+        if prompt.startswith("이전 질문:"):
+            response = "order-api에서 3건 발생: Disk quota exceeded"
+        else:
+            response = "order-api 로그를 확인했습니다. 이상 징후 13건."
+
+        yield {"data": response}
+        self.messages = messages + [{"role": "assistant", "content": [{"text": response}]}]
+
+
+@pytest.fixture
+def agent_log(monkeypatch) -> dict:
+    """ANALYZE 노드의 Agent 풀을 ToolAwareFakeAgent 풀로 교체."""
+    log = {"tool_calls": 0, "histories": []}
+    monkeypatch.setattr(nodes, "_agent_pool", AgentPool(factory=lambda: ToolAwareFakeAgent(log)))
+    return log
+
+
+@pytest.fixture
+def reuse_disabled(monkeypatch):
+    """EVAL_REUSE_TOOL_RESULTS=false."""
+    monkeypatch.setenv("EVAL_REUSE_TOOL_RESULTS", "false")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+# ========== build_tool_history ==========
+
+class TestBuildToolHistory:
+    """재시도 히스토리 구조 테스트."""
+
+    def test_history_alternates_roles_and_round_trips(self):
+        """user/assistant 교대 구조이고, 추출기로 같은 도구 결과를 복원."""
+        results = [
+            ToolResult(ToolType.CLOUDWATCH, "cloudwatch_filter_log_events", {"limit": 5}, TOOL_OUTPUT),
+            ToolResult(ToolType.KNOWLEDGE_BASE, "kb_retrieve", {"query": "22E"}, {"kb_id": "KB", "results": []}),
+        ]
+
+        history = build_tool_history("질문", results, "이전 응답")
+
+        assert [m["role"] for m in history] == ["user", "assistant", "user", "assistant"]
+        assert ToolResultExtractor.from_messages(history) == results
+
+    def test_raw_output_is_passed_verbatim(self):
+        """JSON이 아니었던 도구 결과는 원문 그대로 주입."""
+        result = ToolResult(ToolType.CLOUDWATCH, "tool", {}, {"raw": "plain text"})
+        history = build_tool_history("질문", [result], "응답")
+        assert history[2]["content"][0]["toolResult"]["content"] == [{"text": "plain text"}]
+
+
+# ========== Graph 재시도 ==========
+
+class TestRetryToolReuse:
+    """REGENERATE 루프에서 도구 재호출 여부."""
+
+    def test_retry_reuses_previous_tool_results(self, agent_log):
+        """재시도는 주입된 도구 결과를 사용하고 도구를 다시 호출하지 않음."""
+        state = OpsAgentGraph(max_attempts=2, verbose=False).run("order-api 에러")
+
+        assert state.attempt == 1
+        assert state.final_response == "order-api에서 3건 발생: Disk quota exceeded"
+        assert agent_log["tool_calls"] == 1
+
+        retry_history = agent_log["histories"][1]
+        assert retry_history[0]["content"][0]["text"] == "order-api 에러"
+        assert retry_history[-1]["content"][0]["text"].endswith("이상 징후 13건.")
+
+        # 주입된 도구 결과도 재시도 평가에 사용됨
+        assert [r.tool_output for r in state.tool_results] == [TOOL_OUTPUT]
+        assert state.tool_results[0].tool_name == "cloudwatch_filter_log_events"
+
+    @pytest.mark.usefixtures("reuse_disabled")
+    def test_reuse_can_be_disabled(self, agent_log):
+        """EVAL_REUSE_TOOL_RESULTS=false이면 재시도에서 도구를 다시 호출."""
+        state = OpsAgentGraph(max_attempts=2, verbose=False).run("order-api 에러")
+
+        assert state.attempt == 1
+        assert agent_log["tool_calls"] == 2
+        assert agent_log["histories"][1] == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
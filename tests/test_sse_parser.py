@@ -0,0 +1,221 @@
+"""AgentCore SSEParser 테스트.
+
+청크 경계와 상관없이 동일한 텍스트를 추출하는지,
+캡처된 대용량 스트림을 이전 파서보다 빠르게 처리하는지 검증합니다.
+
+실행 방법:
+    uv run pytest tests/test_sse_parser.py -v -s
+"""
+
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "agentcore" / "scripts"))
+
+from util import AgentCoreClient, SSEParser  # noqa: E402
+
+TOKENS = ["에러", " 로그", " payment-service", " 🔥", " 5건", "\n", " timeout", " 에러"]
+
+
+def _sse(event: dict, event_id: str | None = None) -> bytes:
+    """BedrockAgentCoreApp과 같은 형식의 SSE 이벤트 생성."""
+    header = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{header}data: {json.dumps(event, ensure_ascii=False)}\n\n".encode()
+
+
+def _capture(event_count: int, seed: int = 0) -> tuple[bytes, list[str]]:
+    """캡처된 스트림을 흉내 낸 SSE 바이트와 기대 텍스트 생성."""
+    rng = random.Random(seed)
+    parts: list[bytes] = []
+    expected: list[str] = []
+    for i in range(event_count):
+        if i % 50 == 0:
+            parts.append(_sse({"type": "node_start", "node": "analyze"}))
+        token = rng.choice(TOKENS)
+        parts.append(_sse({"type": "delta", "content": token}))
+        expected.append(token)
+    return b"".join(parts), expected
+
+
+def _split(data: bytes, sizes: tuple[int, int], seed: int = 0) -> list[bytes]:
+    """임의 크기로 청크 분할 (멀티바이트 문자 중간도 자름)."""
+    rng = random.Random(seed)
+    chunks = []
+    pos = 0
+    while pos < len(data):
+        size = rng.randint(*sizes)
+        chunks.append(data[pos:pos + size])
+        pos += size
+    return chunks
+
+
+def _parse(parser: SSEParser, chunks: list) -> list[str]:
+    texts = []
+    for chunk in chunks:
+        texts.extend(parser.feed(chunk))
+    texts.extend(parser.flush())
+    return texts
+
+
+class _LegacySSEParser:
+    """비교용 이전 구현 (str 버퍼 + split + 텍스트 기준 중복 제거)."""
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._seen: set[str] = set()
+
+    def feed(self, chunk: str):
+        self._buffer += chunk
+        while "\n\n" in self._buffer:
+            event_str, self._buffer = self._buffer.split("\n\n", 1)
+            text = self._extract_text(event_str)
+            if text and text not in self._seen:
+                self._seen.add(text)
+                yield text
+
+    def _extract_text(self, event_str: str) -> str | None:
+        data_parts = []
+        for line in event_str.strip().split("\n"):
+            line = line.strip()
+            if line.startswith("data: "):
+                data_parts.append(line[6:])
+            elif line.startswith("data:"):
+                data_parts.append(line[5:])
+        if not data_parts:
+            return None
+        try:
+            data = json.loads("".join(data_parts))
+        except json.JSONDecodeError:
+            return None
+        if isinstance(data, dict) and data.get("type") in ("delta", "text"):
+            return data.get("content")
+        return None
+
+
+# ========== Parsing Tests ==========
+
+class TestSSEParser:
+    """SSEParser 파싱 테스트."""
+
+    def test_chunk_boundaries_do_not_change_output(self):
+        """1바이트 분할을 포함한 모든 분할에서 같은 텍스트를 추출해야 함."""
+        data, expected = _capture(300)
+
+        assert _parse(SSEParser(), [data]) == expected
+        assert _parse(SSEParser(), [data[i:i + 1] for i in range(len(data))]) == expected
+        for seed in range(20):
+            assert _parse(SSEParser(), _split(data, (1, 40), seed)) == expected
+
+    def test_multibyte_character_split_across_chunks(self):
+        """청크 경계에서 잘린 UTF-8 문자도 온전히 복원되어야 함."""
+        data = _sse({"type": "delta", "content": "에러🔥"})
+        cut = data.index("🔥".encode()) + 2
+
+        assert _parse(SSEParser(), [data[:cut], data[cut:]]) == ["에러🔥"]
+
+    def test_repeated_tokens_are_preserved(self):
+        """id가 없는 이벤트는 같은 토큰이 반복되어도 모두 전달되어야 함."""
+        data = b"".join(_sse({"type": "delta", "content": " 에러"}) for _ in range(3))
+
+        assert _parse(SSEParser(), [data]) == [" 에러"] * 3
+
+    def test_duplicate_event_ids_are_dropped(self):
+        """같은 id로 재전송된 이벤트는 한 번만 전달되어야 함."""
+        data = (
+            _sse({"type": "delta", "content": "a"}, "1")
+            + _sse({"type": "delta", "content": "b"}, "2")
+            + _sse({"type": "delta", "content": "a"}, "1")
+        )
+
+        assert _parse(SSEParser(), [data]) == ["a", "b"]
+
+    def test_dedup_window_is_bounded(self):
+        """dedup_window보다 오래된 id는 잊어야 함."""
+        parser = SSEParser(dedup_window=2)
+        events = [_sse({"type": "delta", "content": str(i)}, str(i)) for i in range(3)]
+
+        texts = _parse(parser, [*events, events[0]])
+
+        assert texts == ["0", "1", "2", "0"]
+
+    def test_str_chunks_and_flush_remainder(self):
+        """str 청크와 구분자 없이 끝난 마지막 이벤트도 처리해야 함."""
+        parser = SSEParser()
+        texts = parser.feed('data: {"type": "delta", "content": "a"}\n\ndata: {"type": "text",')
+        texts += parser.feed(' "content": "b"}')
+        texts += parser.flush()
+
+        assert texts == ["a", "b"]
+
+    def test_ignores_non_text_and_malformed_events(self):
+        """텍스트 이벤트가 아니거나 잘못된 JSON은 무시해야 함."""
+        data = (
+            b": keep-alive\n\n"
+            + _sse({"type": "node_start", "content": "x"})
+            + b"data: {\"content\": broken\n\n"
+            + _sse({"type": "text", "content": "ok"})
+        )
+
+        assert _parse(SSEParser(), [data]) == ["ok"]
+
+
+# ========== Client Tests ==========
+
+class TestClientStream:
+    """AgentCoreClient.stream 디코딩 테스트."""
+
+    def _stream(self, events: list, raw: bool) -> list[str]:
+        client = AgentCoreClient("arn", "us-east-1")
+        client._client = type("Stub", (), {
+            "invoke_agent_runtime": lambda _self, **_kwargs: {"response": events},
+        })()
+        return list(client.stream("hi", session_id="s", raw=raw))
+
+    def test_stream_passes_raw_bytes_to_parser(self):
+        """멀티바이트 문자가 청크 사이에서 잘려도 스트림이 실패하지 않아야 함."""
+        data = _sse({"type": "delta", "content": "에러🔥"})
+        cut = data.index("🔥".encode()) + 1
+        events = [{"chunk": {"bytes": data[:cut]}}, {"chunk": {"bytes": data[cut:]}}]
+
+        assert self._stream(events, raw=False) == ["에러🔥"]
+        assert "".join(self._stream(events, raw=True)) == data.decode()
+
+
+# ========== Benchmark ==========
+
+class TestSSEParserBenchmark:
+    """대용량 캡처 스트림 재생 벤치마크."""
+
+    def test_replay_multi_megabyte_stream(self):
+        """수 MB 스트림을 이전 파서보다 빠르게, 반복 토큰 손실 없이 처리해야 함."""
+        data, expected = _capture(100_000)
+        assert len(data) > 3 * 1024 * 1024
+        chunks = _split(data, (16 * 1024, 64 * 1024))
+
+        start = time.perf_counter()
+        texts = _parse(SSEParser(), chunks)
+        new_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        legacy = _LegacySSEParser()
+        legacy_texts = [t for chunk in chunks for t in legacy.feed(chunk.decode("utf-8", errors="replace"))]
+        legacy_elapsed = time.perf_counter() - start
+
+        print(
+            f"\n{len(data) / 1024 / 1024:.1f}MB, {len(chunks)} chunks: "
+            f"SSEParser {new_elapsed * 1000:.1f}ms ({len(texts)} texts), "
+            f"legacy {legacy_elapsed * 1000:.1f}ms ({len(legacy_texts)} texts)"
+        )
+
+        assert texts == expected
+        assert len(legacy_texts) < len(expected)  # 이전 파서는 반복 토큰을 버림
+        assert new_elapsed < legacy_elapsed
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
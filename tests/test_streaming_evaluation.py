@@ -0,0 +1,245 @@
+"""스트리밍(증분) 평가 테스트.
+
+응답을 임의의 청크로 나눠 전달한 증분 검사 결과가
+전체 응답으로 실행한 check() 결과와 같은지 검증합니다.
+
+실행 방법:
+    uv run pytest tests/test_streaming_evaluation.py -v
+"""
+
+import json
+import random
+
+import pytest
+
+from ops_agent.evaluation import OpsAgentEvaluator, ToolResult, ToolType
+from ops_agent.evaluation.checkers.base import StreamingText
+from ops_agent.evaluation.checkers.cloudwatch import CloudWatchChecker, _extract_counts
+from ops_agent.evaluation.checkers.knowledge_base import KBChecker
+from ops_agent.evaluation.streaming import StreamingEvaluation
+from ops_agent.graph import nodes
+from ops_agent.graph.agent_pool import AgentPool
+from ops_agent.graph.runner import OpsAgentGraph
+
+KB_CONTENT = (
+    "# 에러 코드 22E\n\n"
+    "## 답변\n냉장실 팬 모터 이상입니다.\n\n"
+    "## 핵심 키워드\n22E, 팬 모터, 냉장실, 전원 재연결, 서비스센터\n"
+)
+
+TOOL_RESULTS = [
+    ToolResult(
+        tool_type=ToolType.CLOUDWATCH,
+        tool_name="cloudwatch_filter_log_events",
+        tool_input={},
+        tool_output={
+            "event_count": 12,
+            "log_group": "/aws/lambda/payment-service",
+            "events": [
+                {"message": "[ERROR] 500 - Connection timeout to payment gateway"},
+                {"message": "[ERROR] Redis connection refused"},
+                {"message": "Database deadlock detected"},
+            ],
+        },
+    ),
+    ToolResult(
+        tool_type=ToolType.CLOUDWATCH,
+        tool_name="cloudwatch_filter_log_events",
+        tool_input={},
+        tool_output={"event_count": 3, "log_group": "/aws/ecs/order-api", "events": []},
+    ),
+    ToolResult(
+        tool_type=ToolType.KNOWLEDGE_BASE,
+        tool_name="kb_retrieve",
+        tool_input={},
+        tool_output={"results": [{"content": KB_CONTENT}]},
+    ),
+]
+
+FRAGMENTS = [
+    "총 ", "총", "12", "1", "2", "3", "123", "건", "개", " errors", " error", "에러", " events",
+    "이벤트", " ", "  ", "\n", "\t", "payment-service", "PAYMENT", "-service", "order-api",
+    "Connection timeout", "time", "out", "Redis", "deadlock", "DATABASE", "**", "22E", "22e",
+    "팬 모터", "팬  모터", "냉장실", "전원 재연결", "서비스센터", "로그를 확인했습니다. ",
+]
+
+
+def random_chunks(rng: random.Random, text: str) -> list[str]:
+    """텍스트를 임의 길이 청크로 분할."""
+    chunks, i = [], 0
+    while i < len(text):
+        size = rng.randint(1, 6)
+        chunks.append(text[i:i + size])
+        i += size
+    return chunks
+
+
+# ========== StreamingText ==========
+
+class TestStreamingText:
+    """증분 부분 문자열 추적 테스트."""
+
+    def test_match_across_chunk_boundary(self):
+        """청크 경계에 걸친 검색어도 발견."""
+        text = StreamingText(["timeout", "payment-service"])
+        for chunk in ["Connection time", "out on pay", "ment-", "service"]:
+            text.feed(chunk)
+        assert text.found == {"timeout", "payment-service"}
+
+    def test_whitespace_normalization_matches_batch(self):
+        """공백 정리 결과가 _normalize_text와 동일."""
+        rng = random.Random(0)
+        for _ in range(200):
+            raw = "".join(rng.choice(["  ", "a", "B", "\n", " 팬", "모터 ", "\t"]) for _ in range(20))
+            text = StreamingText([], normalize_whitespace=True)
+            for chunk in random_chunks(rng, raw):
+                text.feed(chunk)
+            assert text.lower == " ".join(raw.lower().split())
+
+
+# ========== 증분 검사 동일성 ==========
+
+class TestIncrementalEquivalence:
+    """증분 검사 결과 == check() 결과."""
+
+    @pytest.mark.parametrize("checker_cls", [CloudWatchChecker, KBChecker])
+    def test_random_responses_and_chunking(self, checker_cls):
+        """임의 응답/청크 분할 2,000건에서 결과 동일."""
+        rng = random.Random(7)
+        checker = checker_cls()
+
+        for _ in range(2000):
+            response = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 25)))
+            check = checker.start_incremental(TOOL_RESULTS)
+            for chunk in random_chunks(rng, response):
+                check.feed(chunk)
+
+            assert check.result() == checker.check(response, TOOL_RESULTS), repr(response)
+
+    def test_no_matching_tool_results_is_skipped(self):
+        """해당 도구 결과가 없으면 check()와 같은 skipped 결과."""
+        check = CloudWatchChecker().start_incremental([TOOL_RESULTS[2]])
+        check.feed("응답")
+        assert check.result() == CloudWatchChecker().check("응답", [TOOL_RESULTS[2]])
+
+    def test_partial_results_do_not_fill_response_cache(self):
+        """중간 결과의 임시 텍스트 조각은 응답별 이벤트 수 캐시에 들어가지 않아야 함."""
+        check = CloudWatchChecker().start_incremental(TOOL_RESULTS)
+        _extract_counts.cache_clear()
+
+        for chunk in ["payment-service에서 ", "총 4", "건의 에러가 ", "발생했습니다. 12"]:
+            check.feed(chunk)
+            check.result(final=False)
+
+        assert _extract_counts.cache_info().currsize == 0
+
+
+# ========== StreamingEvaluation ==========
+
+class TestStreamingEvaluation:
+    """증분 평가 세션 테스트."""
+
+    def test_evaluate_reuses_incremental_results(self, monkeypatch):
+        """스트리밍 내용과 최종 응답이 같으면 check()를 다시 실행하지 않음."""
+        response = "payment-service에서 총 12건: Connection timeout, Redis. order-api 3건. 22E 팬 모터"
+        expected = OpsAgentEvaluator(parallel=False).evaluate(response, TOOL_RESULTS)
+
+        session = StreamingEvaluation(OpsAgentEvaluator(parallel=False))
+        session.feed("도구를 호출하겠습니다.")
+        session.end_message()
+        session.add_tool_results(TOOL_RESULTS)
+        for chunk in random_chunks(random.Random(1), response):
+            session.feed(chunk)
+        session.end_message()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("check() should not run")
+
+        monkeypatch.setattr(CloudWatchChecker, "check", fail)
+        monkeypatch.setattr(KBChecker, "check", fail)
+
+        result = session.evaluate(response, TOOL_RESULTS)
+        assert result.check_results == expected.check_results
+        assert result.verdict == expected.verdict
+
+    def test_mismatch_falls_back_to_full_evaluation(self):
+        """스트리밍 텍스트나 도구 결과가 다르면 일반 평가."""
+        session = StreamingEvaluation(OpsAgentEvaluator(parallel=False), TOOL_RESULTS)
+        session.feed("부분 응답")
+
+        response = "payment-service 총 12건"
+        result = session.evaluate(response, TOOL_RESULTS)
+        expected = OpsAgentEvaluator(parallel=False).evaluate(response, TOOL_RESULTS)
+        assert result.check_results == expected.check_results
+
+        result = session.evaluate("부분 응답", TOOL_RESULTS[:1])
+        expected = OpsAgentEvaluator(parallel=False).evaluate("부분 응답", TOOL_RESULTS[:1])
+        assert result.check_results == expected.check_results
+
+    def test_provisional_score_flags_failing_answer(self):
+        """도구 결과를 인용하지 않는 응답은 생성 중에 실패로 표시."""
+        session = StreamingEvaluation(OpsAgentEvaluator(parallel=False), TOOL_RESULTS[:2])
+        session.feed("로그를 확인했습니다. 특이사항 없습니다.")
+        assert session.is_failing()
+        assert session.provisional_score() == 0.5  # CloudWatch 0.0, KB 스킵 1.0
+
+        session.feed(" payment-service 12건, order-api 3건: Connection timeout, Redis, Database")
+        assert not session.is_failing()
+        assert session.provisional_score() == 1.0
+
+
+# ========== Graph 연동 ==========
+
+class StreamingFakeAgent:
+    """Strands 스트림 이벤트 형식(data/message)을 흉내 내는 가짜 Agent."""
+
+    def __init__(self) -> None:
+        self.messages: list[dict] = []
+
+    async def stream_async(self, prompt: str):
+        tool_use = {"role": "assistant", "content": [
+            {"text": "조회하겠습니다."},
+            {"toolUse": {"toolUseId": "t1", "name": "cloudwatch_filter_log_events", "input": {}}},
+        ]}
+        tool_result = {"role": "user", "content": [{"toolResult": {
+            "toolUseId": "t1",
+            "status": "success",
+            "content": [{"text": json.dumps(TOOL_RESULTS[0].tool_output)}],
+        }}]}
+        response = "payment-service에서 총 12건: Connection timeout, Redis, Database deadlock"
+        final = {"role": "assistant", "content": [{"text": response}]}
+
+        yield {"data": "조회하겠습니다."}
+        yield {"message": tool_use}
+        yield {"message": tool_result}
+        for chunk in random_chunks(random.Random(3), response):
+            yield {"data": chunk}
+        yield {"message": final}
+
+        self.messages = [{"role": "user", "content": [{"text": prompt}]}, tool_use, tool_result, final]
+
+
+class TestGraphStreamingEvaluation:
+    """ANALYZE → EVALUATE 연동."""
+
+    def test_evaluate_node_uses_stream_results(self, monkeypatch):
+        """ANALYZE 중 매칭한 결과로 EVALUATE가 check() 없이 완료."""
+        monkeypatch.setattr(nodes, "_agent_pool", AgentPool(factory=StreamingFakeAgent))
+        calls: list[str] = []
+        original = CloudWatchChecker.check
+
+        def counting(self, response, tool_results):
+            calls.append(response)
+            return original(self, response, tool_results)
+
+        monkeypatch.setattr(CloudWatchChecker, "check", counting)
+
+        state = OpsAgentGraph(max_attempts=1, verbose=False).run("payment-service 에러")
+
+        assert state.final_response.startswith("payment-service에서 총 12건")
+        assert state.eval_result.overall_score == 1.0
+        assert calls == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])